@@ -35,6 +35,25 @@ TEST_DATA_FILE = _resolve_dataset_path(
     ],
 )
 
+SNAPSHOT_CACHE_ENABLED = os.environ.get("JIRA_SNAPSHOT_CACHE", "1") == "1"
+SNAPSHOT_CACHE_DIR = Path(
+    os.environ.get("JIRA_SNAPSHOT_DIR", str(BASE_DIR / ".cache" / "prepared"))
+).expanduser()
+
+ANALYSIS_CACHE_BACKEND = os.environ.get("JIRA_ANALYSIS_CACHE", "sqlite")
+ANALYSIS_CACHE_PATH = Path(
+    os.environ.get("JIRA_ANALYSIS_CACHE_PATH", str(BASE_DIR / ".cache" / "analysis.sqlite3"))
+).expanduser()
+ANALYSIS_CACHE_MAX_ENTRIES = int(os.environ.get("JIRA_ANALYSIS_CACHE_MAX_ENTRIES", "2000"))
+ANALYSIS_CACHE_STORE_MAX_ENTRIES = int(os.environ.get("JIRA_ANALYSIS_CACHE_STORE_MAX_ENTRIES", "50000"))
+ANALYSIS_CACHE_TTL_SECONDS = float(os.environ.get("JIRA_ANALYSIS_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+# Thread pool shared by the analysis stages; 1 runs them sequentially.
+ANALYSIS_MAX_WORKERS = int(os.environ.get("JIRA_ANALYSIS_MAX_WORKERS", "8"))
+ANALYSIS_QUEUE_WORKERS = int(os.environ.get("JIRA_ANALYSIS_QUEUE_WORKERS", "2"))
+ANALYSIS_QUEUE_MAX_PENDING = int(os.environ.get("JIRA_ANALYSIS_QUEUE_MAX_PENDING", "10000"))
+ACTION_LOG_MAX_ISSUES = int(os.environ.get("JIRA_ACTION_LOG_MAX_ISSUES", "2000"))
+ACTION_LOG_MAX_ENTRIES = int(os.environ.get("JIRA_ACTION_LOG_MAX_ENTRIES", "50"))
+
 DEFAULT_TIME_WINDOW_DAYS = 30
 TOP_LIMIT = 10
 SIMULATION_MAX_BATCH = 50
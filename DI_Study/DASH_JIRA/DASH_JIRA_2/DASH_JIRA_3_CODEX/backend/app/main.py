@@ -9,7 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from .config import DEFAULT_TIME_WINDOW_DAYS
 from .logging_config import configure_logging
 from .middleware import RequestLoggingMiddleware
-from .schemas import IngestionResponse, JiraWebhookPayload
+from .schemas import BatchIngestionResponse, IngestionResponse, JiraWebhookPayload
 from .services.data_loader import repository
 from .services.ingestion import ingestion_service
 from .services.simulation import simulator
@@ -118,6 +118,16 @@ def ingest_jira_webhook(payload: JiraWebhookPayload) -> IngestionResponse:
     return IngestionResponse(issue_key=record["issue_key"], ingested=True)
 
 
+@app.post("/api/ingest/jira-webhook/batch", response_model=BatchIngestionResponse)
+def ingest_jira_webhook_batch(payloads: List[JiraWebhookPayload]) -> BatchIngestionResponse:
+    records, queued = ingestion_service.ingest_webhooks(payloads)
+    return BatchIngestionResponse(
+        issue_keys=[record["issue_key"] for record in records],
+        ingested=len(records),
+        analysis_queued=queued,
+    )
+
+
 @app.get("/api/issues/{issue_key}/taxonomy")
 def get_issue_taxonomy(issue_key: str) -> dict:
     try:
@@ -134,6 +144,14 @@ def get_issue_analysis(issue_key: str, refresh: bool = Query(False)) -> dict:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
+@app.get("/api/analysis/stats")
+def get_analysis_stats() -> dict:
+    try:
+        return repository.get_analysis_stats()
+    except KeyError as exc:
+        raise HTTPException(status_code=503, detail=str(exc)) from exc
+
+
 @app.get("/api/simulation/state")
 def get_simulation_state() -> dict:
     return simulator.get_state()
@@ -146,13 +164,24 @@ def reset_simulation() -> dict:
 
 
 @app.post("/api/simulation/next")
-def run_simulation(batch: int = Query(1, ge=1, le=50)) -> dict:
-    ingested = simulator.ingest_next(batch=batch)
+def run_simulation(
+    batch: int = Query(1, ge=1, le=50),
+    background: bool = Query(False),
+) -> dict:
+    ingested = simulator.ingest_next(batch=batch, background=background)
     summary = simulator.get_state()
     summary["last_ingested"] = ingested
     return summary
 
 
+@app.post("/api/simulation/replay")
+def replay_simulation() -> dict:
+    ingested = simulator.replay()
+    summary = simulator.get_state()
+    summary["replayed"] = ingested
+    return summary
+
+
 @app.get("/health")
 def health_check() -> dict:
     summary = repository.get_summary()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
@@ -60,3 +60,9 @@ class JiraWebhookPayload(BaseModel):
 class IngestionResponse(BaseModel):
     issue_key: str
     ingested: bool = True
+
+
+class BatchIngestionResponse(BaseModel):
+    issue_keys: List[str]
+    ingested: int
+    analysis_queued: int = 0
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+import pandas as pd
+from pandas.api.types import is_datetime64_dtype
+
+FACET_COLUMNS = ("status", "priority", "region", "category")
+GRANULARITIES = ("day", "week", "month", "year")
+
+DayCounts = Tuple[int, int, int]  # total, closed, high_priority
+
+# Timestamps are kept as epoch nanoseconds and days as epoch day numbers so
+# the initial build never materialises a Timestamp object per row.
+NS_PER_DAY = 86_400 * 10**9
+EPOCH = date(1970, 1, 1)
+
+
+def _text(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+def _flag(value: Any) -> bool:
+    if value is None:
+        return False
+    try:
+        if pd.isna(value):
+            return False
+    except (TypeError, ValueError):
+        pass
+    return bool(value)
+
+
+def _number(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return None if math.isnan(number) else number
+
+
+def _nanoseconds(value: Any) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        if pd.isna(value):
+            return None
+        return int(pd.Timestamp(value).value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _column_list(frame: pd.DataFrame, column: str) -> List[Any]:
+    """Column values coerced the way ``Contribution.from_values`` coerces a record."""
+
+    if column not in frame.columns:
+        default = False if column in ("is_closed", "is_high_priority") else None
+        return [default] * len(frame)
+    series = frame[column]
+    if column in FACET_COLUMNS:
+        values = series.astype(object)
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # IssueFrameStore only admits string categories.
+            return values.where(series.notna(), None).tolist()
+        return [_text(value) for value in values.tolist()]
+    if column in ("is_closed", "is_high_priority"):
+        return series.fillna(False).astype(bool).tolist()
+    if column == "resolution_hours":
+        numbers = pd.to_numeric(series, errors="coerce").astype(float)
+        return numbers.astype(object).where(numbers.notna(), None).tolist()
+    if not is_datetime64_dtype(series):
+        series = pd.to_datetime(series, errors="coerce")
+    values = series.to_numpy(dtype="datetime64[ns]").view("int64").astype(object)
+    values[series.isna().to_numpy()] = None
+    return values.tolist()
+
+
+def bucket_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    if granularity == "year":
+        return day.replace(month=1, day=1)
+    return day
+
+
+class Contribution(NamedTuple):
+    """What a single issue adds to the aggregates; subtracted on update."""
+
+    status: Optional[str]
+    priority: Optional[str]
+    region: Optional[str]
+    category: Optional[str]
+    is_closed: bool
+    is_high_priority: bool
+    resolution_hours: Optional[float]
+    created_at: Optional[int]
+    updated_at: Optional[int]
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any]) -> "Contribution":
+        # Mirrors the coercion IssueFrameStore applies when writing a record.
+        return cls(
+            status=_text(values.get("status")),
+            priority=_text(values.get("priority")),
+            region=_text(values.get("region")),
+            category=_text(values.get("category")),
+            is_closed=_flag(values.get("is_closed")),
+            is_high_priority=_flag(values.get("is_high_priority")),
+            resolution_hours=_number(values.get("resolution_hours")),
+            created_at=_nanoseconds(values.get("created_at")),
+            updated_at=_nanoseconds(values.get("updated_at")),
+        )
+
+
+class IssueAggregates:
+    """Dashboard aggregates maintained alongside the issue store.
+
+    Facet counters, summary totals and per-day creation buckets are adjusted
+    by subtracting an issue's previous contribution and adding the new one,
+    so dashboard reads cost O(buckets) instead of a scan of the frame.
+    Week/month/year series are rolled up from the day buckets on read.
+    """
+
+    def __init__(self, frame: pd.DataFrame, key_column: str = "issue_key") -> None:
+        self.key_column = key_column
+        self._lock = threading.RLock()
+        self._reset()
+        self.rebuild(frame)
+
+    def _reset(self) -> None:
+        self._contributions: Dict[str, Contribution] = {}
+        self._facets: Dict[str, Counter] = {column: Counter() for column in FACET_COLUMNS}
+        self._closed = 0
+        self._high_priority_open = 0
+        self._resolution_sum = 0.0
+        self._resolution_count = 0
+        self._updated_max: Optional[int] = None
+        self._updated_max_stale = False
+        self._days: Dict[int, List[int]] = {}
+        self._day_members: Dict[int, Dict[str, Contribution]] = {}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def rebuild(self, frame: pd.DataFrame) -> None:
+        keys = frame[self.key_column].tolist()
+        columns = {field: _column_list(frame, field) for field in Contribution._fields}
+        items = list(map(Contribution._make, zip(*columns.values())))
+        resolution = [value for value in columns["resolution_hours"] if value is not None]
+        with self._lock:
+            self._reset()
+            self._contributions = dict(zip(keys, items))
+            for column in FACET_COLUMNS:
+                self._facets[column] = Counter(columns[column])
+            self._closed = sum(columns["is_closed"])
+            self._high_priority_open = sum(
+                high and not closed
+                for high, closed in zip(columns["is_high_priority"], columns["is_closed"])
+            )
+            self._resolution_sum = float(sum(resolution))
+            self._resolution_count = len(resolution)
+            self._updated_max = max(
+                (value for value in columns["updated_at"] if value is not None), default=None
+            )
+            for key, item in zip(keys, items):
+                if item.created_at is None:
+                    continue
+                day = item.created_at // NS_PER_DAY
+                counts = self._days.setdefault(day, [0, 0, 0])
+                counts[0] += 1
+                counts[1] += item.is_closed
+                counts[2] += item.is_high_priority
+                self._day_members.setdefault(day, {})[key] = item
+
+    def apply(self, record: Mapping[str, Any]) -> None:
+        key = record.get(self.key_column)
+        if not key:
+            raise ValueError(f"{self.key_column} is required for ingestion")
+        contribution = Contribution.from_values(record)
+        with self._lock:
+            previous = self._contributions.get(key)
+            if previous is not None:
+                self._remove(key, previous)
+            self._add(key, contribution)
+
+    def apply_many(self, records: Iterable[Mapping[str, Any]]) -> None:
+        with self._lock:
+            for record in records:
+                self.apply(record)
+
+    def _add(self, key: str, item: Contribution) -> None:
+        self._contributions[key] = item
+        self._adjust(key, item, 1)
+        if item.updated_at is not None and not self._updated_max_stale:
+            if self._updated_max is None or item.updated_at > self._updated_max:
+                self._updated_max = item.updated_at
+
+    def _remove(self, key: str, item: Contribution) -> None:
+        del self._contributions[key]
+        self._adjust(key, item, -1)
+        if item.updated_at is not None and item.updated_at == self._updated_max:
+            # The max cannot be decremented; recompute lazily on the next read.
+            self._updated_max_stale = True
+
+    def _adjust(self, key: str, item: Contribution, sign: int) -> None:
+        for column in FACET_COLUMNS:
+            value = getattr(item, column)
+            counter = self._facets[column]
+            counter[value] += sign
+            if counter[value] <= 0:
+                del counter[value]
+        self._closed += sign * item.is_closed
+        self._high_priority_open += sign * (item.is_high_priority and not item.is_closed)
+        if item.resolution_hours is not None:
+            self._resolution_sum += sign * item.resolution_hours
+            self._resolution_count += sign
+        if item.created_at is None:
+            return
+        day = item.created_at // NS_PER_DAY
+        counts = self._days.setdefault(day, [0, 0, 0])
+        counts[0] += sign
+        counts[1] += sign * item.is_closed
+        counts[2] += sign * item.is_high_priority
+        members = self._day_members.setdefault(day, {})
+        if sign > 0:
+            members[key] = item
+        else:
+            members.pop(key, None)
+        if counts[0] <= 0:
+            del self._days[day]
+            del self._day_members[day]
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            if self._updated_max_stale:
+                self._updated_max = max(
+                    (
+                        item.updated_at
+                        for item in self._contributions.values()
+                        if item.updated_at is not None
+                    ),
+                    default=None,
+                )
+                self._updated_max_stale = False
+            total = len(self._contributions)
+            return {
+                "total": total,
+                "open": total - self._closed,
+                "closed": self._closed,
+                "high_priority_open": self._high_priority_open,
+                "avg_resolution_hours": (
+                    self._resolution_sum / self._resolution_count
+                    if self._resolution_count
+                    else float("nan")
+                ),
+                "last_updated": (
+                    pd.Timestamp(self._updated_max) if self._updated_max is not None else None
+                ),
+            }
+
+    def facet_counts(
+        self, column: str, fill_value: Optional[str] = None
+    ) -> List[Tuple[str, int]]:
+        """Counts ordered by frequency, then label.
+
+        Missing values are dropped, or folded into ``fill_value`` when given.
+        """
+
+        with self._lock:
+            counts = Counter(self._facets[column])
+        missing = counts.pop(None, 0)
+        if fill_value is not None and missing:
+            counts[fill_value] += missing
+        return sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def day_counts(self, since: Optional[pd.Timestamp] = None) -> Dict[date, DayCounts]:
+        """Per-day (total, closed, high_priority) for issues created at or after ``since``."""
+
+        with self._lock:
+            if since is None:
+                return {
+                    EPOCH + timedelta(days=day): tuple(counts)
+                    for day, counts in self._days.items()
+                }
+            cutoff = int(since.value)
+            first_day = cutoff // NS_PER_DAY
+            result: Dict[date, DayCounts] = {}
+            for day, counts in self._days.items():
+                if day > first_day:
+                    result[EPOCH + timedelta(days=day)] = tuple(counts)
+                elif day == first_day:
+                    # The cutoff falls inside this day; count its members exactly.
+                    members = [
+                        item
+                        for item in self._day_members[day].values()
+                        if item.created_at >= cutoff
+                    ]
+                    if members:
+                        result[EPOCH + timedelta(days=day)] = (
+                            len(members),
+                            sum(item.is_closed for item in members),
+                            sum(item.is_high_priority for item in members),
+                        )
+            return result
+
+    @staticmethod
+    def roll_up(days: Mapping[date, DayCounts], granularity: str) -> Dict[date, DayCounts]:
+        buckets: Dict[date, List[int]] = {}
+        for day, (total, closed, high_priority) in days.items():
+            counts = buckets.setdefault(bucket_start(day, granularity), [0, 0, 0])
+            counts[0] += total
+            counts[1] += closed
+            counts[2] += high_priority
+        return {start: tuple(counts) for start, counts in sorted(buckets.items())}
+
+    # ------------------------------------------------------------------
+    # Verification
+    # ------------------------------------------------------------------
+    def check_consistency(self, frame: pd.DataFrame) -> List[str]:
+        """Compare the incremental state with a full recompute from ``frame``."""
+
+        expected = IssueAggregates(frame, key_column=self.key_column)
+        mismatches: List[str] = []
+        with self._lock:
+            if self._contributions != expected._contributions:
+                mismatches.append("contributions")
+            for column in FACET_COLUMNS:
+                if self._facets[column] != expected._facets[column]:
+                    mismatches.append(f"facet:{column}")
+            if self._days != expected._days:
+                mismatches.append("day_buckets")
+            actual_summary = self.summary()
+        expected_summary = expected.summary()
+        for name, value in expected_summary.items():
+            current = actual_summary[name]
+            if isinstance(value, float):
+                same = (math.isnan(value) and math.isnan(current)) or math.isclose(
+                    value, current, rel_tol=1e-9, abs_tol=1e-6
+                )
+            else:
+                same = value == current
+            if not same:
+                mismatches.append(f"summary:{name} ({current!r} != {value!r})")
+        return mismatches
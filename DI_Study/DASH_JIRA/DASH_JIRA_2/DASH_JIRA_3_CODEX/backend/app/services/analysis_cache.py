@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("memory", "sqlite")
+
+_MISSING = object()
+
+
+def content_hash(*parts: Optional[str]) -> str:
+    """Digest of the fields an analysis result was computed from."""
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """Thread-safe in-memory LRU map with an optional time-to-live.
+
+    ``ttl_seconds <= 0`` disables expiry; ``max_entries <= 0`` disables the
+    size bound.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 0) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._items: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+            stored_at, value = item
+            if self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds:
+                del self._items[key]
+                return default
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._items[key] = (time.time(), value)
+            self._items.move_to_end(key)
+            if self.max_entries > 0:
+                while len(self._items) > self.max_entries:
+                    self._items.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            item = self._items.pop(key, None)
+        return default if item is None else item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class SQLiteAnalysisStore:
+    """Analysis results persisted in SQLite, keyed by issue key + content hash.
+
+    The database runs in WAL mode so several workers can share one file.
+    Rows older than ``ttl_seconds`` are ignored and purged on write; once
+    more than ``max_entries`` rows exist the least recently read ones are
+    dropped.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS analysis_cache (
+            issue_key TEXT PRIMARY KEY,
+            content_hash TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            accessed_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path: Path, max_entries: int = 50000, ttl_seconds: float = 0) -> None:
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(self._SCHEMA)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_analysis_cache_accessed "
+                "ON analysis_cache (accessed_at)"
+            )
+
+    def _expired_before(self, now: float) -> float:
+        return now - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+
+    def get(self, issue_key: str, digest: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT payload FROM analysis_cache "
+                "WHERE issue_key = ? AND content_hash = ? AND created_at >= ?",
+                (issue_key, digest, self._expired_before(now)),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE analysis_cache SET accessed_at = ? WHERE issue_key = ?", (now, issue_key)
+            )
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+
+    def set(self, issue_key: str, digest: str, payload: Dict[str, Any]) -> None:
+        now = time.time()
+        encoded = json.dumps(payload, ensure_ascii=False, default=str)
+        with self._lock, self._conn:
+            # One row per issue: an older content hash is superseded.
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analysis_cache VALUES (?, ?, ?, ?, ?)",
+                (issue_key, digest, encoded, now, now),
+            )
+            if self.ttl_seconds > 0:
+                self._conn.execute(
+                    "DELETE FROM analysis_cache WHERE created_at < ?", (self._expired_before(now),)
+                )
+            if self.max_entries > 0:
+                self._conn.execute(
+                    "DELETE FROM analysis_cache WHERE rowid IN ("
+                    "SELECT rowid FROM analysis_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def delete(self, issue_key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analysis_cache WHERE issue_key = ?", (issue_key,))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM analysis_cache")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class AnalysisResultCache:
+    """Per-issue analysis results: bounded in-memory LRU over an optional store.
+
+    An entry is only returned while the issue's content hash matches the one
+    it was computed for, so edited issues are re-analysed automatically.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_seconds: float = 0,
+        store: Optional[SQLiteAnalysisStore] = None,
+    ) -> None:
+        self.memory = LRUCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.store = store
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+
+    def get(self, issue_key: str, digest: str) -> Optional[Dict[str, Any]]:
+        entry = self.memory.get(issue_key)
+        if entry is not None and entry[0] == digest:
+            self.hits += 1
+            return entry[1]
+        if self.store is not None:
+            payload = self.store.get(issue_key, digest)
+            if payload is not None:
+                self.store_hits += 1
+                self.memory.set(issue_key, (digest, payload))
+                return payload
+        self.misses += 1
+        return None
+
+    def set(self, issue_key: str, digest: str, payload: Dict[str, Any]) -> None:
+        self.memory.set(issue_key, (digest, payload))
+        if self.store is not None:
+            try:
+                self.store.set(issue_key, digest, payload)
+            except sqlite3.Error as exc:
+                logger.warning("분석 캐시 저장 실패 (%s): %s", issue_key, exc)
+
+    def invalidate(self, issue_key: str) -> None:
+        self.memory.pop(issue_key)
+        if self.store is not None:
+            self.store.delete(issue_key)
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self.memory),
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+        }
+
+
+def build_analysis_cache(
+    backend: str, path: Path, max_entries: int, store_max_entries: int, ttl_seconds: float
+) -> AnalysisResultCache:
+    if backend not in BACKENDS:
+        logger.warning("알 수 없는 분석 캐시 백엔드 '%s' → memory 사용", backend)
+        backend = "memory"
+    store = None
+    if backend == "sqlite":
+        try:
+            store = SQLiteAnalysisStore(path, max_entries=store_max_entries, ttl_seconds=ttl_seconds)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning("분석 캐시 DB 초기화 실패 (%s): %s → memory 사용", path, exc)
+    return AnalysisResultCache(max_entries=max_entries, ttl_seconds=ttl_seconds, store=store)
@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from email.message import EmailMessage
+import hashlib
 import json
 import logging
 import os
 import smtplib
-from typing import Dict, List, Optional, Sequence, Tuple
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 from langdetect import detect, LangDetectException
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
+from ..config import (
+    ACTION_LOG_MAX_ENTRIES,
+    ACTION_LOG_MAX_ISSUES,
+    ANALYSIS_CACHE_BACKEND,
+    ANALYSIS_CACHE_MAX_ENTRIES,
+    ANALYSIS_CACHE_PATH,
+    ANALYSIS_CACHE_STORE_MAX_ENTRIES,
+    ANALYSIS_CACHE_TTL_SECONDS,
+    ANALYSIS_MAX_WORKERS,
+    ANALYSIS_QUEUE_MAX_PENDING,
+    ANALYSIS_QUEUE_WORKERS,
+)
+from .analysis_cache import LRUCache, build_analysis_cache, content_hash
+from .analysis_queue import AnalysisWorkQueue
+from .case_index import CaseSimilarityIndex
 from .llm_client import llm_client
 
 logger = logging.getLogger(__name__)
@@ -24,13 +41,32 @@ def _safe_text(value: Optional[str]) -> str:
     return str(value).strip()
 
 
+def _text_key(text: str) -> str:
+    # Whitespace-normalised so re-wrapped boilerplate shares one memo entry.
+    normalized = " ".join(text.split())
+    return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
+
 class TranslationService:
-    """Translation orchestrator supporting OpenAI and googletrans fallback."""
+    """Translation orchestrator supporting OpenAI and googletrans fallback.
+
+    Language detection and successful translations are memoised by a hash of
+    the whitespace-normalised text (LRU, ``TRANSLATION_MEMO_SIZE`` entries),
+    and ``translate_many`` sends the distinct strings that still need an LLM
+    translation as batched requests of up to ``TRANSLATION_BATCH_SIZE``.
+    """
 
     def __init__(self) -> None:
         self.llm = llm_client
         self.enable_online = os.getenv("ENABLE_ONLINE_TRANSLATION", "0") == "1"
         self.target_language = os.getenv("TRANSLATION_TARGET_LANG", "ko")
+        self.batch_size = max(1, int(os.getenv("TRANSLATION_BATCH_SIZE", "16")))
+        self.batch_chars = int(os.getenv("TRANSLATION_BATCH_CHARS", "6000"))
+        memo_size = int(os.getenv("TRANSLATION_MEMO_SIZE", "10000"))
+        self._detections = LRUCache(max_entries=memo_size)
+        self._translations = LRUCache(max_entries=memo_size)
+        self._counters: Counter = Counter()
+        self._counter_lock = threading.Lock()
         self._client = None
         if self.enable_online:
             try:
@@ -41,36 +77,139 @@ class TranslationService:
                 logger.warning("Google Translator 초기화 실패: %s", exc)
                 self._client = None
 
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._counter_lock:
+            self._counters[name] += amount
+
+    def stats(self) -> Dict[str, any]:
+        with self._counter_lock:
+            counters = dict(self._counters)
+
+        def rate(hits: str, misses: str) -> Optional[float]:
+            total = counters.get(hits, 0) + counters.get(misses, 0)
+            return round(counters.get(hits, 0) / total, 4) if total else None
+
+        return {
+            **counters,
+            "detect_hit_rate": rate("detect_hits", "detect_misses"),
+            "translate_hit_rate": rate("translate_hits", "translate_misses"),
+            "detect_memo_size": len(self._detections),
+            "translate_memo_size": len(self._translations),
+        }
+
     def _detect_language(self, text: str) -> str:
         if not text:
             return "unknown"
+        key = _text_key(text)
+        lang = self._detections.get(key)
+        if lang is not None:
+            self._count("detect_hits")
+            return lang
+        self._count("detect_misses")
         try:
-            return detect(text)
+            lang = detect(text)
         except LangDetectException:
-            return "unknown"
+            lang = "unknown"
+        self._detections.set(key, lang)
+        return lang
+
+    def _translation_key(self, text: str) -> Tuple[str, str]:
+        return self.target_language, _text_key(text)
 
     def _translate(self, text: str, lang: str) -> str:
         if not text:
             return ""
         if lang == self.target_language or lang == "unknown":
             return text
+        key = self._translation_key(text)
+        memoized = self._translations.get(key)
+        if memoized is not None:
+            self._count("translate_hits")
+            return memoized
+        self._count("translate_misses")
         if self.llm.available():
+            self._count("llm_requests")
             translated = self.llm.translate(text, self.target_language)
             if translated:
+                self._translations.set(key, translated)
                 return translated
         if self.enable_online and self._client:
             try:
                 result = self._client.translate(text, src=lang, dest=self.target_language)
+                self._translations.set(key, result.text)
                 return result.text
             except Exception as exc:  # pragma: no cover - optional dependency
                 logger.warning("온라인 번역 실패 (%s): %s", lang, exc)
+        # The placeholder is not memoised so a later LLM/online success replaces it.
         return f"[{self.target_language} 번역][{lang}] {text}"
 
+    def translate_many(self, texts: Sequence[str]) -> List[Tuple[str, str]]:
+        """(language, translation) per input, sharing work across duplicates."""
+
+        languages = [self._detect_language(text) for text in texts]
+        translations: List[Optional[str]] = [None] * len(texts)
+        pending: Dict[Tuple[str, str], List[int]] = {}
+        for idx, (text, lang) in enumerate(zip(texts, languages)):
+            if not text or lang == self.target_language or lang == "unknown":
+                translations[idx] = text or ""
+                continue
+            key = self._translation_key(text)
+            memoized = self._translations.get(key)
+            if memoized is not None:
+                self._count("translate_hits")
+                translations[idx] = memoized
+            else:
+                pending.setdefault(key, []).append(idx)
+        if pending and self.llm.available():
+            for chunk in self._batches(list(pending.items()), texts):
+                self._count("llm_requests")
+                self._count("llm_batched_texts", len(chunk))
+                values = self.llm.translate_batch(
+                    [texts[indices[0]] for _, indices in chunk], self.target_language
+                )
+                for (key, indices), value in zip(chunk, values or ()):
+                    if not value:
+                        continue
+                    self._translations.set(key, value)
+                    self._count("translate_misses")
+                    self._count("translate_hits", len(indices) - 1)
+                    for idx in indices:
+                        translations[idx] = value
+        # Anything the batch did not cover goes through the single-text path
+        # (memo first, so duplicates are still translated once).
+        for idx, value in enumerate(translations):
+            if value is None:
+                translations[idx] = self._translate(texts[idx], languages[idx])
+        return list(zip(languages, translations))  # type: ignore[arg-type]
+
+    def _batches(
+        self, items: List[Tuple[Tuple[str, str], List[int]]], texts: Sequence[str]
+    ) -> Iterator[List[Tuple[Tuple[str, str], List[int]]]]:
+        chunk: List[Tuple[Tuple[str, str], List[int]]] = []
+        size = 0
+        for item in items:
+            length = len(texts[item[1][0]])
+            if chunk and (len(chunk) >= self.batch_size or size + length > self.batch_chars):
+                yield chunk
+                chunk, size = [], 0
+            chunk.append(item)
+            size += length
+        if chunk:
+            yield chunk
+
     def translate_fields(self, summary: str, description: str) -> Dict[str, Optional[str]]:
-        summary_lang = self._detect_language(summary)
-        description_lang = self._detect_language(description)
-        translated_summary = self._translate(summary, summary_lang)
-        translated_desc = self._translate(description, description_lang)
+        summary_result, description_result = self.translate_many([summary, description])
+        return self.build_fields(summary, description, summary_result, description_result)
+
+    @staticmethod
+    def build_fields(
+        summary: str,
+        description: str,
+        summary_result: Tuple[str, str],
+        description_result: Tuple[str, str],
+    ) -> Dict[str, Optional[str]]:
+        summary_lang, translated_summary = summary_result
+        description_lang, translated_desc = description_result
         return {
             "summary_original": summary or None,
             "summary_translated": translated_summary or None,
@@ -195,47 +334,61 @@ class CaseRecommendation:
 
 
 class CaseMatcher:
-    """TF-IDF 기반 간단한 유사 케이스 검색기."""
-
-    def __init__(self, dataframe) -> None:
-        texts = (
-            dataframe["summary"].fillna("")
-            + " "
-            + dataframe["description"].fillna("")
-        ).tolist()
-        self.issue_keys = dataframe["issue_key"].tolist()
-        self.issue_lookup = {key: idx for idx, key in enumerate(self.issue_keys)}
-        self.vectorizer = TfidfVectorizer(max_features=4000, ngram_range=(1, 2))
-        self.matrix = self.vectorizer.fit_transform(texts) if texts else None
-        self._summaries = dataframe["summary"].fillna("").tolist()
-        self._descriptions = dataframe["description"].fillna("").tolist()
-        self._status = dataframe["status"].fillna("").tolist()
-        self._regions = dataframe["region"].fillna("Global").tolist()
+    """TF-IDF 기반 유사 케이스 검색기 (신규/변경 이슈 증분 반영)."""
+
+    def __init__(self, dataframe, backend: Optional[str] = None) -> None:
+        self.index = CaseSimilarityIndex(
+            backend=backend or os.getenv("CASE_INDEX_BACKEND", "exact"),
+            refit_ratio=float(os.getenv("CASE_INDEX_REFIT_RATIO", "0.2")),
+        )
+        keys = dataframe["issue_key"].tolist()
+        summaries = dataframe["summary"].fillna("").tolist()
+        descriptions = dataframe["description"].fillna("").tolist()
+        statuses = dataframe["status"].astype(object).fillna("").tolist()
+        regions = dataframe["region"].astype(object).fillna("Global").tolist()
+        self._cases: Dict[str, Tuple[str, str, str, str]] = {
+            key: case for key, *case in zip(keys, summaries, descriptions, statuses, regions)
+        }
+        self.index.fit(
+            keys, [f"{summary} {description}" for summary, description in zip(summaries, descriptions)]
+        )
+
+    def add_issues(self, records: Sequence[Dict[str, any]]) -> None:
+        """Index ingested or updated issues so they can be recommended."""
+
+        items = []
+        for record in records:
+            summary = record.get("summary") if isinstance(record.get("summary"), str) else ""
+            description = (
+                record.get("description") if isinstance(record.get("description"), str) else ""
+            )
+            self._cases[record["issue_key"]] = (
+                summary,
+                description,
+                record.get("status") or "",
+                record.get("region") or "Global",
+            )
+            items.append((record["issue_key"], f"{summary} {description}"))
+        self.index.upsert_many(items)
 
     def recommend(self, issue_key: str, text: str, top_k: int = 3) -> List[CaseRecommendation]:
-        if self.matrix is None or not text.strip():
+        if not text.strip():
             return []
-        query_vec = self.vectorizer.transform([text])
-        scores = cosine_similarity(query_vec, self.matrix).flatten()
-        current_idx = self.issue_lookup.get(issue_key)
-        if current_idx is not None:
-            scores[current_idx] = 0.0
-        top_indices = scores.argsort()[::-1][: top_k * 2]
         results: List[CaseRecommendation] = []
-        for idx in top_indices:
+        for key, score in self.index.search(text, limit=top_k * 2, exclude=issue_key):
             if len(results) >= top_k:
                 break
-            score = float(scores[idx])
             if score <= 0.01:
                 continue
+            summary, description, status, region = self._cases[key]
             rec = CaseRecommendation(
-                issue_key=self.issue_keys[idx],
-                summary=self._summaries[idx][:160],
+                issue_key=key,
+                summary=summary[:160],
                 similarity=round(score, 3),
                 action="과거 해결 방법 참고",
-                status=self._status[idx],
-                team=self._regions[idx],
-                details=self._descriptions[idx][:320] or None,
+                status=status,
+                team=region,
+                details=description[:320] or None,
             )
             results.append(rec)
         return results
@@ -413,16 +566,26 @@ class ActionLog:
 
 
 class ActionLogger:
-    def __init__(self) -> None:
-        self._logs: Dict[str, List[ActionLog]] = {}
+    """Recent stage logs per issue, bounded by issue count (LRU) and entries per issue."""
+
+    def __init__(
+        self, max_issues: int = ACTION_LOG_MAX_ISSUES, max_entries: int = ACTION_LOG_MAX_ENTRIES
+    ) -> None:
+        self.max_entries = max_entries
+        self._logs = LRUCache(max_entries=max_issues)
 
     def log(self, issue_key: str, stage: str, status: str, detail: str) -> None:
-        self._logs.setdefault(issue_key, []).append(
-            ActionLog(stage=stage, status=status, detail=detail)
-        )
+        logs = self._logs.get(issue_key)
+        if logs is None:
+            logs = deque(maxlen=self.max_entries if self.max_entries > 0 else None)
+            self._logs.set(issue_key, logs)
+        logs.append(ActionLog(stage=stage, status=status, detail=detail))
 
     def get(self, issue_key: str) -> List[Dict[str, str]]:
-        return [log.__dict__ for log in self._logs.get(issue_key, [])]
+        return [log.__dict__ for log in self._logs.get(issue_key, ())]
+
+    def clear(self, issue_key: str) -> None:
+        self._logs.pop(issue_key)
 
 
 class SLAService:
@@ -463,28 +626,88 @@ class AnalysisPipeline:
         self.notification_service = NotificationService()
         self.logger = ActionLogger()
         self.sla_service = SLAService()
-        self.cache: Dict[str, Dict[str, any]] = {}
+        self.cache = build_analysis_cache(
+            ANALYSIS_CACHE_BACKEND,
+            ANALYSIS_CACHE_PATH,
+            max_entries=ANALYSIS_CACHE_MAX_ENTRIES,
+            store_max_entries=ANALYSIS_CACHE_STORE_MAX_ENTRIES,
+            ttl_seconds=ANALYSIS_CACHE_TTL_SECONDS,
+        )
+        self.max_workers = ANALYSIS_MAX_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.queue = AnalysisWorkQueue(
+            self.get_issue_analysis,
+            workers=ANALYSIS_QUEUE_WORKERS,
+            max_pending=ANALYSIS_QUEUE_MAX_PENDING,
+        )
+
+    def _submit(self, fn, *args) -> Future:
+        """Run ``fn`` on the shared stage pool, or inline when it is disabled.
 
-    def _ensure_cached(self, issue_key: str) -> None:
-        if issue_key in self.cache:
-            if self._should_refresh_cache(issue_key):
-                self._invalidate_cache(issue_key)
-            return
+        Stage tasks never wait on other tasks, so a bounded pool cannot
+        deadlock; waiting happens only in the request thread.
+        """
+
+        if self.max_workers <= 1:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+            return future
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="analysis-stage"
+            )
+        return self._executor.submit(fn, *args)
+
+    def index_issues(self, records: Sequence[Dict[str, any]]) -> None:
+        self.case_matcher.add_issues(records)
+
+    def _content_digest(self, row) -> str:
+        return content_hash(
+            _safe_text(row.get("summary")),
+            _safe_text(row.get("description")),
+            _safe_text(row.get("region")),
+            _safe_text(row.get("category")),
+            self.translation_service.target_language,
+        )
+
+    def _ensure_cached(self, issue_key: str) -> Dict[str, any]:
         row = self.repository._get_issue_row(issue_key)
+        digest = self._content_digest(row)
+        cached = self.cache.get(issue_key, digest)
+        if cached is not None:
+            if not self._should_refresh_cache(cached):
+                return self._with_sla(row, cached)
+            self._invalidate_cache(issue_key)
         summary_text = _safe_text(row.get("summary"))
         description_text = _safe_text(row.get("description"))
         combined_text = f"{summary_text}\n{description_text}".strip()
 
-        translation = self.translation_service.translate_fields(summary_text, description_text)
+        # Translation, summarization and the per-case translations are
+        # independent (and the slow, network-bound part), so they run on the
+        # stage pool while case matching runs here; stage logs keep their order.
+        fields_future = self._submit(
+            self.translation_service.translate_many, [summary_text, description_text]
+        )
+        structured_future = self._submit(
+            self.summarizer.summarize, summary_text, description_text, row.get("region"), row.get("category")
+        )
+        case_recommendations = [
+            rec.__dict__ for rec in self.case_matcher.recommend(issue_key, combined_text, top_k=3)
+        ]
+        case_future = self._submit_case_translations(case_recommendations)
+
+        translation = self.translation_service.build_fields(
+            summary_text, description_text, *fields_future.result()
+        )
         self.logger.log(issue_key, "translation", "success", f"언어 감지: {translation['summary_language']}/{translation['description_language']}")
 
-        structured_summary = self.summarizer.summarize(summary_text, description_text, row.get("region"), row.get("category"))
+        structured_summary = structured_future.result()
         self.logger.log(issue_key, "summarization", "success", structured_summary["overview"][:80])
 
-        case_recommendations = [
-            rec.__dict__ for rec in self.case_matcher.recommend(issue_key, combined_text, top_k=3)
-        ]
-        case_recommendations = self._translate_case_recommendations(case_recommendations)
+        case_recommendations = self._collect_case_translations(case_recommendations, case_future)
         self.logger.log(issue_key, "case_matching", "success", f"{len(case_recommendations)}건 추천")
 
         record_dict = row.to_dict()
@@ -500,20 +723,26 @@ class AnalysisPipeline:
         sla_state = self.sla_service.evaluate(record_dict)
         self.logger.log(issue_key, "sla", sla_state["status"], f"마감 {sla_state['deadline']}")
 
-        self.cache[issue_key] = {
+        # SLA depends on status/priority/closure and the clock, none of which
+        # are in the content digest, so it is left out of the cached payload
+        # and evaluated on every read instead.
+        result = {
             "translation": translation,
             "summary": structured_summary,
             "case_recommendations": case_recommendations,
             "assignment": self._serialize_assignment(assignment),
             "notifications": [notif.__dict__ for notif in notifications],
             "logs": self.logger.get(issue_key),
-            "sla": sla_state,
         }
+        self.cache.set(issue_key, digest, result)
+        return {**result, "sla": sla_state}
 
-    def _should_refresh_cache(self, issue_key: str) -> bool:
+    def _with_sla(self, row, cached: Dict[str, any]) -> Dict[str, any]:
+        return {**cached, "sla": self.sla_service.evaluate(row.to_dict())}
+
+    def _should_refresh_cache(self, cached: Dict[str, any]) -> bool:
         if not self.translation_service.llm.available():
             return False
-        cached = self.cache.get(issue_key)
         if not cached:
             return False
         translation = cached.get("translation") or {}
@@ -533,23 +762,68 @@ class AnalysisPipeline:
 
         return needs_refresh("summary") or needs_refresh("description")
 
+    def invalidate(self, issue_keys: Sequence[str]) -> None:
+        for issue_key in dict.fromkeys(issue_keys):
+            self._invalidate_cache(issue_key)
+
     def _invalidate_cache(self, issue_key: str) -> None:
-        self.cache.pop(issue_key, None)
-        self.logger._logs.pop(issue_key, None)
+        self.cache.invalidate(issue_key)
+        self.logger.clear(issue_key)
 
-    def _translate_case_recommendations(self, cases: List[Dict[str, any]]) -> List[Dict[str, any]]:
+    @staticmethod
+    def _case_texts(cases: List[Dict[str, any]]) -> List[str]:
+        texts: List[str] = []
+        for item in cases:
+            texts.append(item.get("summary") or "")
+            if item.get("details"):
+                texts.append(item["details"])
+        return texts
+
+    def _submit_case_translations(self, cases: List[Dict[str, any]]) -> Future:
+        # All recommendation texts go out as one deduplicated batch.
+        return self._submit(self.translation_service.translate_many, self._case_texts(cases))
+
+    def _collect_case_translations(
+        self, cases: List[Dict[str, any]], future: Future
+    ) -> List[Dict[str, any]]:
+        results = iter(future.result())
         translated: List[Dict[str, any]] = []
         for item in cases:
-            summary = item.get("summary") or ""
-            details = item.get("details") or ""
-            lang_summary = self.translation_service._detect_language(summary)
-            lang_details = self.translation_service._detect_language(details)
-            item["summary_translated"] = self.translation_service._translate(summary, lang_summary)
-            if details:
-                item["details_translated"] = self.translation_service._translate(details, lang_details)
+            item["summary_translated"] = next(results)[1]
+            if item.get("details"):
+                item["details_translated"] = next(results)[1]
             translated.append(item)
         return translated
 
+    def prefetch_translations(self, records: Sequence[Dict[str, any]]) -> None:
+        """Translate a batch of incoming issues up front in batched LLM requests."""
+
+        texts: List[str] = []
+        for record in records:
+            texts.append(_safe_text(record.get("summary")))
+            texts.append(_safe_text(record.get("description")))
+        if texts:
+            self.translation_service.translate_many(texts)
+
+    def schedule(self, issue_keys: Sequence[str]) -> int:
+        """Queue analyses for background workers; returns how many were queued."""
+
+        return self.queue.enqueue(issue_keys)
+
+    def cached_analysis(self, issue_key: str) -> Optional[Dict[str, any]]:
+        """The analysis for the issue's current content if already computed."""
+
+        row = self.repository._get_issue_row(issue_key)
+        cached = self.cache.get(issue_key, self._content_digest(row))
+        return None if cached is None else self._with_sla(row, cached)
+
+    def stats(self) -> Dict[str, any]:
+        return {
+            "translation": self.translation_service.stats(),
+            "cache": self.cache.stats(),
+            "queue": self.queue.stats(),
+        }
+
     def _serialize_assignment(self, assignment: Dict[str, any]) -> Dict[str, any]:
         def serialize_candidate(candidate: Optional[AssignmentCandidate]) -> Optional[Dict[str, any]]:
             if not isinstance(candidate, AssignmentCandidate):
@@ -565,5 +839,4 @@ class AnalysisPipeline:
     def get_issue_analysis(self, issue_key: str, refresh: bool = False) -> Dict[str, any]:
         if refresh:
             self._invalidate_cache(issue_key)
-        self._ensure_cached(issue_key)
-        return self.cache[issue_key]
+        return self._ensure_cached(issue_key)
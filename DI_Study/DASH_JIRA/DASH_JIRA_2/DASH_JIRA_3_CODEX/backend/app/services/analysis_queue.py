@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class AnalysisWorkQueue:
+    """Background workers that run issue analyses off the request path.
+
+    Keys already waiting in the queue are not enqueued twice, and ``wait``
+    blocks until the given keys (or everything) have been processed, which
+    lets callers choose between fire-and-forget and a batched synchronous
+    run.
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[str], Any],
+        workers: int = 2,
+        max_pending: int = 10000,
+    ) -> None:
+        self._analyze = analyze
+        self.workers = max(1, workers)
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[str]" = queue.Queue()
+        self._pending: Set[str] = set()
+        self._condition = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._processed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    def _ensure_workers(self) -> None:
+        if self._threads:
+            return
+        for idx in range(self.workers):
+            thread = threading.Thread(
+                target=self._run, name=f"analysis-worker-{idx}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def enqueue(self, issue_keys: Iterable[str]) -> int:
+        queued = dropped = 0
+        with self._condition:
+            self._ensure_workers()
+            for key in issue_keys:
+                if not key or key in self._pending:
+                    continue
+                if self.max_pending > 0 and len(self._pending) >= self.max_pending:
+                    dropped += 1
+                    continue
+                self._pending.add(key)
+                self._queue.put(key)
+                queued += 1
+            self._dropped += dropped
+        if dropped:
+            logger.warning("분석 대기열 초과: %s건 제외", dropped)
+        return queued
+
+    def _run(self) -> None:
+        while True:
+            key = self._queue.get()
+            try:
+                self._analyze(key)
+                failed = False
+            except Exception as exc:
+                logger.warning("백그라운드 분석 실패 (%s): %s", key, exc)
+                failed = True
+            with self._condition:
+                self._pending.discard(key)
+                self._processed += 1
+                self._failed += failed
+                self._condition.notify_all()
+            self._queue.task_done()
+
+    def wait(self, issue_keys: Optional[Iterable[str]] = None, timeout: Optional[float] = None) -> bool:
+        """Block until ``issue_keys`` (default: all queued keys) are processed."""
+
+        targets = set(issue_keys) if issue_keys is not None else None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending if targets is None else self._pending & targets:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def is_pending(self, issue_key: str) -> bool:
+        with self._condition:
+            return issue_key in self._pending
+
+    def stats(self) -> Dict[str, int]:
+        with self._condition:
+            return {
+                "workers": self.workers,
+                "pending": len(self._pending),
+                "processed": self._processed,
+                "failed": self._failed,
+                "dropped": self._dropped,
+            }
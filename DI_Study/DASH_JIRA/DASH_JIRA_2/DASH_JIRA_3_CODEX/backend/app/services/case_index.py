@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("exact", "ivf")
+# Delta rows are frozen into CSR chunks of (at least) this size so a query
+# never re-stacks the whole delta segment.
+DELTA_CHUNK_ROWS = 256
+
+
+class _Segments(NamedTuple):
+    vectorizer: Optional[TfidfVectorizer]
+    base: Optional[sparse.csr_matrix]
+    keys: List[str]
+    centroids: Optional[np.ndarray]
+    lists: List[np.ndarray]
+
+
+class CaseSimilarityIndex:
+    """TF-IDF cosine index with a fitted base segment and an append-only delta.
+
+    The base segment is the corpus the vectorizer was fitted on. Issues added
+    or changed afterwards are transformed with the same vocabulary/IDF and
+    appended to a delta segment; replaced rows are tombstoned. Once the delta
+    (plus tombstones) outgrows ``refit_ratio`` of the base, the vectorizer is
+    refitted on the live corpus in a background thread and swapped in.
+
+    ``backend="ivf"`` adds an inverted-file ANN layer over the base segment:
+    rows are clustered with mini-batch k-means and a query only scores the
+    ``n_probe`` closest clusters (the delta is always scored exhaustively).
+    Rows are L2-normalised, so a sparse dot product is the cosine similarity.
+    """
+
+    def __init__(
+        self,
+        max_features: int = 4000,
+        ngram_range: Tuple[int, int] = (1, 2),
+        refit_ratio: float = 0.2,
+        min_refit: int = 256,
+        backend: str = "exact",
+        n_lists: Optional[int] = None,
+        n_probe: int = 8,
+    ) -> None:
+        if backend not in BACKENDS:
+            logger.warning("알 수 없는 케이스 인덱스 백엔드 '%s' → exact 사용", backend)
+            backend = "exact"
+        self.max_features = max_features
+        self.ngram_range = ngram_range
+        self.refit_ratio = refit_ratio
+        self.min_refit = min_refit
+        self.backend = backend
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self._lock = threading.RLock()
+        self._refit_thread: Optional[threading.Thread] = None
+        self._pending: Dict[str, str] = {}
+        self._texts: Dict[str, str] = {}
+        self._reset_segments(None, None, [])
+
+    def _reset_segments(
+        self,
+        vectorizer: Optional[TfidfVectorizer],
+        base: Optional[sparse.csr_matrix],
+        base_keys: List[str],
+    ) -> None:
+        self._vectorizer = vectorizer
+        self._base = base
+        self._base_keys = base_keys
+        self._base_alive = np.ones(len(base_keys), dtype=bool)
+        self._location: Dict[str, Tuple[int, int]] = {
+            key: (0, idx) for idx, key in enumerate(base_keys)
+        }
+        self._delta_keys: List[str] = []
+        self._delta_chunks: List[sparse.csr_matrix] = []
+        self._delta_tail: List[sparse.csr_matrix] = []
+        self._delta_tail_matrix: Optional[sparse.csr_matrix] = None
+        self._delta_alive: List[bool] = []
+        self._dead = 0
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: List[np.ndarray] = []
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def fit(self, keys: Sequence[str], texts: Sequence[str]) -> None:
+        with self._lock:
+            self._texts = dict(zip(keys, texts))
+            self._install(self._build(list(self._texts.keys()), list(self._texts.values())))
+
+    def _build(self, keys: List[str], texts: List[str]) -> _Segments:
+        vectorizer = TfidfVectorizer(max_features=self.max_features, ngram_range=self.ngram_range)
+        try:
+            base = vectorizer.fit_transform(texts).tocsr() if texts else None
+        except ValueError:  # empty vocabulary
+            base = None
+        if base is None:
+            return _Segments(None, None, [], None, [])
+        centroids, lists = (None, [])
+        if self.backend == "ivf":
+            centroids, lists = self._cluster(base)
+        return _Segments(vectorizer, base, keys, centroids, lists)
+
+    def _install(self, state: _Segments) -> None:
+        self._reset_segments(state.vectorizer, state.base, state.keys)
+        self._centroids, self._lists = state.centroids, state.lists
+
+    def _cluster(self, base: sparse.csr_matrix) -> Tuple[Optional[np.ndarray], List[np.ndarray]]:
+        rows = base.shape[0]
+        n_lists = self.n_lists or int(min(1024, max(8, round(math.sqrt(rows)))))
+        if rows < n_lists * 4:
+            return None, []
+        kmeans = MiniBatchKMeans(
+            n_clusters=n_lists, random_state=0, n_init=3, batch_size=2048
+        ).fit(base)
+        assignment = kmeans.labels_
+        order = np.argsort(assignment, kind="stable")
+        bounds = np.searchsorted(assignment[order], np.arange(n_lists + 1))
+        lists = [order[bounds[idx]: bounds[idx + 1]] for idx in range(n_lists)]
+        return normalize(kmeans.cluster_centers_), lists
+
+    # ------------------------------------------------------------------
+    # Incremental maintenance
+    # ------------------------------------------------------------------
+    def upsert(self, key: str, text: str) -> None:
+        with self._lock:
+            if self._texts.get(key) == text and key in self._location:
+                return
+            self._texts[key] = text
+            if self._refit_thread is not None:
+                self._pending[key] = text
+            if self._vectorizer is None:
+                self.fit(list(self._texts.keys()), list(self._texts.values()))
+                return
+            self._tombstone(key)
+            self._append_delta(key, self._vectorizer.transform([text]).tocsr())
+            if self._needs_refit():
+                self.refit(block=False)
+
+    def upsert_many(self, items: Iterable[Tuple[str, str]]) -> None:
+        with self._lock:
+            for key, text in items:
+                self.upsert(key, text)
+
+    def _tombstone(self, key: str) -> None:
+        location = self._location.pop(key, None)
+        if location is None:
+            return
+        segment, idx = location
+        if segment == 0:
+            self._base_alive[idx] = False
+        else:
+            self._delta_alive[idx] = False
+        self._dead += 1
+
+    def _append_delta(self, key: str, row: sparse.csr_matrix) -> None:
+        self._location[key] = (1, len(self._delta_keys))
+        self._delta_keys.append(key)
+        self._delta_alive.append(True)
+        self._delta_tail.append(row)
+        self._delta_tail_matrix = None
+        if len(self._delta_tail) >= DELTA_CHUNK_ROWS:
+            chunks = self._delta_chunks
+            chunks.append(sparse.vstack(self._delta_tail, format="csr"))
+            self._delta_tail = []
+            # Merge equal-sized neighbours so only O(log n) chunks are scored.
+            while len(chunks) > 1 and chunks[-1].shape[0] >= chunks[-2].shape[0]:
+                last = chunks.pop()
+                chunks[-1] = sparse.vstack([chunks[-1], last], format="csr")
+
+    def _needs_refit(self) -> bool:
+        if self._refit_thread is not None:
+            return False
+        churn = len(self._delta_keys) + self._dead
+        return churn >= max(self.min_refit, self.refit_ratio * len(self._base_keys))
+
+    def refit(self, block: bool = True) -> None:
+        """Refit on the live corpus; upserts arriving meanwhile are replayed."""
+
+        with self._lock:
+            if self._refit_thread is not None:
+                thread = self._refit_thread
+            else:
+                keys = list(self._texts.keys())
+                texts = list(self._texts.values())
+                self._pending = {}
+                thread = threading.Thread(
+                    target=self._run_refit, args=(keys, texts), name="case-index-refit", daemon=True
+                )
+                self._refit_thread = thread
+                thread.start()
+        if block:
+            thread.join()
+
+    def _run_refit(self, keys: List[str], texts: List[str]) -> None:
+        try:
+            state = self._build(keys, texts)
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("케이스 인덱스 재학습 실패: %s", exc)
+            with self._lock:
+                self._refit_thread = None
+            return
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._install(state)
+            self._refit_thread = None
+            if self._vectorizer is not None:
+                for key, text in pending.items():
+                    self._tombstone(key)
+                    self._append_delta(key, self._vectorizer.transform([text]).tocsr())
+        logger.info("케이스 인덱스 재학습 완료: %s건", len(keys))
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._location)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._location
+
+    def search(
+        self, text: str, limit: int, exclude: Optional[str] = None
+    ) -> List[Tuple[str, float]]:
+        """Up to ``limit`` (key, cosine) pairs, best first, ties by latest row."""
+
+        with self._lock:
+            if self._vectorizer is None or limit <= 0:
+                return []
+            encoded = self._vectorizer.transform([text])
+            if not encoded.nnz:
+                return []
+            query = encoded.toarray().ravel()
+            offset = len(self._base_keys)
+            rows, scores = self._score_base(query)
+            delta_scores = self._score_delta(query)
+            if len(delta_scores):
+                rows = np.concatenate([rows, np.arange(len(delta_scores)) + offset])
+                scores = np.concatenate([scores, delta_scores])
+            if exclude is not None and exclude in self._location:
+                segment, idx = self._location[exclude]
+                scores = np.where(rows == idx + segment * offset, -1.0, scores)
+            if len(scores) > limit:
+                top = np.argpartition(-scores, limit - 1)[:limit]
+                rows, scores = rows[top], scores[top]
+            order = np.lexsort((-rows, -scores))
+            return [
+                (
+                    self._base_keys[row] if row < offset else self._delta_keys[row - offset],
+                    float(score),
+                )
+                for row, score in zip(rows[order].tolist(), scores[order].tolist())
+                if score >= 0
+            ]
+
+    def _score_base(self, query: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if self._base is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if self._centroids is not None:
+            closeness = self._centroids @ query
+            probe = np.argpartition(-closeness, min(self.n_probe, len(closeness)) - 1)
+            rows = np.concatenate([self._lists[idx] for idx in probe[: self.n_probe]])
+            rows = np.sort(rows)
+            scores = self._base[rows] @ query
+        else:
+            rows = np.arange(self._base.shape[0])
+            scores = self._base @ query
+        scores = np.where(self._base_alive[rows], scores, -1.0)
+        return rows, scores
+
+    def _score_delta(self, query: np.ndarray) -> np.ndarray:
+        segments = list(self._delta_chunks)
+        if self._delta_tail:
+            if self._delta_tail_matrix is None:
+                self._delta_tail_matrix = sparse.vstack(self._delta_tail, format="csr")
+            segments.append(self._delta_tail_matrix)
+        if not segments:
+            return np.empty(0)
+        scores = np.concatenate([segment @ query for segment in segments])
+        return np.where(np.asarray(self._delta_alive, dtype=bool), scores, -1.0)
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import date, datetime, timedelta
+from functools import lru_cache
 import logging
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from ..config import (
@@ -16,7 +18,11 @@ from ..config import (
     HIGH_PRIORITY_MARKERS,
     TOP_LIMIT,
 )
+from .aggregate_store import GRANULARITIES, IssueAggregates
+from .issue_store import IssueFrameStore
 from .reference_data import reference_data
+from .search_index import TextSearchIndex, facet_mask, ordered_positions
+from .snapshot_cache import prepared_frame_cache
 
 
 def _normalize_string(value: Any) -> Optional[str]:
@@ -26,14 +32,27 @@ def _normalize_string(value: Any) -> Optional[str]:
     return None
 
 
+def _none_if_na(value: Any) -> Any:
+    return None if value is None or pd.isna(value) else value
+
+
 def _coalesce(df: pd.DataFrame, columns: List[str]) -> pd.Series:
     valid_cols = [col for col in columns if col in df.columns]
     if not valid_cols:
         return pd.Series([None] * len(df), index=df.index)
-    filled = df[valid_cols].replace(r"^\s*$", pd.NA, regex=True).bfill(axis=1)
+    filled = pd.DataFrame(
+        {col: _blank_to_na(df[col]) for col in valid_cols}, index=df.index
+    ).bfill(axis=1)
     return filled.iloc[:, 0]
 
 
+def _blank_to_na(series: pd.Series) -> pd.Series:
+    if series.dtype != object:
+        return series
+    blank = series.str.strip().eq("")
+    return series.mask(blank.fillna(False).astype(bool))
+
+
 RAW_DATA_COLUMNS = [
     "Issue key",
     "Issue id",
@@ -366,6 +385,8 @@ COUNTRY_TOKEN_MAP.update(
 )
 
 TOKEN_PATTERN = re.compile(r"[\[(]([A-Za-z0-9_\\-\\/]{2,20})[\])]")
+TOKEN_SPLIT_PATTERN = re.compile(r"[^A-Za-z0-9]+")
+NON_ALPHA_PATTERN = re.compile(r"[^A-Za-z]")
 
 
 def _normalize_placeholder(value: Optional[str]) -> Optional[str]:
@@ -390,7 +411,7 @@ def _normalize_country_code(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
     raw = value.strip().upper()
-    token = re.sub(r"[^A-Za-z]", "", raw)
+    token = NON_ALPHA_PATTERN.sub("", raw)
     if not token:
         return None
     name_mapped = COUNTRY_NAME_TO_CODE.get(raw) or COUNTRY_NAME_TO_CODE.get(token)
@@ -408,7 +429,7 @@ def _finalize_country_code(value: Optional[str]) -> Optional[str]:
         return normalized
     if not value:
         return None
-    token = re.sub(r"[^A-Za-z]", "", str(value)).upper()
+    token = NON_ALPHA_PATTERN.sub("", str(value)).upper()
     return token or None
 
 
@@ -418,7 +439,7 @@ def _extract_tokens(*texts: Optional[str]) -> List[str]:
         if not text:
             continue
         for raw in TOKEN_PATTERN.findall(text):
-            parts = re.split(r"[^A-Za-z0-9]+", raw)
+            parts = TOKEN_SPLIT_PATTERN.split(raw)
             tokens.extend(
                 part.upper()
                 for part in parts
@@ -451,6 +472,145 @@ def _resolve_region_from_site(info) -> Optional[str]:
         return COUNTRY_TO_REGION.get(country)
     return None
 
+
+def _region_for_country(country: Optional[str]) -> Optional[str]:
+    if not country:
+        return None
+    normalized = _normalize_country_code(country)
+    if not normalized:
+        return None
+    return COUNTRY_TO_REGION.get(normalized)
+
+
+def _map_distinct(series: pd.Series, func: Callable[[Any], Any]) -> pd.Series:
+    """Apply ``func`` once per distinct value; missing values map to ``func(None)``."""
+
+    codes, uniques = pd.factorize(series)
+    table = np.empty(len(uniques) + 1, dtype=object)
+    for idx, value in enumerate(uniques):
+        table[idx] = func(value)
+    table[-1] = func(None)  # factorize codes missing values as -1
+    return pd.Series(table[codes], index=series.index, dtype=object)
+
+
+class GeoHits(NamedTuple):
+    """First matches for one text, one field per lookup the resolvers try."""
+
+    country_token: Optional[str]
+    country_site: Optional[str]
+    region_token: Optional[str]
+    region_site: Optional[str]
+    region_country: Optional[str]
+
+
+EMPTY_GEO_HITS = GeoHits(None, None, None, None, None)
+
+
+def _first_hits(hits: Iterable[GeoHits]) -> GeoHits:
+    merged = list(EMPTY_GEO_HITS)
+    for hit in hits:
+        for idx, value in enumerate(hit):
+            if merged[idx] is None and value:
+                merged[idx] = value
+    return GeoHits(*merged)
+
+
+@lru_cache(maxsize=4096)
+def _token_geo_hits(token: str) -> GeoHits:
+    site_info = reference_data.resolve_site_code(token)
+    return GeoHits(
+        country_token=COUNTRY_TOKEN_MAP.get(token) or None,
+        country_site=_resolve_country_from_site(site_info) or None,
+        region_token=REGION_TOKEN_MAP.get(token) or None,
+        region_site=_resolve_region_from_site(site_info) or None,
+        region_country=COUNTRY_TO_REGION.get(COUNTRY_TOKEN_MAP.get(token, token)) or None,
+    )
+
+
+@lru_cache(maxsize=65536)
+def _text_geo_hits(text: str) -> GeoHits:
+    tokens = _extract_tokens(text)
+    if not tokens:
+        return EMPTY_GEO_HITS
+    if len(tokens) == 1:
+        return _token_geo_hits(tokens[0])
+    return _first_hits(_token_geo_hits(token) for token in tokens)
+
+
+class GeoResolutionEngine:
+    """Column-wise equivalent of the row-wise country/region resolvers.
+
+    ``JiraDataRepository._resolve_country_value`` and
+    ``_resolve_region_value`` scan the bracketed tokens of summary then
+    description in priority passes (token map, site code, country group).
+    Because each pass takes the first hit in summary before description, the
+    combined answer can be assembled from per-text hits, which are memoized
+    per token and per text and computed once per distinct summary/description.
+    """
+
+    REGION_PLACEHOLDERS = {"", "UNSPECIFIED", "UNKNOWN", "NONE", "N/A"}
+    NA_COUNTRIES = {"US", "CA"}
+
+    def __init__(self, summary: pd.Series, description: pd.Series) -> None:
+        self._index = summary.index
+        self._summary_hits = self._hit_columns(summary)
+        self._description_hits = self._hit_columns(description)
+
+    @staticmethod
+    def _hit_columns(texts: pd.Series) -> Dict[str, np.ndarray]:
+        codes, uniques = pd.factorize(texts)
+        table = [
+            _text_geo_hits(text) if isinstance(text, str) else EMPTY_GEO_HITS
+            for text in uniques
+        ]
+        table.append(EMPTY_GEO_HITS)  # factorize codes missing values as -1
+        columns: Dict[str, np.ndarray] = {}
+        for idx, field_name in enumerate(GeoHits._fields):
+            values = np.empty(len(table), dtype=object)
+            values[:] = [hits[idx] for hits in table]
+            columns[field_name] = values[codes]
+        return columns
+
+    def _first_hit(self, *fields: str) -> pd.Series:
+        result: Optional[np.ndarray] = None
+        for field_name in fields:
+            for hits in (self._summary_hits, self._description_hits):
+                column = hits[field_name]
+                if result is None:
+                    result = column.copy()
+                else:
+                    missing = pd.isna(result)
+                    result[missing] = column[missing]
+        return pd.Series(result, index=self._index, dtype=object)
+
+    def resolve_countries(self, current: pd.Series) -> pd.Series:
+        normalized_current = _map_distinct(current, _finalize_country_code)
+        inferred = _map_distinct(
+            self._first_hit("country_token", "country_site"), _finalize_country_code
+        )
+        keep_current = _map_distinct(
+            normalized_current, lambda value: bool(value) and len(value) == 2
+        ).astype(bool)
+        fallback = inferred.where(inferred.notna(), normalized_current)
+        return normalized_current.where(keep_current, fallback)
+
+    def resolve_regions(self, current: pd.Series, country: pd.Series) -> pd.Series:
+        normalized_current = _map_distinct(current, _normalize_region_label)
+        inferred = self._first_hit("region_token", "region_site", "region_country")
+        inferred = inferred.where(
+            inferred.notna(), _map_distinct(country, _region_for_country)
+        )
+        upper_current = _map_distinct(
+            normalized_current, lambda value: value.upper() if value else None
+        )
+        prefer_inferred = upper_current.isin(self.REGION_PLACEHOLDERS) | (
+            (upper_current == "NA") & ~country.isin(self.NA_COUNTRIES)
+        )
+        fallback = inferred.where(inferred.notna(), normalized_current)
+        resolved = normalized_current.where(~prefer_inferred, fallback)
+        return resolved.where(normalized_current.notna(), inferred)
+
+
 CATEGORY_KEYWORDS = {
     "Tagging Request": [
         "tag",
@@ -532,6 +692,9 @@ class IssueSummary:
     is_high_priority: bool
 
 
+SEARCH_ITEM_COLUMNS = [item.name for item in fields(IssueSummary)]
+
+
 class JiraDataRepository:
     """Loads the Jira CSV once and exposes handy analytics helpers."""
 
@@ -539,12 +702,14 @@ class JiraDataRepository:
         self.data_path = Path(data_path)
         if not self.data_path.exists():
             raise FileNotFoundError(f"Dataset not found: {self.data_path}")
-        self._df = self._load_dataframe()
+        self._store = IssueFrameStore(self._load_dataframe())
+        self._aggregates = IssueAggregates(self._store.frame)
+        self._text_index = TextSearchIndex()
         self._analysis_engine = None
 
     @property
     def dataframe(self) -> pd.DataFrame:
-        return self._df
+        return self._store.frame
 
     def attach_analysis_engine(self, engine) -> None:
         self._analysis_engine = engine
@@ -554,6 +719,16 @@ class JiraDataRepository:
             raise KeyError("analysis engine not ready")
         return self._analysis_engine.get_issue_analysis(issue_key, refresh=refresh)
 
+    def schedule_analysis(self, issue_keys: List[str]) -> int:
+        if not self._analysis_engine:
+            return 0
+        return self._analysis_engine.schedule(issue_keys)
+
+    def get_analysis_stats(self) -> Dict[str, Any]:
+        if not self._analysis_engine:
+            raise KeyError("analysis engine not ready")
+        return self._analysis_engine.stats()
+
     # ------------------------------------------------------------------
     # Data loading helpers
     # ------------------------------------------------------------------
@@ -566,12 +741,30 @@ class JiraDataRepository:
 
     @classmethod
     def _load_and_prepare(cls, path: Path) -> pd.DataFrame:
+        df = prepared_frame_cache.load(path)
+        if df is None:
+            df = cls._prepare_frame(cls._read_raw_frame(path))
+            prepared_frame_cache.store(path, df)
+        return cls._with_age_days(df)
+
+    @staticmethod
+    def _with_age_days(df: pd.DataFrame) -> pd.DataFrame:
+        # Depends on the current time, so it is never part of a snapshot.
+        if "created_at" in df.columns:
+            now = pd.Timestamp.utcnow().tz_localize(None)
+            df["age_days"] = (now - df["created_at"]).dt.days
+        return df
+
+    @staticmethod
+    def _read_raw_frame(path: Path) -> pd.DataFrame:
         available_columns = pd.read_csv(path, nrows=0).columns.tolist()
         usecols = [col for col in RAW_DATA_COLUMNS if col in available_columns]
         df = pd.read_csv(path, usecols=usecols)
         rename_map = {k: v for k, v in COLUMN_RENAMES.items() if k in df.columns}
-        df = df.rename(columns=rename_map)
+        return df.rename(columns=rename_map)
 
+    @classmethod
+    def _prepare_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
         df = df.dropna(subset=["issue_key"])
         df = df.replace({pd.NA: None})
 
@@ -585,50 +778,43 @@ class JiraDataRepository:
         df["created_date"] = df["created_at"].dt.date
         df["updated_date"] = df["updated_at"].dt.date
 
-        df["region"] = (
-            _coalesce(df, ["ads_region", "project_region", "region_es2"])
-            .apply(_normalize_string)
-            .apply(_normalize_placeholder)
-            .apply(_normalize_region_label)
+        region_seed = _map_distinct(
+            _coalesce(df, ["ads_region", "project_region", "region_es2"]),
+            lambda value: _normalize_region_label(
+                _normalize_placeholder(_normalize_string(value))
+            ),
         )
-        df["country"] = (
-            _coalesce(df, ["country_es1", "country_es2", "country_aeme"])
-            .apply(_normalize_string)
-            .apply(_normalize_placeholder)
-            .apply(_normalize_country_code)
+        country_seed = _map_distinct(
+            _coalesce(df, ["country_es1", "country_es2", "country_aeme"]),
+            lambda value: _normalize_country_code(
+                _normalize_placeholder(_normalize_string(value))
+            ),
         )
-        df["category"] = _coalesce(
-            df, ["category_raw", "category_sub", "request_type"]
-        ).apply(_normalize_string)
-        df["root_cause"] = _coalesce(df, ["root_cause", "cause"]).apply(
-            _normalize_string
+        df["category"] = _map_distinct(
+            _coalesce(df, ["category_raw", "category_sub", "request_type"]),
+            _normalize_string,
         )
-
-        df["country"] = df.apply(
-            lambda row: cls._resolve_country_value(
-                row.get("country"), row.get("summary"), row.get("description")
-            ),
-            axis=1,
+        df["root_cause"] = _map_distinct(
+            _coalesce(df, ["root_cause", "cause"]), _normalize_string
         )
-        df["region"] = df.apply(
-            lambda row: cls._resolve_region_value(
-                row.get("region"),
-                row.get("country"),
-                row.get("summary"),
-                row.get("description"),
-            ),
-            axis=1,
+
+        empty_text = pd.Series(None, index=df.index, dtype=object)
+        geo = GeoResolutionEngine(
+            df["summary"] if "summary" in df.columns else empty_text,
+            df["description"] if "description" in df.columns else empty_text,
         )
+        df["country"] = geo.resolve_countries(country_seed)
+        df["region"] = geo.resolve_regions(region_seed, df["country"])
 
         df["status"] = df["status"].fillna("Unknown")
         df["priority"] = df["priority"].fillna("Unspecified")
 
-        df["is_closed"] = df["status"].str.lower().apply(cls._is_closed_status)
-        df["is_high_priority"] = df["priority"].str.lower().apply(cls._is_high_priority)
-
-        if "created_at" in df.columns:
-            now = pd.Timestamp.utcnow().tz_localize(None)
-            df["age_days"] = (now - df["created_at"]).dt.days
+        df["is_closed"] = _map_distinct(
+            df["status"].str.lower(), cls._is_closed_status
+        ).astype(bool)
+        df["is_high_priority"] = _map_distinct(
+            df["priority"].str.lower(), cls._is_high_priority
+        ).astype(bool)
 
         if "resolved_at" in df.columns:
             df["resolution_hours"] = (
@@ -757,130 +943,211 @@ class JiraDataRepository:
 
         return normalized
 
+    def _prepare_records(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Batch equivalent of ``_prepare_record``.
+
+        String normalisation runs once per distinct value, country/region
+        resolution goes through ``GeoResolutionEngine`` and dates are coerced
+        once per distinct value, so a batch costs a handful of column passes
+        instead of the per-record helpers.
+        """
+
+        if not records:
+            return []
+        keys = [record.get("issue_key") for record in records]
+        if not all(keys):
+            raise ValueError("issue_key is required for ingestion")
+
+        def column(name: str) -> pd.Series:
+            return pd.Series([record.get(name) for record in records], dtype=object)
+
+        def first_truthy(*names: str) -> pd.Series:
+            values = zip(*(column(name).tolist() for name in names))
+            return pd.Series([next((v for v in row if v), row[-1]) for row in values], dtype=object)
+
+        status = pd.Series([record.get("status") or "Unknown" for record in records], dtype=object)
+        priority = pd.Series(
+            [record.get("priority") or "Unspecified" for record in records], dtype=object
+        )
+        region_seed = _map_distinct(
+            column("region"),
+            lambda value: _normalize_region_label(
+                _normalize_placeholder(_normalize_string(value))
+            ),
+        )
+        country_seed = _map_distinct(
+            column("country"),
+            lambda value: _finalize_country_code(
+                _normalize_placeholder(_normalize_string(value))
+            ),
+        )
+        geo = GeoResolutionEngine(column("summary"), column("description"))
+        country = geo.resolve_countries(country_seed)
+        region = geo.resolve_regions(region_seed, country)
+
+        dates = {
+            date_col: _map_distinct(column(date_col), self._coerce_datetime_value).tolist()
+            for date_col in ["created_at", "updated_at", "resolved_at"]
+        }
+        is_closed = _map_distinct(status, self._is_closed_status).astype(bool)
+        is_high_priority = _map_distinct(priority, self._is_high_priority).astype(bool)
+        now = pd.Timestamp.utcnow().tz_localize(None)
+
+        derived: Dict[str, List[Any]] = {
+            "issue_key": keys,
+            "status": status.tolist(),
+            "priority": priority.tolist(),
+            "region": region.tolist(),
+            "country": country.tolist(),
+            "category": _map_distinct(
+                first_truthy("category", "category_sub", "request_type"), _normalize_string
+            ).tolist(),
+            "root_cause": _map_distinct(
+                first_truthy("root_cause", "cause"), _normalize_string
+            ).tolist(),
+            "cause": _map_distinct(column("cause"), _normalize_string).tolist(),
+            "urgency_raw": _map_distinct(
+                first_truthy("urgency_raw", "urgency"), _normalize_string
+            ).tolist(),
+            **dates,
+            "created_date": [ts.date() if ts else None for ts in dates["created_at"]],
+            "updated_date": [ts.date() if ts else None for ts in dates["updated_at"]],
+            "is_closed": is_closed.tolist(),
+            "is_high_priority": is_high_priority.tolist(),
+            "status_bucket": ["Closed" if flag else "Open" for flag in is_closed.tolist()],
+            "age_days": [
+                int((now - created).days) if created is not None else None
+                for created in dates["created_at"]
+            ],
+            "resolution_hours": [
+                (resolved - created).total_seconds() / 3600
+                if created is not None and resolved is not None
+                else None
+                for created, resolved in zip(dates["created_at"], dates["resolved_at"])
+            ],
+        }
+        normalized = [record.copy() for record in records]
+        for name, values in derived.items():
+            for item, value in zip(normalized, values):
+                item[name] = value
+        return normalized
+
     # ------------------------------------------------------------------
     # Mutation helpers (webhook ingestion)
     # ------------------------------------------------------------------
     def upsert_issue(self, record: Dict[str, Any]) -> Dict[str, Any]:
         normalized = self._prepare_record(record)
-        # Ensure dataframe has all required columns
-        for column in normalized.keys():
-            if column not in self._df.columns:
-                self._df[column] = None
-
-        new_row = pd.DataFrame([normalized])
-        self._df = (
-            pd.concat([self._df, new_row], ignore_index=True)
-            .drop_duplicates(subset=["issue_key"], keep="last")
-            .reset_index(drop=True)
-        )
+        pos = self._store.upsert(normalized)
+        self._aggregates.apply(normalized)
+        self._text_index.update(pos, normalized)
+        if self._analysis_engine:
+            self._analysis_engine.index_issues([normalized])
+        return normalized
+
+    def upsert_issues(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        normalized = self._prepare_records(list(records))
+        reingested = [record["issue_key"] for record in normalized if record["issue_key"] in self._store]
+        self._store.upsert_many(normalized)
+        self._aggregates.apply_many(normalized)
+        for record in normalized:
+            self._text_index.update(self._store.position(record["issue_key"]), record)
+        if self._analysis_engine:
+            self._analysis_engine.index_issues(normalized)
+            # Re-ingested issues get a fresh analysis, as an explicit refresh would.
+            self._analysis_engine.invalidate(reingested)
         return normalized
 
+    def verify_aggregates(self) -> List[str]:
+        """Compare the incrementally maintained aggregates with a full recompute."""
+
+        return self._aggregates.check_consistency(self.dataframe)
+
     # ------------------------------------------------------------------
     # Analytics surfaced to the API layer
     # ------------------------------------------------------------------
     def get_summary(self) -> Dict[str, Any]:
-        df = self._df
-        total = len(df)
-        open_issues = int((~df["is_closed"]).sum())
-        closed_issues = int(df["is_closed"].sum())
-        high_priority_open = int((~df["is_closed"] & df["is_high_priority"]).sum())
-        avg_resolution = (
-            float(df["resolution_hours"].dropna().mean())
-            if "resolution_hours" in df
-            else 0.0
-        )
-        latest_update = (
-            df["updated_at"].max().isoformat() if "updated_at" in df else None
-        )
+        stats = self._aggregates.summary()
+        avg_resolution = stats["avg_resolution_hours"]
+        latest_update = stats["last_updated"] or pd.NaT
 
         return {
-            "total_issues": total,
-            "open_issues": open_issues,
-            "closed_issues": closed_issues,
-            "high_priority_open": high_priority_open,
+            "total_issues": stats["total"],
+            "open_issues": stats["open"],
+            "closed_issues": stats["closed"],
+            "high_priority_open": stats["high_priority_open"],
             "avg_resolution_hours": round(avg_resolution, 2) if avg_resolution else None,
-            "last_updated": latest_update,
+            "last_updated": latest_update.isoformat(),
         }
 
     def get_status_distribution(self, top_n: int = TOP_LIMIT) -> List[Dict[str, Any]]:
-        counts = self._df["status"].value_counts().head(top_n)
-        return [
-            {"status": status, "count": int(count)}
-            for status, count in counts.items()
-        ]
+        counts = self._aggregates.facet_counts("status")[:top_n]
+        return [{"status": status, "count": count} for status, count in counts]
 
     def get_priority_distribution(self) -> List[Dict[str, Any]]:
-        counts = self._df["priority"].value_counts()
-        return [
-            {"priority": priority, "count": int(count)}
-            for priority, count in counts.items()
-        ]
+        counts = self._aggregates.facet_counts("priority")
+        return [{"priority": priority, "count": count} for priority, count in counts]
 
     def get_region_distribution(self, top_n: int = TOP_LIMIT) -> List[Dict[str, Any]]:
-        series = self._df["region"].fillna("Unspecified")
-        counts = series.value_counts().head(top_n)
-        return [
-            {"region": region, "count": int(count)} for region, count in counts.items()
-        ]
+        counts = self._aggregates.facet_counts("region", "Unspecified")[:top_n]
+        return [{"region": region, "count": count} for region, count in counts]
 
     def get_category_distribution(self, top_n: int = TOP_LIMIT) -> List[Dict[str, Any]]:
-        if "category" not in self._df:
-            return []
-        series = self._df["category"].fillna("Unspecified")
-        counts = series.value_counts().head(top_n)
-        return [
-            {"category": category, "count": int(count)}
-            for category, count in counts.items()
-        ]
+        counts = self._aggregates.facet_counts("category", "Unspecified")[:top_n]
+        return [{"category": category, "count": count} for category, count in counts]
 
     def get_time_series(self, days: int = DEFAULT_TIME_WINDOW_DAYS, granularity: str = "day") -> List[Dict[str, Any]]:
-        df = self._df.dropna(subset=["created_at"]).copy()
-        if df.empty:
-            return []
-        df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
-        cutoff = pd.Timestamp.utcnow().tz_localize(None) - timedelta(days=days - 1)
-        window_df = df[df["created_at"] >= cutoff]
-        if window_df.empty:
-            window_df = df.tail(days)
-
         granularity = (granularity or "day").lower()
-        if granularity not in {"day", "week", "month", "year"}:
+        if granularity not in GRANULARITIES:
             granularity = "day"
 
-        window_df["bucket_start"] = self._compute_bucket_start(window_df["created_at"], granularity)
+        cutoff = pd.Timestamp.utcnow().tz_localize(None) - timedelta(days=days - 1)
+        day_counts = self._aggregates.day_counts(since=cutoff)
+        if not day_counts:
+            day_counts = self._latest_created_day_counts(days)
+        if not day_counts:
+            return []
 
-        series = (
-            window_df.groupby("bucket_start")
-            .agg(
-                total=("issue_key", "count"),
-                closed=("is_closed", "sum"),
-                high_priority=("is_high_priority", "sum"),
+        series: List[Dict[str, Any]] = []
+        for start, (total, closed, high_priority) in IssueAggregates.roll_up(
+            day_counts, granularity
+        ).items():
+            value = start.isoformat()
+            series.append(
+                {
+                    "date": value,
+                    "total": total,
+                    "closed": closed,
+                    "high_priority": high_priority,
+                    "label": self._format_bucket_label(value, granularity),
+                    "open": total - closed,
+                    "granularity": granularity,
+                }
             )
-            .reset_index()
+        return series
+
+    def _latest_created_day_counts(self, limit: int) -> Dict[date, Tuple[int, int, int]]:
+        """Day buckets for the last ``limit`` dated issues, used when the window is empty."""
+
+        df = self.dataframe
+        span = max(limit, 1)
+        while True:
+            tail = df.iloc[-span:]
+            tail = tail[tail["created_at"].notna()]
+            if len(tail) >= limit or span >= len(df):
+                break
+            span *= 2
+        tail = tail.tail(limit)
+        if tail.empty:
+            return {}
+        grouped = tail.groupby(tail["created_at"].dt.date).agg(
+            total=("issue_key", "count"),
+            closed=("is_closed", "sum"),
+            high_priority=("is_high_priority", "sum"),
         )
-
-        series = series.rename(columns={"bucket_start": "date"})
-        series = series.sort_values(by="date")
-        series["date"] = series["date"].apply(lambda d: d.isoformat())
-        series["label"] = series["date"].apply(
-            lambda value: self._format_bucket_label(value, granularity)
-        )
-        series["open"] = series["total"] - series["closed"]
-        series["granularity"] = granularity
-
-        return series.to_dict(orient="records")
-
-    @staticmethod
-    def _compute_bucket_start(series: pd.Series, granularity: str) -> pd.Series:
-        if granularity == "day":
-            return series.dt.floor("D").dt.date
-        if granularity == "week":
-            return series.dt.to_period("W").dt.start_time.dt.date
-        if granularity == "month":
-            return series.dt.to_period("M").dt.start_time.dt.date
-        if granularity == "year":
-            return series.dt.to_period("Y").dt.start_time.dt.date
-        return series.dt.floor("D").dt.date
+        return {
+            day: (int(row.total), int(row.closed), int(row.high_priority))
+            for day, row in grouped.iterrows()
+        }
 
     @staticmethod
     def _format_bucket_label(value: str, granularity: str) -> str:
@@ -914,58 +1181,52 @@ class JiraDataRepository:
         sort_by: str = "created_at",
         sort_order: str = "desc",
     ) -> Dict[str, Any]:
-        df = self._df
-        filtered = df
-
-        if status:
-            lowered = [s.lower() for s in status]
-            filtered = filtered[filtered["status"].str.lower().isin(lowered)]
-        if priority:
-            lowered = [p.lower() for p in priority]
-            filtered = filtered[filtered["priority"].str.lower().isin(lowered)]
-        if region:
-            lowered = [r.lower() for r in region]
-            filtered = filtered[filtered["region"].fillna("").str.lower().isin(lowered)]
-        if category:
-            lowered = [c.lower() for c in category]
-            filtered = filtered[
-                filtered["category"].fillna("").str.lower().isin(lowered)
-            ]
+        df = self.dataframe
+        mask: Optional[np.ndarray] = None
+        for column, values in (
+            ("status", status),
+            ("priority", priority),
+            ("region", region),
+            ("category", category),
+        ):
+            if values:
+                selected = facet_mask(df[column], values)
+                mask = selected if mask is None else mask & selected
+
         if text:
-            filtered = filtered[
-                filtered["summary"]
-                .fillna("")
-                .str.contains(text, case=False, regex=False)
-                | filtered["description"]
-                .fillna("")
-                .str.contains(text, case=False, regex=False)
-            ]
-
-        total = len(filtered)
-        sort_by = sort_by if sort_by in filtered.columns else "created_at"
+            if not self._text_index.built:
+                self._text_index.build(df)
+            positions = self._text_index.search(text, within=mask)
+        elif mask is not None:
+            positions = np.flatnonzero(mask)
+        else:
+            positions = np.arange(len(df))
+
+        total = len(positions)
+        sort_by = sort_by if sort_by in df.columns else "created_at"
         ascending = sort_order == "asc"
-        filtered = filtered.sort_values(by=sort_by, ascending=ascending)
 
         start = (page - 1) * page_size
         end = start + page_size
-        page_df = filtered.iloc[start:end]
+        ordered = ordered_positions(df[sort_by], positions, ascending, end)
+        page_df = df.iloc[ordered[start:end]][SEARCH_ITEM_COLUMNS]
 
         items = [
             {
                 "issue_key": row.issue_key,
                 "summary": row.summary,
-                "status": row.status,
-                "priority": row.priority,
-                "issue_type": row.issue_type,
+                "status": _none_if_na(row.status),
+                "priority": _none_if_na(row.priority),
+                "issue_type": _none_if_na(row.issue_type),
                 "created_at": row.created_at.isoformat()
                 if pd.notna(row.created_at)
                 else None,
                 "updated_at": row.updated_at.isoformat()
                 if pd.notna(row.updated_at)
                 else None,
-                "region": row.region,
-                "country": row.country,
-                "category": row.category,
+                "region": _none_if_na(row.region),
+                "country": _none_if_na(row.country),
+                "category": _none_if_na(row.category),
                 "is_closed": bool(row.is_closed),
                 "is_high_priority": bool(row.is_high_priority),
             }
@@ -1055,11 +1316,7 @@ class JiraDataRepository:
         }
 
     def _get_issue_row(self, issue_key: str) -> pd.Series:
-        df = self._df
-        row = df[df["issue_key"] == issue_key].head(1)
-        if row.empty:
-            raise KeyError(f"Issue {issue_key} not found")
-        return row.iloc[0]
+        return self._store.row(issue_key)
 
     @staticmethod
     def _classify_category(
@@ -1272,12 +1529,7 @@ class JiraDataRepository:
 
     @staticmethod
     def _infer_region_from_country(country: Optional[str]) -> Optional[str]:
-        if not country:
-            return None
-        normalized = _normalize_country_code(country)
-        if not normalized:
-            return None
-        return COUNTRY_TO_REGION.get(normalized)
+        return _region_for_country(country)
 
 
 repository = JiraDataRepository()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..schemas import JiraIssueFields, JiraWebhookPayload
 from .data_loader import JiraDataRepository, repository
@@ -22,6 +22,22 @@ class IngestionService:
         self._repository.upsert_issue(record)
         return record
 
+    def ingest_webhooks(
+        self, payloads: Sequence[JiraWebhookPayload]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Apply a batch of webhook events in one repository upsert.
+
+        Analyses for the touched issues are queued for the background
+        workers; returns the records and how many analyses were queued.
+        """
+
+        records = [self._transform_payload(payload) for payload in payloads]
+        if not records:
+            return [], 0
+        self._repository.upsert_issues(records)
+        queued = self._repository.schedule_analysis([record["issue_key"] for record in records])
+        return records, queued
+
     def _transform_payload(self, payload: JiraWebhookPayload) -> Dict[str, Any]:
         issue = payload.issue
         fields = issue.fields
@@ -3,7 +3,7 @@ from __future__ import annotations
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 try:
     from openai import OpenAI
@@ -60,6 +60,39 @@ class LLMClient:
         ]
         return self._chat(messages, max_tokens=min(800, len(text) * 2))
 
+    def translate_batch(self, texts: List[str], target_language: str) -> Optional[List[str]]:
+        """Translate several strings in one request; ``None`` if the reply is unusable."""
+
+        if not texts or not self.available():
+            return None
+        prompt = (
+            f"Translate every string in the following JSON array into {target_language}. "
+            "Respond ONLY with a JSON array of the translated strings, in the same order "
+            "and with the same length, without additional commentary.\n\n"
+            f"{json.dumps(texts, ensure_ascii=False)}"
+        )
+        messages = [
+            {"role": "system", "content": "You are a professional translator."},
+            {"role": "user", "content": prompt},
+        ]
+        total = sum(len(text) for text in texts)
+        raw = self._chat(messages, max_tokens=min(4000, total * 2 + 16 * len(texts)))
+        if not raw:
+            return None
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.warning("LLM 일괄 번역 JSON 파싱 실패 (%s건)", len(texts))
+            return None
+        if (
+            not isinstance(parsed, list)
+            or len(parsed) != len(texts)
+            or not all(isinstance(item, str) for item in parsed)
+        ):
+            logger.warning("LLM 일괄 번역 응답 형식 불일치 (%s건)", len(texts))
+            return None
+        return parsed
+
     def summarize(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         if not self.available():
             return None
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import bisect
+import re
+import threading
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+TEXT_FIELDS = ("summary", "description")
+
+# ``\w`` covers Hangul syllables, so Korean eojeol (word + particle) become a
+# single token and partial words are found through the token n-grams below.
+TOKEN_PATTERN = re.compile(r"\w+")
+GRAM_SIZE = 2
+
+
+def _fold(value: Any) -> str:
+    # Same folding as ``Series.str.contains(case=False, regex=False)``.
+    return value.upper() if isinstance(value, str) else ""
+
+
+def _grams(token: str) -> Set[str]:
+    return {token[idx: idx + GRAM_SIZE] for idx in range(len(token) - GRAM_SIZE + 1)}
+
+
+def _tokens(document: Tuple[str, ...]) -> Set[str]:
+    tokens: Set[str] = set()
+    for text in document:
+        tokens.update(TOKEN_PATTERN.findall(text))
+    return tokens
+
+
+class TextSearchIndex:
+    """Inverted index answering case-insensitive substring queries.
+
+    Postings map each case-folded ``\\w+`` token to the sorted row positions
+    that contain it, and a character bigram index over the token vocabulary
+    finds tokens that merely contain a query fragment (e.g. ``리포트`` inside
+    ``리포트를``). Every word run of the query must be a substring of some
+    token of a matching row, so intersecting those posting unions yields a
+    superset that is then verified with a plain substring check. Results are
+    therefore identical to ``str.contains(text, case=False, regex=False)``
+    over the indexed fields.
+
+    The index is built on first use and kept current through ``update``.
+    """
+
+    def __init__(self, fields: Sequence[str] = TEXT_FIELDS) -> None:
+        self.fields = tuple(fields)
+        self._lock = threading.RLock()
+        self._built = False
+        self._documents: List[Optional[Tuple[str, ...]]] = []
+        self._postings: Dict[str, array] = {}
+        self._vocabulary_grams: Dict[str, Set[str]] = {}
+
+    @property
+    def built(self) -> bool:
+        return self._built
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+    def build(self, frame: pd.DataFrame) -> None:
+        columns = [
+            frame[field].tolist() if field in frame.columns else [None] * len(frame)
+            for field in self.fields
+        ]
+        with self._lock:
+            self._documents = []
+            self._postings = {}
+            self._vocabulary_grams = {}
+            for pos, values in enumerate(zip(*columns)):
+                document = tuple(_fold(value) for value in values)
+                self._documents.append(document)
+                for token in _tokens(document):
+                    postings = self._postings.get(token)
+                    if postings is None:
+                        postings = self._postings[token] = array("i")
+                        self._register_token(token)
+                    postings.append(pos)
+            self._built = True
+
+    def update(self, pos: int, record: Dict[str, Any]) -> None:
+        """Reindex the row at ``pos``; a no-op until the index is built."""
+
+        if not self._built:
+            return
+        document = tuple(_fold(record.get(field)) for field in self.fields)
+        with self._lock:
+            if pos >= len(self._documents):
+                self._documents.extend([None] * (pos + 1 - len(self._documents)))
+            previous = self._documents[pos]
+            old_tokens = _tokens(previous) if previous is not None else set()
+            new_tokens = _tokens(document)
+            self._documents[pos] = document
+            for token in old_tokens - new_tokens:
+                postings = self._postings[token]
+                idx = bisect.bisect_left(postings, pos)
+                if idx < len(postings) and postings[idx] == pos:
+                    del postings[idx]
+                if not postings:
+                    del self._postings[token]
+                    self._unregister_token(token)
+            for token in new_tokens - old_tokens:
+                postings = self._postings.get(token)
+                if postings is None:
+                    postings = self._postings[token] = array("i")
+                    self._register_token(token)
+                if not postings or postings[-1] < pos:
+                    postings.append(pos)
+                else:
+                    bisect.insort(postings, pos)
+
+    def _register_token(self, token: str) -> None:
+        for gram in _grams(token):
+            self._vocabulary_grams.setdefault(gram, set()).add(token)
+
+    def _unregister_token(self, token: str) -> None:
+        for gram in _grams(token):
+            tokens = self._vocabulary_grams.get(gram)
+            if tokens is not None:
+                tokens.discard(token)
+                if not tokens:
+                    del self._vocabulary_grams[gram]
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def search(self, text: str, within: Optional[np.ndarray] = None) -> np.ndarray:
+        """Sorted positions whose indexed fields contain ``text`` (case-insensitive).
+
+        ``within`` optionally restricts the result to a boolean row mask,
+        e.g. the facet filters, before the substring verification runs.
+        """
+
+        needle = text.upper()
+        with self._lock:
+            candidates = self._candidates(needle)
+            if within is not None:
+                limit = min(len(within), len(self._documents))
+                candidates = candidates[candidates < limit]
+                candidates = candidates[within[candidates]]
+            if TOKEN_PATTERN.fullmatch(needle):
+                # A single word run: every candidate token contains it, so
+                # every candidate row already contains the needle.
+                return candidates
+            documents = self._documents
+            matches = [
+                pos
+                for pos in candidates.tolist()
+                if documents[pos] is not None
+                and any(needle in field for field in documents[pos])
+            ]
+        return np.asarray(matches, dtype=np.int64)
+
+    def _candidates(self, needle: str) -> np.ndarray:
+        runs = set(TOKEN_PATTERN.findall(needle))
+        if not runs:
+            # Punctuation-only queries cannot use the index; verify every row.
+            return np.arange(len(self._documents), dtype=np.int64)
+        result: Optional[np.ndarray] = None
+        # Longest runs tend to be the most selective, so intersect them first.
+        for run in sorted(runs, key=len, reverse=True):
+            positions = self._run_positions(run)
+            result = positions if result is None else np.intersect1d(
+                result, positions, assume_unique=True
+            )
+            if not len(result):
+                break
+        return result
+
+    def _run_positions(self, run: str) -> np.ndarray:
+        tokens = self._tokens_containing(run)
+        if not tokens:
+            return np.empty(0, dtype=np.int64)
+        arrays = [np.frombuffer(self._postings[token], dtype=np.int32) for token in tokens]
+        if len(arrays) == 1:
+            return arrays[0].astype(np.int64)
+        return np.unique(np.concatenate(arrays)).astype(np.int64)
+
+    def _tokens_containing(self, run: str) -> List[str]:
+        if len(run) < GRAM_SIZE:
+            return [token for token in self._postings if run in token]
+        matched: Optional[Set[str]] = None
+        for gram in sorted(_grams(run), key=lambda g: len(self._vocabulary_grams.get(g, ()))):
+            tokens = self._vocabulary_grams.get(gram)
+            if not tokens:
+                return []
+            matched = set(tokens) if matched is None else matched & tokens
+            if not matched:
+                return []
+        return [token for token in matched or () if run in token]
+
+
+def facet_mask(series: pd.Series, values: Iterable[str]) -> np.ndarray:
+    """Boolean row bitmap for a case-insensitive facet filter.
+
+    Categorical facets are resolved once per category and then broadcast
+    through the integer codes; an empty string also selects missing values.
+    """
+
+    lowered = {value.lower() for value in values}
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        allowed = np.fromiter(
+            (str(category).lower() in lowered for category in series.cat.categories),
+            dtype=bool,
+            count=len(series.cat.categories),
+        )
+        # Code -1 (missing) indexes the trailing slot.
+        allowed = np.append(allowed, "" in lowered)
+        return allowed[series.cat.codes.to_numpy()]
+    return series.fillna("").astype(str).str.lower().isin(lowered).to_numpy()
+
+
+def ordered_positions(
+    series: pd.Series, positions: np.ndarray, ascending: bool, limit: int
+) -> np.ndarray:
+    """The first ``limit`` of ``positions`` ordered by ``series``.
+
+    Ties keep row order and missing values sort last, as with a stable
+    ``sort_values``. For ordinal columns only the leading ``limit`` rows are
+    fully sorted: ``np.partition`` finds the cut-off key and everything
+    beyond it is discarded.
+    """
+
+    values = series.iloc[positions]
+    dtype = values.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        keys = values.cat.codes.to_numpy().astype(np.int64)
+        missing = keys < 0
+    elif np.issubdtype(dtype, np.datetime64):
+        keys = values.to_numpy().view(np.int64)
+        missing = values.isna().to_numpy()
+    elif dtype == bool or np.issubdtype(dtype, np.number):
+        keys = values.to_numpy()
+        if dtype == bool:
+            keys = keys.astype(np.int64)
+        missing = values.isna().to_numpy()
+    else:
+        order = values.reset_index(drop=True).sort_values(
+            ascending=ascending, kind="stable", na_position="last"
+        )
+        return positions[order.index.to_numpy()[:limit]]
+
+    present = np.flatnonzero(~missing)
+    keys = keys[present]
+    if not ascending:
+        keys = -keys
+    if limit < len(keys):
+        cutoff = np.partition(keys, limit - 1)[limit - 1]
+        keep = np.flatnonzero(keys <= cutoff)
+        present, keys = present[keep], keys[keep]
+    head = present[np.argsort(keys, kind="stable")][:limit]
+    if len(head) < limit:
+        head = np.concatenate([head, np.flatnonzero(missing)[: limit - len(head)]])
+    return positions[head]
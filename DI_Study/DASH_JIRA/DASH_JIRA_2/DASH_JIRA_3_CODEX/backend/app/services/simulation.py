@@ -1,93 +1,135 @@
 from __future__ import annotations
 
+import logging
+import threading
 from pathlib import Path
 from typing import List
 
 from ..config import SIMULATION_MAX_BATCH, TEST_DATA_FILE
 from .data_loader import JiraDataRepository, repository
 
+logger = logging.getLogger(__name__)
+
 
 class TestDatasetSimulator:
     def __init__(self, repository: JiraDataRepository, dataset_path: Path | str = TEST_DATA_FILE) -> None:
         self._repository = repository
         self._dataset_path = Path(dataset_path)
         self._df = JiraDataRepository.load_dataset(self._dataset_path)
+        self._keys = self._df["issue_key"].tolist() if "issue_key" in self._df.columns else []
         self._total = len(self._df)
         self._cursor = 0
+        self._lock = threading.Lock()
         self._last_batch: List[str] = []
-        self._last_batch_details: List[dict] = []
+        self._last_records: List[dict] = []
 
     def reset(self) -> None:
-        self._cursor = 0
-        self._last_batch = []
-        self._last_batch_details = []
+        with self._lock:
+            self._cursor = 0
+            self._last_batch = []
+            self._last_records = []
+
+    def ingest_next(self, batch: int = 1, background: bool = False) -> List[str]:
+        """Upsert the next ``batch`` issues in one repository call.
+
+        Analyses run on the pipeline's worker queue; unless ``background`` is
+        set the call waits for them so the response can include the results.
+        """
 
-    def ingest_next(self, batch: int = 1) -> List[str]:
         if self._df.empty:
             return []
         batch = max(1, min(batch, SIMULATION_MAX_BATCH))
-        ingested: List[str] = []
-        details: List[dict] = []
-        while len(ingested) < batch and self._cursor < self._total:
-            row = self._df.iloc[self._cursor]
-            self._cursor += 1
-            record = row.to_dict()
-            issue_key = record.get("issue_key")
-            if issue_key:
-                self._repository.upsert_issue(record)
-                ingested.append(issue_key)
-                enriched = {
-                    "issue_key": issue_key,
-                    "summary": record.get("summary"),
-                    "status": record.get("status"),
-                    "priority": record.get("priority"),
-                    "region": record.get("region"),
-                    "category": record.get("category"),
-                }
-                # 간단한 분석 결과를 포함해 신규 티켓 내용/번역을 바로 볼 수 있도록 한다.
-                try:
-                    if self._repository._analysis_engine:
-                        analysis = self._repository.get_issue_analysis(issue_key, refresh=True)
-                        translation = analysis.get("translation", {}) if isinstance(analysis, dict) else {}
-                        summary = analysis.get("summary", {}) if isinstance(analysis, dict) else {}
-                        cases = analysis.get("case_recommendations", []) if isinstance(analysis, dict) else []
-                        assignment = analysis.get("assignment") if isinstance(analysis, dict) else None
-                        notifications = analysis.get("notifications") if isinstance(analysis, dict) else None
-                        summary_text = (
-                            translation.get("summary_translated")
-                            or translation.get("summary_original")
-                            or record.get("summary")
-                        )
-                        desc_text = (
-                            translation.get("description_translated")
-                            or translation.get("description_original")
-                            or record.get("description")
-                        )
-                        enriched["translation"] = {
-                            "summary": summary_text,
-                            "description": desc_text,
-                            "summary_original": translation.get("summary_original") or record.get("summary"),
-                            "description_original": translation.get("description_original") or record.get("description"),
-                        }
-                        enriched["summary_outline"] = summary.get("description_summary")
-                        enriched["summary_structured"] = {
-                            "overview": summary.get("overview"),
-                            "requirements": summary.get("requirements"),
-                            "risks": summary.get("risks"),
-                            "sla": summary.get("sla"),
-                            "recommended_org": summary.get("recommended_org"),
-                        }
-                        enriched["recommended_org"] = summary.get("recommended_org")
-                        enriched["cases"] = cases
-                        enriched["assignment"] = assignment
-                        enriched["notifications"] = notifications
-                except Exception:
-                    pass
-                details.append(enriched)
-        self._last_batch = ingested
-        self._last_batch_details = details
+        with self._lock:
+            positions: List[int] = []
+            cursor = self._cursor
+            while len(positions) < batch and cursor < self._total:
+                if self._keys[cursor]:
+                    positions.append(cursor)
+                cursor += 1
+            self._cursor = cursor
+            records = self._df.iloc[positions].to_dict("records")
+            ingested = [record["issue_key"] for record in records]
+            if records:
+                self._repository.upsert_issues(records)
+            self._last_batch = ingested
+            self._last_records = records
+
+        engine = self._repository._analysis_engine
+        if engine and ingested:
+            try:
+                if not background:
+                    # 번역은 배치 단위로 미리 요청해 두고, 이후 건별 분석은 메모를 재사용한다.
+                    engine.prefetch_translations(records)
+                engine.schedule(ingested)
+                if not background:
+                    engine.queue.wait(ingested)
+            except Exception as exc:
+                logger.warning("시뮬레이션 분석 예약 실패: %s", exc)
         return ingested
 
+    def replay(self, chunk: int = SIMULATION_MAX_BATCH) -> int:
+        """Ingest everything that is left; analyses continue in the background."""
+
+        ingested = 0
+        while self._cursor < self._total:
+            ingested += len(self.ingest_next(batch=chunk, background=True))
+        return ingested
+
+    def _build_detail(self, record: dict) -> dict:
+        issue_key = record.get("issue_key")
+        enriched = {
+            "issue_key": issue_key,
+            "summary": record.get("summary"),
+            "status": record.get("status"),
+            "priority": record.get("priority"),
+            "region": record.get("region"),
+            "category": record.get("category"),
+        }
+        # 간단한 분석 결과를 포함해 신규 티켓 내용/번역을 바로 볼 수 있도록 한다.
+        # 백그라운드 분석이 끝나지 않은 건은 기본 정보만 노출하고 다음 조회 때 채운다.
+        try:
+            engine = self._repository._analysis_engine
+            analysis = engine.cached_analysis(issue_key) if engine else None
+            if analysis is None:
+                enriched["analysis_pending"] = bool(engine) and engine.queue.is_pending(issue_key)
+                return enriched
+            translation = analysis.get("translation", {}) if isinstance(analysis, dict) else {}
+            summary = analysis.get("summary", {}) if isinstance(analysis, dict) else {}
+            cases = analysis.get("case_recommendations", []) if isinstance(analysis, dict) else []
+            assignment = analysis.get("assignment") if isinstance(analysis, dict) else None
+            notifications = analysis.get("notifications") if isinstance(analysis, dict) else None
+            summary_text = (
+                translation.get("summary_translated")
+                or translation.get("summary_original")
+                or record.get("summary")
+            )
+            desc_text = (
+                translation.get("description_translated")
+                or translation.get("description_original")
+                or record.get("description")
+            )
+            enriched["translation"] = {
+                "summary": summary_text,
+                "description": desc_text,
+                "summary_original": translation.get("summary_original") or record.get("summary"),
+                "description_original": translation.get("description_original") or record.get("description"),
+            }
+            enriched["summary_outline"] = summary.get("description_summary")
+            enriched["summary_structured"] = {
+                "overview": summary.get("overview"),
+                "requirements": summary.get("requirements"),
+                "risks": summary.get("risks"),
+                "sla": summary.get("sla"),
+                "recommended_org": summary.get("recommended_org"),
+            }
+            enriched["recommended_org"] = summary.get("recommended_org")
+            enriched["cases"] = cases
+            enriched["assignment"] = assignment
+            enriched["notifications"] = notifications
+        except Exception:
+            pass
+        return enriched
+
     def get_state(self) -> dict:
         remaining = max(0, self._total - self._cursor)
         return {
@@ -95,7 +137,7 @@ class TestDatasetSimulator:
             "processed": self._cursor,
             "remaining": remaining,
             "last_ingested": self._last_batch,
-            "last_ingested_details": self._last_batch_details,
+            "last_ingested_details": [self._build_detail(record) for record in self._last_records],
             "dataset_path": str(self._dataset_path),
         }
 
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except Exception:  # pragma: no cover - optional dependency
+    pa = None  # type: ignore
+    pa_ipc = None  # type: ignore
+
+from ..config import (
+    CLOSED_STATUS_MARKERS,
+    HIGH_PRIORITY_MARKERS,
+    META_DIR,
+    SNAPSHOT_CACHE_DIR,
+    SNAPSHOT_CACHE_ENABLED,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the on-disk layout changes; code changes are picked up through
+# the source fingerprint below.
+SNAPSHOT_FORMAT_VERSION = "1"
+
+_SERVICES_DIR = Path(__file__).resolve().parent
+_FINGERPRINT_SOURCES = (
+    _SERVICES_DIR / "data_loader.py",
+    _SERVICES_DIR / "reference_data.py",
+    _SERVICES_DIR / "snapshot_cache.py",
+)
+_FINGERPRINT_META_FILES = ("report_suite_info.csv", "abbreviation_dictionary.csv")
+# Settings read during normalization (is_closed / is_high_priority).
+_FINGERPRINT_SETTINGS = {
+    "CLOSED_STATUS_MARKERS": CLOSED_STATUS_MARKERS,
+    "HIGH_PRIORITY_MARKERS": HIGH_PRIORITY_MARKERS,
+}
+
+_CHUNK_SIZE = 1 << 20
+
+
+def _sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(paths: Iterable[Path], settings: Dict[str, Iterable[str]]) -> str:
+    digest = hashlib.sha256(SNAPSHOT_FORMAT_VERSION.encode())
+    for path in paths:
+        digest.update(str(path.name).encode())
+        if path.exists():
+            digest.update(_sha256_file(path).encode())
+    for name, values in settings.items():
+        digest.update(name.encode())
+        digest.update("\x1f".join(values).encode())
+    return digest.hexdigest()
+
+
+class PreparedFrameCache:
+    """On-disk Arrow IPC snapshots of prepared Jira frames.
+
+    A snapshot is valid while the source CSV hash and the normalization code
+    fingerprint (``data_loader``/``reference_data`` sources, the status and
+    priority marker settings and the META lookup files) match what was
+    recorded when it was written. Size and mtime are checked first so an
+    untouched source is not re-hashed on every start. Snapshots are read through a memory map.
+    """
+
+    def __init__(self, cache_dir: Path, enabled: bool = True) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.enabled = enabled and pa is not None
+        self._code_fingerprint: Optional[str] = None
+        if enabled and pa is None:
+            logger.warning("pyarrow 미설치로 스냅샷 캐시를 사용하지 않습니다.")
+
+    @property
+    def code_fingerprint(self) -> str:
+        if self._code_fingerprint is None:
+            self._code_fingerprint = _fingerprint(
+                [*_FINGERPRINT_SOURCES, *(META_DIR / name for name in _FINGERPRINT_META_FILES)],
+                _FINGERPRINT_SETTINGS,
+            )
+        return self._code_fingerprint
+
+    def snapshot_path(self, source: Path) -> Path:
+        source = Path(source).resolve()
+        suffix = hashlib.sha256(str(source).encode()).hexdigest()[:12]
+        return self.cache_dir / f"{source.stem}-{suffix}.arrow"
+
+    def load(self, source: Path) -> Optional[pd.DataFrame]:
+        if not self.enabled:
+            return None
+        snapshot = self.snapshot_path(source)
+        if not snapshot.exists():
+            return None
+        try:
+            with pa.memory_map(str(snapshot), "r") as mapped:
+                reader = pa_ipc.open_file(mapped)
+                metadata = self._decode_metadata(reader.schema.metadata)
+                if not self._is_fresh(Path(source), metadata):
+                    logger.info("스냅샷 캐시 만료: %s", snapshot.name)
+                    return None
+                return reader.read_all().to_pandas(date_as_object=True)
+        except Exception as exc:
+            logger.warning("스냅샷 캐시 읽기 실패 (%s): %s", snapshot.name, exc)
+            return None
+
+    def store(self, source: Path, frame: pd.DataFrame) -> Optional[Path]:
+        if not self.enabled:
+            return None
+        source = Path(source)
+        snapshot = self.snapshot_path(source)
+        tmp_path = snapshot.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            stat = source.stat()
+            metadata = {
+                "source_path": str(source.resolve()),
+                "source_sha256": _sha256_file(source),
+                "source_size": str(stat.st_size),
+                "source_mtime_ns": str(stat.st_mtime_ns),
+                "code_fingerprint": self.code_fingerprint,
+            }
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), **self._encode_metadata(metadata)}
+            )
+            snapshot.parent.mkdir(parents=True, exist_ok=True)
+            with pa.OSFile(str(tmp_path), "wb") as sink:
+                with pa_ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, snapshot)
+            return snapshot
+        except Exception as exc:
+            logger.warning("스냅샷 캐시 저장 실패 (%s): %s", snapshot.name, exc)
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+    def invalidate(self, source: Path) -> None:
+        self.snapshot_path(source).unlink(missing_ok=True)
+
+    def _is_fresh(self, source: Path, metadata: Dict[str, str]) -> bool:
+        if metadata.get("code_fingerprint") != self.code_fingerprint:
+            return False
+        if not source.exists():
+            return False
+        stat = source.stat()
+        if (
+            metadata.get("source_size") == str(stat.st_size)
+            and metadata.get("source_mtime_ns") == str(stat.st_mtime_ns)
+        ):
+            return True
+        return metadata.get("source_sha256") == _sha256_file(source)
+
+    @staticmethod
+    def _encode_metadata(metadata: Dict[str, str]) -> Dict[bytes, bytes]:
+        return {f"jira.{key}".encode(): value.encode() for key, value in metadata.items()}
+
+    @staticmethod
+    def _decode_metadata(raw: Optional[Dict[bytes, bytes]]) -> Dict[str, str]:
+        decoded: Dict[str, str] = {}
+        for key, value in (raw or {}).items():
+            name = key.decode()
+            if name.startswith("jira."):
+                decoded[name[len("jira."):]] = value.decode()
+        return decoded
+
+
+prepared_frame_cache = PreparedFrameCache(SNAPSHOT_CACHE_DIR, enabled=SNAPSHOT_CACHE_ENABLED)
@@ -0,0 +1,6 @@
+"""Micro-benchmarks for the Jira monitoring backend.
+
+Run from the ``backend`` directory, e.g. ``python -m benchmarks.upsert_bench``.
+Each script generates a synthetic Jira export so it does not depend on
+``processed/*.csv`` being present.
+"""
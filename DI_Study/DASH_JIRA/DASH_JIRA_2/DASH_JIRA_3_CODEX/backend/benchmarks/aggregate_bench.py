@@ -0,0 +1,173 @@
+"""Dashboard endpoint latency: full-frame scans vs. IssueAggregates reads.
+
+The legacy functions below are the pre-aggregate bodies of ``get_summary``,
+the facet distributions and ``get_time_series``. After timing, a stream of
+upserts (new keys and updates to existing ones) is applied and the
+incremental state is checked against a full recompute and against the
+legacy outputs. The script fails on any difference.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.aggregate_bench --rows 100000 --upserts 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List
+
+import pandas as pd
+
+from .synthetic import generate_rows, synthetic_environment, write_csv
+
+
+def legacy_summary(df: pd.DataFrame) -> Dict[str, Any]:
+    avg_resolution = float(df["resolution_hours"].dropna().mean())
+    return {
+        "total_issues": len(df),
+        "open_issues": int((~df["is_closed"]).sum()),
+        "closed_issues": int(df["is_closed"].sum()),
+        "high_priority_open": int((~df["is_closed"] & df["is_high_priority"]).sum()),
+        "avg_resolution_hours": round(avg_resolution, 2) if avg_resolution else None,
+        "last_updated": df["updated_at"].max().isoformat(),
+    }
+
+
+def legacy_facet(df: pd.DataFrame, column: str, fill_value: str | None = None) -> Dict[str, int]:
+    series = df[column].astype(object)
+    if fill_value is not None:
+        series = series.fillna(fill_value)
+    return {key: int(count) for key, count in series.value_counts().items()}
+
+
+def legacy_time_series(df: pd.DataFrame, days: int, granularity: str) -> List[Dict[str, Any]]:
+    df = df.dropna(subset=["created_at"]).copy()
+    if df.empty:
+        return []
+    df["created_at"] = pd.to_datetime(df["created_at"], errors="coerce")
+    cutoff = pd.Timestamp.utcnow().tz_localize(None) - timedelta(days=days - 1)
+    window_df = df[df["created_at"] >= cutoff]
+    if window_df.empty:
+        window_df = df.tail(days)
+    periods = {"day": "D", "week": "W", "month": "M", "year": "Y"}
+    window_df = window_df.assign(
+        bucket_start=window_df["created_at"].dt.to_period(periods[granularity]).dt.start_time.dt.date
+    )
+    series = (
+        window_df.groupby("bucket_start")
+        .agg(
+            total=("issue_key", "count"),
+            closed=("is_closed", "sum"),
+            high_priority=("is_high_priority", "sum"),
+        )
+        .reset_index()
+        .sort_values(by="bucket_start")
+    )
+    return [
+        {
+            "date": row.bucket_start.isoformat(),
+            "total": int(row.total),
+            "closed": int(row.closed),
+            "high_priority": int(row.high_priority),
+        }
+        for row in series.itertuples()
+    ]
+
+
+def _time_call(func: Callable[[], Any], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def compare_with_legacy(repo, days: int) -> List[str]:
+    df = repo.dataframe
+    mismatches: List[str] = []
+    if repo.get_summary() != legacy_summary(df):
+        mismatches.append("summary")
+    facets = {
+        "status": ({row["status"]: row["count"] for row in repo.get_status_distribution(10**6)}, None),
+        "priority": ({row["priority"]: row["count"] for row in repo.get_priority_distribution()}, None),
+        "region": ({row["region"]: row["count"] for row in repo.get_region_distribution(10**6)}, "Unspecified"),
+        "category": (
+            {row["category"]: row["count"] for row in repo.get_category_distribution(10**6)},
+            "Unspecified",
+        ),
+    }
+    for column, (actual, fill_value) in facets.items():
+        if actual != legacy_facet(df, column, fill_value):
+            mismatches.append(f"facet:{column}")
+    # A short window exercises the ``tail(days)`` fallback on older data.
+    for window in (days, 7):
+        for granularity in ("day", "week", "month", "year"):
+            actual = [
+                {key: row[key] for key in ("date", "total", "closed", "high_priority")}
+                for row in repo.get_time_series(days=window, granularity=granularity)
+            ]
+            if actual != legacy_time_series(df, window, granularity):
+                mismatches.append(f"time_series:{granularity}/{window}d")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--upserts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--days", type=int, default=900)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10) as root:
+        from app.services.data_loader import JiraDataRepository
+
+        repo = JiraDataRepository()
+        df = repo.dataframe
+        cases = {
+            "summary": (lambda: legacy_summary(repo.dataframe), repo.get_summary),
+            "region": (
+                lambda: legacy_facet(repo.dataframe, "region", "Unspecified"),
+                repo.get_region_distribution,
+            ),
+            "time_series(month)": (
+                lambda: legacy_time_series(repo.dataframe, args.days, "month"),
+                lambda: repo.get_time_series(days=args.days, granularity="month"),
+            ),
+        }
+        timings = {
+            label: (_time_call(legacy, args.repeat), _time_call(current, args.repeat))
+            for label, (legacy, current) in cases.items()
+        }
+
+        updates = args.upserts // 2
+        incoming = write_csv(
+            root / "incoming.csv",
+            generate_rows(args.upserts - updates, seed=31, start_index=args.rows)
+            + generate_rows(updates, seed=37, start_index=0),
+        )
+        records = JiraDataRepository.load_dataset(incoming).to_dict("records")
+        half = len(records) // 2
+        for record in records[:half]:
+            repo.upsert_issue(record)
+        repo.upsert_issues(records[half:])
+
+        consistency = repo.verify_aggregates()
+        legacy_diffs = compare_with_legacy(repo, args.days)
+
+    print(f"rows={len(df)} upserts={len(records)} final rows={len(repo.dataframe)}")
+    for label, (legacy, current) in timings.items():
+        print(
+            f"{label:<20} legacy {legacy * 1e3:8.2f} ms  aggregates {current * 1e3:8.3f} ms"
+            f"  ({legacy / current:,.0f}x)"
+        )
+    if consistency:
+        raise SystemExit("aggregates drifted from a full recompute: " + ", ".join(consistency))
+    if legacy_diffs:
+        raise SystemExit("aggregates differ from legacy outputs: " + ", ".join(legacy_diffs))
+    print("consistency: OK (incremental == recompute == legacy)")
+
+
+if __name__ == "__main__":
+    main()
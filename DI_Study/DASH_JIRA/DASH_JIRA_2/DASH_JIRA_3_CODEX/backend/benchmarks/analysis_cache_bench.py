@@ -0,0 +1,99 @@
+"""Analysis result cache: cold pipeline vs. in-memory hits vs. SQLite after a restart.
+
+Counts how often the summarisation stage (the LLM call when one is
+configured) runs: a fresh ``AnalysisPipeline`` sharing the SQLite file must
+not re-run it for unchanged issues, edited issues must be re-analysed, and
+the in-memory LRU / action log must stay within their bounds.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.analysis_cache_bench --issues 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import Dict, List
+
+from .synthetic import synthetic_environment, timer
+
+
+def instrument(pipeline, calls: Dict[str, int]) -> None:
+    summarize = pipeline.summarizer.summarize
+
+    def counted(*args, **kwargs):
+        calls["summarize"] += 1
+        return summarize(*args, **kwargs)
+
+    pipeline.summarizer.summarize = counted
+
+
+def analyse(pipeline, keys: List[str]) -> None:
+    for key in keys:
+        pipeline.get_issue_analysis(key)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--issues", type=int, default=500)
+    parser.add_argument("--memory-entries", type=int, default=200)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10):
+        os.environ["JIRA_ANALYSIS_CACHE"] = "sqlite"
+        os.environ["JIRA_ANALYSIS_CACHE_MAX_ENTRIES"] = str(args.memory_entries)
+        from app.services.analysis_pipeline import AnalysisPipeline
+        from app.services.data_loader import repository
+
+        keys = repository.dataframe["issue_key"].tolist()[: args.issues]
+        results: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+
+        pipeline = AnalysisPipeline(repository)
+        calls = {"summarize": 0}
+        instrument(pipeline, calls)
+        with timer("cold", results):
+            analyse(pipeline, keys)
+        counts["cold"] = calls["summarize"]
+        recent = keys[-args.memory_entries:]
+        with timer("warm (memory)", results):
+            analyse(pipeline, recent)
+        counts["warm (memory)"] = calls["summarize"] - counts["cold"]
+        bounded = len(pipeline.cache) <= args.memory_entries and len(pipeline.logger._logs) <= (
+            pipeline.logger._logs.max_entries
+        )
+
+        restarted = AnalysisPipeline(repository)
+        calls = {"summarize": 0}
+        instrument(restarted, calls)
+        with timer("restart (sqlite)", results):
+            analyse(restarted, keys)
+        counts["restart (sqlite)"] = calls["summarize"]
+
+        edited = keys[:10]
+        for key in edited:
+            record = repository._get_issue_row(key).to_dict()
+            record["summary"] = f"{record.get('summary') or ''} (edited)"
+            repository.upsert_issue(record)
+        with timer("after edits", results):
+            analyse(restarted, keys)
+        counts["after edits"] = calls["summarize"] - counts["restart (sqlite)"]
+        stats = restarted.cache.stats()
+
+    print(f"issues={len(keys)} memory entries={args.memory_entries}")
+    for label, elapsed in results.items():
+        print(f"{label:<18} {elapsed:8.3f}s  summarize calls={counts[label]}")
+    print(f"cache stats after restart: {stats}")
+    if counts["warm (memory)"] or counts["restart (sqlite)"]:
+        raise SystemExit("unchanged issues were analysed twice")
+    if counts["after edits"] != len(edited):
+        raise SystemExit(f"expected {len(edited)} re-analyses after edits, got {counts['after edits']}")
+    if not bounded:
+        raise SystemExit("in-memory analysis cache or action log exceeded its bound")
+    print("persistence: OK, invalidation: OK, bounds: OK")
+
+
+if __name__ == "__main__":
+    main()
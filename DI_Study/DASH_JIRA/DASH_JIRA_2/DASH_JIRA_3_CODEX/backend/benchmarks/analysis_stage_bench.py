@@ -0,0 +1,94 @@
+"""First-view ``/issues/{key}/analysis`` latency: sequential vs. concurrent stages.
+
+No LLM is reachable in the benchmark environment, so translation goes
+through ``translation_bench.LatencyClient`` and a fixed delay is added to
+every summarization call to model the network round-trip of
+``llm_client``. Sequentially a first view waits for the issue translation,
+the summary and the case translations one after another; concurrently for
+roughly the slowest of them.
+The script fails if both modes do not produce the same analysis.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.analysis_stage_bench --issues 20 --delay 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .synthetic import synthetic_environment
+from .translation_bench import LatencyClient
+
+
+def add_latency(pipeline, delay: float) -> None:
+    summarize = pipeline.summarizer.summarize
+    pipeline.translation_service.llm = LatencyClient(delay)
+
+    def slow_summarize(*args, **kwargs):
+        time.sleep(delay)
+        return summarize(*args, **kwargs)
+
+    pipeline.summarizer.summarize = slow_summarize
+
+
+def comparable(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Log/notification timestamps and SLA elapsed time depend on wall-clock.
+    return {
+        "translation": result["translation"],
+        "summary": result["summary"],
+        "case_recommendations": result["case_recommendations"],
+        "assignment": result["assignment"],
+        "stages": [(log["stage"], log["status"], log["detail"]) for log in result["logs"]],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--issues", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=8)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10):
+        os.environ["JIRA_ANALYSIS_CACHE"] = "memory"
+        from langdetect import DetectorFactory
+
+        from app.services.analysis_pipeline import AnalysisPipeline
+        from app.services.data_loader import repository
+
+        DetectorFactory.seed = 0
+        keys = repository.dataframe["issue_key"].tolist()[: args.issues]
+        latencies: Dict[str, List[float]] = {}
+        outputs: Dict[str, List[Dict[str, Any]]] = {}
+        for label, workers in (("sequential", 1), (f"pool x{args.workers}", args.workers)):
+            pipeline = AnalysisPipeline(repository)
+            pipeline.max_workers = workers
+            add_latency(pipeline, args.delay)
+            latencies[label], outputs[label] = [], []
+            for key in keys:
+                start = time.perf_counter()
+                result = pipeline.get_issue_analysis(key)
+                latencies[label].append(time.perf_counter() - start)
+                outputs[label].append(comparable(result))
+
+    print(f"issues={len(keys)} simulated round-trip={args.delay * 1e3:.0f} ms")
+    for label, values in latencies.items():
+        print(
+            f"{label:<12} p50 {np.percentile(values, 50) * 1e3:8.1f} ms"
+            f"  p95 {np.percentile(values, 95) * 1e3:8.1f} ms"
+        )
+    sequential, concurrent = outputs.values()
+    if sequential != concurrent:
+        raise SystemExit("concurrent stages produced a different analysis")
+    print("parity: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Case similarity: brute-force ``cosine_similarity`` vs. CaseSimilarityIndex.
+
+Reports p50/p95 query latency and recall@k against the legacy brute-force
+matcher (the pre-index ``CaseMatcher.recommend`` scoring) for the exact and
+IVF backends, then adds a batch of new issues incrementally and measures
+recall against a matcher refitted from scratch on the grown corpus.
+
+The corpus is synthetic topical text (Zipf-sampled words per topic) so
+neighbours are meaningful; the Jira CSV generator repeats too few phrases.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.case_index_bench --docs 50000 --queries 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from app.services.case_index import CaseSimilarityIndex
+
+
+def synthetic_corpus(count: int, topics: int = 80, vocabulary: int = 6000, seed: int = 13) -> List[str]:
+    rng = random.Random(seed)
+    words = [f"w{idx:05d}" for idx in range(vocabulary)]
+    topic_words = [rng.sample(words, 120) for _ in range(topics)]
+    weights = [1.0 / (rank + 1) for rank in range(120)]
+    documents = []
+    for _ in range(count):
+        topic = topic_words[rng.randrange(topics)]
+        body = rng.choices(topic, weights=weights, k=rng.randint(15, 45))
+        noise = rng.choices(words, k=rng.randint(2, 8))
+        documents.append(" ".join(body + noise))
+    return documents
+
+
+class LegacyMatcher:
+    """Pre-index scoring: refit-only TF-IDF plus a full ``argsort`` per query."""
+
+    def __init__(self, keys: Sequence[str], texts: Sequence[str]) -> None:
+        self.keys = list(keys)
+        self.vectorizer = TfidfVectorizer(max_features=4000, ngram_range=(1, 2))
+        self.matrix = self.vectorizer.fit_transform(texts)
+
+    def search(self, text: str, limit: int) -> List[Tuple[str, float]]:
+        scores = cosine_similarity(self.vectorizer.transform([text]), self.matrix).flatten()
+        top = scores.argsort()[::-1][:limit]
+        return [(self.keys[idx], float(scores[idx])) for idx in top]
+
+
+def recall_at_k(expected: List[Tuple[str, float]], actual: List[Tuple[str, float]], k: int) -> float:
+    """Share of the true top-k found; rows tied with the k-th score count as hits."""
+
+    expected = [item for item in expected[:k] if item[1] > 0.01]
+    if not expected:
+        return 1.0
+    cutoff = expected[-1][1] - 1e-9
+    found = {key for key, score in actual[:k] if score >= cutoff}
+    truth = {key for key, _ in expected}
+    hits = len(found & truth) + sum(
+        1 for key, score in actual[:k] if key not in truth and score >= cutoff
+    )
+    return min(hits, len(expected)) / len(expected)
+
+
+def measure(search, queries: List[str], truth: List[List[Tuple[str, float]]], k: int) -> Dict[str, float]:
+    latencies, recalls = [], []
+    for text, expected in zip(queries, truth):
+        start = time.perf_counter()
+        results = search(text)
+        latencies.append(time.perf_counter() - start)
+        recalls.append(recall_at_k(expected, results, k))
+    return {
+        "p50_ms": float(np.percentile(latencies, 50) * 1e3),
+        "p95_ms": float(np.percentile(latencies, 95) * 1e3),
+        "recall": float(np.mean(recalls)),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=50000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--adds", type=int, default=5000)
+    parser.add_argument("--k", type=int, default=6)
+    parser.add_argument("--n-probe", type=int, default=8)
+    args = parser.parse_args()
+
+    corpus = synthetic_corpus(args.docs + args.adds + args.queries)
+    keys = [f"CASE-{idx}" for idx in range(len(corpus))]
+    base_keys, base_texts = keys[: args.docs], corpus[: args.docs]
+    added = list(zip(keys[args.docs: args.docs + args.adds], corpus[args.docs: args.docs + args.adds]))
+    queries = corpus[args.docs + args.adds:]
+
+    timings: Dict[str, float] = {}
+    start = time.perf_counter()
+    legacy = LegacyMatcher(base_keys, base_texts)
+    timings["legacy fit"] = time.perf_counter() - start
+    truth = [legacy.search(text, args.k) for text in queries]
+
+    indexes: Dict[str, CaseSimilarityIndex] = {}
+    for backend in ("exact", "ivf"):
+        index = CaseSimilarityIndex(backend=backend, n_probe=args.n_probe, refit_ratio=1.0)
+        start = time.perf_counter()
+        index.fit(base_keys, base_texts)
+        timings[f"{backend} fit"] = time.perf_counter() - start
+        indexes[backend] = index
+
+    rows = {"legacy": measure(lambda text: legacy.search(text, args.k), queries, truth, args.k)}
+    for backend, index in indexes.items():
+        rows[backend] = measure(lambda text, index=index: index.search(text, args.k), queries, truth, args.k)
+
+    # Incremental adds (delta segment, no refit) vs. a full refit of the grown corpus.
+    start = time.perf_counter()
+    for backend, index in indexes.items():
+        index.upsert_many(added)
+    timings["incremental adds (both)"] = time.perf_counter() - start
+    refit = LegacyMatcher(base_keys + [key for key, _ in added], base_texts + [text for _, text in added])
+    grown_truth = [refit.search(text, args.k) for text in queries]
+    for backend, index in indexes.items():
+        rows[f"{backend}+delta"] = measure(
+            lambda text, index=index: index.search(text, args.k), queries, grown_truth, args.k
+        )
+
+    indexes["exact"].refit(block=True)
+    rows["exact+refit"] = measure(
+        lambda text: indexes["exact"].search(text, args.k), queries, grown_truth, args.k
+    )
+
+    print(f"docs={args.docs} adds={args.adds} queries={len(queries)} k={args.k}")
+    for label, elapsed in timings.items():
+        print(f"{label:<26} {elapsed:8.2f}s")
+    print(f"{'matcher':<14} {'p50 ms':>8} {'p95 ms':>8} {'recall@k':>9}")
+    for label, row in rows.items():
+        print(f"{label:<14} {row['p50_ms']:8.2f} {row['p95_ms']:8.2f} {row['recall']:9.3f}")
+    if rows["exact"]["recall"] < 0.999:
+        raise SystemExit("exact backend must reproduce the brute-force ranking")
+
+
+if __name__ == "__main__":
+    main()
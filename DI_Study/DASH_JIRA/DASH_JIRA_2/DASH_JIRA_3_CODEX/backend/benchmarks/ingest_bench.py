@@ -0,0 +1,177 @@
+"""Replaying the test dataset: per-row ingest vs. bulk ``ingest_next``.
+
+``legacy`` is the pre-bulk simulator loop (``iloc`` + ``to_dict`` +
+``upsert_issue`` per row, then a synchronous ``get_issue_analysis``); ``bulk``
+normalises each 50-issue batch with ``_prepare_records``, applies it with one
+``upsert_issues`` call and leaves the analyses to the background queue (the
+timing includes draining it). ``--no-analysis`` measures ingestion alone.
+
+Before timing, the script checks that ``_prepare_records`` produces exactly
+what ``_prepare_record`` produces for the test dataset rows and for
+webhook-shaped records (string dates, time zones, placeholders).
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.ingest_bench --test-rows 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from .snapshot_bench import frame_mismatches
+from .synthetic import synthetic_environment
+
+WEBHOOK_RECORDS: List[Dict[str, Any]] = [
+    {
+        "issue_key": "HOOK-1",
+        "summary": "[FR] Pixel not firing on campaign landing",
+        "description": "Please check the tag (DE) asap",
+        "status": "In Progress",
+        "priority": "P1",
+        "created_at": "2025-01-02T10:00:00+09:00",
+        "updated_at": "2025-01-03T11:30:00Z",
+        "resolved_at": None,
+        "region": "n/a",
+        "country": "France",
+        "category": "  Tagging ",
+    },
+    {
+        "issue_key": "HOOK-2",
+        "summary": "(KR) 신규 리포트 요청",
+        "description": None,
+        "status": None,
+        "priority": "",
+        "created_at": "02/Jan/25 10:15 AM",
+        "updated_at": "",
+        "resolved_at": "2025-01-05 08:00",
+        "region": "NA",
+        "country": None,
+        "category": None,
+        "category_sub": "Access",
+        "cause": "Config",
+    },
+    {
+        "issue_key": "HOOK-3",
+        "summary": "Report access",
+        "description": "",
+        "status": "Closed",
+        "priority": "High",
+        "created_at": pd.Timestamp("2024-12-30 09:00"),
+        "updated_at": pd.NaT,
+        "resolved_at": pd.Timestamp("2024-12-31 09:00"),
+        "region": "emea",
+        "country": "u.s.",
+        "request_type": "Service Request",
+        "urgency": "High",
+    },
+]
+
+
+def _same(left: Any, right: Any) -> bool:
+    if left is None or right is None:
+        return left is None and right is None
+    if isinstance(left, float) and isinstance(right, float):
+        return (math.isnan(left) and math.isnan(right)) or left == right
+    try:
+        if pd.isna(left) and pd.isna(right):
+            return True
+    except (TypeError, ValueError):
+        pass
+    return bool(left == right)
+
+
+def prepare_mismatches(repo, records: List[Dict[str, Any]]) -> List[str]:
+    expected = [repo._prepare_record(record) for record in records]
+    actual = repo._prepare_records(records)
+    mismatches = []
+    for left, right in zip(expected, actual):
+        if left.keys() != right.keys():
+            mismatches.append(f"{left['issue_key']}: keys")
+            continue
+        for name in left:
+            if not _same(left[name], right[name]):
+                mismatches.append(f"{left['issue_key']}.{name}: {left[name]!r} != {right[name]!r}")
+    return mismatches
+
+
+def legacy_replay(repo, df: pd.DataFrame, analyze: bool) -> int:
+    for idx in range(len(df)):
+        record = df.iloc[idx].to_dict()
+        if record.get("issue_key"):
+            repo.upsert_issue(record)
+            if analyze:
+                repo.get_issue_analysis(record["issue_key"], refresh=True)
+    return len(df)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--test-rows", type=int, default=1000)
+    parser.add_argument("--no-analysis", action="store_true")
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=args.test_rows):
+        from app.services.data_loader import JiraDataRepository, repository
+        from app.services.simulation import TestDatasetSimulator
+        from app.config import TEST_DATA_FILE
+
+        test_df = JiraDataRepository.load_dataset(TEST_DATA_FILE)
+        mismatches = prepare_mismatches(
+            repository, test_df.to_dict("records") + WEBHOOK_RECORDS
+        )
+        analyze = not args.no_analysis and repository._analysis_engine is not None
+
+        results: Dict[str, float] = {}
+        legacy_repo = JiraDataRepository()
+        start = time.perf_counter()
+        legacy_replay(legacy_repo, test_df, analyze=False)
+        results["legacy ingest"] = time.perf_counter() - start
+
+        bulk_repo = JiraDataRepository()
+        simulator = TestDatasetSimulator(bulk_repo, TEST_DATA_FILE)
+        start = time.perf_counter()
+        simulator.replay()
+        results["bulk ingest"] = time.perf_counter() - start
+        if bulk_repo.verify_aggregates():
+            mismatches.append("aggregates after bulk replay")
+        mismatches += [
+            f"frame {item}"
+            for item in frame_mismatches(legacy_repo.dataframe, bulk_repo.dataframe)
+        ]
+
+        if analyze:
+            # Fresh repositories so both runs start from an empty analysis cache.
+            engine = repository._analysis_engine
+            engine.cache.memory.clear()
+            if engine.cache.store is not None:
+                engine.cache.store.clear()
+            start = time.perf_counter()
+            legacy_replay(repository, test_df, analyze=True)
+            results["legacy ingest+analysis"] = time.perf_counter() - start
+
+            engine.cache.memory.clear()
+            if engine.cache.store is not None:
+                engine.cache.store.clear()
+            simulator = TestDatasetSimulator(repository, TEST_DATA_FILE)
+            start = time.perf_counter()
+            simulator.replay()
+            engine.queue.wait()
+            results["bulk ingest+analysis"] = time.perf_counter() - start
+
+    print(f"base rows={args.rows} replayed={args.test_rows}")
+    for label, elapsed in results.items():
+        print(f"{label:<24} {elapsed:8.2f}s  {args.test_rows / elapsed:9.0f} issues/s")
+    if mismatches:
+        raise SystemExit("bulk ingest differs:\n  " + "\n  ".join(mismatches[:20]))
+    print("parity: OK (_prepare_records == _prepare_record, same frame, aggregates consistent)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Startup cost of ``_prepare_frame`` and parity with the row-wise resolvers.
+
+The legacy path below is the pre-GeoResolutionEngine body of
+``_load_and_prepare`` (two ``df.apply(axis=1)`` passes plus chained per-cell
+``.apply``). The script fails if any prepared column differs.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.resolution_bench --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Dict, List
+
+import pandas as pd
+
+from .synthetic import synthetic_environment, timer
+
+COMPARED_COLUMNS = [
+    "region",
+    "country",
+    "category",
+    "root_cause",
+    "status",
+    "priority",
+    "is_closed",
+    "is_high_priority",
+    "created_date",
+    "updated_date",
+    "resolution_hours",
+    "status_bucket",
+]
+
+
+def legacy_prepare(df: pd.DataFrame) -> pd.DataFrame:
+    from app.services.data_loader import (
+        JiraDataRepository as repo,
+        _coalesce,
+        _normalize_country_code,
+        _normalize_placeholder,
+        _normalize_region_label,
+        _normalize_string,
+    )
+
+    df = df.dropna(subset=["issue_key"])
+    df = df.replace({pd.NA: None})
+    if "issue_id" not in df.columns:
+        df["issue_id"] = None
+    for date_col in ["created_at", "updated_at", "resolved_at"]:
+        if date_col in df.columns:
+            df[date_col] = repo._parse_datetime(df[date_col])
+    df["created_date"] = df["created_at"].dt.date
+    df["updated_date"] = df["updated_at"].dt.date
+    df["region"] = (
+        _coalesce(df, ["ads_region", "project_region", "region_es2"])
+        .apply(_normalize_string)
+        .apply(_normalize_placeholder)
+        .apply(_normalize_region_label)
+    )
+    df["country"] = (
+        _coalesce(df, ["country_es1", "country_es2", "country_aeme"])
+        .apply(_normalize_string)
+        .apply(_normalize_placeholder)
+        .apply(_normalize_country_code)
+    )
+    df["category"] = _coalesce(df, ["category_raw", "category_sub", "request_type"]).apply(
+        _normalize_string
+    )
+    df["root_cause"] = _coalesce(df, ["root_cause", "cause"]).apply(_normalize_string)
+    df["country"] = df.apply(
+        lambda row: repo._resolve_country_value(
+            row.get("country"), row.get("summary"), row.get("description")
+        ),
+        axis=1,
+    )
+    df["region"] = df.apply(
+        lambda row: repo._resolve_region_value(
+            row.get("region"), row.get("country"), row.get("summary"), row.get("description")
+        ),
+        axis=1,
+    )
+    df["status"] = df["status"].fillna("Unknown")
+    df["priority"] = df["priority"].fillna("Unspecified")
+    df["is_closed"] = df["status"].str.lower().apply(repo._is_closed_status)
+    df["is_high_priority"] = df["priority"].str.lower().apply(repo._is_high_priority)
+    if "resolved_at" in df.columns:
+        df["resolution_hours"] = (df["resolved_at"] - df["created_at"]).dt.total_seconds() / 3600
+    df["status_bucket"] = df["is_closed"].map({True: "Closed", False: "Open"})
+    return df
+
+
+def _normalized_values(series: pd.Series) -> List[object]:
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+
+def check_parity(expected: pd.DataFrame, actual: pd.DataFrame) -> List[str]:
+    mismatches: List[str] = []
+    if expected["issue_key"].tolist() != actual["issue_key"].tolist():
+        return ["issue_key order"]
+    for column in COMPARED_COLUMNS:
+        left = _normalized_values(expected[column])
+        right = _normalized_values(actual[column])
+        if left != right:
+            diffs = sum(1 for a, b in zip(left, right) if a != b)
+            mismatches.append(f"{column} ({diffs} rows)")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10):
+        from app.services.data_loader import JiraDataRepository, _text_geo_hits
+
+        path = JiraDataRepository().data_path
+        results: Dict[str, float] = {}
+        with timer("read_csv", results):
+            raw = JiraDataRepository._read_raw_frame(path)
+        with timer("legacy_prepare", results):
+            expected = legacy_prepare(raw.copy())
+        _text_geo_hits.cache_clear()
+        with timer("prepare (cold memo)", results):
+            actual = JiraDataRepository._prepare_frame(raw.copy())
+        with timer("prepare (warm memo)", results):
+            JiraDataRepository._prepare_frame(raw.copy())
+
+    mismatches = check_parity(expected, actual)
+    print(f"rows={len(actual)}")
+    for label, elapsed in results.items():
+        print(f"{label:<22} {elapsed:8.3f}s")
+    print(f"speedup (cold): {results['legacy_prepare'] / results['prepare (cold memo)']:.1f}x")
+    if mismatches:
+        raise SystemExit("parity check failed: " + ", ".join(mismatches))
+    print("parity: OK (" + ", ".join(COMPARED_COLUMNS) + ")")
+
+
+if __name__ == "__main__":
+    main()
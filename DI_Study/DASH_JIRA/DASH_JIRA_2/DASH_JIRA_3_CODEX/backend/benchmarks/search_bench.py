@@ -0,0 +1,142 @@
+"""``search_issues`` latency: ``str.contains`` scan + full sort vs. inverted index.
+
+The legacy function below is the pre-index filter/sort body of
+``search_issues`` with ``kind="stable"`` so tie order is well defined; the
+script fails if any query returns a different total or page. Upserts are
+applied between the two rounds to exercise incremental index maintenance.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.search_bench --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .synthetic import generate_rows, synthetic_environment, write_csv
+
+QUERIES: List[Dict[str, Any]] = [
+    {"text": "tracking"},
+    {"text": "리포트"},
+    {"text": "프로모션 페이지", "sort_by": "priority", "sort_order": "asc"},
+    {"text": "#12", "status": ["Open", "In Progress"]},
+    {"text": "page tracking error", "region": ["eu", "apac"], "page": 2},
+    {"text": "ks", "sort_by": "status"},
+    {"text": "[fr]", "category": ["tagging", ""]},
+    {"text": "--", "page": 3},
+    {"status": ["closed"], "sort_by": "resolution_hours", "sort_order": "desc"},
+    {"region": ["eu"], "sort_by": "region", "sort_order": "asc", "page": 5},
+    {"priority": ["highest", "p1"], "sort_by": "summary"},
+    {"page": 40, "page_size": 100},
+    {"sort_by": "updated_at", "sort_order": "asc"},
+]
+
+
+def _casefold_isin(series: pd.Series, values: List[str]) -> pd.Series:
+    lowered = {value.lower() for value in values}
+    return series.astype(object).fillna("").astype(str).str.lower().isin(lowered)
+
+
+def legacy_search(
+    df: pd.DataFrame,
+    status: Optional[List[str]] = None,
+    priority: Optional[List[str]] = None,
+    region: Optional[List[str]] = None,
+    category: Optional[List[str]] = None,
+    text: Optional[str] = None,
+    page: int = 1,
+    page_size: int = 20,
+    sort_by: str = "created_at",
+    sort_order: str = "desc",
+) -> Tuple[int, List[str]]:
+    filtered = df
+    for column, values in (
+        ("status", status),
+        ("priority", priority),
+        ("region", region),
+        ("category", category),
+    ):
+        if values:
+            filtered = filtered[_casefold_isin(filtered[column], values)]
+    if text:
+        filtered = filtered[
+            filtered["summary"].fillna("").str.contains(text, case=False, regex=False)
+            | filtered["description"].fillna("").str.contains(text, case=False, regex=False)
+        ]
+    total = len(filtered)
+    filtered = filtered.sort_values(by=sort_by, ascending=sort_order == "asc", kind="stable")
+    start = (page - 1) * page_size
+    return total, filtered["issue_key"].iloc[start: start + page_size].tolist()
+
+
+def _run(repo, query: Dict[str, Any]) -> Tuple[int, List[str]]:
+    result = repo.search_issues(**query)
+    return result["total"], [item["issue_key"] for item in result["items"]]
+
+
+def compare(repo, label: str) -> List[str]:
+    df = repo.dataframe
+    mismatches = []
+    for query in QUERIES:
+        if legacy_search(df, **query) != _run(repo, query):
+            mismatches.append(f"{label}: {query}")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--upserts", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10) as root:
+        from app.services.data_loader import JiraDataRepository
+
+        repo = JiraDataRepository()
+        start = time.perf_counter()
+        repo.search_issues(text="warmup")
+        build_seconds = time.perf_counter() - start
+
+        timings: Dict[str, Tuple[float, float]] = {}
+        for query in QUERIES:
+            label = ", ".join(f"{key}={value}" for key, value in query.items())
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                legacy_search(repo.dataframe, **query)
+            legacy = (time.perf_counter() - start) / args.repeat
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                _run(repo, query)
+            current = (time.perf_counter() - start) / args.repeat
+            timings[label] = (legacy, current)
+        mismatches = compare(repo, "initial")
+
+        rng = random.Random(3)
+        incoming = write_csv(
+            root / "incoming.csv",
+            generate_rows(args.upserts, seed=41, start_index=args.rows)
+            + generate_rows(args.upserts, seed=43, start_index=rng.randint(0, args.rows // 2)),
+        )
+        records = JiraDataRepository.load_dataset(incoming).to_dict("records")
+        for record in records[: len(records) // 2]:
+            repo.upsert_issue(record)
+        repo.upsert_issues(records[len(records) // 2:])
+        mismatches += compare(repo, "after upserts")
+
+    print(f"rows={args.rows} index build={build_seconds:.2f}s")
+    for label, (legacy, current) in timings.items():
+        print(f"{label[:60]:<60} legacy {legacy * 1e3:8.1f} ms  index {current * 1e3:7.2f} ms")
+    if mismatches:
+        raise SystemExit("search results differ:\n  " + "\n  ".join(mismatches))
+    print("parity: OK (initial + after upserts)")
+
+
+if __name__ == "__main__":
+    main()
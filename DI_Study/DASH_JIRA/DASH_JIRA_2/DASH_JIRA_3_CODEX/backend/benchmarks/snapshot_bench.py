@@ -0,0 +1,76 @@
+"""Cold vs. warm ``_load_and_prepare`` with the Arrow snapshot cache.
+
+Cold parses the CSV and writes the snapshot, warm reads it back through a
+memory map. The script fails if the warm frame differs from the cold one or
+if touching the source CSV does not invalidate the snapshot.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.snapshot_bench --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+from typing import Dict, List
+
+import pandas as pd
+
+from .synthetic import generate_rows, synthetic_environment, timer, write_csv
+
+
+def _normalized_values(series: pd.Series) -> List[object]:
+    return [None if pd.isna(value) else value for value in series.tolist()]
+
+
+def frame_mismatches(expected: pd.DataFrame, actual: pd.DataFrame) -> List[str]:
+    mismatches: List[str] = []
+    if list(expected.columns) != list(actual.columns):
+        return ["column order"]
+    for column in expected.columns:
+        if expected[column].dtype != actual[column].dtype:
+            mismatches.append(f"{column} dtype {expected[column].dtype} != {actual[column].dtype}")
+        elif _normalized_values(expected[column]) != _normalized_values(actual[column]):
+            mismatches.append(f"{column} values")
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows, test_rows=10) as root:
+        from app.services.data_loader import JiraDataRepository
+        from app.services.snapshot_cache import prepared_frame_cache
+
+        path = root / "bench.csv"
+        write_csv(path, generate_rows(args.rows, seed=5))
+        results: Dict[str, float] = {}
+        with timer("cold (csv + store)", results):
+            cold = JiraDataRepository.load_dataset(path)
+        snapshot = prepared_frame_cache.snapshot_path(path)
+        if not snapshot.exists():
+            raise SystemExit("snapshot was not written (is pyarrow installed?)")
+        with timer("warm (snapshot)", results):
+            warm = JiraDataRepository.load_dataset(path)
+
+        write_csv(path, generate_rows(args.rows, seed=6))
+        with timer("after source change", results):
+            changed = JiraDataRepository.load_dataset(path)
+        snapshot_size = snapshot.stat().st_size
+
+    mismatches = frame_mismatches(cold, warm)
+    print(f"rows={len(cold)} snapshot={snapshot_size / 1e6:.1f} MB")
+    for label, elapsed in results.items():
+        print(f"{label:<22} {elapsed:8.3f}s")
+    print(f"speedup (warm): {results['cold (csv + store)'] / results['warm (snapshot)']:.1f}x")
+    if mismatches:
+        raise SystemExit("warm frame differs: " + ", ".join(mismatches))
+    if changed["summary"].tolist() == cold["summary"].tolist():
+        raise SystemExit("stale snapshot served after the source CSV changed")
+    print("parity: OK, invalidation: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import csv
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+STATUSES = ["Open", "In Progress", "Closed", "Done", "Resolved", "Waiting for Customer", "Verification"]
+PRIORITIES = ["Highest", "High", "Medium", "Low", "P1", None]
+REGIONS = ["EU", "NA", "APAC", "LATAM", "MENA", "Global", "-", None, ""]
+COUNTRIES = ["FR", "DE", "US", "United Kingdom", "KR", "Brazil", "SA", "n/a", None]
+CATEGORIES = ["Tagging", "Report", "Access", "Data Issue", None]
+SUMMARY_TAGS = ["[UK]", "[FR]", "(DE)", "[APAC]", "[KSA]", "[NL]", "[SEC]", "(GLOBAL)", "[LC-Request]", ""]
+SUMMARY_BODIES = [
+    "LC Request - tagging update for product page",
+    "Data discrepancy between Adobe and GA",
+    "Please enable dashboard access for new account",
+    "Checkout page tracking error after release",
+    "신규 리포트 요청 - 프로모션 페이지",
+    "Pixel not firing on campaign landing",
+]
+DESCRIPTIONS = [
+    "Please check the tracking request for the [FR] site. Risk: data loss.",
+    "We need a new report for the promotion. 요청 사항 확인 부탁드립니다.",
+    "Issue observed since last deployment, urgent review needed (P1).",
+    "",
+    None,
+]
+
+CSV_COLUMNS = [
+    "Issue key",
+    "Issue id",
+    "Summary",
+    "Issue Type",
+    "Status",
+    "Priority",
+    "Resolution",
+    "Assignee",
+    "Reporter",
+    "Creator",
+    "Created",
+    "Updated",
+    "Resolved",
+    "Description",
+    "Custom field (Ads Region)",
+    "Custom field (Project Region)",
+    "Custom field (Country-ES1)",
+    "Custom field (Country-ES2)",
+    "Custom field (Category)",
+    "Custom field (Request Type)",
+    "Custom field (Cause)",
+    "Custom field (Urgency)",
+]
+
+
+def _format_jira_date(value: datetime) -> str:
+    return value.strftime("%d/%b/%y %I:%M %p")
+
+
+def generate_rows(count: int, seed: int = 7, start_index: int = 0) -> List[Dict[str, object]]:
+    """Build Jira CSV export rows shaped like ``processed/dataset_modeling.csv``."""
+
+    rng = random.Random(seed)
+    base = datetime(2024, 1, 1)
+    rows: List[Dict[str, object]] = []
+    for offset in range(count):
+        idx = start_index + offset
+        created = base + timedelta(minutes=rng.randint(0, 60 * 24 * 600))
+        status = rng.choice(STATUSES)
+        resolved = created + timedelta(hours=rng.randint(1, 400)) if status in {"Closed", "Done", "Resolved"} else None
+        rows.append(
+            {
+                "Issue key": f"GTA-{100000 + idx}",
+                "Issue id": str(2_000_000 + idx),
+                "Summary": f"{rng.choice(SUMMARY_TAGS)} {rng.choice(SUMMARY_BODIES)} #{idx}".strip(),
+                "Issue Type": rng.choice(["Task", "Bug", "Story"]),
+                "Status": status,
+                "Priority": rng.choice(PRIORITIES),
+                "Resolution": "Done" if resolved else None,
+                "Assignee": f"user{rng.randint(1, 40)}@example.com",
+                "Reporter": f"reporter{rng.randint(1, 20)}@example.com",
+                "Creator": f"reporter{rng.randint(1, 20)}@example.com",
+                "Created": _format_jira_date(created),
+                "Updated": _format_jira_date(created + timedelta(hours=rng.randint(0, 48))),
+                "Resolved": _format_jira_date(resolved) if resolved else None,
+                "Description": rng.choice(DESCRIPTIONS),
+                "Custom field (Ads Region)": rng.choice(REGIONS),
+                "Custom field (Project Region)": rng.choice(REGIONS),
+                "Custom field (Country-ES1)": rng.choice(COUNTRIES),
+                "Custom field (Country-ES2)": rng.choice(COUNTRIES),
+                "Custom field (Category)": rng.choice(CATEGORIES),
+                "Custom field (Request Type)": rng.choice(["Service Request", None]),
+                "Custom field (Cause)": rng.choice(["Config", "Code", None]),
+                "Custom field (Urgency)": rng.choice(["High", "Low", None]),
+            }
+        )
+    return rows
+
+
+def write_csv(path: Path, rows: List[Dict[str, object]]) -> Path:
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: ("" if value is None else value) for key, value in row.items()})
+    return path
+
+
+@contextmanager
+def synthetic_environment(model_rows: int, test_rows: int = 200) -> Iterator[Path]:
+    """Point ``JIRA_MODEL_DATASET``/``JIRA_TEST_DATASET`` at generated CSVs.
+
+    Prepared-frame snapshots and the analysis cache database are written
+    under the same temporary directory.
+
+    Must wrap the first ``import app...`` because the service singletons load
+    the datasets at import time.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="jira-bench-") as tmp:
+        root = Path(tmp)
+        model_path = write_csv(root / "dataset_modeling.csv", generate_rows(model_rows))
+        test_path = write_csv(
+            root / "dataset_test.csv", generate_rows(test_rows, seed=11, start_index=model_rows)
+        )
+        os.environ["JIRA_MODEL_DATASET"] = str(model_path)
+        os.environ["JIRA_TEST_DATASET"] = str(test_path)
+        os.environ["JIRA_SNAPSHOT_DIR"] = str(root / "snapshots")
+        os.environ["JIRA_ANALYSIS_CACHE_PATH"] = str(root / "analysis.sqlite3")
+        yield root
+
+
+@contextmanager
+def timer(label: str, results: Dict[str, float]) -> Iterator[None]:
+    start = time.perf_counter()
+    yield
+    results[label] = time.perf_counter() - start
@@ -0,0 +1,107 @@
+"""Simulation-sized translation load: per-string calls vs. batched, memoised engine.
+
+``TranslationService`` is driven with the summary/description pairs of
+consecutive 50-issue simulation batches. No LLM is reachable here, so a
+latency-modelling client stands in for ``llm_client``: every request
+(single or batched) sleeps ``--delay`` seconds and returns a tagged copy of
+the input. The legacy column is the pre-memo behaviour (``langdetect`` plus
+one ``translate`` request per string). The script fails if the two paths
+disagree on any language or translation.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.translation_bench --batches 10 --delay 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import List, Optional, Tuple
+
+from .synthetic import generate_rows, synthetic_environment
+
+
+class LatencyClient:
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.requests = 0
+
+    def available(self) -> bool:
+        return True
+
+    def translate(self, text: str, target_language: str) -> Optional[str]:
+        self.requests += 1
+        time.sleep(self.delay)
+        return f"<{target_language}> {text}"
+
+    def translate_batch(self, texts: List[str], target_language: str) -> Optional[List[str]]:
+        self.requests += 1
+        time.sleep(self.delay)
+        return [f"<{target_language}> {text}" for text in texts]
+
+
+def legacy_translate(client: LatencyClient, texts: List[str], target: str) -> List[Tuple[str, str]]:
+    from langdetect import LangDetectException, detect
+
+    results = []
+    for text in texts:
+        try:
+            lang = detect(text) if text else "unknown"
+        except LangDetectException:
+            lang = "unknown"
+        if not text or lang in (target, "unknown"):
+            results.append((lang, text))
+        else:
+            results.append((lang, client.translate(text, target)))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.05)
+    args = parser.parse_args()
+
+    from langdetect import DetectorFactory
+
+    with synthetic_environment(10, test_rows=10):
+        from app.services.analysis_pipeline import TranslationService
+
+    rows = generate_rows(args.batches * args.batch_size, seed=21)
+    batches = [
+        [
+            text
+            for row in rows[start: start + args.batch_size]
+            for text in (row["Summary"] or "", row["Description"] or "")
+        ]
+        for start in range(0, len(rows), args.batch_size)
+    ]
+
+    DetectorFactory.seed = 0
+    legacy_client = LatencyClient(args.delay)
+    start = time.perf_counter()
+    expected = [legacy_translate(legacy_client, texts, "ko") for texts in batches]
+    legacy_seconds = time.perf_counter() - start
+
+    DetectorFactory.seed = 0
+    service = TranslationService()
+    service.target_language = "ko"
+    service.llm = LatencyClient(args.delay)
+    start = time.perf_counter()
+    actual = [service.translate_many(texts) for texts in batches]
+    engine_seconds = time.perf_counter() - start
+
+    strings = sum(len(texts) for texts in batches)
+    print(f"batches={len(batches)} strings={strings} simulated round-trip={args.delay * 1e3:.0f} ms")
+    print(f"legacy  {legacy_seconds:8.2f}s  LLM requests={legacy_client.requests}")
+    print(f"engine  {engine_seconds:8.2f}s  LLM requests={service.llm.requests}")
+    print(f"stats   {service.stats()}")
+    if expected != actual:
+        raise SystemExit("batched engine returned different languages or translations")
+    print("parity: OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Sequential upsert throughput: legacy ``pd.concat`` path vs. IssueFrameStore.
+
+Usage (from ``backend/``)::
+
+    python -m benchmarks.upsert_bench --rows 20000 --upserts 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import warnings
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from .synthetic import generate_rows, synthetic_environment, timer, write_csv
+
+
+def legacy_upsert(df: pd.DataFrame, normalized: Dict[str, Any]) -> pd.DataFrame:
+    """The pre-IssueFrameStore ``upsert_issue`` body, kept for comparison."""
+
+    for column in normalized.keys():
+        if column not in df.columns:
+            df[column] = None
+    new_row = pd.DataFrame([normalized])
+    return (
+        pd.concat([df, new_row], ignore_index=True)
+        .drop_duplicates(subset=["issue_key"], keep="last")
+        .reset_index(drop=True)
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000, help="issues in the base dataset")
+    parser.add_argument("--upserts", type=int, default=10000, help="sequential upserts to apply")
+    parser.add_argument(
+        "--update-ratio", type=float, default=0.3, help="share of upserts hitting existing keys"
+    )
+    args = parser.parse_args()
+
+    with synthetic_environment(args.rows) as root:
+        from app.services.data_loader import JiraDataRepository
+
+        updates = int(args.upserts * args.update_ratio)
+        incoming_path = write_csv(
+            root / "incoming.csv",
+            generate_rows(args.upserts - updates, seed=23, start_index=args.rows)
+            + generate_rows(updates, seed=29, start_index=0),
+        )
+        records: List[Dict[str, Any]] = JiraDataRepository.load_dataset(incoming_path).to_dict(
+            "records"
+        )
+
+        results: Dict[str, float] = {}
+        repo = JiraDataRepository()
+        prepared = [repo._prepare_record(record) for record in records]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", FutureWarning)
+            legacy_df = JiraDataRepository.load_dataset(repo.data_path)
+            with timer("legacy", results):
+                for normalized in prepared:
+                    legacy_df = legacy_upsert(legacy_df, normalized)
+
+        with timer("store", results):
+            for normalized in prepared:
+                repo._store.upsert(normalized)
+
+        batch_repo = JiraDataRepository()
+        with timer("store_batch", results):
+            batch_repo._store.upsert_many(prepared)
+
+    expected = len(legacy_df)
+    for name, repository in (("store", repo), ("store_batch", batch_repo)):
+        if len(repository.dataframe) != expected:
+            raise SystemExit(
+                f"{name} holds {len(repository.dataframe)} rows, legacy holds {expected}"
+            )
+
+    print(f"base rows={args.rows} upserts={len(prepared)} (updates={updates}) final rows={expected}")
+    for label, elapsed in results.items():
+        rate = len(prepared) / elapsed if elapsed else float("inf")
+        print(f"{label:<12} {elapsed:8.3f}s  {elapsed / len(prepared) * 1e3:8.3f} ms/op  {rate:10.0f} ops/s")
+    print(f"speedup (sequential): {results['legacy'] / results['store']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
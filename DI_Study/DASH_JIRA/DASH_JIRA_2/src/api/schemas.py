@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any
 
 class IssueRequest(BaseModel):
@@ -21,6 +21,9 @@ class AnalysisResponse(BaseModel):
 class SearchRequest(BaseModel):
     query: str
     limit: int = 3
+    # ANN recall/latency knobs; server defaults apply when omitted
+    ef_search: Optional[int] = Field(None, ge=1, le=1000)
+    probes: Optional[int] = Field(None, ge=1, le=10000)
 
 class SearchResult(BaseModel):
     issue_key: str
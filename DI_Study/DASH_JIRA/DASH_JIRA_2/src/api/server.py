@@ -5,6 +5,9 @@ from src.nlp.processor import NLPProcessor
 from src.routing.rules import RuleEngine
 from src.search.vector_store import VectorStore
 from src.ingestion.models import IssueModel
+from src.db.connection import pooled_connection, close_pool
+from src.nlp.cache import cache_stats
+from src.api.workers import run_blocking, run_llm, shutdown_workers
 
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -31,7 +34,7 @@ vector_store = VectorStore()
 @app.post("/analyze", response_model=AnalysisResponse)
 async def analyze_issue(request: IssueRequest):
     try:
-        result = nlp_processor.process_issue(request.summary, request.description)
+        result = await run_llm(nlp_processor.process_issue, request.summary, request.description)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -40,7 +43,7 @@ async def analyze_issue(request: IssueRequest):
 async def route_issue(request: IssueRequest):
     try:
         # 1. Analyze first
-        analysis = nlp_processor.process_issue(request.summary, request.description)
+        analysis = await run_llm(nlp_processor.process_issue, request.summary, request.description)
         
         # 2. Create a temporary IssueModel for rule engine
         issue = IssueModel(
@@ -68,15 +71,26 @@ async def route_issue(request: IssueRequest):
 @app.post("/search", response_model=List[SearchResult])
 async def search_issues(request: SearchRequest):
     try:
-        results = vector_store.search_similar_cases(request.query, request.limit)
+        results = await run_llm(
+            vector_store.search_similar_cases, request.query, request.limit, ef_search=request.ef_search, probes=request.probes
+        )
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.on_event("shutdown")
+def shutdown_db_pool():
+    shutdown_workers()
+    close_pool()
+
 @app.get("/health")
 async def health_check():
     return {"status": "ok"}
 
+@app.get("/cache/stats")
+async def get_cache_stats():
+    return cache_stats()
+
 from fastapi.responses import FileResponse
 
 @app.get("/")
@@ -87,7 +101,13 @@ async def read_root():
 # --- Knowledge Base Endpoints ---
 @app.get("/issues/stats")
 async def get_issue_stats():
-    conn = get_db_connection()
+    return await run_blocking(_issue_stats)
+
+def _issue_stats():
+    with pooled_connection() as conn:
+        return _query_issue_stats(conn)
+
+def _query_issue_stats(conn):
     cur = conn.cursor()
     try:
         # Total count
@@ -109,11 +129,16 @@ async def get_issue_stats():
         }
     finally:
         cur.close()
-        conn.close()
 
 @app.get("/issues")
 async def get_issues(limit: int = 20, offset: int = 0, search: str = None):
-    conn = get_db_connection()
+    return await run_blocking(_list_issues, limit, offset, search)
+
+def _list_issues(limit, offset, search):
+    with pooled_connection() as conn:
+        return _query_issues(conn, limit, offset, search)
+
+def _query_issues(conn, limit, offset, search):
     cur = conn.cursor()
     try:
         query = "SELECT issue_key, summary, issue_type, status, created, priority, description, project_name FROM issues"
@@ -144,7 +169,6 @@ async def get_issues(limit: int = 20, offset: int = 0, search: str = None):
         return issues
     finally:
         cur.close()
-        conn.close()
 
 # --- Simulation Endpoints ---
 import pandas as pd
@@ -155,17 +179,20 @@ TEST_DATA_PATH = '/home/ubuntu/DI/DASH_JIRA_2/processed/dataset_test.csv'
 @app.get("/simulation/test-data")
 async def get_test_data():
     try:
-        # Read only a subset or cache this in production
-        df = pd.read_csv(TEST_DATA_PATH)
-        # Pick a random row
-        row = df.sample(n=1).iloc[0]
-        
-        return {
-            "summary": row.get('Summary', ''),
-            "description": row.get('Description', ''),
-            "issue_type": row.get('Issue Type', ''),
-            "project": row.get('Project name', '') or row.get('Project key', ''),
-            "priority": row.get('Priority', '')
-        }
+        return await run_blocking(_sample_test_row)
     except Exception as e:
         return {"error": str(e)}
+
+def _sample_test_row():
+    # Read only a subset or cache this in production
+    df = pd.read_csv(TEST_DATA_PATH)
+    # Pick a random row
+    row = df.sample(n=1).iloc[0]
+
+    return {
+        "summary": row.get('Summary', ''),
+        "description": row.get('Description', ''),
+        "issue_type": row.get('Issue Type', ''),
+        "project": row.get('Project name', '') or row.get('Project key', ''),
+        "priority": row.get('Priority', '')
+    }
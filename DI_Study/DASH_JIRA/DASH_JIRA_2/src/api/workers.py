@@ -0,0 +1,53 @@
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+from src.config import settings
+
+# Blocking service calls (OpenAI, psycopg2, pandas) run on bounded thread
+# pools so a slow upstream never stalls the event loop. LLM calls get their
+# own lane so a burst of slow analyses cannot queue fast DB reads behind it.
+# A lane with 0 threads runs calls inline on the loop (comparisons only).
+_threads: Dict[str, int] = {
+    "db": settings.API_WORKER_THREADS,
+    "llm": settings.API_LLM_THREADS,
+}
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+def _get_executor(lane: str):
+    with _lock:
+        executor = _executors.get(lane)
+        if executor is None and _threads[lane] > 0:
+            executor = ThreadPoolExecutor(max_workers=_threads[lane], thread_name_prefix=f"api-{lane}")
+            _executors[lane] = executor
+        return executor
+
+async def _run(lane: str, fn: Callable[..., Any], args, kwargs) -> Any:
+    call = functools.partial(fn, *args, **kwargs)
+    executor = _get_executor(lane)
+    if executor is None:
+        return call()
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a blocking DB/file call on the worker pool."""
+    return await _run("db", fn, args, kwargs)
+
+async def run_llm(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Runs a blocking LLM/embedding call on the LLM pool."""
+    return await _run("llm", fn, args, kwargs)
+
+def configure_workers(db_threads: int, llm_threads: int):
+    shutdown_workers()
+    with _lock:
+        _threads["db"] = db_threads
+        _threads["llm"] = llm_threads
+
+def shutdown_workers():
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -8,9 +8,36 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "jira_agent")
     POSTGRES_HOST: str = os.getenv("POSTGRES_HOST", "localhost")
     POSTGRES_PORT: int = int(os.getenv("POSTGRES_PORT", 5433))
+    DB_POOL_MIN: int = int(os.getenv("DB_POOL_MIN", 1))
+    DB_POOL_MAX: int = int(os.getenv("DB_POOL_MAX", 10))
+
+    # API: worker threads for blocking DB / LLM calls (0 = run on the event loop)
+    API_WORKER_THREADS: int = int(os.getenv("API_WORKER_THREADS", 8))
+    API_LLM_THREADS: int = int(os.getenv("API_LLM_THREADS", 32))
+
+    # Ingestion
+    LOADER_CHUNK_ROWS: int = int(os.getenv("LOADER_CHUNK_ROWS", 50000))
 
     # OpenAI
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
+    OPENAI_BASE_URL: str = os.getenv("OPENAI_BASE_URL", "")
+
+    # Query-embedding / analysis cache; LLM_CACHE_PATH="" keeps it in memory only
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 4096))
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", 7 * 24 * 3600))
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", "")
+    LLM_CACHE_STORE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_STORE_MAX_ENTRIES", 100000))
+
+    # Embedding indexer
+    EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+    EMBEDDING_BATCH_SIZE: int = int(os.getenv("EMBEDDING_BATCH_SIZE", 64))
+    EMBEDDING_MAX_CONCURRENCY: int = int(os.getenv("EMBEDDING_MAX_CONCURRENCY", 4))
+
+    # Vector search: "pgvector", or "local" for the in-process NumPy index
+    VECTOR_BACKEND: str = os.getenv("VECTOR_BACKEND", "pgvector")
+    HNSW_EF_SEARCH: int = int(os.getenv("HNSW_EF_SEARCH", 40))
+    IVFFLAT_PROBES: int = int(os.getenv("IVFFLAT_PROBES", 10))
+    LOCAL_INDEX_PATH: str = os.getenv("LOCAL_INDEX_PATH", "data/vector_index.npz")
 
     class Config:
         env_file = ".env"
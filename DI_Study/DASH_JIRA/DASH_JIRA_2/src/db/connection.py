@@ -1,13 +1,62 @@
+import threading
+from contextlib import contextmanager
 import psycopg2
 from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
 from src.config import settings
 
-def get_db_connection():
-    conn = psycopg2.connect(
+def _connect_kwargs():
+    return dict(
         user=settings.POSTGRES_USER,
         password=settings.POSTGRES_PASSWORD,
         dbname=settings.POSTGRES_DB,
         host=settings.POSTGRES_HOST,
         port=settings.POSTGRES_PORT
     )
+
+def get_db_connection():
+    conn = psycopg2.connect(**_connect_kwargs())
     return conn
+
+_pool = None
+_pool_lock = threading.Lock()
+# ThreadedConnectionPool raises once it is exhausted; the semaphore makes
+# callers wait for a free connection instead.
+_pool_slots = threading.BoundedSemaphore(settings.DB_POOL_MAX)
+
+def get_pool() -> ThreadedConnectionPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadedConnectionPool(settings.DB_POOL_MIN, settings.DB_POOL_MAX, **_connect_kwargs())
+        return _pool
+
+@contextmanager
+def pooled_connection():
+    """Borrow a connection from the shared pool.
+
+    Commits on success and rolls back on error before the connection goes
+    back to the pool; broken connections are discarded.
+    """
+    _pool_slots.acquire()
+    try:
+        pool = get_pool()
+        conn = pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
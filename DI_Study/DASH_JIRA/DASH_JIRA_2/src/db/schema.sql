@@ -34,10 +34,26 @@ CREATE TABLE IF NOT EXISTS embeddings (
     issue_key VARCHAR(50) REFERENCES issues(issue_key) ON DELETE CASCADE,
     embedding_type VARCHAR(20), -- 'summary', 'full_context', 'resolution'
     vector VECTOR(1536),
-    model_version VARCHAR(50)
+    model_version VARCHAR(50),
+    content_hash VARCHAR(64) -- sha256 of the embedded text; unchanged text is not re-embedded
+);
+
+-- Embedding indexer progress (resumable runs)
+CREATE TABLE IF NOT EXISTS embedding_checkpoints (
+    job_name VARCHAR(100) PRIMARY KEY,
+    last_issue_key VARCHAR(50),
+    indexed_count INTEGER DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT NOW()
 );
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_issues_status ON issues(status);
 CREATE INDEX IF NOT EXISTS idx_issues_assignee ON issues(assignee_id);
 CREATE INDEX IF NOT EXISTS idx_comments_issue_key ON comments(issue_key);
+CREATE INDEX IF NOT EXISTS idx_embeddings_issue_type ON embeddings(issue_key, embedding_type);
+
+-- ANN index for cosine search (pgvector >= 0.5). Tune recall at query time with
+-- hnsw.ef_search; for IVFFlat rebuild via `python -m src.search.vector_store
+-- create-index --kind ivfflat` after loading and tune with ivfflat.probes.
+CREATE INDEX IF NOT EXISTS idx_embeddings_vector_hnsw ON embeddings
+    USING hnsw (vector vector_cosine_ops) WITH (m = 16, ef_construction = 64);
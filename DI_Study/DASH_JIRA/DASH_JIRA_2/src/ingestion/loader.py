@@ -1,57 +1,215 @@
 import pandas as pd
+import csv
+import io
 import json
-from typing import List
+from json.encoder import encode_basestring
+import time
+from typing import List, Optional
 import psycopg2
+from src.config import settings
 from src.db.connection import get_db_connection
 from src.ingestion.models import IssueModel
 from datetime import datetime
 
+DATE_FORMAT = "%d/%b/%y %I:%M %p"
+CUSTOM_FIELD_PREFIX = 'Custom field'
+
+# CSV header for each issues column; the bulk path stages them in this order.
+COLUMN_SOURCES = {
+    'issue_key': 'Issue key',
+    'issue_id': 'Issue id',
+    'summary': 'Summary',
+    'description': 'Description',
+    'status': 'Status',
+    'issue_type': 'Issue Type',
+    'priority': 'Priority',
+    'created_at': 'Created',
+    'updated_at': 'Updated',
+    'assignee_id': 'Assignee',
+    'reporter_id': 'Reporter',
+}
+ISSUE_COLUMNS = list(COLUMN_SOURCES) + ['custom_fields']
+STAGE_COLUMNS = ['seq'] + ISSUE_COLUMNS
+COPY_NULL = '\\N'
+
+# Columns the upsert overwrites on conflict; the rest keep their first value.
+UPDATE_COLUMNS = ['summary', 'description', 'status', 'updated_at', 'custom_fields']
+
+# Equivalent to upserting the staged rows one by one in file order: a new
+# issue takes its insert-only columns from its first row and the updated
+# columns from its last row.
+UPSERT_SQL = """
+    WITH first_rows AS (
+        SELECT DISTINCT ON (issue_key) * FROM issues_stage ORDER BY issue_key, seq
+    ), last_rows AS (
+        SELECT DISTINCT ON (issue_key) * FROM issues_stage ORDER BY issue_key, seq DESC
+    )
+    INSERT INTO issues ({columns})
+    SELECT {selected}
+    FROM first_rows f JOIN last_rows l USING (issue_key)
+    ON CONFLICT (issue_key) DO UPDATE SET
+        {assignments};
+""".format(
+    columns=', '.join(ISSUE_COLUMNS),
+    selected=', '.join(
+        ('l.' if column in UPDATE_COLUMNS else 'f.') + column if column != 'issue_key' else column
+        for column in ISSUE_COLUMNS
+    ),
+    assignments=',\n        '.join(f'{column} = EXCLUDED.{column}' for column in UPDATE_COLUMNS),
+)
+
 def parse_date(date_str):
     if pd.isna(date_str):
         return None
-    # Adjust format based on actual CSV data. 
+    # Adjust format based on actual CSV data.
     # Example: "16/Jul/24 10:06 PM"
     try:
-        return datetime.strptime(str(date_str), "%d/%b/%y %I:%M %p")
+        return datetime.strptime(str(date_str), DATE_FORMAT)
     except ValueError:
         return None
 
-def load_csv_to_db(csv_path: str):
+def custom_field_columns(columns) -> List[str]:
+    return [col for col in columns if str(col).startswith(CUSTOM_FIELD_PREFIX)]
+
+def build_issue(row, custom_columns: List[str]) -> IssueModel:
+    # Map standard fields
+    issue = IssueModel(
+        issue_key=row.get('Issue key'),
+        issue_id=row.get('Issue id'),
+        summary=row.get('Summary') or '',
+        description=row.get('Description', ''),
+        status=row.get('Status'),
+        issue_type=row.get('Issue Type'),
+        priority=row.get('Priority'),
+        created_at=parse_date(row.get('Created')),
+        updated_at=parse_date(row.get('Updated')),
+        assignee_id=row.get('Assignee'),
+        reporter_id=row.get('Reporter'),
+        custom_fields={}
+    )
+
+    # Simple dynamic mapping for custom fields (columns starting with 'Custom field')
+    for col in custom_columns:
+        if not pd.isna(row[col]):
+            issue.custom_fields[col] = str(row[col])
+    return issue
+
+def _text_column(chunk: pd.DataFrame, name: str) -> pd.Series:
+    if name not in chunk.columns:
+        return pd.Series(None, index=chunk.index, dtype=object)
+    values = chunk[name]
+    return values.astype(str).where(values.notna(), None).astype(object)
+
+def _custom_fields_json(chunk: pd.DataFrame, custom_columns: List[str]) -> pd.Series:
+    """Column-at-a-time JSON object per row, skipping null fields."""
+
+    body = pd.Series('', index=chunk.index, dtype=object)
+    for col in custom_columns:
+        values = chunk[col]
+        present = values.notna()
+        if not present.any():
+            continue
+        # encode_basestring is json's C string encoder (quotes included).
+        encoded = values[present].astype(str).map(encode_basestring)
+        fragment = json.dumps(col) + ':' + encoded
+        current = body[present]
+        body[present] = current.where(current == '', current + ',') + fragment
+    return '{' + body + '}'
+
+def prepare_chunk(chunk: pd.DataFrame, custom_columns: List[str]) -> pd.DataFrame:
+    """Vectorised equivalent of ``build_issue`` for a whole CSV chunk.
+
+    Rows without an issue key are dropped; a missing summary becomes ''.
+    """
+
+    frame = pd.DataFrame(index=chunk.index)
+    for column, source in COLUMN_SOURCES.items():
+        frame[column] = _text_column(chunk, source)
+    frame['summary'] = frame['summary'].fillna('')
+
+    issue_id = pd.to_numeric(frame['issue_id'], errors='coerce')
+    frame['issue_id'] = issue_id.where(issue_id % 1 == 0).astype('Int64')
+    for column in ('created_at', 'updated_at'):
+        frame[column] = pd.to_datetime(frame[column], format=DATE_FORMAT, errors='coerce')
+
+    frame['custom_fields'] = _custom_fields_json(chunk, custom_columns)
+    return frame[frame['issue_key'].notna()]
+
+def _copy_chunk(cur, frame: pd.DataFrame, seq_start: int) -> None:
+    staged = frame.reset_index(drop=True)
+    staged.insert(0, 'seq', range(seq_start, seq_start + len(staged)))
+    buffer = io.StringIO()
+    # Every field is quoted so empty strings survive; FORCE_NULL maps \N back to NULL.
+    staged.to_csv(
+        buffer, header=False, index=False, quoting=csv.QUOTE_ALL,
+        na_rep=COPY_NULL, date_format='%Y-%m-%d %H:%M:%S',
+    )
+    buffer.seek(0)
+    cur.copy_expert(
+        "COPY issues_stage ({columns}) FROM STDIN WITH (FORMAT csv, NULL '{null}', FORCE_NULL ({columns}))".format(
+            columns=', '.join(STAGE_COLUMNS), null=COPY_NULL
+        ),
+        buffer,
+    )
+
+def bulk_load_csv(csv_path: str, chunksize: Optional[int] = None, conn=None) -> int:
+    """Stream the CSV in chunks through COPY into a staging table, then upsert once.
+
+    Repeated issue keys resolve as they would in the row-by-row loader.
+    Returns the number of issues inserted or updated.
+    """
+
+    chunksize = chunksize or settings.LOADER_CHUNK_ROWS
+    own_conn = conn is None
+    conn = conn or get_db_connection()
+    cur = conn.cursor()
+    started = time.perf_counter()
+    staged = 0
+
+    try:
+        cur.execute("CREATE TEMP TABLE issues_stage (seq BIGINT, LIKE issues) ON COMMIT DROP;")
+        custom_columns = None
+        for chunk in pd.read_csv(csv_path, low_memory=False, chunksize=chunksize):
+            if custom_columns is None:
+                custom_columns = custom_field_columns(chunk.columns)
+            frame = prepare_chunk(chunk, custom_columns)
+            _copy_chunk(cur, frame, staged)
+            staged += len(frame)
+            print(f"Staged {staged} rows from {csv_path}...")
+        cur.execute(UPSERT_SQL)
+        loaded = cur.rowcount
+        conn.commit()
+    except Exception as e:
+        print(f"Bulk load failed for {csv_path}: {e}")
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+        if own_conn:
+            conn.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"Data loading complete: {loaded} issues in {elapsed:.2f}s ({staged / max(elapsed, 1e-9):.0f} rows/s).")
+    return loaded
+
+def load_csv_rowwise(csv_path: str, conn=None):
     df = pd.read_csv(csv_path, low_memory=False)
-    df = df.where(pd.notnull(df), None)
-    
-    conn = get_db_connection()
+    df = df.astype(object).where(pd.notnull(df), None)
+    custom_columns = custom_field_columns(df.columns)
+
+    own_conn = conn is None
+    conn = conn or get_db_connection()
     cur = conn.cursor()
-    
+
     print(f"Loading {len(df)} rows from {csv_path}...")
-    
+
     for _, row in df.iterrows():
-        # Map standard fields
-        issue = IssueModel(
-            issue_key=row.get('Issue key'),
-            issue_id=row.get('Issue id'),
-            summary=row.get('Summary', ''),
-            description=row.get('Description', ''),
-            status=row.get('Status'),
-            issue_type=row.get('Issue Type'),
-            priority=row.get('Priority'),
-            created_at=parse_date(row.get('Created')),
-            updated_at=parse_date(row.get('Updated')),
-            assignee_id=row.get('Assignee'),
-            reporter_id=row.get('Reporter'),
-            custom_fields={} # TODO: Map custom fields dynamically
-        )
-        
-        # Simple dynamic mapping for custom fields (columns starting with 'Custom field')
-        for col in df.columns:
-            if col.startswith('Custom field'):
-                if not pd.isna(row[col]):
-                    issue.custom_fields[col] = str(row[col])
+        issue = build_issue(row, custom_columns)
 
         try:
             cur.execute("""
                 INSERT INTO issues (
-                    issue_key, issue_id, summary, description, status, issue_type, priority, 
+                    issue_key, issue_id, summary, description, status, issue_type, priority,
                     created_at, updated_at, assignee_id, reporter_id, custom_fields
                 ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                 ON CONFLICT (issue_key) DO UPDATE SET
@@ -61,23 +219,30 @@ def load_csv_to_db(csv_path: str):
                     updated_at = EXCLUDED.updated_at,
                     custom_fields = EXCLUDED.custom_fields;
             """, (
-                issue.issue_key, issue.issue_id, issue.summary, issue.description, issue.status, 
-                issue.issue_type, issue.priority, issue.created_at, issue.updated_at, 
+                issue.issue_key, issue.issue_id, issue.summary, issue.description, issue.status,
+                issue.issue_type, issue.priority, issue.created_at, issue.updated_at,
                 issue.assignee_id, issue.reporter_id, json.dumps(issue.custom_fields)
             ))
         except Exception as e:
             print(f"Error inserting issue {issue.issue_key}: {e}")
             conn.rollback()
             continue
-            
+
     conn.commit()
     cur.close()
-    conn.close()
+    if own_conn:
+        conn.close()
     print("Data loading complete.")
 
+def load_csv_to_db(csv_path: str, bulk: bool = True, chunksize: Optional[int] = None, conn=None):
+    if bulk:
+        return bulk_load_csv(csv_path, chunksize=chunksize, conn=conn)
+    return load_csv_rowwise(csv_path, conn=conn)
+
 if __name__ == "__main__":
     import sys
-    if len(sys.argv) > 1:
-        load_csv_to_db(sys.argv[1])
+    args = [arg for arg in sys.argv[1:] if arg != '--rowwise']
+    if args:
+        load_csv_to_db(args[0], bulk='--rowwise' not in sys.argv)
     else:
-        print("Usage: python loader.py <csv_path>")
+        print("Usage: python loader.py <csv_path> [--rowwise]")
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+from src.config import settings
+
+def content_key(*parts: Optional[str]) -> str:
+    """sha256 over the parts that determine an upstream result."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x1f")
+    return digest.hexdigest()
+
+class LRUCache:
+    """Thread-safe LRU map; ``ttl_seconds <= 0`` disables expiry."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if self.ttl_seconds > 0 and time.time() - stored_at > self.ttl_seconds:
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._items[key] = (time.time(), value)
+            self._items.move_to_end(key)
+            while self.max_entries > 0 and len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+class SQLiteStore:
+    """JSON values persisted in one SQLite file, shared by all cache namespaces.
+
+    Rows older than ``ttl_seconds`` are never returned. They are deleted on
+    open and every ``prune_every`` writes, when the least recently read rows
+    beyond ``max_entries`` are dropped as well (``<= 0`` disables either bound).
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 0, max_entries: int = 0, prune_every: int = 256):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.prune_every = max(1, prune_every)
+        self._writes = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    namespace TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    PRIMARY KEY (namespace, key)
+                )
+            """)
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_cache)")}
+            if "accessed_at" not in columns:
+                # Files written before reads were tracked
+                self._conn.execute("ALTER TABLE llm_cache ADD COLUMN accessed_at REAL NOT NULL DEFAULT 0")
+                self._conn.execute("UPDATE llm_cache SET accessed_at = created_at")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_created ON llm_cache (created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)")
+            self._prune()
+
+    def _oldest(self, now: float) -> float:
+        return now - self.ttl_seconds if self.ttl_seconds > 0 else float("-inf")
+
+    def _prune(self):
+        # Callers hold the lock inside a transaction.
+        if self.ttl_seconds > 0:
+            self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (self._oldest(time.time()),))
+        if self.max_entries > 0:
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE rowid IN ("
+                "SELECT rowid FROM llm_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def get(self, namespace: str, key: str) -> Any:
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT value FROM llm_cache WHERE namespace = ? AND key = ? AND created_at >= ?",
+                (namespace, key, self._oldest(now)),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+            )
+        return json.loads(row[0])
+
+    def set(self, namespace: str, key: str, value: Any):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (namespace, key, json.dumps(value, ensure_ascii=False), now, now),
+            )
+            self._writes += 1
+            if self._writes % self.prune_every == 0:
+                self._prune()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    def clear(self):
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+class ResultCache:
+    """In-memory LRU in front of an optional SQLite store, with hit counters."""
+
+    def __init__(self, namespace: str, max_entries: int, ttl_seconds: float = 0, store: Optional[SQLiteStore] = None):
+        self.namespace = namespace
+        self.memory = LRUCache(max_entries, ttl_seconds)
+        self.store = store
+        self.hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        # Callers run on the LLM thread pool; += on an attribute is not atomic.
+        self._stats_lock = threading.Lock()
+
+    def _count(self, counter: str):
+        with self._stats_lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get(self, key: str) -> Any:
+        value = self.memory.get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+        if self.store is not None:
+            try:
+                value = self.store.get(self.namespace, key)
+            except sqlite3.Error as e:
+                print(f"Cache read failed ({self.namespace}): {e}")
+                value = None
+            if value is not None:
+                self._count("store_hits")
+                self.memory.set(key, value)
+                return value
+        self._count("misses")
+        return None
+
+    def set(self, key: str, value: Any):
+        self.memory.set(key, value)
+        if self.store is not None:
+            try:
+                self.store.set(self.namespace, key, value)
+            except sqlite3.Error as e:
+                print(f"Cache write failed ({self.namespace}): {e}")
+
+    def clear(self):
+        self.memory.clear()
+        with self._stats_lock:
+            self.hits = self.store_hits = self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return {"entries": len(self.memory), "hits": self.hits, "store_hits": self.store_hits, "misses": self.misses}
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one upstream call.
+
+    The first caller runs ``fn``; callers arriving while it is in flight wait
+    and receive the same result (or exception).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Dict[str, Any]] = {}
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"done": threading.Event(), "result": None, "error": None}
+                self._calls[key] = call
+            else:
+                self.coalesced += 1
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+        try:
+            call["result"] = fn()
+            return call["result"]
+        except Exception as e:
+            call["error"] = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+def _build_store() -> Optional[SQLiteStore]:
+    if not settings.LLM_CACHE_PATH:
+        return None
+    try:
+        return SQLiteStore(
+            settings.LLM_CACHE_PATH, settings.LLM_CACHE_TTL_SECONDS, settings.LLM_CACHE_STORE_MAX_ENTRIES
+        )
+    except (OSError, sqlite3.Error) as e:
+        print(f"LLM cache store unavailable ({settings.LLM_CACHE_PATH}): {e}; using memory only")
+        return None
+
+_store = _build_store()
+embedding_cache = ResultCache("embedding", settings.LLM_CACHE_MAX_ENTRIES, settings.LLM_CACHE_TTL_SECONDS, _store)
+analysis_cache = ResultCache("analysis", settings.LLM_CACHE_MAX_ENTRIES, settings.LLM_CACHE_TTL_SECONDS, _store)
+flights = SingleFlight()
+
+def cache_stats() -> Dict[str, Any]:
+    return {
+        "embedding": embedding_cache.stats(),
+        "analysis": analysis_cache.stats(),
+        "coalesced": flights.coalesced,
+        "persistent": _store is not None,
+    }
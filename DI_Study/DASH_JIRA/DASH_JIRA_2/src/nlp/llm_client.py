@@ -1,15 +1,11 @@
 from openai import OpenAI
 import json
+from typing import List, Optional
 from src.config import settings
 from src.nlp.models import AnalysisResult
+from src.nlp.cache import analysis_cache, content_key, embedding_cache, flights
 
-class LLMClient:
-    def __init__(self):
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        self.model = "gpt-4o-mini" # Cost-effective model
-
-    def analyze_issue(self, summary: str, description: str) -> AnalysisResult:
-        system_prompt = """
+ANALYSIS_SYSTEM_PROMPT = """
         You are an expert JIRA Issue Triage Agent.
         Analyze the given Jira issue (Summary and Description) and provide a structured analysis in JSON format.
         
@@ -33,31 +29,30 @@ class LLMClient:
         }
         """
 
-        user_prompt = f"""
-        Analyze the following Jira issue:
-        
-        Summary: {summary}
-        Description: {description}
-        """
+class LLMClient:
+    def __init__(self, max_retries: Optional[int] = None):
+        options = {"api_key": settings.OPENAI_API_KEY, "base_url": settings.OPENAI_BASE_URL or None}
+        if max_retries is not None:
+            options["max_retries"] = max_retries
+        self.client = OpenAI(**options)
+        self.model = "gpt-4o-mini" # Cost-effective model
+        self.embedding_model = settings.EMBEDDING_MODEL
+
+    def analyze_issue(self, summary: str, description: str) -> AnalysisResult:
+        # Identical issue text (e.g. /analyze then /route) reuses one analysis;
+        # concurrent identical requests share a single LLM call.
+        key = content_key(self.model, ANALYSIS_SYSTEM_PROMPT, summary, description)
+        cached = analysis_cache.get(key)
+        if cached is not None:
+            return AnalysisResult(**cached)
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.0
-            )
-            
-            content = response.choices[0].message.content
-            data = json.loads(content)
+            data = flights.do(("analysis", key), lambda: self._analyze(key, summary, description))
             return AnalysisResult(**data)
-            
+
         except Exception as e:
             print(f"LLM Analysis failed: {e}")
-            # Return a fallback result
+            # Return a fallback result (never cached)
             return AnalysisResult(
                 summary=summary[:100],
                 category="미분류 (Unclassified)",
@@ -71,14 +66,50 @@ class LLMClient:
                 translated_description="번역 실패"
             )
 
+    def _analyze(self, key: str, summary: str, description: str) -> dict:
+        user_prompt = f"""
+        Analyze the following Jira issue:
+        
+        Summary: {summary}
+        Description: {description}
+        """
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": ANALYSIS_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.0
+        )
+
+        content = response.choices[0].message.content
+        data = AnalysisResult(**json.loads(content)).model_dump()
+        analysis_cache.set(key, data)
+        return data
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embeds several texts in one request, in input order. Errors propagate."""
+        response = self.client.embeddings.create(
+            input=[text.replace("\n", " ") for text in texts],
+            model=self.embedding_model
+        )
+        return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+
     def get_embedding(self, text: str) -> list[float]:
+        key = content_key(self.embedding_model, text.replace("\n", " "))
+        cached = embedding_cache.get(key)
+        if cached is not None:
+            return list(cached)
         try:
-            text = text.replace("\n", " ")
-            response = self.client.embeddings.create(
-                input=[text],
-                model="text-embedding-3-small"
-            )
-            return response.data[0].embedding
+            return list(flights.do(("embedding", key), lambda: self._embed_one(key, text)))
         except Exception as e:
             print(f"Embedding generation failed: {e}")
             return []
+
+    def _embed_one(self, key: str, text: str) -> list[float]:
+        vector = self.get_embeddings([text])[0]
+        if vector:
+            embedding_cache.set(key, vector)
+        return vector
@@ -0,0 +1,116 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+# (group name, mask token, pattern). Order is priority, as in the old
+# sequential passes (email -> phone -> IP), with the Korean formats ahead of
+# the generic phone: see PIIMasker for how overlapping matches are resolved.
+LEGACY_PATTERNS: Tuple[Tuple[str, str, str], ...] = (
+    ("EMAIL", "<EMAIL>", r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"),
+    ("PHONE", "<PHONE>", r"\b\d{3}[-.]?\d{3}[-.]?\d{4}\b"),
+    ("IP", "<IP>", r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"),
+)
+
+# Korean formats use digit lookarounds instead of \b, because Hangul counts as
+# a word character and text like "연락처010-1234-5678" has no word boundary.
+KOREAN_PATTERNS: Tuple[Tuple[str, str, str], ...] = (
+    # 주민등록번호 / 외국인등록번호: YYMMDD-GNNNNNN. Numbers that continue into
+    # more digits, directly or across a "-"/"." (e.g. "2024-...", "...-01",
+    # "1.5..."), are rejected. A bare 13-digit number with a date-like prefix
+    # (e.g. an epoch-ms timestamp) is indistinguishable and is masked.
+    ("RRN", "<RRN>",
+     r"(?<!\d)(?<!\d[-.])\d{2}(?:0[1-9]|1[0-2])(?:0[1-9]|[12]\d|3[01])[- ]?[1-8]\d{6}(?![-.]?\d)"),
+    # Mobile (010/011/016-019), Seoul 02, area codes 031-064, 070; optional +82
+    ("KR_PHONE", "<PHONE>",
+     r"(?<![\d+])(?:\+82[- .]?|0)(?:1[016789]|2|[3-6][1-5]|70)[- .]?\d{3,4}[- .]?\d{4}(?!\d)"),
+)
+
+DEFAULT_PATTERNS = LEGACY_PATTERNS[:1] + KOREAN_PATTERNS + LEGACY_PATTERNS[1:]
+
+_WORD_CHAR = re.compile(r"\w")
+
+def _alternation(patterns) -> str:
+    return "|".join(f"(?P<{name}>{pattern})" for name, _, pattern in patterns)
+
+class PIIMasker:
+    """Single-pass PII masking over one precompiled alternation.
+
+    Apart from EMAIL, every pattern starts with a digit or '+', so text
+    without an "@" is scanned by a second alternation behind a digit-or-plus
+    lookahead, which lets the regex engine skip straight to candidate characters
+    instead of trying each alternative at every position.
+
+    The alternation picks the leftmost match, while the old passes let an
+    earlier pattern win wherever it matched. When a higher-priority pattern
+    starts inside the match found (``"1.1.1.123.456.7890"``: IP, then a phone
+    from "123"), that one is masked instead and the text in front of it is
+    scanned on its own, as the old passes did ("1.1.1.<PHONE>"). Text right
+    after a mask is likewise scanned as if it followed the mask token.
+    """
+
+    def __init__(self, patterns: Sequence[Tuple[str, str, str]] = DEFAULT_PATTERNS):
+        self.patterns = tuple(patterns)
+        self.tokens = {name: token for name, token, _ in self.patterns}
+        self.regex = re.compile(_alternation(self.patterns))
+        digit_led = [item for item in self.patterns if item[0] != "EMAIL"]
+        self.digit_regex = re.compile(f"(?=[\\d+])(?:{_alternation(digit_led)})") if digit_led else None
+        # Per pattern: an alternation of the patterns that take priority over it.
+        self._higher = {
+            name: re.compile(_alternation(self.patterns[:idx])) if idx else None
+            for idx, (name, _, _) in enumerate(self.patterns)
+        }
+
+    def _preempt(self, text: str, name: str, start: int, end: int, endpos: int) -> Optional["re.Match"]:
+        """Leftmost higher-priority match starting inside ``(start, end)``."""
+        higher = self._higher[name]
+        if higher is None:
+            return None
+        for pos in range(start + 1, end):
+            found = higher.match(text, pos, endpos)
+            if found:
+                return found
+        return None
+
+    def _sub(self, regex: "re.Pattern", text: str, pos: int, endpos: int) -> str:
+        pieces: List[str] = []
+        while True:
+            match = regex.search(text, pos, endpos)
+            if match is None:
+                pieces.append(text[pos:endpos])
+                return "".join(pieces)
+            name, start, end = match.lastgroup, match.start(), match.end()
+            preempted = self._preempt(text, name, start, end, endpos)
+            while preempted is not None:
+                name, start, end = preempted.lastgroup, preempted.start(), preempted.end()
+                preempted = self._preempt(text, name, start, end, endpos)
+            if start > match.start():
+                # Masking stops in front of the preempting match, which the
+                # old passes had already replaced by a token.
+                pieces.append(self._sub(regex, text, pos, start))
+            else:
+                pieces.append(text[pos:start])
+            pieces.append(self.tokens[name])
+            pos = end
+            if pos < endpos and _WORD_CHAR.match(text, pos):
+                # The token ends in ">", so what follows now starts at a word
+                # boundary; scan it from a copy so lookbehinds see that.
+                text, pos, endpos = text[pos:endpos], 0, endpos - pos
+
+    def mask(self, text: Optional[str]) -> str:
+        if not text:
+            return ""
+        if "@" in text:
+            return self._sub(self.regex, text, 0, len(text))
+        if self.digit_regex is None:
+            return text
+        return self._sub(self.digit_regex, text, 0, len(text))
+
+    def mask_many(self, texts: Iterable[Optional[str]], processes: int = 0, chunksize: int = 2000) -> List[str]:
+        """Masks a batch; ``processes > 1`` spreads it over a process pool."""
+        if processes and processes > 1:
+            texts = list(texts)
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                return list(pool.map(self.mask, texts, chunksize=chunksize))
+        return [self.mask(text) for text in texts]
+
+default_masker = PIIMasker()
@@ -1,5 +1,6 @@
-import re
+from typing import List
 from src.nlp.llm_client import LLMClient
+from src.nlp.pii import default_masker
 from src.nlp.models import AnalysisResult
 
 class NLPProcessor:
@@ -7,19 +8,11 @@ class NLPProcessor:
         self.llm_client = LLMClient()
         
     def mask_pii(self, text: str) -> str:
-        if not text:
-            return ""
-            
-        # Email masking
-        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '<EMAIL>', text)
-        
-        # Phone masking (simple pattern)
-        text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '<PHONE>', text)
-        
-        # IP Address masking (IPv4)
-        text = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '<IP>', text)
-        
-        return text
+        # Email, Korean RRN/phone, phone and IPv4 in one precompiled pass
+        return default_masker.mask(text)
+
+    def mask_pii_batch(self, texts: List[str], processes: int = 0) -> List[str]:
+        return default_masker.mask_many(texts, processes=processes)
 
     def process_issue(self, summary: str, description: str) -> AnalysisResult:
         # 1. Mask PII
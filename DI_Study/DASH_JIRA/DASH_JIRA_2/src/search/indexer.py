@@ -1,68 +1,310 @@
+import hashlib
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+import openai
 import psycopg2
 from psycopg2.extras import execute_values
+from src.config import settings
 from src.db.connection import get_db_connection
 from src.nlp.llm_client import LLMClient
-import time
 
-def generate_embeddings_for_issues(batch_size=50, limit=None):
-    conn = get_db_connection()
-    cur = conn.cursor()
-    llm = LLMClient()
-
-    # Fetch issues that don't have embeddings yet
-    # For simplicity, we'll just fetch all issues and check if they exist in embeddings table
-    # In a real system, we'd have a more robust way to track indexed status
-    
-    query = """
-        SELECT i.issue_key, i.summary, i.description 
-        FROM issues i
-        LEFT JOIN embeddings e ON i.issue_key = e.issue_key
-        WHERE e.issue_key IS NULL
+MAX_TEXT_CHARS = 8000
+# Rough request size cap (~50k tokens) on top of the input-count cap.
+MAX_BATCH_CHARS = 200000
+
+# Applied on every run: schema.sql only runs when the database is first created.
+INDEXER_DDL = """
+    ALTER TABLE embeddings ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
+    CREATE INDEX IF NOT EXISTS idx_embeddings_issue_type ON embeddings(issue_key, embedding_type);
+    CREATE TABLE IF NOT EXISTS embedding_checkpoints (
+        job_name VARCHAR(100) PRIMARY KEY,
+        last_issue_key VARCHAR(50),
+        indexed_count INTEGER DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT NOW()
+    );
+"""
+
+# (issue_key, text, content_hash)
+Item = Tuple[str, str, str]
+
+def build_text(summary: Optional[str], description: Optional[str]) -> str:
+    # Truncate if too long (simple check)
+    return f"Summary: {summary}\nDescription: {description}"[:MAX_TEXT_CHARS]
+
+def content_hash(text: str, model: str) -> str:
+    return hashlib.sha256(f"{model}\x1f{text}".encode("utf-8")).hexdigest()
+
+class AdaptiveLimiter:
+    """AIMD limit on in-flight embedding requests.
+
+    The limit grows by one after ``increase_every`` consecutive successes and
+    is halved whenever the API answers 429, so the indexer settles just under
+    the account's rate limit instead of sleeping a fixed amount per batch.
     """
-    if limit:
-        query += f" LIMIT {limit}"
-        
-    cur.execute(query)
-    rows = cur.fetchall()
-    print(f"Found {len(rows)} issues to index.")
-
-    batch = []
-    count = 0
-    
-    for row in rows:
-        issue_key, summary, description = row
-        text_to_embed = f"Summary: {summary}\nDescription: {description}"
-        
-        # Truncate if too long (simple check)
-        if len(text_to_embed) > 8000:
-            text_to_embed = text_to_embed[:8000]
-
-        vector = llm.get_embedding(text_to_embed)
-        
-        if vector:
-            batch.append((issue_key, 'full_context', vector, 'text-embedding-3-small'))
-            count += 1
-        
-        if len(batch) >= batch_size:
-            _insert_batch(conn, cur, batch)
-            batch = []
-            print(f"Indexed {count} issues...")
-            time.sleep(0.5) # Rate limit protection
-
-    if batch:
-        _insert_batch(conn, cur, batch)
-        
-    print(f"Completed! Total indexed: {count}")
-    cur.close()
-    conn.close()
-
-def _insert_batch(conn, cur, batch):
-    insert_query = """
-        INSERT INTO embeddings (issue_key, embedding_type, vector, model_version)
-        VALUES %s
+
+    def __init__(self, max_limit: int, min_limit: int = 1, increase_every: int = 4):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.increase_every = increase_every
+        self.limit = self.max_limit
+        self.in_flight = 0
+        self._streak = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while self.in_flight >= self.limit:
+                self._condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self):
+        with self._condition:
+            self._streak += 1
+            if self._streak >= self.increase_every and self.limit < self.max_limit:
+                self.limit += 1
+                self._streak = 0
+                self._condition.notify_all()
+
+    def on_throttle(self):
+        with self._condition:
+            self._streak = 0
+            self.limit = max(self.min_limit, self.limit // 2)
+
+class EmbeddingIndexer:
+    """Streams issues from Postgres and embeds them in concurrent multi-input requests.
+
+    Rows are read through a server-side cursor in issue_key order. Issues whose
+    stored ``content_hash`` matches the current text are skipped. Each finished
+    batch is written in its own transaction together with a checkpoint (the last
+    issue_key before which every batch is done), so an interrupted run resumes
+    from there; a run that completes clears its checkpoint.
     """
-    execute_values(cur, insert_query, batch)
-    conn.commit()
+
+    def __init__(
+        self,
+        llm: Optional[LLMClient] = None,
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        embedding_type: str = 'full_context',
+        max_retries: int = 6,
+        backoff: float = 1.0,
+        itersize: int = 2000,
+    ):
+        # Retries are handled here so throttling can feed the limiter.
+        self.llm = llm or LLMClient(max_retries=0)
+        self.model = self.llm.embedding_model
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+        self.max_concurrency = max_concurrency or settings.EMBEDDING_MAX_CONCURRENCY
+        self.embedding_type = embedding_type
+        self.job_name = f"{embedding_type}:{self.model}"
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.itersize = itersize
+        self.limiter = AdaptiveLimiter(self.max_concurrency)
+        self.stats = {"requests": 0, "embedded": 0, "skipped": 0, "failed": 0, "throttled": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name: str, amount: int = 1):
+        with self._stats_lock:
+            self.stats[name] += amount
+
+    # ------------------------------------------------------------------
+    # Embedding
+    # ------------------------------------------------------------------
+    def batches(self, items: Iterable[Item]) -> Iterator[List[Item]]:
+        batch, chars = [], 0
+        for item in items:
+            if batch and (len(batch) >= self.batch_size or chars + len(item[1]) > MAX_BATCH_CHARS):
+                yield batch
+                batch, chars = [], 0
+            batch.append(item)
+            chars += len(item[1])
+        if batch:
+            yield batch
+
+    def _retry_delay(self, error: Exception, attempt: int) -> float:
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('retry-after') if response is not None else None
+        try:
+            if retry_after is not None:
+                return float(retry_after)
+        except ValueError:
+            pass
+        return self.backoff * (2 ** attempt)
+
+    def _embed_batch(self, batch: List[Item]) -> Optional[List[List[float]]]:
+        texts = [text for _, text, _ in batch]
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            try:
+                self._count("requests")
+                vectors = self.llm.get_embeddings(texts)
+            except openai.RateLimitError as e:
+                error = e
+                self.limiter.on_throttle()
+                self._count("throttled")
+            except (openai.APIConnectionError, openai.InternalServerError) as e:
+                error = e
+            except Exception as e:
+                print(f"Embedding request failed ({batch[0][0]}..{batch[-1][0]}): {e}")
+                return None
+            else:
+                self.limiter.on_success()
+                return vectors
+            finally:
+                self.limiter.release()
+            if attempt < self.max_retries:
+                time.sleep(self._retry_delay(error, attempt))
+        print(f"Embedding request gave up after {self.max_retries + 1} attempts ({batch[0][0]}..{batch[-1][0]}): {error}")
+        return None
+
+    def embed(self, batches: Iterable[List[Item]]) -> Iterator[Tuple[int, List[Item], Optional[List[List[float]]]]]:
+        """Yields ``(seq, batch, vectors)`` in completion order; ``vectors`` is None on failure.
+
+        At most ``2 * max_concurrency`` batches are held in memory at a time.
+        """
+
+        window = 2 * self.max_concurrency
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='embedding') as pool:
+            pending = {}
+            for seq, batch in enumerate(batches):
+                pending[pool.submit(self._embed_batch, batch)] = (seq, batch)
+                while len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        seq_done, batch_done = pending.pop(future)
+                        yield seq_done, batch_done, future.result()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    seq_done, batch_done = pending.pop(future)
+                    yield seq_done, batch_done, future.result()
+
+    # ------------------------------------------------------------------
+    # Database
+    # ------------------------------------------------------------------
+    def _load_checkpoint(self, cur) -> Optional[str]:
+        cur.execute("SELECT last_issue_key FROM embedding_checkpoints WHERE job_name = %s", (self.job_name,))
+        row = cur.fetchone()
+        return row[0] if row else None
+
+    def _save_checkpoint(self, cur, last_issue_key: str):
+        cur.execute("""
+            INSERT INTO embedding_checkpoints (job_name, last_issue_key, indexed_count, updated_at)
+            VALUES (%s, %s, %s, NOW())
+            ON CONFLICT (job_name) DO UPDATE SET
+                last_issue_key = EXCLUDED.last_issue_key,
+                indexed_count = EXCLUDED.indexed_count,
+                updated_at = EXCLUDED.updated_at;
+        """, (self.job_name, last_issue_key, self.stats["embedded"]))
+
+    def _stream_items(self, conn, after_key: Optional[str], limit: Optional[int]) -> Iterator[Item]:
+        cur = conn.cursor(name='embedding_source')
+        cur.itersize = self.itersize
+        query = """
+            SELECT i.issue_key, i.summary, i.description,
+                   (SELECT e.content_hash FROM embeddings e
+                    WHERE e.issue_key = i.issue_key AND e.embedding_type = %s AND e.model_version = %s
+                    ORDER BY e.id DESC LIMIT 1)
+            FROM issues i
+        """
+        params = [self.embedding_type, self.model]
+        if after_key is not None:
+            query += " WHERE i.issue_key > %s"
+            params.append(after_key)
+        query += " ORDER BY i.issue_key"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+        cur.execute(query, params)
+        try:
+            for issue_key, summary, description, stored_hash in cur:
+                text = build_text(summary, description)
+                digest = content_hash(text, self.model)
+                if digest == stored_hash:
+                    self._count("skipped")
+                    continue
+                yield issue_key, text, digest
+        finally:
+            cur.close()
+
+    def _write_batch(self, conn, batch: List[Item], vectors: List[List[float]]):
+        rows = [
+            (issue_key, self.embedding_type, vector, self.model, digest)
+            for (issue_key, _, digest), vector in zip(batch, vectors)
+            if vector
+        ]
+        cur = conn.cursor()
+        cur.execute(
+            "DELETE FROM embeddings WHERE embedding_type = %s AND issue_key = ANY(%s)",
+            (self.embedding_type, [row[0] for row in rows]),
+        )
+        execute_values(cur, """
+            INSERT INTO embeddings (issue_key, embedding_type, vector, model_version, content_hash)
+            VALUES %s
+        """, rows)
+        self._count("embedded", len(rows))
+        return cur
+
+    def run(self, limit: Optional[int] = None, resume: bool = True) -> Dict[str, Any]:
+        reader = get_db_connection()
+        writer = get_db_connection()
+        cur = writer.cursor()
+        cur.execute(INDEXER_DDL)
+        after_key = self._load_checkpoint(cur) if resume else None
+        writer.commit()
+        if after_key:
+            print(f"Resuming after checkpoint {after_key}.")
+
+        started = time.perf_counter()
+        last_keys = {}
+        done = set()
+        next_seq = 0
+        try:
+            items = self._stream_items(reader, after_key, limit)
+            for seq, batch, vectors in self.embed(self.batches(items)):
+                last_keys[seq] = batch[-1][0]
+                if vectors is None:
+                    self._count("failed", len(batch))
+                    continue
+                write_cur = self._write_batch(writer, batch, vectors)
+                done.add(seq)
+                # Advance over the contiguous prefix of finished batches only.
+                checkpoint = None
+                while next_seq in done:
+                    done.discard(next_seq)
+                    checkpoint = last_keys.pop(next_seq)
+                    next_seq += 1
+                if checkpoint is not None:
+                    self._save_checkpoint(write_cur, checkpoint)
+                writer.commit()
+                write_cur.close()
+                print(f"Indexed {self.stats['embedded']} issues...")
+
+            if not self.stats["failed"]:
+                cur.execute("DELETE FROM embedding_checkpoints WHERE job_name = %s", (self.job_name,))
+                writer.commit()
+        finally:
+            cur.close()
+            reader.close()
+            writer.close()
+
+        elapsed = time.perf_counter() - started
+        self.stats["elapsed"] = round(elapsed, 3)
+        self.stats["rows_per_sec"] = round(self.stats["embedded"] / elapsed, 1) if elapsed else 0.0
+        print(f"Completed! {self.stats}")
+        return dict(self.stats)
+
+def generate_embeddings_for_issues(batch_size=None, limit=None, max_concurrency=None, resume=True):
+    indexer = EmbeddingIndexer(batch_size=batch_size, max_concurrency=max_concurrency)
+    return indexer.run(limit=limit, resume=resume)
 
 if __name__ == "__main__":
     # Indexing a subset first to verify
@@ -0,0 +1,86 @@
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import numpy as np
+
+class LocalVectorIndex:
+    """In-process exact cosine top-k, used when pgvector is not reachable.
+
+    Vectors are kept as one L2-normalised float32 matrix, so a query is a
+    single matrix-vector product followed by ``argpartition``. Results have
+    the same shape as ``VectorStore.search_similar_cases``.
+    """
+
+    def __init__(self, keys: Sequence[str], vectors: np.ndarray, records: Optional[Sequence[Dict[str, Any]]] = None):
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or len(keys) != matrix.shape[0]:
+            raise ValueError("keys and vectors must have the same number of rows")
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms == 0, 1.0, norms)
+        self.keys = list(keys)
+        self.records = list(records) if records is not None else [{} for _ in self.keys]
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence[Any]]) -> "LocalVectorIndex":
+        """Rows of (issue_key, summary, description, status, vector)."""
+        keys, vectors, records = [], [], []
+        for issue_key, summary, description, status, vector in rows:
+            keys.append(issue_key)
+            vectors.append(vector)
+            records.append({"summary": summary, "description": description or "", "status": status})
+        dims = len(vectors[0]) if vectors else 0
+        return cls(keys, np.asarray(vectors, dtype=np.float32).reshape(len(keys), dims), records)
+
+    @classmethod
+    def from_db(cls, conn, embedding_type: str = 'full_context') -> "LocalVectorIndex":
+        cur = conn.cursor()
+        try:
+            cur.execute("""
+                SELECT i.issue_key, i.summary, i.description, i.status, e.vector::real[]
+                FROM issues i
+                JOIN embeddings e ON i.issue_key = e.issue_key
+                WHERE e.embedding_type = %s
+                ORDER BY e.id
+            """, (embedding_type,))
+            return cls.from_rows(cur.fetchall())
+        finally:
+            cur.close()
+
+    def save(self, path: str):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as fh:
+            np.savez(fh, keys=np.asarray(self.keys, dtype=str), vectors=self.matrix,
+                     records=np.asarray(json.dumps(self.records, ensure_ascii=False)))
+
+    @classmethod
+    def load(cls, path: str) -> "LocalVectorIndex":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["keys"].tolist(), data["vectors"], json.loads(str(data["records"])))
+
+    def search(self, query_vector: Sequence[float], limit: int = 3) -> List[Dict[str, Any]]:
+        if not self.keys or limit <= 0:
+            return []
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+        scores = self.matrix @ (query / norm)
+        if limit < len(scores):
+            top = np.argpartition(-scores, limit - 1)[:limit]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.lexsort((top, -scores[top]))]
+        results = []
+        for idx in top.tolist():
+            record = self.records[idx]
+            results.append({
+                "issue_key": self.keys[idx],
+                "summary": record.get("summary"),
+                "description": record.get("description") or "",
+                "status": record.get("status"),
+                "similarity": float(scores[idx])
+            })
+        return results
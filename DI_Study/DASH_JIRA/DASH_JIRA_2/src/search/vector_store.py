@@ -1,53 +1,143 @@
+import os
+import threading
 import psycopg2
-from typing import List, Dict, Any
-from src.db.connection import get_db_connection
+from typing import List, Dict, Any, Optional
+from src.config import settings
+from src.db.connection import pooled_connection
 from src.nlp.llm_client import LLMClient
+from src.search.local_index import LocalVectorIndex
+
+INDEX_KINDS = ("hnsw", "ivfflat")
+
+def create_vector_index(conn, kind: str = "hnsw", lists: Optional[int] = None, m: int = 16, ef_construction: int = 64):
+    """(Re)builds the ANN index on embeddings.vector.
+
+    HNSW can be built on an empty table; IVFFlat should be built after loading,
+    with ``lists`` around rows / 1000 (sqrt(rows) beyond ~1M rows).
+    """
+    if kind not in INDEX_KINDS:
+        raise ValueError(f"Unknown vector index kind: {kind}")
+    cur = conn.cursor()
+    try:
+        cur.execute("DROP INDEX IF EXISTS idx_embeddings_vector_hnsw")
+        cur.execute("DROP INDEX IF EXISTS idx_embeddings_vector_ivfflat")
+        if kind == "hnsw":
+            cur.execute(
+                "CREATE INDEX idx_embeddings_vector_hnsw ON embeddings "
+                "USING hnsw (vector vector_cosine_ops) WITH (m = %s, ef_construction = %s)",
+                (int(m), int(ef_construction)),
+            )
+        else:
+            if not lists:
+                cur.execute("SELECT COUNT(*) FROM embeddings")
+                lists = max(1, cur.fetchone()[0] // 1000)
+            cur.execute(
+                "CREATE INDEX idx_embeddings_vector_ivfflat ON embeddings "
+                "USING ivfflat (vector vector_cosine_ops) WITH (lists = %s)",
+                (int(lists),),
+            )
+        cur.execute("ANALYZE embeddings")
+        conn.commit()
+    finally:
+        cur.close()
 
 class VectorStore:
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None):
         self.llm_client = LLMClient() # Used for embedding generation if needed locally
-        # Note: In a real scenario, we might use a separate embedding service.
-        # Here we assume we can get embeddings via OpenAI client (not implemented in LLMClient yet, but placeholder)
+        self.backend = backend or settings.VECTOR_BACKEND
+        self._local_index = None
+        self._local_lock = threading.Lock()
+
+    def local_index(self) -> Optional[LocalVectorIndex]:
+        """The in-process index from LOCAL_INDEX_PATH, loaded on first use."""
+        with self._local_lock:
+            if self._local_index is None and os.path.exists(settings.LOCAL_INDEX_PATH):
+                self._local_index = LocalVectorIndex.load(settings.LOCAL_INDEX_PATH)
+                print(f"Loaded local vector index: {len(self._local_index)} vectors")
+            return self._local_index
 
-    def search_similar_cases(self, query_text: str, limit: int = 3) -> List[Dict[str, Any]]:
+    def set_local_index(self, index: Optional[LocalVectorIndex]):
+        with self._local_lock:
+            self._local_index = index
+
+    def search_similar_cases(self, query_text: str, limit: int = 3,
+                             ef_search: Optional[int] = None, probes: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Searches for similar cases using vector similarity.
         """
         # 1. Generate embedding for the query
         query_vector = self.llm_client.get_embedding(query_text)
-        
+
         if not query_vector:
             return []
-        
-        conn = get_db_connection()
-        cur = conn.cursor()
-        
-        try:
-            # Use pgvector's cosine distance operator (<=>)
-            # 1 - distance = similarity
-            cur.execute("""
-                SELECT i.issue_key, i.summary, i.description, i.status, 1 - (e.vector <=> %s::vector) as similarity
-                FROM issues i
-                JOIN embeddings e ON i.issue_key = e.issue_key
-                ORDER BY similarity DESC
-                LIMIT %s
-            """, (query_vector, limit))
-            
-            results = []
-            for row in cur.fetchall():
-                results.append({
-                    "issue_key": row[0],
-                    "summary": row[1],
-                    "description": row[2] or "", # Handle None
-                    "status": row[3],
-                    "similarity": float(row[4])
-                })
-            
-            return results
-            
-        except Exception as e:
-            print(f"Vector search failed: {e}")
-            return []
-        finally:
-            cur.close()
-            conn.close()
+
+        return self.search_by_vector(query_vector, limit, ef_search=ef_search, probes=probes)
+
+    def search_by_vector(self, query_vector: List[float], limit: int = 3,
+                         ef_search: Optional[int] = None, probes: Optional[int] = None) -> List[Dict[str, Any]]:
+        if self.backend == "pgvector":
+            try:
+                return self._search_pgvector(query_vector, limit, ef_search, probes)
+            except psycopg2.Error as e:
+                print(f"Vector search failed: {e}")
+                if self.local_index() is None:
+                    return []
+                print("Falling back to local vector index.")
+
+        index = self.local_index()
+        return index.search(query_vector, limit) if index is not None else []
+
+    def _search_pgvector(self, query_vector, limit, ef_search, probes) -> List[Dict[str, Any]]:
+        with pooled_connection() as conn:
+            cur = conn.cursor()
+            try:
+                # Search-time recall/speed knobs for whichever ANN index exists;
+                # SET LOCAL keeps them scoped to this transaction.
+                cur.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search or settings.HNSW_EF_SEARCH)}")
+                cur.execute(f"SET LOCAL ivfflat.probes = {int(probes or settings.IVFFLAT_PROBES)}")
+                # Use pgvector's cosine distance operator (<=>)
+                # 1 - distance = similarity. Ordering by the raw distance
+                # (ascending) is what lets the planner use the ANN index.
+                cur.execute("""
+                    SELECT i.issue_key, i.summary, i.description, i.status, 1 - (e.vector <=> %(query)s::vector) as similarity
+                    FROM embeddings e
+                    JOIN issues i ON i.issue_key = e.issue_key
+                    ORDER BY e.vector <=> %(query)s::vector
+                    LIMIT %(limit)s
+                """, {"query": query_vector, "limit": limit})
+
+                results = []
+                for row in cur.fetchall():
+                    results.append({
+                        "issue_key": row[0],
+                        "summary": row[1],
+                        "description": row[2] or "", # Handle None
+                        "status": row[3],
+                        "similarity": float(row[4])
+                    })
+
+                return results
+            finally:
+                cur.close()
+
+if __name__ == "__main__":
+    import argparse
+    from src.db.connection import get_db_connection
+
+    parser = argparse.ArgumentParser(description="Vector index maintenance")
+    parser.add_argument("command", choices=["create-index", "export-local"])
+    parser.add_argument("--kind", choices=INDEX_KINDS, default="hnsw")
+    parser.add_argument("--lists", type=int, default=None)
+    args = parser.parse_args()
+
+    conn = get_db_connection()
+    try:
+        if args.command == "create-index":
+            create_vector_index(conn, args.kind, lists=args.lists)
+            print(f"Created {args.kind} index on embeddings.vector")
+        else:
+            index = LocalVectorIndex.from_db(conn)
+            index.save(settings.LOCAL_INDEX_PATH)
+            print(f"Exported {len(index)} vectors to {settings.LOCAL_INDEX_PATH}")
+    finally:
+        conn.close()
@@ -0,0 +1,72 @@
+"""Embedding throughput against the fake embeddings server (no database needed).
+
+Compares the old pattern (one text per request, 0.5s pause every 50 texts)
+with EmbeddingIndexer's multi-input, concurrent, rate-adaptive requests.
+
+Usage::
+
+    python -m tests.bench_indexer --texts 2000 --latency-ms 80
+    python -m tests.bench_indexer --texts 5000 --max-concurrent 3 --skip-serial
+"""
+import argparse
+import time
+from openai import OpenAI
+from src.nlp.llm_client import LLMClient
+from src.search.indexer import EmbeddingIndexer, build_text, content_hash
+from tests.fake_embedding_server import FakeEmbeddingServer
+
+def make_items(count, model):
+    items = []
+    for idx in range(count):
+        text = build_text(f"Issue {idx} summary", f"Steps to reproduce issue {idx}. " * 20)
+        items.append((f"GTA-{idx}", text, content_hash(text, model)))
+    return items
+
+def serial(llm, items):
+    embedded = 0
+    for idx, (_, text, _) in enumerate(items, start=1):
+        if llm.get_embedding(text):
+            embedded += 1
+        if idx % 50 == 0:
+            time.sleep(0.5)
+    return embedded
+
+def batched(indexer, items):
+    embedded = 0
+    for _, batch, vectors in indexer.embed(indexer.batches(items)):
+        embedded += len(vectors or [])
+    return embedded
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=80.0)
+    parser.add_argument("--max-concurrent", type=int, default=0, help="server-side 429 threshold")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--skip-serial", action="store_true")
+    args = parser.parse_args()
+
+    with FakeEmbeddingServer(latency_ms=args.latency_ms, max_concurrent=args.max_concurrent) as server:
+        llm = LLMClient(max_retries=0)
+        llm.client = OpenAI(api_key="fake", base_url=server.base_url, max_retries=0)
+        items = make_items(args.texts, llm.embedding_model)
+
+        runs = []
+        if not args.skip_serial:
+            runs.append(("serial", lambda: serial(llm, items)))
+        indexer = EmbeddingIndexer(llm=llm, batch_size=args.batch_size, max_concurrency=args.concurrency, backoff=0.05)
+        runs.append(("batched", lambda: batched(indexer, items)))
+
+        for label, run in runs:
+            before = server.requests
+            started = time.perf_counter()
+            embedded = run()
+            elapsed = time.perf_counter() - started
+            if embedded != len(items):
+                raise SystemExit(f"{label}: embedded {embedded}/{len(items)}")
+            print(f"{label:8s} {elapsed:7.2f}s  {embedded / elapsed:8.0f} texts/s  {server.requests - before:6d} requests")
+        print(f"throttled={indexer.stats['throttled']} final_limit={indexer.limiter.limit}")
+
+if __name__ == "__main__":
+    main()
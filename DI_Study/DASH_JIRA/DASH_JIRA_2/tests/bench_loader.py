@@ -0,0 +1,102 @@
+"""Rows/sec of the row-by-row loader vs the COPY bulk loader.
+
+Runs against the Postgres from docker-compose (``src.config`` settings) in a
+scratch ``loader_bench`` schema, so the real ``issues`` table is untouched.
+Both loaders must leave identical tables behind.
+
+Usage::
+
+    python -m tests.bench_loader --rows 50000 --custom-fields 40
+    python -m tests.bench_loader --rows 500000 --skip-rowwise
+"""
+import argparse
+import csv
+import os
+import random
+import tempfile
+import time
+import psycopg2
+from src.config import settings
+from src.ingestion.loader import ISSUE_COLUMNS, bulk_load_csv, load_csv_rowwise
+
+SCHEMA = 'loader_bench'
+
+def connect():
+    return psycopg2.connect(
+        user=settings.POSTGRES_USER,
+        password=settings.POSTGRES_PASSWORD,
+        dbname=settings.POSTGRES_DB,
+        host=settings.POSTGRES_HOST,
+        port=settings.POSTGRES_PORT,
+        options=f'-c search_path={SCHEMA}'
+    )
+
+def write_csv(path, rows, custom_fields, seed=7):
+    rng = random.Random(seed)
+    statuses = ['Open', 'In Progress', 'Resolved', 'Closed']
+    custom = [f'Custom field (Field {idx})' for idx in range(custom_fields)]
+    header = ['Issue key', 'Issue id', 'Summary', 'Description', 'Status', 'Issue Type',
+              'Priority', 'Created', 'Updated', 'Assignee', 'Reporter'] + custom
+    with open(path, 'w', newline='', encoding='utf-8') as fh:
+        writer = csv.writer(fh)
+        writer.writerow(header)
+        for idx in range(rows):
+            # ~2% of rows re-export an earlier issue; the last occurrence must win.
+            key_id = rng.randrange(max(idx, 1)) if idx and rng.random() < 0.02 else idx
+            writer.writerow([
+                f'GTA-{key_id}', key_id, f'Issue {idx} summary "quoted"',
+                f'Line one for {idx}\nline two, with comma' if rng.random() < 0.8 else '',
+                rng.choice(statuses), 'Bug', rng.choice(['High', 'Low', '']),
+                f'{rng.randint(1, 28):02d}/Jul/24 {rng.randint(1, 12):02d}:06 PM', '17/Jul/24 09:00 AM',
+                f'user{rng.randrange(200)}', f'user{rng.randrange(200)}',
+            ] + [f'value {idx}-{col}' if rng.random() < 0.3 else '' for col in range(custom_fields)])
+
+def reset(conn):
+    cur = conn.cursor()
+    cur.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA};")
+    cur.execute(f"DROP TABLE IF EXISTS {SCHEMA}.issues CASCADE;")
+    cur.execute(f"CREATE TABLE {SCHEMA}.issues (LIKE public.issues INCLUDING ALL);")
+    conn.commit()
+    cur.close()
+
+def snapshot(conn):
+    cur = conn.cursor()
+    cur.execute(f"SELECT {', '.join(ISSUE_COLUMNS)} FROM issues ORDER BY issue_key;")
+    rows = cur.fetchall()
+    cur.close()
+    return rows
+
+def timed(label, load, conn, path, rows):
+    reset(conn)
+    started = time.perf_counter()
+    load(path, conn=conn)
+    elapsed = time.perf_counter() - started
+    print(f"{label:8s} {elapsed:8.2f}s  {rows / elapsed:10.0f} rows/s")
+    return snapshot(conn)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--custom-fields', type=int, default=40)
+    parser.add_argument('--skip-rowwise', action='store_true')
+    args = parser.parse_args()
+
+    conn = connect()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'jira_export.csv')
+        write_csv(path, args.rows, args.custom_fields)
+        print(f"{args.rows} rows x {args.custom_fields} custom fields")
+        bulk = timed('bulk', bulk_load_csv, conn, path, args.rows)
+        if not args.skip_rowwise:
+            rowwise = timed('rowwise', load_csv_rowwise, conn, path, args.rows)
+            if rowwise != bulk:
+                raise SystemExit("Bulk and row-by-row loads differ")
+            print("Bulk and row-by-row loads are identical.")
+
+    cur = conn.cursor()
+    cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE;")
+    conn.commit()
+    conn.close()
+
+if __name__ == "__main__":
+    main()
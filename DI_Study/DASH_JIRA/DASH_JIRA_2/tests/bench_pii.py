@@ -0,0 +1,79 @@
+"""PII masking throughput on a synthetic 100k-issue corpus.
+
+Compares the old three ``re.sub`` passes with the single-pass PIIMasker
+(same patterns, must give identical output), then the full masker with the
+Korean formats, serially and on a process pool.
+
+Usage::
+
+    python -m tests.bench_pii --docs 100000
+    python -m tests.bench_pii --docs 100000 --processes 4
+"""
+import argparse
+import os
+import random
+import re
+import time
+from src.nlp.pii import LEGACY_PATTERNS, PIIMasker, default_masker
+
+WORDS = ("server", "login", "배너", "태그", "오류", "page", "tracking", "요청", "campaign", "release",
+         "timeout", "cache", "확인", "부탁드립니다", "deploy", "error", "GTM", "pixel", "site", "version")
+
+def legacy_mask(text):
+    if not text:
+        return ""
+    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '<EMAIL>', text)
+    text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '<PHONE>', text)
+    text = re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '<IP>', text)
+    return text
+
+def make_corpus(docs, seed=5):
+    rng = random.Random(seed)
+    pii = [
+        lambda: f"user{rng.randrange(999)}@example.com",
+        lambda: f"{rng.randrange(100, 999)}-{rng.randrange(100, 999)}-{rng.randrange(1000, 9999)}",
+        lambda: f"10.{rng.randrange(256)}.{rng.randrange(256)}.{rng.randrange(256)}",
+        lambda: f"010-{rng.randrange(1000, 9999)}-{rng.randrange(1000, 9999)}",
+        lambda: f"9{rng.randrange(10)}0{rng.randrange(1, 10)}1{rng.randrange(10)}-{rng.randrange(1, 5)}{rng.randrange(100000, 999999)}",
+        lambda: f"v{rng.randrange(10)}.{rng.randrange(10)}",
+        lambda: str(rng.randrange(10 ** 6)),
+    ]
+    corpus = []
+    for _ in range(docs):
+        tokens = [rng.choice(WORDS) for _ in range(rng.randrange(20, 120))]
+        for _ in range(rng.randrange(0, 4)):
+            tokens.insert(rng.randrange(len(tokens) + 1), rng.choice(pii)())
+        corpus.append(" ".join(tokens))
+    return corpus
+
+def timed(label, fn, docs):
+    started = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:28s} {elapsed:7.2f}s  {docs / elapsed:10.0f} docs/s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--docs", type=int, default=100000)
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.docs)
+    print(f"{args.docs} documents, {sum(map(len, corpus)) / 1e6:.1f}M chars")
+    expected = timed("legacy 3 passes", lambda: [legacy_mask(text) for text in corpus], args.docs)
+    single = PIIMasker(LEGACY_PATTERNS)
+    actual = timed("single pass (legacy set)", lambda: single.mask_many(corpus), args.docs)
+    mismatches = sum(a != b for a, b in zip(expected, actual))
+    if mismatches:
+        raise SystemExit(f"single-pass output differs from legacy passes on {mismatches} documents")
+    full = timed("single pass (+ Korean)", lambda: default_masker.mask_many(corpus), args.docs)
+    if args.processes > 1:
+        pooled = timed(f"process pool x{args.processes}",
+                       lambda: default_masker.mask_many(corpus, processes=args.processes), args.docs)
+        if pooled != full:
+            raise SystemExit("process-pool output differs from serial output")
+    print(f"Korean formats masked in {sum(a != b for a, b in zip(actual, full))} extra documents")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Latency / recall@k of similar-case search at 10k and 100k vectors.
+
+Always measures the in-process NumPy index (exact, so recall is 1.0). With
+``--pgvector`` it also loads the same vectors into a scratch ``vector_bench``
+schema of the docker-compose Postgres, builds the HNSW or IVFFlat index and
+sweeps ef_search / probes, scoring recall against the exact top-k.
+
+Usage::
+
+    python -m tests.bench_vector_search --sizes 10000 100000
+    python -m tests.bench_vector_search --sizes 10000 --pgvector --kind hnsw --sweep 10 40 100
+    python -m tests.bench_vector_search --sizes 100000 --pgvector --kind ivfflat --sweep 1 10 40
+"""
+import argparse
+import io
+import os
+import time
+import numpy as np
+
+SCHEMA = "vector_bench"
+
+def make_vectors(rows, dims, clusters=64, seed=11):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dims)).astype(np.float32)
+    labels = rng.integers(0, clusters, rows)
+    vectors = centers[labels] + 0.6 * rng.standard_normal((rows, dims)).astype(np.float32)
+    queries = centers[rng.integers(0, clusters, 200)] + 0.6 * rng.standard_normal((200, dims)).astype(np.float32)
+    return vectors, queries
+
+def percentiles(samples):
+    ms = np.asarray(samples) * 1000
+    return np.percentile(ms, 50), np.percentile(ms, 99)
+
+def exact_top_k(vectors, queries, k):
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = (queries / np.linalg.norm(queries, axis=1, keepdims=True)) @ normalized.T
+    return [set(np.argsort(-row)[:k].tolist()) for row in scores]
+
+def run_search(search, queries, truth, k):
+    latencies, hits = [], 0
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        results = search(query.tolist(), k)
+        latencies.append(time.perf_counter() - started)
+        hits += len(expected & {int(row["issue_key"].split("-")[1]) for row in results})
+    p50, p99 = percentiles(latencies)
+    return p50, p99, hits / (k * len(queries))
+
+def bench_local(vectors, queries, truth, k):
+    from src.search.local_index import LocalVectorIndex
+    index = LocalVectorIndex([f"GTA-{idx}" for idx in range(len(vectors))], vectors)
+    return run_search(index.search, queries, truth, k)
+
+def load_pgvector(conn, vectors, kind):
+    from src.search.vector_store import create_vector_index
+    cur = conn.cursor()
+    cur.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+    cur.execute(f"CREATE TABLE {SCHEMA}.issues (LIKE public.issues INCLUDING DEFAULTS)")
+    cur.execute(f"""
+        CREATE TABLE {SCHEMA}.embeddings (
+            id SERIAL PRIMARY KEY, issue_key VARCHAR(50), embedding_type VARCHAR(20),
+            vector VECTOR({vectors.shape[1]}), model_version VARCHAR(50), content_hash VARCHAR(64))
+    """)
+    issues = io.StringIO("".join(f"GTA-{idx}\tIssue {idx}\tOpen\n" for idx in range(len(vectors))))
+    cur.copy_expert(f"COPY {SCHEMA}.issues (issue_key, summary, status) FROM STDIN", issues)
+    payload = io.StringIO()
+    for idx, vector in enumerate(vectors):
+        payload.write(f"GTA-{idx}\tfull_context\t[{','.join(f'{v:.6g}' for v in vector)}]\n")
+    payload.seek(0)
+    cur.copy_expert(f"COPY {SCHEMA}.embeddings (issue_key, embedding_type, vector) FROM STDIN", payload)
+    conn.commit()
+    started = time.perf_counter()
+    create_vector_index(conn, kind)
+    print(f"  {kind} index built in {time.perf_counter() - started:.1f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--pgvector", action="store_true")
+    parser.add_argument("--kind", choices=["hnsw", "ivfflat"], default="hnsw")
+    parser.add_argument("--sweep", type=int, nargs="+", default=[10, 40, 100],
+                        help="ef_search values (hnsw) or probes (ivfflat)")
+    args = parser.parse_args()
+
+    if args.pgvector:
+        # Pooled connections pick the scratch schema up from libpq's PGOPTIONS.
+        os.environ["PGOPTIONS"] = f"-c search_path={SCHEMA},public"
+        from src.db.connection import close_pool, get_db_connection
+        from src.search.vector_store import VectorStore
+
+    for rows in args.sizes:
+        vectors, queries = make_vectors(rows, args.dims)
+        truth = exact_top_k(vectors, queries, args.k)
+        print(f"{rows} vectors x {args.dims} dims, recall@{args.k} over {len(queries)} queries")
+        p50, p99, recall = bench_local(vectors, queries, truth, args.k)
+        print(f"  local numpy        p50 {p50:7.2f}ms  p99 {p99:7.2f}ms  recall {recall:.3f}")
+
+        if args.pgvector:
+            conn = get_db_connection()
+            load_pgvector(conn, vectors, args.kind)
+            store = VectorStore(backend="pgvector")
+            knob = "ef_search" if args.kind == "hnsw" else "probes"
+            for value in args.sweep:
+                search = lambda vector, k: store._search_pgvector(
+                    vector, k, value if knob == "ef_search" else None, value if knob == "probes" else None)
+                p50, p99, recall = run_search(search, queries, truth, args.k)
+                print(f"  pgvector {args.kind} {knob}={value:<4d} p50 {p50:7.2f}ms  p99 {p99:7.2f}ms  recall {recall:.3f}")
+            cur = conn.cursor()
+            cur.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+            conn.commit()
+            conn.close()
+            close_pool()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Local stand-in for the OpenAI embeddings endpoint.
+
+Returns deterministic unit vectors per input text after a fixed latency, and
+answers 429 (with Retry-After) once more than ``max_concurrent`` requests are
+in flight, which is enough to exercise batching, concurrency and throttling.
+
+Usage::
+
+    python -m tests.fake_embedding_server --port 8765 --latency-ms 80
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 OPENAI_API_KEY=fake python -m src.search.indexer
+"""
+import argparse
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import numpy as np
+
+def fake_vector(text: str, dims: int) -> np.ndarray:
+    seed = int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+    vector = np.random.default_rng(seed).standard_normal(dims).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+class FakeEmbeddingServer:
+    def __init__(self, port: int = 0, dims: int = 1536, latency_ms: float = 50.0,
+                 max_concurrent: int = 0, retry_after: float = 0.05):
+        self.dims = dims
+        self.latency = latency_ms / 1000.0
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self.requests = 0
+        self.inputs = 0
+        self.throttled = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}/v1"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _reply(self, status, body, headers=None):
+                payload = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if not self.path.endswith("/embeddings"):
+                    return self._reply(404, {"error": {"message": "not found"}})
+                with server._lock:
+                    server.requests += 1
+                    if server.max_concurrent and server._in_flight >= server.max_concurrent:
+                        server.throttled += 1
+                        throttled = True
+                    else:
+                        server._in_flight += 1
+                        server.peak_in_flight = max(server.peak_in_flight, server._in_flight)
+                        throttled = False
+                if throttled:
+                    return self._reply(
+                        429,
+                        {"error": {"message": "Rate limit reached", "type": "requests", "code": "rate_limit_exceeded"}},
+                        {"Retry-After": str(server.retry_after)},
+                    )
+                try:
+                    texts = body.get("input", [])
+                    texts = [texts] if isinstance(texts, str) else texts
+                    time.sleep(server.latency)
+                    data = []
+                    for index, text in enumerate(texts):
+                        vector = fake_vector(text, server.dims)
+                        if body.get("encoding_format") == "base64":
+                            embedding = base64.b64encode(vector.tobytes()).decode("ascii")
+                        else:
+                            embedding = vector.tolist()
+                        data.append({"object": "embedding", "index": index, "embedding": embedding})
+                    with server._lock:
+                        server.inputs += len(texts)
+                    tokens = sum(len(text.split()) for text in texts)
+                    self._reply(200, {
+                        "object": "list", "data": data, "model": body.get("model"),
+                        "usage": {"prompt_tokens": tokens, "total_tokens": tokens},
+                    })
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fake OpenAI embeddings server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dims", type=int, default=1536)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--max-concurrent", type=int, default=0)
+    args = parser.parse_args()
+    fake = FakeEmbeddingServer(args.port, args.dims, args.latency_ms, args.max_concurrent)
+    print(f"Serving fake embeddings at {fake.base_url}")
+    fake.httpd.serve_forever()
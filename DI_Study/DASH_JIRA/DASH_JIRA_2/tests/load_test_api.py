@@ -0,0 +1,149 @@
+"""Concurrent /analyze + /issues load test against stubbed backends.
+
+The LLM and Postgres are replaced by stubs that block for a fixed latency
+(like the sync OpenAI client and psycopg2 do). The app is served by uvicorn
+on a background thread and driven over HTTP, so time spent with the event
+loop blocked is part of the measured latency. Each mode prints p50/p99 per
+endpoint: ``inline`` runs service calls on the event loop (the old
+behaviour), ``pool`` dispatches them to the bounded DB / LLM worker pools.
+
+Usage::
+
+    python -m tests.load_test_api --requests 400 --concurrency 32
+    python -m tests.load_test_api --llm-latency-ms 800 --db-latency-ms 5 --llm-threads 64
+"""
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from contextlib import contextmanager
+import httpx
+import numpy as np
+import uvicorn
+from src.api import server
+from src.api.workers import configure_workers
+from src.config import settings
+from src.nlp.models import AnalysisResult
+
+class StubLLMClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def analyze_issue(self, summary, description):
+        time.sleep(self.latency)
+        return AnalysisResult(
+            summary=summary[:100], category="Bug Report", urgency="Medium",
+            root_cause_hypothesis="stub", required_action="stub",
+            suggested_assignee_team="Triage Team", confidence_score=0.5,
+        )
+
+class StubCursor:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def execute(self, query, params=None):
+        time.sleep(self.latency)
+
+    def fetchone(self):
+        return (1000,)
+
+    def fetchall(self):
+        return [(f"GTA-{idx}", f"Issue {idx}", "Bug", "Open", None, "High", "", "GTA") for idx in range(20)]
+
+    def close(self):
+        pass
+
+class StubConnection:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def cursor(self):
+        return StubCursor(self.latency)
+
+@contextmanager
+def stubbed_backends(llm_latency: float, db_latency: float):
+    original = server.nlp_processor.llm_client, server.pooled_connection
+
+    @contextmanager
+    def stub_pool():
+        yield StubConnection(db_latency)
+
+    server.nlp_processor.llm_client = StubLLMClient(llm_latency)
+    server.pooled_connection = stub_pool
+    try:
+        yield
+    finally:
+        server.nlp_processor.llm_client, server.pooled_connection = original
+
+@contextmanager
+def serve_app():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    uv = uvicorn.Server(uvicorn.Config(server.app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=uv.run, daemon=True)
+    thread.start()
+    while not uv.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        uv.should_exit = True
+        thread.join()
+
+async def run_load(base_url: str, total: int, concurrency: int, analyze_share: float = 0.2):
+    gate = asyncio.Semaphore(concurrency)
+    latencies = {"/analyze": [], "/issues": []}
+    every = max(1, round(1 / analyze_share)) if analyze_share > 0 else 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=120) as client:
+        async def one(idx):
+            async with gate:
+                started = time.perf_counter()
+                if every and idx % every == 0:
+                    path = "/analyze"
+                    response = await client.post(path, json={"summary": f"Issue {idx}", "description": "Server crashed."})
+                else:
+                    path = "/issues"
+                    response = await client.get(path, params={"limit": 20})
+                response.raise_for_status()
+                latencies[path].append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(idx) for idx in range(total)))
+        elapsed = time.perf_counter() - started
+    return latencies, elapsed
+
+def summarize(latencies):
+    return {
+        path: (np.percentile(values, 50) * 1000, np.percentile(values, 99) * 1000)
+        for path, values in latencies.items() if values
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--llm-latency-ms", type=float, default=300.0)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    parser.add_argument("--db-threads", type=int, default=settings.API_WORKER_THREADS)
+    parser.add_argument("--llm-threads", type=int, default=settings.API_LLM_THREADS)
+    parser.add_argument("--modes", nargs="+", choices=["inline", "pool"], default=["inline", "pool"])
+    args = parser.parse_args()
+
+    with stubbed_backends(args.llm_latency_ms / 1000, args.db_latency_ms / 1000):
+        for mode in args.modes:
+            if mode == "inline":
+                configure_workers(0, 0)
+            else:
+                configure_workers(args.db_threads, args.llm_threads)
+            with serve_app() as base_url:
+                latencies, elapsed = asyncio.run(run_load(base_url, args.requests, args.concurrency))
+            print(f"{mode:6s} {args.requests / elapsed:7.1f} req/s")
+            for path, (p50, p99) in summarize(latencies).items():
+                print(f"    {path:9s} p50 {p50:8.1f}ms  p99 {p99:8.1f}ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+import asyncio
+import time
+import httpx
+from tests.load_test_api import serve_app, stubbed_backends
+
+async def _slow_analyze_with_fast_reads(base_url):
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        async def read():
+            started = time.perf_counter()
+            response = await client.get("/issues")
+            assert response.status_code == 200
+            return time.perf_counter() - started
+
+        analyze = asyncio.create_task(client.post("/analyze", json={"summary": "Slow", "description": "LLM call"}))
+        await asyncio.sleep(0.05)
+        reads = await asyncio.gather(*(read() for _ in range(5)))
+        response = await analyze
+        assert response.status_code == 200
+        return reads
+
+def test_slow_llm_call_does_not_block_other_requests():
+    with stubbed_backends(llm_latency=1.0, db_latency=0.01), serve_app() as base_url:
+        reads = asyncio.run(_slow_analyze_with_fast_reads(base_url))
+    print(f"/issues while /analyze in flight: max {max(reads) * 1000:.0f}ms")
+    assert max(reads) < 0.5
+
+if __name__ == "__main__":
+    test_slow_llm_call_does_not_block_other_requests()
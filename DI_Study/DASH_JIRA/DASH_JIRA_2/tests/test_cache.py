@@ -0,0 +1,132 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from openai import OpenAI
+from src.nlp.cache import LRUCache, ResultCache, SingleFlight, SQLiteStore, embedding_cache
+from src.nlp.llm_client import LLMClient
+from tests.fake_embedding_server import FakeEmbeddingServer
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+def test_sqlite_store_survives_restart():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm_cache.sqlite3")
+        first = ResultCache("analysis", 10, store=SQLiteStore(path))
+        first.set("key", {"summary": "요약", "confidence_score": 0.9})
+
+        second = ResultCache("analysis", 10, store=SQLiteStore(path))
+        assert second.get("key") == {"summary": "요약", "confidence_score": 0.9}
+        assert second.stats()["store_hits"] == 1
+        assert ResultCache("embedding", 10, store=SQLiteStore(path)).get("key") is None
+    print("SQLite Cache Test Passed!")
+
+def test_sqlite_store_prunes_expired_and_excess_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm_cache.sqlite3")
+        store = SQLiteStore(path, max_entries=3, prune_every=2)
+        for idx in range(4):
+            store.set("analysis", f"k{idx}", idx)
+            time.sleep(0.002)  # distinct access times
+        assert len(store) == 3 and store.get("analysis", "k0") is None
+        store.get("analysis", "k1")
+        for idx in (4, 5):
+            time.sleep(0.002)
+            store.set("analysis", f"k{idx}", idx)
+        # k1 was read most recently, so k2 and k3 went first
+        assert len(store) == 3 and store.get("analysis", "k1") == 1
+        assert store.get("analysis", "k2") is None and store.get("analysis", "k3") is None
+
+        store._conn.execute("UPDATE llm_cache SET created_at = created_at - 7200 WHERE key = 'k4'")
+        store._conn.commit()
+        reopened = SQLiteStore(path, ttl_seconds=3600)
+        assert len(reopened) == 2 and reopened.get("analysis", "k4") is None
+    print("SQLite Cache Pruning Test Passed!")
+
+def test_sqlite_store_upgrades_old_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "llm_cache.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE llm_cache (namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "created_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        conn.execute("INSERT INTO llm_cache VALUES ('analysis', 'old', '1', ?)", (time.time(),))
+        conn.commit()
+        conn.close()
+        store = SQLiteStore(path, max_entries=10)
+        assert store.get("analysis", "old") == 1
+        store.set("analysis", "new", 2)
+        assert len(store) == 2
+
+def test_result_cache_counters_are_thread_safe():
+    cache = ResultCache("analysis", 10)
+    cache.set("key", "value")
+
+    def read():
+        for _ in range(5000):
+            cache.get("key")
+            cache.get("missing")
+
+    threads = [threading.Thread(target=read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert cache.stats()["hits"] == 40000 and cache.stats()["misses"] == 40000
+
+def test_single_flight_coalesces_concurrent_calls():
+    flights = SingleFlight()
+    calls = []
+    results = []
+
+    def upstream():
+        calls.append(1)
+        time.sleep(0.2)
+        return "result"
+
+    threads = [threading.Thread(target=lambda: results.append(flights.do("same", upstream))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1
+    assert results == ["result"] * 8
+    assert flights.coalesced == 7
+    print("Single-flight Test Passed!")
+
+def test_query_embedding_is_cached():
+    embedding_cache.clear()
+    with FakeEmbeddingServer(dims=8, latency_ms=100) as server:
+        llm = LLMClient(max_retries=0)
+        llm.client = OpenAI(api_key="fake", base_url=server.base_url, max_retries=0)
+
+        vectors = []
+        threads = [threading.Thread(target=lambda: vectors.append(llm.get_embedding("Login failure"))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        again = llm.get_embedding("Login failure")
+
+    assert server.requests == 1
+    assert all(vector == again for vector in vectors) and len(again) == 8
+    assert embedding_cache.stats()["hits"] >= 1
+    print("Embedding Cache Test Passed!")
+
+if __name__ == "__main__":
+    test_lru_evicts_least_recently_used()
+    test_sqlite_store_survives_restart()
+    test_sqlite_store_prunes_expired_and_excess_rows()
+    test_sqlite_store_upgrades_old_files()
+    test_result_cache_counters_are_thread_safe()
+    test_single_flight_coalesces_concurrent_calls()
+    test_query_embedding_is_cached()
@@ -0,0 +1,62 @@
+import time
+from openai import OpenAI
+from src.nlp.llm_client import LLMClient
+from src.search.indexer import EmbeddingIndexer, build_text, content_hash
+from tests.fake_embedding_server import FakeEmbeddingServer, fake_vector
+
+def _indexer(server, **kwargs):
+    llm = LLMClient(max_retries=0)
+    llm.client = OpenAI(api_key="fake", base_url=server.base_url, max_retries=0)
+    return EmbeddingIndexer(llm=llm, **kwargs)
+
+def _items(count):
+    items = []
+    for idx in range(count):
+        text = build_text(f"Issue {idx}", f"Description for issue {idx}")
+        items.append((f"GTA-{idx}", text, content_hash(text, "text-embedding-3-small")))
+    return items
+
+def _collect(indexer, items):
+    results = {}
+    for _, batch, vectors in indexer.embed(indexer.batches(items)):
+        assert vectors is not None
+        for (issue_key, text, _), vector in zip(batch, vectors):
+            results[issue_key] = (text, vector)
+    return results
+
+def test_batched_concurrent_embedding():
+    with FakeEmbeddingServer(dims=8, latency_ms=50) as server:
+        indexer = _indexer(server, batch_size=50, max_concurrency=4)
+        items = _items(1000)
+        started = time.perf_counter()
+        results = _collect(indexer, items)
+        elapsed = time.perf_counter() - started
+
+    assert len(results) == 1000
+    for text, vector in results.values():
+        assert [round(v, 5) for v in vector] == [round(float(v), 5) for v in fake_vector(text.replace("\n", " "), 8)]
+    assert server.requests == 20 and indexer.stats["requests"] == 20
+    # Batches overlap on the server, never beyond the configured concurrency.
+    assert 1 < server.peak_in_flight <= 4
+    print(f"Embedded 1000 texts in {elapsed:.2f}s with {server.requests} requests")
+
+def test_throttling_backs_off_and_recovers():
+    with FakeEmbeddingServer(dims=8, latency_ms=30, max_concurrent=2, retry_after=0.02) as server:
+        indexer = _indexer(server, batch_size=20, max_concurrency=8, max_retries=20)
+        results = _collect(indexer, _items(600))
+
+    assert len(results) == 600
+    assert indexer.stats["throttled"] == server.throttled > 0
+    assert indexer.limiter.limit < 8
+    print(f"Throttled {server.throttled} times; settled at {indexer.limiter.limit} in flight")
+
+def test_batches_respect_size_and_order():
+    indexer = EmbeddingIndexer(llm=LLMClient(max_retries=0), batch_size=3)
+    batches = list(indexer.batches(_items(7)))
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [item[0] for batch in batches for item in batch] == [f"GTA-{idx}" for idx in range(7)]
+
+if __name__ == "__main__":
+    test_batched_concurrent_embedding()
+    test_throttling_backs_off_and_recovers()
+    test_batches_respect_size_and_order()
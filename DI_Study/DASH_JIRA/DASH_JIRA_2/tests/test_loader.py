@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+import pandas as pd
+from src.ingestion.loader import (
+    COPY_NULL, STAGE_COLUMNS, build_issue, custom_field_columns, prepare_chunk, _copy_chunk
+)
+
+CSV_TEXT = '''Issue key,Issue id,Summary,Description,Status,Issue Type,Priority,Created,Updated,Assignee,Reporter,Custom field (Region),Custom field (Site),Custom field (Score)
+GTA-1,101,Login failure,"Multi-line
+description with ""quotes"" and \\ slash",Open,Bug,High,16/Jul/24 10:06 PM,17/Jul/24 09:00 AM,alice,bob,EU,,3
+GTA-2,102,,,Closed,Task,,01/Jan/25 12:00 AM,bad date,,carol,,"tab\there",
+GTA-3,,한글 요약,설명,Open,Bug,Low,,,,,KR,사이트,1.5
+'''
+
+class _FakeCursor:
+    def __init__(self):
+        self.sql = None
+        self.payload = None
+
+    def copy_expert(self, sql, buffer):
+        self.sql = sql
+        self.payload = buffer.read()
+
+def _read_chunk():
+    return pd.read_csv(io.StringIO(CSV_TEXT), low_memory=False)
+
+def test_prepare_chunk_matches_row_mapping():
+    df = _read_chunk()
+    custom_columns = custom_field_columns(df.columns)
+    frame = prepare_chunk(df, custom_columns)
+
+    rows = df.astype(object).where(pd.notnull(df), None)
+    assert len(frame) == len(rows)
+    for (_, row), (_, staged) in zip(rows.iterrows(), frame.iterrows()):
+        issue = build_issue(row, custom_columns)
+        assert staged['issue_key'] == issue.issue_key
+        assert (None if pd.isna(staged['issue_id']) else int(staged['issue_id'])) == issue.issue_id
+        assert staged['summary'] == (issue.summary or '')
+        for column in ('description', 'status', 'issue_type', 'priority', 'assignee_id', 'reporter_id'):
+            assert staged[column] == getattr(issue, column), column
+        for column in ('created_at', 'updated_at'):
+            value = staged[column]
+            assert (None if pd.isna(value) else value.to_pydatetime()) == getattr(issue, column), column
+        assert json.loads(staged['custom_fields']) == issue.custom_fields
+    print("Bulk Loader Mapping Test Passed!")
+
+def test_copy_payload_round_trip():
+    df = _read_chunk()
+    frame = prepare_chunk(df, custom_field_columns(df.columns))
+    cur = _FakeCursor()
+    _copy_chunk(cur, frame, seq_start=10)
+
+    assert "FORMAT csv" in cur.sql and "issues_stage" in cur.sql
+    records = list(csv.reader(io.StringIO(cur.payload)))
+    assert len(records) == len(frame)
+    assert [int(record[0]) for record in records] == [10, 11, 12]
+    first = dict(zip(STAGE_COLUMNS, records[0]))
+    assert first['description'] == frame.iloc[0]['description']
+    assert first['created_at'] == '2024-07-16 22:06:00'
+    second = dict(zip(STAGE_COLUMNS, records[1]))
+    assert second['summary'] == ''
+    assert second['updated_at'] == COPY_NULL
+    assert json.loads(second['custom_fields']) == {"Custom field (Site)": "tab\there"}
+    print("COPY Payload Test Passed!")
+
+if __name__ == "__main__":
+    test_prepare_chunk_matches_row_mapping()
+    test_copy_payload_round_trip()
@@ -1,3 +1,5 @@
+import re
+from src.nlp.pii import LEGACY_PATTERNS, PIIMasker
 from src.nlp.processor import NLPProcessor
 
 def test_pii_masking():
@@ -17,6 +19,45 @@ def test_pii_masking():
     assert "192.168.1.1" not in masked
     print("PII Masking Test Passed!")
 
+def test_korean_pii_masking():
+    processor = NLPProcessor()
+
+    text = "담당자 연락처010-1234-5678, 사무실 02-123-4567, 주민번호 900101-1234567, +82 10 9876 5432"
+    masked = processor.mask_pii(text)
+
+    print(f"Masked:   {masked}")
+    assert masked == "담당자 연락처<PHONE>, 사무실 <PHONE>, 주민번호 <RRN>, <PHONE>"
+    assert processor.mask_pii_batch([text, None, "no pii here"]) == [masked, "", "no pii here"]
+    print("Korean PII Masking Test Passed!")
+
+def test_single_pass_matches_legacy_passes():
+    def legacy(text):
+        text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '<EMAIL>', text)
+        text = re.sub(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', '<PHONE>', text)
+        return re.sub(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', '<IP>', text)
+
+    masker = PIIMasker(LEGACY_PATTERNS)
+    samples = [
+        "Contact me at user@example.com or 123-456-7890. IP is 192.168.1.1.",
+        "mail a.b-c@d.co.uk, call 123.456.7890 or 1234567890 from 10.0.0.255",
+        "ids 12345678901 and 999.999.999.999 and 1.2.3.4.5",
+        # Overlaps: a phone inside an IP candidate, an IP right after an email.
+        "1.1.1.123.456.7890 and 10.0.0.1234.567.8901",
+        "mail a@b.com1.2.3.4 or x@y.org123-456-7890",
+    ]
+    for text in samples:
+        assert masker.mask(text) == legacy(text), text
+    assert masker.mask("1.1.1.123.456.7890") == "1.1.1.<PHONE>"
+
+def test_rrn_rejects_longer_numbers():
+    masker = PIIMasker()
+    assert masker.mask("주민번호 900101-1234567.") == "주민번호 <RRN>."
+    for text in ("2024-900101-1234567", "900101-1234567-01", "1.9001011234567", "90010112345678"):
+        assert masker.mask(text) == text
+    # A bare 13-digit number with a date-like prefix looks exactly like an
+    # RRN, so epoch-ms timestamps are masked too (documented over-masking).
+    assert masker.mask("ts 1710101234567") == "ts <RRN>"
+
 def test_llm_success():
     processor = NLPProcessor()
     result = processor.process_issue("System crash", "Server crashed due to memory leak.")
@@ -31,4 +72,7 @@ def test_llm_success():
 
 if __name__ == "__main__":
     test_pii_masking()
+    test_korean_pii_masking()
+    test_single_pass_matches_legacy_passes()
+    test_rrn_rejects_longer_numbers()
     test_llm_success()
@@ -0,0 +1,48 @@
+import os
+import tempfile
+import numpy as np
+from src.search.local_index import LocalVectorIndex
+from src.search.vector_store import VectorStore
+
+def _index(rows=500, dims=32, seed=3):
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((rows, dims)).astype(np.float32)
+    keys = [f"GTA-{idx}" for idx in range(rows)]
+    records = [{"summary": f"Issue {idx}", "description": None, "status": "Open"} for idx in range(rows)]
+    return LocalVectorIndex(keys, vectors, records), vectors
+
+def test_local_index_top_k_matches_brute_force():
+    index, vectors = _index()
+    query = np.random.default_rng(9).standard_normal(vectors.shape[1])
+    results = index.search(query.tolist(), limit=5)
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    expected = np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:5]
+    assert [row["issue_key"] for row in results] == [f"GTA-{idx}" for idx in expected]
+    assert all(a["similarity"] >= b["similarity"] for a, b in zip(results, results[1:]))
+    assert results[0]["description"] == ""
+    print("Local Index Top-k Test Passed!")
+
+def test_local_index_round_trip():
+    index, vectors = _index(rows=50)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "index.npz")
+        index.save(path)
+        loaded = LocalVectorIndex.load(path)
+    assert loaded.keys == index.keys and loaded.records == index.records
+    assert loaded.search(vectors[7].tolist(), limit=1)[0]["issue_key"] == "GTA-7"
+
+def test_vector_store_falls_back_to_local_index():
+    # No Postgres is reachable from the test run, so pgvector search fails.
+    index, vectors = _index(rows=50)
+    store = VectorStore(backend="pgvector")
+    store.set_local_index(index)
+    results = store.search_by_vector(vectors[3].tolist(), limit=3)
+    assert results[0]["issue_key"] == "GTA-3"
+    assert len(results) == 3
+    print("Vector Store Fallback Test Passed!")
+
+if __name__ == "__main__":
+    test_local_index_top_k_matches_brute_force()
+    test_local_index_round_trip()
+    test_vector_store_falls_back_to_local_index()
@@ -1,6 +1,6 @@
 import asyncio
 import random
-from playwright.async_api import async_playwright, BrowserContext
+from playwright.async_api import async_playwright, Browser, BrowserContext
 from fake_useragent import UserAgent
 
 # Generate realistic user agents
@@ -25,12 +25,11 @@ def _desktop_user_agent() -> str:
         "Chrome/120.0.0.0 Safari/537.36"
     )
 
-async def get_advanced_stealth_context(playwright, headless=True) -> BrowserContext:
+async def launch_advanced_browser(playwright, headless=True) -> Browser:
     """
-    Creates an advanced stealth browser context with comprehensive anti-detection measures.
+    Launches Chromium with the anti-detection flags used by the advanced contexts.
     """
-    # Launch browser with extensive flags to avoid detection
-    browser = await playwright.chromium.launch(
+    return await playwright.chromium.launch(
         headless=headless,
         args=[
             '--disable-blink-features=AutomationControlled',
@@ -47,8 +46,12 @@ async def get_advanced_stealth_context(playwright, headless=True) -> BrowserCont
             '--disable-features=BlockInsecurePrivateNetworkRequests',
         ]
     )
-    
-    # Create context with realistic settings
+
+
+async def new_advanced_context(browser: Browser) -> BrowserContext:
+    """
+    Creates a stealth context (desktop UA, Seoul locale, init scripts) on a running browser.
+    """
     context = await browser.new_context(
         viewport={'width': 1920, 'height': 1080},
         user_agent=_desktop_user_agent(),
@@ -216,6 +219,15 @@ async def get_advanced_stealth_context(playwright, headless=True) -> BrowserCont
         });
     """)
     
+    return context
+
+
+async def get_advanced_stealth_context(playwright, headless=True) -> BrowserContext:
+    """
+    Creates an advanced stealth browser context with comprehensive anti-detection measures.
+    """
+    browser = await launch_advanced_browser(playwright, headless=headless)
+    context = await new_advanced_context(browser)
     return context, browser
 
 
@@ -0,0 +1,333 @@
+"""
+Shared Playwright browser/context pool for orchestrated crawl runs.
+
+Crawlers used to launch a fresh Chromium per keyword. Under the
+orchestrator they lease a stealth context from a pool instead: one browser
+per stealth profile is launched lazily and kept for the whole run, and
+contexts are reused across keywords until they have served
+``recycle_after_pages`` pages. Browsers are replaced after
+``recycle_browser_after_contexts`` contexts, or as soon as the Chromium
+processes exceed ``max_browser_rss_mb``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import random
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from playwright.async_api import Browser, BrowserContext, async_playwright
+
+from src.crawler.advanced_stealth import launch_advanced_browser, new_advanced_context
+from src.crawler.ultra_stealth import UltraStealth
+from src.crawler.utils import launch_stealth_browser, new_stealth_context
+
+
+def _ultra_launch_options() -> Dict[str, Any]:
+    # Contexts must report the same screen size as the browser window.
+    return {"resolution": random.choice(UltraStealth.SCREEN_RESOLUTIONS)}
+
+
+# profile -> (launch(playwright, headless=..., **options), new_context(browser, **options),
+#             launch_options()); the options are chosen once per browser.
+PROFILES = {
+    "basic": (launch_stealth_browser, new_stealth_context, dict),
+    "advanced": (launch_advanced_browser, new_advanced_context, dict),
+    "ultra": (UltraStealth.launch_ultra_browser, UltraStealth.new_ultra_context, _ultra_launch_options),
+}
+
+logger = logging.getLogger("browser_pool")
+
+
+@dataclass
+class BrowserPoolConfig:
+    """Pool limits, loaded from ``global.browser_pool`` in crawl_targets.json."""
+
+    headless: bool = True
+    max_contexts_per_profile: int = 4
+    recycle_after_pages: int = 25
+    recycle_browser_after_contexts: int = 40
+    max_browser_rss_mb: float = 1536
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "BrowserPoolConfig":
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in (data or {}).items() if key in known})
+
+
+@dataclass
+class BrowserPoolMetrics:
+    browser_launches: int = 0
+    launch_seconds: float = 0.0
+    contexts_created: int = 0
+    context_seconds: float = 0.0
+    leases: int = 0
+    reused_leases: int = 0
+    page_recycles: int = 0
+    memory_recycles: int = 0
+    browsers_closed: int = 0
+
+    @property
+    def launch_seconds_saved(self) -> float:
+        """Estimated startup time avoided versus one browser+context per lease."""
+        if not self.browser_launches or not self.contexts_created:
+            return 0.0
+        per_launch = self.launch_seconds / self.browser_launches
+        per_context = self.context_seconds / self.contexts_created
+        standalone = self.leases * (per_launch + per_context)
+        return max(0.0, standalone - self.launch_seconds - self.context_seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["launch_seconds"] = round(self.launch_seconds, 2)
+        data["context_seconds"] = round(self.context_seconds, 2)
+        data["launch_seconds_saved"] = round(self.launch_seconds_saved, 2)
+        return data
+
+
+class _BrowserHandle:
+    def __init__(self, browser: Browser, launch_options: Dict[str, Any]) -> None:
+        self.browser = browser
+        self.launch_options = launch_options
+        self.contexts_created = 0
+        self.open_contexts = 0
+        self.retired = False
+
+
+class _PooledContext:
+    def __init__(self, context: BrowserContext, handle: _BrowserHandle) -> None:
+        self.context = context
+        self.handle = handle
+        self.pages_served = 0
+        context.on("page", self._on_page)
+
+    def _on_page(self, _page) -> None:
+        self.pages_served += 1
+
+
+class _ProfileSlot:
+    def __init__(self, max_contexts: int) -> None:
+        self.handle: Optional[_BrowserHandle] = None
+        self.idle: List[_PooledContext] = []
+        self.semaphore = asyncio.Semaphore(max(1, max_contexts))
+        self.lock = asyncio.Lock()
+
+
+def _browser_rss_mb() -> Optional[float]:
+    """RSS of the Chromium processes below this process (Linux /proc only)."""
+    proc = Path("/proc")
+    if not proc.is_dir():
+        return None
+    page_size = os.sysconf("SC_PAGE_SIZE")
+    children: Dict[int, List[int]] = defaultdict(list)
+    info: Dict[int, tuple] = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+            rss_pages = int((entry / "statm").read_text().split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+        name = stat[stat.find("(") + 1:stat.rfind(")")]
+        ppid = int(stat[stat.rfind(")") + 2:].split()[1])
+        pid = int(entry.name)
+        children[ppid].append(pid)
+        info[pid] = (name, rss_pages * page_size)
+
+    total = 0
+    stack = list(children[os.getpid()])
+    while stack:
+        pid = stack.pop()
+        name, rss = info[pid]
+        if "chrom" in name.lower() or "headless" in name.lower():
+            total += rss
+        stack.extend(children[pid])
+    return total / (1024 * 1024)
+
+
+class BrowserPool:
+    """
+    Leases stealth browser contexts to crawlers for the duration of one task.
+
+    Usage::
+
+        async with BrowserPool() as pool:
+            async with pool.lease("advanced") as context:
+                page = await context.new_page()
+    """
+
+    def __init__(self, config: Optional[BrowserPoolConfig] = None) -> None:
+        self.config = config or BrowserPoolConfig()
+        self.metrics = BrowserPoolMetrics()
+        self._playwright = None
+        self._start_lock = asyncio.Lock()
+        self._slots: Dict[str, _ProfileSlot] = {}
+
+    async def __aenter__(self) -> "BrowserPool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def reset_metrics(self) -> None:
+        self.metrics = BrowserPoolMetrics()
+
+    @asynccontextmanager
+    async def lease(self, profile: str) -> AsyncIterator[BrowserContext]:
+        if profile not in PROFILES:
+            raise ValueError(f"Unknown browser profile: {profile}")
+        slot = self._slots.get(profile)
+        if slot is None:
+            slot = self._slots[profile] = _ProfileSlot(self.config.max_contexts_per_profile)
+        async with slot.semaphore:
+            pooled = await self._acquire(profile, slot)
+            try:
+                yield pooled.context
+            finally:
+                await self._release(slot, pooled)
+
+    async def close(self) -> None:
+        slots, self._slots = self._slots, {}
+        for slot in slots.values():
+            for pooled in slot.idle:
+                await self._close_context(pooled)
+            slot.idle.clear()
+            if slot.handle is not None:
+                await self._retire(slot.handle)
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def _acquire(self, profile: str, slot: _ProfileSlot) -> _PooledContext:
+        self.metrics.leases += 1
+        while slot.idle:
+            pooled = slot.idle.pop()
+            if pooled.handle.browser.is_connected():
+                self.metrics.reused_leases += 1
+                return pooled
+            await self._close_context(pooled)
+
+        launch, new_context, launch_options = PROFILES[profile]
+        async with slot.lock:
+            handle = slot.handle
+            if handle is None or handle.retired or not handle.browser.is_connected():
+                playwright = await self._ensure_started()
+                options = launch_options()
+                started = time.perf_counter()
+                browser = await launch(playwright, headless=self.config.headless, **options)
+                self.metrics.launch_seconds += time.perf_counter() - started
+                self.metrics.browser_launches += 1
+                handle = slot.handle = _BrowserHandle(browser, options)
+            handle.contexts_created += 1
+            handle.open_contexts += 1
+            if handle.contexts_created >= self.config.recycle_browser_after_contexts:
+                # Let the browser drain: no new contexts, closed with its last one.
+                handle.retired = True
+                slot.handle = None
+
+        started = time.perf_counter()
+        try:
+            context = await new_context(handle.browser, **handle.launch_options)
+        except Exception:
+            handle.open_contexts -= 1
+            raise
+        self.metrics.context_seconds += time.perf_counter() - started
+        self.metrics.contexts_created += 1
+        return _PooledContext(context, handle)
+
+    async def _release(self, slot: _ProfileSlot, pooled: _PooledContext) -> None:
+        # Pages a crawler left open (e.g. after an exception) are not reused.
+        for page in list(pooled.context.pages):
+            try:
+                await page.close()
+            except Exception:  # noqa: BLE001
+                pass
+
+        if pooled.handle.retired or not pooled.handle.browser.is_connected():
+            await self._close_context(pooled)
+            return
+        if pooled.pages_served >= self.config.recycle_after_pages:
+            self.metrics.page_recycles += 1
+            await self._close_context(pooled)
+            return
+        rss_mb = _browser_rss_mb() if self.config.max_browser_rss_mb > 0 else None
+        if rss_mb is not None and rss_mb > self.config.max_browser_rss_mb:
+            logger.info(
+                "Browser memory %.0fMB over cap %.0fMB; recycling browsers",
+                rss_mb,
+                self.config.max_browser_rss_mb,
+            )
+            self.metrics.memory_recycles += 1
+            await self._close_context(pooled)
+            await self._retire_all()
+            return
+        slot.idle.append(pooled)
+
+    async def _retire_all(self) -> None:
+        for slot in self._slots.values():
+            for pooled in slot.idle:
+                await self._close_context(pooled)
+            slot.idle.clear()
+            if slot.handle is not None:
+                handle, slot.handle = slot.handle, None
+                await self._retire(handle)
+
+    async def _retire(self, handle: _BrowserHandle) -> None:
+        handle.retired = True
+        if handle.open_contexts <= 0:
+            await self._close_browser(handle)
+
+    async def _close_context(self, pooled: _PooledContext) -> None:
+        try:
+            await pooled.context.close()
+        except Exception:  # noqa: BLE001
+            pass
+        pooled.handle.open_contexts -= 1
+        if pooled.handle.retired and pooled.handle.open_contexts <= 0:
+            await self._close_browser(pooled.handle)
+
+    async def _close_browser(self, handle: _BrowserHandle) -> None:
+        if not handle.browser.is_connected():
+            return
+        self.metrics.browsers_closed += 1
+        try:
+            await handle.browser.close()
+        except Exception:  # noqa: BLE001
+            pass
+
+    async def _ensure_started(self):
+        async with self._start_lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            return self._playwright
+
+
+@asynccontextmanager
+async def browser_context(
+    profile: str,
+    pool: Optional[BrowserPool] = None,
+    headless: bool = True,
+) -> AsyncIterator[BrowserContext]:
+    """
+    Leases a context from ``pool``, or launches a private browser when there is none.
+    """
+    if pool is not None:
+        async with pool.lease(profile) as context:
+            yield context
+        return
+
+    launch, new_context, launch_options = PROFILES[profile]
+    options = launch_options()
+    async with async_playwright() as p:
+        browser = await launch(p, headless=headless, **options)
+        try:
+            yield await new_context(browser, **options)
+        finally:
+            await browser.close()
@@ -0,0 +1,377 @@
+"""
+Shared SQLite store for crawled items.
+
+Every item is keyed by a hash of its normalized URL (or, for URL-less
+records such as ETF snapshots, of its item code and crawl date), so the
+same post collected again by a later run, another keyword or another
+source is stored once. ``crawl_item_keywords`` records every
+(source, keyword) that returned the item, which lets downstream analysis
+query by source / keyword / date without globbing the raw JSON files.
+``crawl_watermarks`` keeps the newest ``published_at`` per
+(source, keyword) for incremental runs.
+
+Usage::
+
+    python -m src.crawler.crawl_store import-json data/raw
+    python -m src.crawler.crawl_store query --source dcinside_stock --since 2025-01-01
+    python -m src.crawler.crawl_store stats
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_STORE_PATH = Path(__file__).resolve().parents[2] / "data" / "crawl_store.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS crawl_items (
+    item_hash TEXT PRIMARY KEY,
+    url TEXT,
+    source TEXT NOT NULL,
+    title TEXT,
+    published_at TEXT,
+    first_seen_at TEXT NOT NULL,
+    last_seen_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS crawl_item_keywords (
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    item_hash TEXT NOT NULL,
+    first_seen_at TEXT NOT NULL,
+    PRIMARY KEY (source, keyword, item_hash)
+);
+CREATE TABLE IF NOT EXISTS crawl_watermarks (
+    source TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    newest_published_at TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (source, keyword)
+);
+CREATE INDEX IF NOT EXISTS idx_crawl_items_source_published
+    ON crawl_items (source, published_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_items_first_seen
+    ON crawl_items (first_seen_at);
+CREATE INDEX IF NOT EXISTS idx_crawl_item_keywords_hash
+    ON crawl_item_keywords (item_hash);
+"""
+
+_TRACKING_PARAMS = ("utm_", "fbclid", "gclid")
+
+
+def normalize_url(url: str) -> str:
+    """Lower-cases scheme/host, drops fragments and tracking parameters."""
+    parts = urlsplit(url.strip())
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(_TRACKING_PARAMS)
+    ]
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def item_identity(item: Dict[str, Any]) -> str:
+    url = item.get("url")
+    if url:
+        return normalize_url(url)
+    if item.get("item_code"):
+        # Snapshot records (ETF quotes) are unique per code and day.
+        return f"{item['item_code']}@{str(item.get('crawled_at', ''))[:10]}"
+    return json.dumps(
+        {key: value for key, value in item.items() if key != "crawled_at"},
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+
+
+def item_hash(item: Dict[str, Any]) -> str:
+    return hashlib.sha1(item_identity(item).encode("utf-8")).hexdigest()
+
+
+class Watermark:
+    """
+    What earlier runs collected for one (source, keyword).
+
+    Crawlers stop paginating (or skip expensive per-item work) once they
+    reach content for which ``reached`` is true: an item already in the
+    store, or one published before the newest item seen so far.
+
+    ``hits`` counts those checks that came back true, so an empty result
+    can be told apart from one where the crawler never saw any content.
+    """
+
+    def __init__(self, store: "CrawlStore", newest_published_at: Optional[str]) -> None:
+        self.store = store
+        self.newest_published_at = newest_published_at
+        self.hits = 0
+
+    def is_known(self, item: Dict[str, Any]) -> bool:
+        known = bool(self.store.known_hashes([item]))
+        if known:
+            self.hits += 1
+        return known
+
+    def reached(self, item: Dict[str, Any]) -> bool:
+        if self.is_known(item):
+            return True
+        published_at = item.get("published_at")
+        older = bool(
+            self.newest_published_at
+            and isinstance(published_at, str)
+            and published_at < self.newest_published_at
+        )
+        if older:
+            self.hits += 1
+        return older
+
+
+class CrawlStore:
+    """Thread-safe write-through store shared by all crawlers of a run."""
+
+    def __init__(self, path: Path | str = DEFAULT_STORE_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _existing(self, hashes: Sequence[str]) -> set:
+        existing = set()
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT item_hash FROM crawl_items WHERE item_hash IN ({placeholders})",
+                chunk,
+            )
+            existing.update(row[0] for row in rows)
+        return existing
+
+    def add_items(
+        self, source: str, keyword: str, items: Iterable[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Stores ``items`` and returns (items not seen before, duplicate count).
+
+        Duplicates only refresh ``last_seen_at`` and gain the (source, keyword)
+        link; the first payload is kept. The (source, keyword) watermark moves
+        up to the newest ``published_at`` among ``items``; it is only written
+        when at least one item carries a ``published_at``.
+        """
+        now = datetime.now().isoformat(timespec="seconds")
+        keyed: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            if isinstance(item, dict):
+                keyed.setdefault(item_hash(item), item)
+        if not keyed:
+            return [], 0
+
+        hashes = list(keyed)
+        published = [
+            item["published_at"]
+            for item in keyed.values()
+            if isinstance(item.get("published_at"), str) and item["published_at"]
+        ]
+        with self._lock, self._conn:
+            existing = self._existing(hashes)
+            new_items = [(h, keyed[h]) for h in hashes if h not in existing]
+            self._conn.executemany(
+                "INSERT INTO crawl_items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        h,
+                        item.get("url"),
+                        source,
+                        item.get("title") or item.get("item_name"),
+                        item.get("published_at"),
+                        now,
+                        now,
+                        json.dumps(item, ensure_ascii=False, default=str),
+                    )
+                    for h, item in new_items
+                ],
+            )
+            self._conn.executemany(
+                "UPDATE crawl_items SET last_seen_at = ? WHERE item_hash = ?",
+                [(now, h) for h in existing],
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO crawl_item_keywords VALUES (?, ?, ?, ?)",
+                [(source, keyword, h, now) for h in hashes],
+            )
+            if not published:
+                # No dated item: leave the watermark untouched (or absent).
+                return [item for _, item in new_items], len(existing)
+            self._conn.execute(
+                """
+                INSERT INTO crawl_watermarks VALUES (?, ?, ?, ?)
+                ON CONFLICT (source, keyword) DO UPDATE SET
+                    newest_published_at = CASE
+                        WHEN newest_published_at IS NULL
+                            OR excluded.newest_published_at > newest_published_at
+                        THEN COALESCE(excluded.newest_published_at, newest_published_at)
+                        ELSE newest_published_at
+                    END,
+                    updated_at = excluded.updated_at
+                """,
+                (source, keyword, max(published), now),
+            )
+        return [item for _, item in new_items], len(existing)
+
+    def watermark(self, source: str, keyword: str) -> Optional[Watermark]:
+        """
+        None until a run has stored items for (source, keyword). Sources whose
+        items carry no ``published_at`` get a watermark without a date, which
+        only recognizes already stored items.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT newest_published_at FROM crawl_watermarks WHERE source = ? AND keyword = ?",
+                (source, keyword),
+            ).fetchone()
+            if row is not None:
+                return Watermark(self, row[0])
+            seen = self._conn.execute(
+                "SELECT 1 FROM crawl_item_keywords WHERE source = ? AND keyword = ? LIMIT 1",
+                (source, keyword),
+            ).fetchone()
+        return Watermark(self, None) if seen else None
+
+    def known_hashes(self, items: Iterable[Dict[str, Any]]) -> set:
+        """Hashes of ``items`` already in the store."""
+        hashes = [item_hash(item) for item in items]
+        with self._lock:
+            return self._existing(hashes)
+
+    def query(
+        self,
+        source: Optional[str] = None,
+        keyword: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Items by source / keyword and published date (ISO strings, inclusive
+        ``since``, exclusive ``until``), newest first. Items without a
+        published date fall back to when they were first seen.
+        """
+        date_expr = "COALESCE(i.published_at, i.first_seen_at)"
+        clauses, params = [], []
+        if source or keyword:
+            link = ["k.item_hash = i.item_hash"]
+            if source:
+                link.append("k.source = ?")
+                params.append(source)
+            if keyword:
+                link.append("k.keyword = ?")
+                params.append(keyword)
+            clauses.append(f"EXISTS (SELECT 1 FROM crawl_item_keywords k WHERE {' AND '.join(link)})")
+        if since:
+            clauses.append(f"{date_expr} >= ?")
+            params.append(since)
+        if until:
+            clauses.append(f"{date_expr} < ?")
+            params.append(until)
+        sql = "SELECT i.payload FROM crawl_items i"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY {date_expr} DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT k.source, COUNT(DISTINCT k.keyword) AS keywords,
+                       COUNT(DISTINCT k.item_hash) AS items,
+                       MAX(i.last_seen_at) AS last_seen_at
+                FROM crawl_item_keywords k
+                JOIN crawl_items i ON i.item_hash = k.item_hash
+                GROUP BY k.source
+                ORDER BY k.source
+                """
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+
+def import_json_dir(store: CrawlStore, root: Path, source: Optional[str] = None) -> Tuple[int, int]:
+    """
+    Backfills the store from legacy ``data/raw/<dir>/**/*.json`` files. Items
+    are attributed to ``source`` or, by default, to the top-level directory.
+    """
+    new_total = dup_total = 0
+    for path in sorted(root.rglob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        if not isinstance(data, list):
+            continue
+        item_source = source or path.relative_to(root).parts[0]
+        by_keyword: Dict[str, List[Dict[str, Any]]] = {}
+        for item in data:
+            if isinstance(item, dict):
+                by_keyword.setdefault(str(item.get("keyword") or ""), []).append(item)
+        for keyword, items in by_keyword.items():
+            new_items, duplicates = store.add_items(item_source, keyword, items)
+            new_total += len(new_items)
+            dup_total += duplicates
+    return new_total, dup_total
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Crawl store maintenance and queries")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    importer = sub.add_parser("import-json", help="Backfill from raw JSON files")
+    importer.add_argument("root", type=Path)
+    importer.add_argument("--source", help="Source key for all imported items")
+    query = sub.add_parser("query", help="Print matching items as JSON lines")
+    query.add_argument("--source")
+    query.add_argument("--keyword")
+    query.add_argument("--since")
+    query.add_argument("--until")
+    query.add_argument("--limit", type=int, default=100)
+    sub.add_parser("stats", help="Item counts per source")
+    args = parser.parse_args(argv)
+
+    store = CrawlStore(args.store)
+    try:
+        if args.command == "import-json":
+            new_items, duplicates = import_json_dir(store, args.root, args.source)
+            print(f"Imported {new_items} new items ({duplicates} duplicates) into {args.store}")
+        elif args.command == "query":
+            for item in store.query(args.source, args.keyword, args.since, args.until, args.limit):
+                print(json.dumps(item, ensure_ascii=False))
+        else:
+            for row in store.stats():
+                print(json.dumps(row, ensure_ascii=False))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -6,17 +6,15 @@ import sys
 from datetime import datetime
 from urllib.parse import quote
 
-from playwright.async_api import async_playwright
-
-# Add parent directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from advanced_stealth import (  # noqa: E402
-    get_advanced_stealth_context,
+# Add project root to path so the module also runs from src/crawler
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
+from src.crawler.advanced_stealth import (  # noqa: E402
     human_like_delay,
     random_mouse_movement,
     human_typing,
 )
-from google_news_rss import GoogleNewsRSSCrawler  # noqa: E402
+from src.crawler.browser_pool import browser_context  # noqa: E402
+from src.crawler.google_news_rss import GoogleNewsRSSCrawler  # noqa: E402
 
 
 class AdvancedGoogleCrawler:
@@ -24,8 +22,9 @@ class AdvancedGoogleCrawler:
     Advanced Google SERP crawler with comprehensive anti-detection measures.
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.base_url = "https://www.google.com"
+        self.browser_pool = browser_pool
         self._rss_fallback = GoogleNewsRSSCrawler()
 
     @staticmethod
@@ -57,8 +56,7 @@ class AdvancedGoogleCrawler:
         """
         Search Google with advanced stealth techniques to avoid CAPTCHA.
         """
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -255,8 +253,7 @@ class AdvancedGoogleCrawler:
                 await human_like_delay(1000, 2000)
                 return await self._save_results(keyword, results)
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
 
@@ -5,14 +5,13 @@ import random
 from datetime import datetime
 from urllib.parse import quote
 
-from playwright.async_api import async_playwright
-
+from src.crawler.browser_pool import browser_context
 from src.crawler.google_news_rss import GoogleNewsRSSCrawler
-from src.crawler.utils import get_stealth_context
 
 class GoogleCrawler:
-    def __init__(self, output_dir="data/raw/google"):
+    def __init__(self, output_dir="data/raw/google", browser_pool=None):
         self.output_dir = output_dir
+        self.browser_pool = browser_pool
         os.makedirs(f"{self.output_dir}/serp", exist_ok=True)
         self._rss_fallback = GoogleNewsRSSCrawler()
 
@@ -39,8 +38,7 @@ class GoogleCrawler:
         """
         Searches for a keyword on Google and crawls SERP results.
         """
-        async with async_playwright() as p:
-            context, browser = await get_stealth_context(p, headless=True)
+        async with browser_context("basic", self.browser_pool) as context:
             page = await context.new_page()
             try:
                 encoded_keyword = quote(keyword)
@@ -155,7 +153,7 @@ class GoogleCrawler:
 
                 return await self._save_results(keyword, results)
             finally:
-                await browser.close()
+                await page.close()
 
     async def _save_results(self, keyword: str, results: list[dict], rss_fallback: bool = False):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -3,17 +3,18 @@ import json
 import os
 import random
 import re
+import sys
 from datetime import datetime, timedelta
 from urllib.parse import quote
 
-from playwright.async_api import async_playwright
-
-from advanced_stealth import (
-    get_advanced_stealth_context,
+# Add project root to path so the module also runs from src/crawler
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
+from src.crawler.advanced_stealth import (  # noqa: E402
     human_like_delay,
     random_mouse_movement,
     human_typing,
 )
+from src.crawler.browser_pool import browser_context  # noqa: E402
 
 
 class AdvancedNaverCrawler:
@@ -22,8 +23,9 @@ class AdvancedNaverCrawler:
     Supports: Blog, Cafe, and Stock Cafe crawling.
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.base_url = "https://search.naver.com"
+        self.browser_pool = browser_pool
 
     @staticmethod
     def _clean_text(value: str) -> str:
@@ -412,8 +414,7 @@ class AdvancedNaverCrawler:
         """
         Search Naver Blog with advanced stealth techniques.
         """
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -502,8 +503,7 @@ class AdvancedNaverCrawler:
                 await human_like_delay(1000, 2000)
                 
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
     
@@ -516,8 +516,7 @@ class AdvancedNaverCrawler:
         """
         Search Naver Cafe with advanced stealth techniques.
         """
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -628,8 +627,7 @@ class AdvancedNaverCrawler:
                 print(f"\n✅ Saved {len(results)} cafe posts to {filename}")
                 
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
     
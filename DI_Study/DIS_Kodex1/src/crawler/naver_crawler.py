@@ -8,9 +8,9 @@ class NaverCrawler:
     Maintained for backward compatibility with existing imports.
     """
 
-    def __init__(self, output_dir="data/raw/naver"):
+    def __init__(self, output_dir="data/raw/naver", browser_pool=None):
         self.output_dir = output_dir
-        self._advanced = AdvancedNaverCrawler()
+        self._advanced = AdvancedNaverCrawler(browser_pool=browser_pool)
 
     async def search_blog(self, keyword: str, max_posts: int = 10):
         return await self._advanced.search_blog(keyword, max_posts=max_posts)
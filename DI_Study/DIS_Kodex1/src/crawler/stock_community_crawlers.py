@@ -11,14 +11,15 @@ import random
 import re
 from datetime import datetime, timedelta
 from urllib.parse import quote, urljoin
-from playwright.async_api import async_playwright
 import sys
 import os
 
 import requests
 
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from advanced_stealth import get_advanced_stealth_context, human_like_delay, random_mouse_movement
+# Add project root to path so the module also runs from src/crawler
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../"))
+from src.crawler.advanced_stealth import human_like_delay, random_mouse_movement
+from src.crawler.browser_pool import browser_context
 
 
 class DCInsideCrawler:
@@ -48,8 +49,14 @@ class DCInsideCrawler:
         keyword: str = None,
         max_posts: int = 20,
         max_age_days: int = 32,
+        watermark=None,
     ):
-        """DC Inside 검색 API를 이용해 게시글을 수집."""
+        """
+        DC Inside 검색 API를 이용해 게시글을 수집.
+
+        ``watermark`` (crawl_store.Watermark)가 주어지면 이전 실행에서 수집한
+        게시글은 건너뛰고, 그런 게시글이 나온 페이지를 마지막으로 페이지 탐색을 멈춘다.
+        """
 
         search_keyword = keyword or self.gallery_id
         per_page = min(max_posts, 50)
@@ -74,6 +81,7 @@ class DCInsideCrawler:
             if not items:
                 break
 
+            reached_known = False
             for item in items:
                 normalized = self._normalize_item(search_keyword, item)
                 if not normalized:
@@ -91,6 +99,9 @@ class DCInsideCrawler:
                 url = normalized["url"]
                 if url in seen_urls:
                     continue
+                if watermark is not None and watermark.reached(normalized):
+                    reached_known = True
+                    continue
 
                 results.append(normalized)
                 seen_urls.add(url)
@@ -101,6 +112,10 @@ class DCInsideCrawler:
             if len(results) >= max_posts:
                 break
 
+            if reached_known:
+                print(f"   ↳ Reached previously collected posts on page {page}, stopping")
+                break
+
             if channel.get("isEnd"):
                 break
             page += 1
@@ -261,14 +276,14 @@ class FMKoreaCrawler:
     Target: https://www.fmkorea.com/index.php?mid=stock
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.base_url = "https://www.fmkorea.com"
+        self.browser_pool = browser_pool
         self.board_id = "stock"  # 주식 게시판
         
     async def crawl_stock_board(self, keyword: str = None, max_posts: int = 20):
         """Crawl FMKorea stock board"""
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -383,8 +398,7 @@ class FMKoreaCrawler:
                 print(f"\n✅ Saved {len(results)} FMKorea posts to {filename}")
                 
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
 
@@ -395,13 +409,13 @@ class StockDiscussionCrawler:
     Target: Naver Finance stock discussion boards
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
         self.base_url = "https://finance.naver.com"
+        self.browser_pool = browser_pool
         
     async def crawl_stock_discussion(self, stock_code: str, max_posts: int = 20):
         """Crawl Naver Finance stock discussion board"""
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -511,8 +525,7 @@ class StockDiscussionCrawler:
                 print(f"\n✅ Saved {len(results)} stock discussion posts to {filename}")
                 
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
 
@@ -524,7 +537,8 @@ class JulineCrawler:
     주요 주식 커뮤니티 사이트들을 타겟팅합니다.
     """
     
-    def __init__(self):
+    def __init__(self, browser_pool=None):
+        self.browser_pool = browser_pool
         # 주린이 관련 주요 커뮤니티 URLs
         self.communities = {
             "ppomppu": "https://www.ppomppu.co.kr/zboard/zboard.php?id=stock",
@@ -533,8 +547,7 @@ class JulineCrawler:
         
     async def crawl_ppomppu(self, keyword: str = None, max_posts: int = 20):
         """Crawl Ppomppu stock board"""
-        async with async_playwright() as p:
-            context, browser = await get_advanced_stealth_context(p, headless=True)
+        async with browser_context("advanced", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -671,8 +684,7 @@ class JulineCrawler:
                 print(f"\n✅ Saved {len(results)} Ppomppu posts to {filename}")
                 
             finally:
-                await context.close()
-                await browser.close()
+                await page.close()
         
         return results
 
@@ -64,12 +64,20 @@ class UltraStealth:
         Returns:
             (context, browser) 튜플
         """
-        
-        # 랜덤 설정 선택
-        user_agent = random.choice(UltraStealth.USER_AGENTS)
         resolution = random.choice(UltraStealth.SCREEN_RESOLUTIONS)
-        language = random.choice(UltraStealth.LANGUAGES)
-        timezone = random.choice(UltraStealth.TIMEZONES)
+        browser = await UltraStealth.launch_ultra_browser(playwright, headless, proxy, resolution)
+        context = await UltraStealth.new_ultra_context(browser, resolution)
+        return context, browser
+    
+    @staticmethod
+    async def launch_ultra_browser(
+        playwright,
+        headless: bool = True,
+        proxy: Optional[Dict[str, str]] = None,
+        resolution: Optional[Dict[str, int]] = None,
+    ) -> Browser:
+        """안티-디텍션 인자로 Chromium 실행 (컨텍스트는 new_ultra_context로 생성)"""
+        resolution = resolution or random.choice(UltraStealth.SCREEN_RESOLUTIONS)
         
         # 브라우저 실행 인자 (최신 안티-디텍션)
         launch_args = [
@@ -106,11 +114,22 @@ class UltraStealth:
         ]
         
         # 브라우저 실행
-        browser = await playwright.chromium.launch(
+        return await playwright.chromium.launch(
             headless=headless,
             args=launch_args,
             proxy=proxy
         )
+    
+    @staticmethod
+    async def new_ultra_context(
+        browser: Browser,
+        resolution: Optional[Dict[str, int]] = None,
+    ) -> BrowserContext:
+        """실행 중인 브라우저에 랜덤 지문(UA/해상도/언어/타임존)의 스텔스 컨텍스트 생성"""
+        user_agent = random.choice(UltraStealth.USER_AGENTS)
+        resolution = resolution or random.choice(UltraStealth.SCREEN_RESOLUTIONS)
+        language = random.choice(UltraStealth.LANGUAGES)
+        timezone = random.choice(UltraStealth.TIMEZONES)
         
         # 컨텍스트 생성 (고급 설정)
         context = await browser.new_context(
@@ -269,7 +288,7 @@ class UltraStealth:
             
             console.log('🔒 Ultra Stealth Mode Activated');
         """)
-        return context, browser
+        return context
     
     @staticmethod
     async def human_like_delay(min_ms: int = 1000, max_ms: int = 3000):
@@ -1,5 +1,5 @@
 import random
-from playwright.async_api import async_playwright, BrowserContext
+from playwright.async_api import async_playwright, Browser, BrowserContext
 
 USER_AGENTS = [
     "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36",
@@ -7,23 +7,33 @@ USER_AGENTS = [
     "Mozilla/5.0 (Linux; Android 13; SM-S908B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/112.0.0.0 Mobile Safari/537.36"
 ]
 
-async def get_stealth_context(playwright, headless=True, user_agent: str | None = None) -> BrowserContext:
+async def launch_stealth_browser(playwright, headless=True, single_process=False) -> Browser:
     """
-    Creates a Playwright browser context with stealth settings.
+    Launches the sandbox-less Chromium used by the basic stealth contexts.
+
+    ``single_process`` is only safe for a browser that hosts one context;
+    pooled browsers serve several and must leave it off.
     """
-    browser = await playwright.chromium.launch(
+    args = [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-seccomp-filter-sandbox',
+        '--disable-namespace-sandbox',
+    ]
+    if single_process:
+        args.append('--single-process')
+    return await playwright.chromium.launch(
         headless=headless,
         chromium_sandbox=False,
-        args=[
-            '--no-sandbox',
-            '--disable-setuid-sandbox',
-            '--disable-dev-shm-usage',
-            '--disable-seccomp-filter-sandbox',
-            '--disable-namespace-sandbox',
-            '--single-process',
-        ],
+        args=args,
     )
-    
+
+
+async def new_stealth_context(browser: Browser, user_agent: str | None = None) -> BrowserContext:
+    """
+    Creates a mobile-UA stealth context on a running browser.
+    """
     user_agent = user_agent or random.choice(USER_AGENTS)
     
     context = await browser.new_context(
@@ -59,4 +69,13 @@ async def get_stealth_context(playwright, headless=True, user_agent: str | None
         });
     """)
     
+    return context
+
+
+async def get_stealth_context(playwright, headless=True, user_agent: str | None = None) -> BrowserContext:
+    """
+    Creates a Playwright browser context with stealth settings.
+    """
+    browser = await launch_stealth_browser(playwright, headless=headless, single_process=True)
+    context = await new_stealth_context(browser, user_agent=user_agent)
     return context, browser
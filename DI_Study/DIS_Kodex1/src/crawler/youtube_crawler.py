@@ -5,13 +5,12 @@ import re
 from datetime import datetime
 from urllib.parse import quote_plus
 
-from playwright.async_api import async_playwright
-
-from src.crawler.ultra_stealth import UltraStealth
+from src.crawler.browser_pool import browser_context
 
 class YouTubeCrawler:
-    def __init__(self, output_dir="data/raw/youtube"):
+    def __init__(self, output_dir="data/raw/youtube", browser_pool=None):
         self.output_dir = output_dir
+        self.browser_pool = browser_pool
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(os.path.join(output_dir, "video_meta"), exist_ok=True)
         os.makedirs(os.path.join(output_dir, "thumbnails"), exist_ok=True)
@@ -188,6 +187,7 @@ class YouTubeCrawler:
         collect_comments: bool = True,
         max_comments_per_video: int = 50,
         upload_date_filter: str | None = None,
+        watermark=None,
     ):
         """
         Searches for a keyword and crawls video metadata with comments.
@@ -197,9 +197,10 @@ class YouTubeCrawler:
             max_videos: Maximum number of videos to crawl
             collect_comments: Whether to collect comments for each video
             max_comments_per_video: Maximum comments to collect per video
+            watermark: crawl_store.Watermark; videos collected by earlier runs
+                are skipped, along with their comment crawl
         """
-        async with async_playwright() as p:
-            context, browser = await UltraStealth.create_ultra_stealth_context(p, headless=True)
+        async with browser_context("ultra", self.browser_pool) as context:
             page = await context.new_page()
             
             filter_code = self._map_upload_filter(upload_date_filter)
@@ -229,6 +230,9 @@ class YouTubeCrawler:
                     url = await title_el.get_attribute("href")
                     video_id = self._extract_video_id(url)
                     full_url = f"https://www.youtube.com{url}"
+                    if watermark is not None and watermark.is_known({"url": full_url}):
+                        print(f"↷ [{i+1}/{max_videos}] Already collected: {title.strip()}")
+                        continue
                     
                     meta_el = video.locator("#metadata-line")
                     meta_text = await meta_el.text_content()
@@ -315,7 +319,7 @@ class YouTubeCrawler:
                 
             print(f"\n✅ Saved {len(results)} videos to {filename}")
             
-            await browser.close()
+            await page.close()
             return results
 
 if __name__ == "__main__":
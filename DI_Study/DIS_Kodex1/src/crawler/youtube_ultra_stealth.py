@@ -5,13 +5,13 @@ import random
 from datetime import datetime
 from urllib.parse import quote_plus
 
-from playwright.async_api import async_playwright
-
-from src.crawler.ultra_stealth import get_ultra_stealth_context, UltraStealth
+from src.crawler.browser_pool import browser_context
+from src.crawler.ultra_stealth import UltraStealth
 
 class YouTubeCrawlerUltraStealth:
-    def __init__(self, output_dir="data/raw/youtube"):
+    def __init__(self, output_dir="data/raw/youtube", browser_pool=None):
         self.output_dir = output_dir
+        self.browser_pool = browser_pool
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(os.path.join(output_dir, "video_meta"), exist_ok=True)
         os.makedirs(os.path.join(output_dir, "thumbnails"), exist_ok=True)
@@ -161,12 +161,15 @@ class YouTubeCrawlerUltraStealth:
         collect_comments: bool = True,
         max_comments_per_video: int = 50,
         upload_date_filter: str | None = None,
+        watermark=None,
     ):
         """
         YouTube 검색 및 크롤링 (Ultra Stealth)
+
+        watermark(crawl_store.Watermark)가 주어지면 이전 실행에서 수집한 영상은
+        댓글 수집까지 건너뛴다.
         """
-        async with async_playwright() as p:
-            context, browser = await get_ultra_stealth_context(p, headless=True)
+        async with browser_context("ultra", self.browser_pool) as context:
             page = await context.new_page()
             
             try:
@@ -220,6 +223,9 @@ class YouTubeCrawlerUltraStealth:
                             continue
                             
                         full_url = f"https://www.youtube.com{url}" if url.startswith("/") else url
+                        if watermark is not None and watermark.is_known({"url": full_url}):
+                            print(f"   ↷ [{i+1}/{max_videos}] 이미 수집된 영상: {title.strip() if title else full_url}")
+                            continue
                         
                         # 메타데이터 추출
                         meta_text = ""
@@ -310,7 +316,7 @@ class YouTubeCrawlerUltraStealth:
                 traceback.print_exc()
                 return []
             finally:
-                await browser.close()
+                await page.close()
 
 if __name__ == "__main__":
     crawler = YouTubeCrawlerUltraStealth(output_dir="/home/ubuntu/DI/DIS_Kodex1/data/raw/youtube")
@@ -5,12 +5,15 @@ import asyncio
 import json
 import logging
 import random
+import sqlite3
 import sys
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
+from src.crawler.browser_pool import BrowserPool, BrowserPoolConfig
+from src.crawler.crawl_store import DEFAULT_STORE_PATH, CrawlStore
 from src.crawler.google_crawler import GoogleCrawler
 from src.crawler.google_advanced import AdvancedGoogleCrawler
 from src.crawler.naver_crawler import NaverCrawler
@@ -24,6 +27,11 @@ from src.crawler.stock_community_crawlers import (
 )
 from src.crawler.youtube_crawler import YouTubeCrawler
 from src.crawler.youtube_ultra_stealth import YouTubeCrawlerUltraStealth
+from src.execution.source_limits import (
+    InterleavedScheduler,
+    build_host_budgets,
+    parse_source_limits,
+)
 
 CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "crawl_targets.json"
 
@@ -51,8 +59,12 @@ class CrawlTask:
         return self.job.source
 
 
-async def run_google_basic(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = GoogleCrawler(output_dir=params.get("output_dir", "data/raw/google"))
+async def run_google_basic(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = GoogleCrawler(
+        output_dir=params.get("output_dir", "data/raw/google"), browser_pool=pool
+    )
     max_results = params.get("max_results", 10)
     time_range = params.get("time_range")
     results = await crawler.search(
@@ -65,13 +77,15 @@ async def run_google_basic(keyword: str, params: Dict[str, Any]) -> Any:
             "Google basic returned no data, falling back to advanced crawler for '%s'",
             keyword,
         )
-        advanced = AdvancedGoogleCrawler()
+        advanced = AdvancedGoogleCrawler(browser_pool=pool)
         return await advanced.search(keyword, max_results=max_results)
     return results
 
 
-async def run_google_advanced(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = AdvancedGoogleCrawler()
+async def run_google_advanced(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = AdvancedGoogleCrawler(browser_pool=pool)
     max_results = params.get("max_results", 10)
     time_range = params.get("time_range")
     return await crawler.search(
@@ -81,20 +95,30 @@ async def run_google_advanced(keyword: str, params: Dict[str, Any]) -> Any:
     )
 
 
-async def run_naver_blog_mobile(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = NaverCrawler(output_dir=params.get("output_dir", "data/raw/naver"))
+async def run_naver_blog_mobile(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = NaverCrawler(
+        output_dir=params.get("output_dir", "data/raw/naver"), browser_pool=pool
+    )
     max_posts = params.get("max_posts", 10)
     return await crawler.search_blog(keyword, max_posts=max_posts)
 
 
-async def run_naver_cafe_mobile(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = NaverCrawler(output_dir=params.get("output_dir", "data/raw/naver"))
+async def run_naver_cafe_mobile(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = NaverCrawler(
+        output_dir=params.get("output_dir", "data/raw/naver"), browser_pool=pool
+    )
     max_posts = params.get("max_posts", 10)
     return await crawler.search_cafe(keyword, max_posts=max_posts)
 
 
-async def run_naver_blog_advanced(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = AdvancedNaverCrawler()
+async def run_naver_blog_advanced(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = AdvancedNaverCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     date_range = params.get("date_range")
     return await crawler.search_blog(
@@ -104,8 +128,10 @@ async def run_naver_blog_advanced(keyword: str, params: Dict[str, Any]) -> Any:
     )
 
 
-async def run_naver_cafe_advanced(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = AdvancedNaverCrawler()
+async def run_naver_cafe_advanced(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = AdvancedNaverCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     date_range = params.get("date_range")
     return await crawler.search_cafe(
@@ -115,8 +141,10 @@ async def run_naver_cafe_advanced(keyword: str, params: Dict[str, Any]) -> Any:
     )
 
 
-async def run_naver_stock_cafe(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = AdvancedNaverCrawler()
+async def run_naver_stock_cafe(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = AdvancedNaverCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     date_range = params.get("date_range")
     return await crawler.search_stock_cafe(
@@ -126,8 +154,12 @@ async def run_naver_stock_cafe(keyword: str, params: Dict[str, Any]) -> Any:
     )
 
 
-async def run_youtube_standard(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = YouTubeCrawler(output_dir=params.get("output_dir", "data/raw/youtube"))
+async def run_youtube_standard(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = YouTubeCrawler(
+        output_dir=params.get("output_dir", "data/raw/youtube"), browser_pool=pool
+    )
     upload_filter = params.get("upload_date_filter")
     return await crawler.search_and_crawl(
         keyword,
@@ -135,12 +167,15 @@ async def run_youtube_standard(keyword: str, params: Dict[str, Any]) -> Any:
         collect_comments=params.get("collect_comments", True),
         max_comments_per_video=params.get("max_comments_per_video", 50),
         upload_date_filter=upload_filter,
+        watermark=params.get("watermark"),
     )
 
 
-async def run_youtube_ultra(keyword: str, params: Dict[str, Any]) -> Any:
+async def run_youtube_ultra(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
     crawler = YouTubeCrawlerUltraStealth(
-        output_dir=params.get("output_dir", "data/raw/youtube")
+        output_dir=params.get("output_dir", "data/raw/youtube"), browser_pool=pool
     )
     upload_filter = params.get("upload_date_filter")
     return await crawler.search_and_crawl(
@@ -149,10 +184,13 @@ async def run_youtube_ultra(keyword: str, params: Dict[str, Any]) -> Any:
         collect_comments=params.get("collect_comments", True),
         max_comments_per_video=params.get("max_comments_per_video", 50),
         upload_date_filter=upload_filter,
+        watermark=params.get("watermark"),
     )
 
 
-async def run_dcinside(keyword: str, params: Dict[str, Any]) -> Any:
+async def run_dcinside(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
     crawler = DCInsideCrawler()
     max_posts = params.get("max_posts", 20)
     max_age_days = params.get("max_age_days", 32)
@@ -160,34 +198,45 @@ async def run_dcinside(keyword: str, params: Dict[str, Any]) -> Any:
         keyword=keyword,
         max_posts=max_posts,
         max_age_days=max_age_days,
+        watermark=params.get("watermark"),
     )
 
 
-async def run_miraeasset(keyword: str, params: Dict[str, Any]) -> Any:
+async def run_miraeasset(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
     crawler = MiraeassetCrawler()
     max_items = params.get("max_items", 25)
     return await crawler.crawl_etf_info(keyword=keyword, max_items=max_items)
 
 
-async def run_fmkorea(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = FMKoreaCrawler()
+async def run_fmkorea(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = FMKoreaCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     return await crawler.crawl_stock_board(keyword=keyword, max_posts=max_posts)
 
 
-async def run_ppomppu(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = JulineCrawler()
+async def run_ppomppu(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = JulineCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     return await crawler.crawl_ppomppu(keyword=keyword, max_posts=max_posts)
 
 
-async def run_naver_stock_discussion(keyword: str, params: Dict[str, Any]) -> Any:
-    crawler = StockDiscussionCrawler()
+async def run_naver_stock_discussion(
+    keyword: str, params: Dict[str, Any], pool: Optional[BrowserPool] = None
+) -> Any:
+    crawler = StockDiscussionCrawler(browser_pool=pool)
     max_posts = params.get("max_posts", 20)
     return await crawler.crawl_stock_discussion(stock_code=keyword, max_posts=max_posts)
 
 
-SOURCE_RUNNERS: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[Any]]] = {
+Runner = Callable[[str, Dict[str, Any], Optional[BrowserPool]], Awaitable[Any]]
+
+SOURCE_RUNNERS: Dict[str, Runner] = {
     "google_basic": run_google_basic,
     "google_advanced": run_google_advanced,
     "naver_blog_mobile": run_naver_blog_mobile,
@@ -204,6 +253,10 @@ SOURCE_RUNNERS: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[Any]]] = {
     "miraeasset_etf": run_miraeasset,
 }
 
+# Runners whose crawlers take ``watermark`` and stop at previously collected
+# content. Only for these does an empty result mean "nothing new".
+SUPPORTS_WATERMARK = frozenset({"youtube_standard", "youtube_ultra", "dcinside_stock"})
+
 
 class CrawlOrchestrator:
     """Coordinates multi-source crawling runs."""
@@ -214,6 +267,9 @@ class CrawlOrchestrator:
         *,
         concurrency_override: Optional[int] = None,
         retry_override: Optional[int] = None,
+        use_browser_pool: bool = True,
+        use_store: bool = True,
+        incremental: Optional[bool] = None,
     ) -> None:
         self.config = config
         self._jobs: List[JobConfig] = self._parse_jobs(config.get("jobs", []))
@@ -228,6 +284,26 @@ class CrawlOrchestrator:
         if len(backoff_range) != 2:
             backoff_range = [5, 20]
         self.backoff_min, self.backoff_max = sorted(backoff_range)
+        self.source_limits = parse_source_limits(config, self.max_concurrency)
+
+        # One pool per orchestrator: runners lease contexts from it instead
+        # of launching a browser per keyword task.
+        self.browser_pool: Optional[BrowserPool] = None
+        if use_browser_pool:
+            self.browser_pool = BrowserPool(
+                BrowserPoolConfig.from_dict(global_cfg.get("browser_pool"))
+            )
+
+        # Every task's items are written through the shared store, which
+        # dedups them across runs, keywords and sources.
+        self.crawl_store: Optional[CrawlStore] = None
+        if use_store:
+            self.crawl_store = CrawlStore(global_cfg.get("store_path") or DEFAULT_STORE_PATH)
+        # Incremental runs hand the (source, keyword) watermark to the runners
+        # in SUPPORTS_WATERMARK so they stop at content collected by earlier runs.
+        if incremental is None:
+            incremental = global_cfg.get("incremental", True)
+        self.incremental = bool(incremental) and self.crawl_store is not None
 
         self.logger = logging.getLogger("crawl_orchestrator")
 
@@ -276,19 +352,34 @@ class CrawlOrchestrator:
             self.logger.warning("No crawl tasks to run. Check your filters/config.")
             return {"total": 0, "success": 0, "failed": 0, "skipped": 0}
 
-        semaphore = asyncio.Semaphore(self.max_concurrency)
+        scheduler = InterleavedScheduler(
+            self.max_concurrency,
+            self.source_limits,
+            build_host_budgets(self.config),
+        )
         self.logger.info(
-            "Starting crawl run: %d tasks | concurrency=%d | retry_limit=%d",
+            "Starting crawl run: %d tasks | concurrency=%d | retry_limit=%d | incremental=%s",
             len(tasks),
             self.max_concurrency,
             self.retry_limit,
+            self.incremental,
         )
+        for source in sorted({task.source for task in tasks}):
+            limits = scheduler.limits_for(source)
+            self.logger.info(
+                "  source=%s concurrency=%d hosts=%s",
+                source,
+                limits.max_concurrency,
+                ",".join(limits.hosts) or "-",
+            )
 
-        async def runner(task: CrawlTask) -> Dict[str, Any]:
-            async with semaphore:
-                return await self._execute_with_retry(task)
-
-        results = await asyncio.gather(*(runner(task) for task in tasks))
+        if self.browser_pool is not None:
+            self.browser_pool.reset_metrics()
+        try:
+            results = await scheduler.run(tasks, self._execute_with_retry)
+        finally:
+            if self.browser_pool is not None:
+                await self.browser_pool.close()
 
         summary = {
             "total": len(results),
@@ -296,6 +387,19 @@ class CrawlOrchestrator:
             "failed": sum(1 for r in results if r["status"] == "failed"),
             "skipped": sum(1 for r in results if r["status"] == "skipped"),
         }
+        if self.crawl_store is not None:
+            summary["new_items"] = sum(r.get("new_items") or 0 for r in results)
+            summary["duplicate_items"] = sum(r.get("duplicates") or 0 for r in results)
+        if self.browser_pool is not None:
+            metrics = self.browser_pool.metrics
+            summary["browser_pool"] = metrics.as_dict()
+            self.logger.info(
+                "Browser pool: %d launches for %d leases (%d reused) | ~%.1fs launch time saved",
+                metrics.browser_launches,
+                metrics.leases,
+                metrics.reused_leases,
+                metrics.launch_seconds_saved,
+            )
         self.logger.info(
             "Crawl run completed: %s",
             summary,
@@ -312,16 +416,41 @@ class CrawlOrchestrator:
             )
             return {"status": "skipped", "task": task, "reason": "unknown_source"}
 
+        params = task.job.params
+        watermark = None
+        if self.incremental and task.source in SUPPORTS_WATERMARK:
+            watermark = await asyncio.to_thread(
+                self.crawl_store.watermark, task.source, task.keyword
+            )
+            if watermark is not None:
+                params = {**params, "watermark": watermark}
+
         attempt = 0
         while True:
             attempt += 1
+            if watermark is not None:
+                watermark.hits = 0
             try:
                 start = time.perf_counter()
-                payload = await runner(task.keyword, task.job.params)
+                payload = await runner(task.keyword, params, self.browser_pool)
                 duration = time.perf_counter() - start
                 item_count = None
                 if isinstance(payload, list):
                     item_count = len(payload)
+                    if item_count == 0 and watermark is not None and watermark.hits > 0:
+                        # The crawler reached previously collected content and
+                        # found nothing newer: not a failure. An empty result
+                        # without any hit (block page, parse error) still is.
+                        self.logger.info(
+                            "[UP TO DATE] job=%s source=%s keyword='%s' since=%s known=%d duration=%.1fs",
+                            task.job.id,
+                            task.source,
+                            task.keyword,
+                            watermark.newest_published_at or "-",
+                            watermark.hits,
+                            duration,
+                        )
+                        return {"status": "success", "task": task, "items": 0, "new_items": 0}
                     if item_count == 0:
                         self.logger.warning(
                             "[NO DATA] job=%s source=%s keyword='%s' duration=%.1fs",
@@ -332,15 +461,23 @@ class CrawlOrchestrator:
                         )
                         return {"status": "failed", "task": task, "error": "no_data_collected"}
 
+                new_count, duplicates = await self._store_payload(task, payload)
                 self.logger.info(
-                    "[SUCCESS] job=%s source=%s keyword='%s' items=%s duration=%.1fs",
+                    "[SUCCESS] job=%s source=%s keyword='%s' items=%s new=%s duration=%.1fs",
                     task.job.id,
                     task.source,
                     task.keyword,
                     item_count if item_count is not None else "-",
+                    new_count if new_count is not None else "-",
                     duration,
                 )
-                return {"status": "success", "task": task, "items": item_count}
+                return {
+                    "status": "success",
+                    "task": task,
+                    "items": item_count,
+                    "new_items": new_count,
+                    "duplicates": duplicates,
+                }
             except Exception as exc:  # noqa: BLE001
                 self.logger.exception(
                     "[FAIL] job=%s source=%s keyword='%s' attempt=%d/%d error=%s",
@@ -362,6 +499,24 @@ class CrawlOrchestrator:
                 )
                 await asyncio.sleep(wait_time)
 
+    async def _store_payload(self, task: CrawlTask, payload: Any):
+        if self.crawl_store is None or not isinstance(payload, list):
+            return None, None
+        try:
+            new_items, duplicates = await asyncio.to_thread(
+                self.crawl_store.add_items, task.source, task.keyword, payload
+            )
+        except sqlite3.Error as exc:
+            # The crawl itself succeeded; a store failure must not trigger a re-crawl.
+            self.logger.error(
+                "Crawl store write failed job=%s keyword='%s': %s",
+                task.job.id,
+                task.keyword,
+                exc,
+            )
+            return None, None
+        return len(new_items), duplicates
+
     def _backoff_seconds(self, attempt: int) -> float:
         base = random.uniform(self.backoff_min, self.backoff_max)
         jitter = random.uniform(0, 1)
@@ -416,6 +571,21 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         type=int,
         help="Override retry limit per task.",
     )
+    parser.add_argument(
+        "--no-browser-pool",
+        action="store_true",
+        help="Launch a separate browser per task instead of sharing a pool.",
+    )
+    parser.add_argument(
+        "--no-store",
+        action="store_true",
+        help="Do not write results to the shared crawl store.",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Ignore high-water marks and crawl every page (non-incremental).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -445,6 +615,9 @@ def main(argv: Optional[List[str]] = None) -> None:
         config,
         concurrency_override=args.concurrency,
         retry_override=args.retry_limit,
+        use_browser_pool=not args.no_browser_pool,
+        use_store=not args.no_store and not args.dry_run,
+        incremental=False if args.full else None,
     )
 
     tasks = orchestrator.collect_tasks(job_ids=args.jobs, sources=args.sources)
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class SourceLimits:
+    """Per-source settings from the ``sources`` section of the config."""
+
+    max_concurrency: int
+    hosts: Tuple[str, ...] = ()
+    # Rough number of host requests one keyword task issues; charged
+    # against each host budget when the task starts.
+    requests_per_task: float = 1.0
+
+
+class HostBudget:
+    """
+    Polite request budget for one host.
+
+    A token bucket refilled at ``requests_per_minute`` holding at most
+    ``burst`` requests. A task may start once the bucket covers its cost
+    (capped at ``burst``) and then charges the full cost, so an expensive
+    task delays the next one instead of never starting. ``max_concurrency``
+    additionally caps tasks in flight against the host (0 = unlimited).
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        burst: Optional[float] = None,
+        max_concurrency: int = 0,
+    ) -> None:
+        self.rate = requests_per_minute / 60.0
+        self.capacity = burst if burst is not None else max(1.0, requests_per_minute / 6.0)
+        self.max_concurrency = max_concurrency
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.active = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_seconds(self, cost: float, now: float) -> float:
+        """0 if a task of ``cost`` may start now, ``inf`` if it must wait for a slot."""
+        if self.max_concurrency and self.active >= self.max_concurrency:
+            return math.inf
+        if self.rate <= 0:
+            return 0.0
+        self._refill(now)
+        needed = min(cost, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+    def take(self, cost: float, now: float) -> None:
+        self._refill(now)
+        if self.rate > 0:
+            self.tokens -= cost
+        self.active += 1
+
+    def release(self) -> None:
+        self.active -= 1
+
+
+def parse_source_limits(
+    config: Dict[str, Any], default_concurrency: int
+) -> Dict[str, SourceLimits]:
+    limits: Dict[str, SourceLimits] = {}
+    for source, item in (config.get("sources") or {}).items():
+        limits[source] = SourceLimits(
+            max_concurrency=max(1, int(item.get("max_concurrency", default_concurrency))),
+            hosts=tuple(item.get("hosts", [])),
+            requests_per_task=float(item.get("requests_per_task", 1)),
+        )
+    return limits
+
+
+def build_host_budgets(config: Dict[str, Any]) -> Dict[str, HostBudget]:
+    """Fresh (full) budgets for one run from the ``hosts`` section."""
+    return {
+        host: HostBudget(
+            requests_per_minute=float(item.get("requests_per_minute", 0)),
+            burst=item.get("burst"),
+            max_concurrency=int(item.get("max_concurrency", 0)),
+        )
+        for host, item in (config.get("hosts") or {}).items()
+    }
+
+
+class InterleavedScheduler:
+    """
+    Runs tasks under a global cap, per-source caps and per-host budgets.
+
+    Tasks are queued per source and started round-robin across sources, so
+    a source that is at its own limit (or waiting on its host budget) never
+    holds back other sources while global slots are free.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        source_limits: Dict[str, SourceLimits],
+        host_budgets: Dict[str, HostBudget],
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.source_limits = source_limits
+        self.host_budgets = host_budgets
+        self.default_limits = SourceLimits(max_concurrency=self.max_concurrency)
+
+    def limits_for(self, source: str) -> SourceLimits:
+        return self.source_limits.get(source, self.default_limits)
+
+    def _budgets_for(self, limits: SourceLimits) -> List[HostBudget]:
+        return [self.host_budgets[host] for host in limits.hosts if host in self.host_budgets]
+
+    async def run(
+        self,
+        tasks: Sequence[Any],
+        execute: Callable[[Any], Awaitable[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        queues: Dict[str, Deque[Tuple[int, Any]]] = {}
+        for index, task in enumerate(tasks):
+            queues.setdefault(task.source, deque()).append((index, task))
+        order = list(queues)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tasks)
+        running: Dict[asyncio.Future, Tuple[int, str, List[HostBudget]]] = {}
+        try:
+            await self._drain(queues, order, running, results, execute)
+        finally:
+            for pending in running:
+                pending.cancel()
+        return results  # type: ignore[return-value]
+
+    async def _drain(self, queues, order, running, results, execute) -> None:
+        active: Counter = Counter()
+        cursor = 0
+
+        while any(queues.values()) or running:
+            delay = math.inf
+            while len(running) < self.max_concurrency:
+                started = False
+                now = time.monotonic()
+                for offset in range(len(order)):
+                    position = (cursor + offset) % len(order)
+                    source = order[position]
+                    if not queues[source]:
+                        continue
+                    limits = self.limits_for(source)
+                    if active[source] >= limits.max_concurrency:
+                        continue
+                    budgets = self._budgets_for(limits)
+                    wait = max(
+                        (budget.wait_seconds(limits.requests_per_task, now) for budget in budgets),
+                        default=0.0,
+                    )
+                    if wait > 0:
+                        delay = min(delay, wait)
+                        continue
+
+                    index, task = queues[source].popleft()
+                    for budget in budgets:
+                        budget.take(limits.requests_per_task, now)
+                    active[source] += 1
+                    running[asyncio.ensure_future(execute(task))] = (index, source, budgets)
+                    cursor = position + 1
+                    started = True
+                    break
+                if not started:
+                    break
+
+            if not running:
+                # Everything left is waiting on a host budget to refill.
+                await asyncio.sleep(delay if math.isfinite(delay) else 0.1)
+                continue
+
+            done, _ = await asyncio.wait(
+                running,
+                timeout=delay if math.isfinite(delay) else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for finished in done:
+                index, source, budgets = running.pop(finished)
+                active[source] -= 1
+                for budget in budgets:
+                    budget.release()
+                results[index] = finished.result()
@@ -12,6 +12,11 @@ class Settings(BaseSettings):
     upload_dir: str = "./storage/uploads"
     app_cors_origins: str = "http://localhost:3000"
 
+    ingest_worker_processes: int = 2
+    ingest_poll_seconds: float = 2.0
+    ingest_job_stale_minutes: int = 30
+    ingest_job_max_attempts: int = 3
+
     def cors_origins_list(self) -> list[str]:
         return [origin.strip() for origin in self.app_cors_origins.split(",") if origin.strip()]
 
@@ -0,0 +1,85 @@
+"""Pivoted per-country metrics on country_summary
+
+Adds ``country_summary.metrics`` (metric_key -> value JSON) and the
+(report_file_id, total_score) index, then fills ``metrics`` for reports
+ingested before the column existed from the ``country_metrics`` rows.
+
+Fresh databases get the column and index from ``create_all``; every step
+checks the live schema first, so this is safe on both.
+
+Revision ID: 0001_country_summary_metrics
+Revises:
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+import math
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001_country_summary_metrics"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    columns = {c["name"] for c in inspector.get_columns("country_summary")}
+    if "metrics" not in columns:
+        op.add_column("country_summary", sa.Column("metrics", sa.JSON(), nullable=True))
+
+    indexes = {i["name"] for i in inspector.get_indexes("country_summary")}
+    if "ix_country_summary_report_total_score" not in indexes:
+        op.create_index("ix_country_summary_report_total_score", "country_summary", ["report_file_id", "total_score"])
+
+    country_summary = sa.table(
+        "country_summary",
+        sa.column("report_file_id", sa.Integer),
+        sa.column("country", sa.String),
+        sa.column("metrics", sa.JSON),
+    )
+    country_metrics = sa.table(
+        "country_metrics",
+        sa.column("report_file_id", sa.Integer),
+        sa.column("country", sa.String),
+        sa.column("metric_key", sa.String),
+        sa.column("value", sa.Float),
+    )
+
+    pending = sa.select(country_summary.c.report_file_id).where(country_summary.c.metrics.is_(None)).distinct()
+    pivoted: dict[tuple[int, str], dict[str, float | None]] = {}
+    for report_file_id, country, metric_key, value in bind.execute(
+        sa.select(
+            country_metrics.c.report_file_id,
+            country_metrics.c.country,
+            country_metrics.c.metric_key,
+            country_metrics.c.value,
+        ).where(country_metrics.c.report_file_id.in_(pending))
+    ):
+        if value is not None and not math.isfinite(value):
+            value = None
+        pivoted.setdefault((report_file_id, country), {})[metric_key] = value
+
+    if pivoted:
+        bind.execute(
+            sa.update(country_summary)
+            .where(
+                country_summary.c.report_file_id == sa.bindparam("b_report_file_id"),
+                country_summary.c.country == sa.bindparam("b_country"),
+            )
+            .values(metrics=sa.bindparam("b_metrics", type_=sa.JSON)),
+            [
+                {"b_report_file_id": report_file_id, "b_country": country, "b_metrics": metrics}
+                for (report_file_id, country), metrics in pivoted.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_country_summary_report_total_score", table_name="country_summary")
+    op.drop_column("country_summary", "metrics")
@@ -0,0 +1,49 @@
+"""Composite indexes for the public query paths
+
+- report_files (report_type, is_active, status, year, month): active report
+  lookup and period listings.
+- country_metrics (report_file_id, metric_key): per-report metric averages.
+- issues_alt_text / issues_bottom30 (report_file_id, country): per-country
+  issue lists and counts.
+- issues_bottom30 (report_file_id, total_score): bottom 30% ordering.
+
+tests/test_query_plans.py checks the public endpoints still use them.
+
+Revision ID: 0002_public_query_indexes
+Revises: 0001_country_summary_metrics
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002_public_query_indexes"
+down_revision = "0001_country_summary_metrics"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ("ix_report_files_type_active_status_period", "report_files", ["report_type", "is_active", "status", "year", "month"]),
+    ("ix_country_metrics_report_metric", "country_metrics", ["report_file_id", "metric_key"]),
+    ("ix_issues_alt_text_report_country", "issues_alt_text", ["report_file_id", "country"]),
+    ("ix_issues_bottom30_report_country", "issues_bottom30", ["report_file_id", "country"]),
+    ("ix_issues_bottom30_report_total_score", "issues_bottom30", ["report_file_id", "total_score"]),
+]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    existing: dict[str, set[str]] = {}
+    for name, table, columns in INDEXES:
+        if table not in existing:
+            existing[table] = {i["name"] for i in inspector.get_indexes(table)}
+        if name not in existing[table]:
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
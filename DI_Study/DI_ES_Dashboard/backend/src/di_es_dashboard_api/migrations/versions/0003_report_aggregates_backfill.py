@@ -0,0 +1,118 @@
+"""Backfill report_aggregates for reports ingested before it existed
+
+Ingestion writes one ``report_aggregates`` row per completed report; this
+computes the same row for older completed reports, so ``/overview`` never
+has to write on a GET. The table itself comes from ``create_all``.
+
+Revision ID: 0003_report_aggregates_backfill
+Revises: 0002_public_query_indexes
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+import datetime as dt
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003_report_aggregates_backfill"
+down_revision = "0002_public_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    report_files = sa.table("report_files", sa.column("id", sa.Integer), sa.column("status", sa.String))
+    report_aggregates = sa.table(
+        "report_aggregates",
+        sa.column("report_file_id", sa.Integer),
+        sa.column("avg_total_score", sa.Float),
+        sa.column("countries_count", sa.Integer),
+        sa.column("alt_text_errors_count", sa.Integer),
+        sa.column("bottom30_count", sa.Integer),
+        sa.column("metrics", sa.JSON),
+        sa.column("computed_at", sa.DateTime),
+    )
+    country_summary = sa.table(
+        "country_summary", sa.column("report_file_id", sa.Integer), sa.column("total_score", sa.Float)
+    )
+    country_metrics = sa.table(
+        "country_metrics",
+        sa.column("report_file_id", sa.Integer),
+        sa.column("metric_key", sa.String),
+        sa.column("metric_label", sa.String),
+        sa.column("value", sa.Float),
+    )
+    issues_alt_text = sa.table("issues_alt_text", sa.column("report_file_id", sa.Integer))
+    issues_bottom30 = sa.table("issues_bottom30", sa.column("report_file_id", sa.Integer))
+
+    pending = bind.execute(
+        sa.select(report_files.c.id).where(
+            report_files.c.status == "completed",
+            ~sa.exists().where(report_aggregates.c.report_file_id == report_files.c.id),
+        )
+    ).scalars().all()
+    if not pending:
+        return
+
+    totals = {
+        report_file_id: (avg_total, count)
+        for report_file_id, avg_total, count in bind.execute(
+            sa.select(country_summary.c.report_file_id, sa.func.avg(country_summary.c.total_score), sa.func.count())
+            .where(country_summary.c.report_file_id.in_(pending))
+            .group_by(country_summary.c.report_file_id)
+        )
+    }
+
+    def counts(table) -> dict[int, int]:
+        return dict(
+            bind.execute(
+                sa.select(table.c.report_file_id, sa.func.count())
+                .where(table.c.report_file_id.in_(pending))
+                .group_by(table.c.report_file_id)
+            ).all()
+        )
+
+    alt_counts = counts(issues_alt_text)
+    bottom_counts = counts(issues_bottom30)
+
+    metrics: dict[int, list[dict]] = {}
+    for report_file_id, key, label, value in bind.execute(
+        sa.select(
+            country_metrics.c.report_file_id,
+            country_metrics.c.metric_key,
+            country_metrics.c.metric_label,
+            sa.func.avg(country_metrics.c.value),
+        )
+        .where(country_metrics.c.report_file_id.in_(pending))
+        .group_by(country_metrics.c.report_file_id, country_metrics.c.metric_key, country_metrics.c.metric_label)
+        .order_by(country_metrics.c.report_file_id, country_metrics.c.metric_key.asc())
+    ):
+        metrics.setdefault(report_file_id, []).append(
+            {"metric_key": key, "metric_label": label, "avg_value": float(value) if value is not None else None}
+        )
+
+    now = dt.datetime.utcnow()
+    rows = []
+    for report_file_id in pending:
+        avg_total, count = totals.get(report_file_id, (None, 0))
+        rows.append(
+            {
+                "report_file_id": report_file_id,
+                "avg_total_score": float(avg_total) if avg_total is not None else None,
+                "countries_count": int(count),
+                "alt_text_errors_count": alt_counts.get(report_file_id, 0),
+                "bottom30_count": bottom_counts.get(report_file_id, 0),
+                "metrics": metrics.get(report_file_id, []),
+                "computed_at": now,
+            }
+        )
+    bind.execute(sa.insert(report_aggregates), rows)
+
+
+def downgrade() -> None:
+    # Backfilled rows are indistinguishable from ingested ones; nothing to undo.
+    pass
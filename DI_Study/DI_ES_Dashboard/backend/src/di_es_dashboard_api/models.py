@@ -32,6 +32,12 @@ class ReportFile(Base):
     created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
     ingested_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Active-report lookup (type/year/month/is_active/status) and the
+        # per-type period listings ordered by year, month.
+        Index("ix_report_files_type_active_status_period", "report_type", "is_active", "status", "year", "month"),
+    )
+
 
 class ReportIngestLog(Base):
     __tablename__ = "report_ingest_logs"
@@ -44,6 +50,43 @@ class ReportIngestLog(Base):
     created_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
 
 
+class ReportAggregate(Base):
+    """Report-level totals written at the end of ingestion (served by ``/overview``)."""
+
+    __tablename__ = "report_aggregates"
+
+    report_file_id: Mapped[int] = mapped_column(ForeignKey("report_files.id"), primary_key=True)
+    avg_total_score: Mapped[float | None] = mapped_column(Float, nullable=True)
+    countries_count: Mapped[int] = mapped_column(Integer, default=0)
+    alt_text_errors_count: Mapped[int] = mapped_column(Integer, default=0)
+    bottom30_count: Mapped[int] = mapped_column(Integer, default=0)
+    # [{"metric_key", "metric_label", "avg_value"}, ...] ordered by metric_key
+    metrics: Mapped[list[dict[str, Any]]] = mapped_column(JSON, default=list)
+    computed_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
+
+
+class IngestJob(Base):
+    """Queue entry for the ingest worker (``scripts/ingest_worker.py``)."""
+
+    __tablename__ = "ingest_jobs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    report_file_id: Mapped[int] = mapped_column(ForeignKey("report_files.id"), index=True)
+    # queued -> running -> done/failed
+    status: Mapped[str] = mapped_column(String(16), default="queued")
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    worker_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    enqueued_at: Mapped[dt.datetime] = mapped_column(DateTime, default=dt.datetime.utcnow)
+    started_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[dt.datetime | None] = mapped_column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_ingest_jobs_status_id", "status", "id"),
+    )
+
+
 class CountrySummary(Base):
     __tablename__ = "country_summary"
 
@@ -66,8 +109,12 @@ class CountrySummary(Base):
     rank_current: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rank_change: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
+    # metric_key -> value, pivoted from country_metrics for ranking/sorting.
+    metrics: Mapped[dict[str, float | None] | None] = mapped_column(JSON, nullable=True)
+
     __table_args__ = (
         Index("ix_country_summary_report_country", "report_file_id", "country"),
+        Index("ix_country_summary_report_total_score", "report_file_id", "total_score"),
     )
 
 
@@ -84,6 +131,7 @@ class CountryMetric(Base):
 
     __table_args__ = (
         Index("ix_country_metrics_report_country_metric", "report_file_id", "country", "metric_key"),
+        Index("ix_country_metrics_report_metric", "report_file_id", "metric_key"),
     )
 
 
@@ -102,6 +150,10 @@ class IssueAltText(Base):
     alt_length: Mapped[int | None] = mapped_column(Integer, nullable=True)
     alt_comment: Mapped[str | None] = mapped_column(Text, nullable=True)
 
+    __table_args__ = (
+        Index("ix_issues_alt_text_report_country", "report_file_id", "country"),
+    )
+
 
 class IssueBottom30(Base):
     __tablename__ = "issues_bottom30"
@@ -117,3 +169,8 @@ class IssueBottom30(Base):
     rank_change: Mapped[int | None] = mapped_column(Integer, nullable=True)
     details: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
 
+    __table_args__ = (
+        Index("ix_issues_bottom30_report_country", "report_file_id", "country"),
+        Index("ix_issues_bottom30_report_total_score", "report_file_id", "total_score"),
+    )
+
@@ -4,7 +4,7 @@ import shutil
 import uuid
 from pathlib import Path
 
-from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -12,7 +12,8 @@ from di_es_dashboard_api.config import settings
 from di_es_dashboard_api.db import get_db
 from di_es_dashboard_api.models import ReportFile, ReportIngestLog
 from di_es_dashboard_api.schemas import ReportFileOut
-from di_es_dashboard_api.services.ingestion import create_report_file_record, ingest_excel_report, _log
+from di_es_dashboard_api.services.ingest_queue import enqueue_ingest
+from di_es_dashboard_api.services.ingestion import create_report_file_record, _log
 
 
 router = APIRouter(prefix="/admin")
@@ -24,30 +25,8 @@ def _ensure_upload_dir() -> Path:
     return upload_dir
 
 
-def _process_upload(report_file_id: int) -> None:
-    from di_es_dashboard_api.db import SessionLocal
-
-    db = SessionLocal()
-    try:
-        report_file = db.get(ReportFile, report_file_id)
-        if not report_file:
-            return
-        try:
-            ingest_excel_report(db, report_file)
-            db.commit()
-        except Exception as e:
-            report_file.status = "failed"
-            report_file.error_message = str(e)
-            db.add(report_file)
-            _log(db, report_file.id, "ERROR", "Ingestion failed", {"error": str(e)})
-            db.commit()
-    finally:
-        db.close()
-
-
 @router.post("/uploads", response_model=ReportFileOut)
 def upload_report(
-    background: BackgroundTasks,
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
 ) -> ReportFileOut:
@@ -63,16 +42,14 @@ def upload_report(
 
     try:
         report_file = create_report_file_record(db, stored_path, file.filename)
-        report_file.status = "processing"
-        db.add(report_file)
         _log(db, report_file.id, "INFO", "Upload received", {"stored_path": str(stored_path)})
+        enqueue_ingest(db, report_file.id)
         db.commit()
     except Exception as e:
         db.rollback()
         stored_path.unlink(missing_ok=True)
         raise HTTPException(status_code=400, detail=str(e))
 
-    background.add_task(_process_upload, report_file.id)
     db.refresh(report_file)
 
     return ReportFileOut.model_validate(report_file)
@@ -105,17 +82,17 @@ def upload_detail(upload_id: int, db: Session = Depends(get_db)) -> dict:
 
 
 @router.post("/uploads/{upload_id}/reprocess", response_model=ReportFileOut)
-def reprocess_upload(upload_id: int, background: BackgroundTasks, db: Session = Depends(get_db)) -> ReportFileOut:
+def reprocess_upload(upload_id: int, db: Session = Depends(get_db)) -> ReportFileOut:
     report = db.get(ReportFile, upload_id)
     if not report:
         raise HTTPException(status_code=404, detail="Upload not found")
 
-    report.status = "processing"
+    report.status = "pending"
     report.error_message = None
     db.add(report)
     _log(db, report.id, "INFO", "Reprocess requested")
+    enqueue_ingest(db, report.id)
     db.commit()
 
-    background.add_task(_process_upload, report.id)
     db.refresh(report)
     return ReportFileOut.model_validate(report)
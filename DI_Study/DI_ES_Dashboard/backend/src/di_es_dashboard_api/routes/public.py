@@ -5,7 +5,14 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from di_es_dashboard_api.db import get_db
-from di_es_dashboard_api.models import CountryMetric, CountrySummary, IssueAltText, IssueBottom30, ReportFile
+from di_es_dashboard_api.models import (
+    CountryMetric,
+    CountrySummary,
+    IssueAltText,
+    IssueBottom30,
+    ReportAggregate,
+    ReportFile,
+)
 from di_es_dashboard_api.schemas import (
     CountryDetailResponse,
     IssuesAltTextResponse,
@@ -18,6 +25,7 @@ from di_es_dashboard_api.schemas import (
     RankingResponse,
     CountryRankingRow,
 )
+from di_es_dashboard_api.services.aggregates import compute_report_aggregate, overview_cache
 
 
 router = APIRouter()
@@ -57,49 +65,61 @@ def overview(
     month: int = Query(...),
     db: Session = Depends(get_db),
 ) -> OverviewResponse:
-    report = _get_active_report(db, reportType, year, month)
+    # One lookup over the active reports of this type: yields the trend and
+    # the requested report's revision (the cache key).
+    history_query = (
+        select(
+            ReportFile.id,
+            ReportFile.year,
+            ReportFile.month,
+            ReportFile.revision,
+            ReportFile.ingested_at,
+            ReportAggregate.report_file_id,
+            ReportAggregate.avg_total_score,
+            ReportAggregate.countries_count,
+        )
+        .outerjoin(ReportAggregate, ReportAggregate.report_file_id == ReportFile.id)
+        .where(ReportFile.report_type == reportType, ReportFile.is_active.is_(True), ReportFile.status == "completed")
+        .order_by(ReportFile.year.asc(), ReportFile.month.asc())
+    )
+    history = db.execute(history_query).all()
+
+    # Reports ingested before aggregates existed are backfilled by migration
+    # 0003; until it has run they are computed here, but never written on a GET.
+    fallback = {row.id: compute_report_aggregate(db, row.id) for row in history if row.report_file_id is None}
+
+    report = next((row for row in history if row.year == year and row.month == month), None)
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    avg_total = db.execute(
-        select(func.avg(CountrySummary.total_score)).where(CountrySummary.report_file_id == report.id)
-    ).scalar_one_or_none()
-    countries_count = db.execute(
-        select(func.count()).select_from(CountrySummary).where(CountrySummary.report_file_id == report.id)
-    ).scalar_one()
-    alt_count = db.execute(
-        select(func.count()).select_from(IssueAltText).where(IssueAltText.report_file_id == report.id)
-    ).scalar_one()
-    bottom_count = db.execute(
-        select(func.count()).select_from(IssueBottom30).where(IssueBottom30.report_file_id == report.id)
-    ).scalar_one()
-
-    metrics_rows = db.execute(
-        select(CountryMetric.metric_key, CountryMetric.metric_label, func.avg(CountryMetric.value))
-        .where(CountryMetric.report_file_id == report.id)
-        .group_by(CountryMetric.metric_key, CountryMetric.metric_label)
-        .order_by(CountryMetric.metric_key.asc())
-    ).all()
-    metrics = [OverviewMetric(metric_key=k, metric_label=l, avg_value=v) for (k, l, v) in metrics_rows]
+    cache_key = (reportType, year, month, report.revision, report.ingested_at)
+    cached = overview_cache.get(cache_key)
+    if cached is None:
+        aggregate = fallback.get(report.id) or db.get(ReportAggregate, report.id)
+        cached = (
+            OverviewKpis(
+                avg_total_score=aggregate.avg_total_score,
+                countries_count=aggregate.countries_count,
+                alt_text_errors_count=aggregate.alt_text_errors_count,
+                bottom30_count=aggregate.bottom30_count,
+            ),
+            [OverviewMetric(**m) for m in aggregate.metrics or []],
+        )
+        overview_cache.put(cache_key, cached)
+    kpis, metrics = cached
 
-    trend_rows = db.execute(
-        select(ReportFile.year, ReportFile.month, func.avg(CountrySummary.total_score))
-        .join(CountrySummary, CountrySummary.report_file_id == ReportFile.id)
-        .where(ReportFile.report_type == reportType, ReportFile.is_active.is_(True), ReportFile.status == "completed")
-        .group_by(ReportFile.year, ReportFile.month)
-        .order_by(ReportFile.year.asc(), ReportFile.month.asc())
-    ).all()
-    trend = [OverviewTrendPoint(year=y, month=m, avg_total_score=v) for (y, m, v) in trend_rows]
+    trend = []
+    for row in history:
+        aggregate = fallback.get(row.id)
+        avg_total_score = aggregate.avg_total_score if aggregate else row.avg_total_score
+        countries_count = aggregate.countries_count if aggregate else row.countries_count
+        if countries_count:
+            trend.append(OverviewTrendPoint(year=row.year, month=row.month, avg_total_score=avg_total_score))
 
     return OverviewResponse(
         report_type=reportType,
         period=Period(year=year, month=month),
-        kpis=OverviewKpis(
-            avg_total_score=avg_total,
-            countries_count=int(countries_count),
-            alt_text_errors_count=int(alt_count),
-            bottom30_count=int(bottom_count),
-        ),
+        kpis=kpis,
         metrics=metrics,
         trend=trend,
     )
@@ -120,37 +140,30 @@ def country_ranking(
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
 
-    base_query = select(CountrySummary).where(CountrySummary.report_file_id == report.id)
-    total = db.execute(select(func.count()).select_from(base_query.subquery())).scalar_one()
-
+    # Metrics are pivoted onto country_summary.metrics, so any sort key is a
+    # single query over the report's rows (ix_country_summary_report_*),
+    # with the total carried along as a window count.
     order_desc = sortOrder.lower() != "asc"
     if sortKey == "total_score":
         order_col = CountrySummary.total_score
-        query = base_query.order_by(order_col.desc() if order_desc else order_col.asc())
     else:
-        metric_key = sortKey
-        metric_sub = (
-            select(CountryMetric.country, CountryMetric.value)
-            .where(CountryMetric.report_file_id == report.id, CountryMetric.metric_key == metric_key)
-            .subquery()
-        )
-        query = (
-            select(CountrySummary)
-            .join(metric_sub, metric_sub.c.country == CountrySummary.country, isouter=True)
-            .where(CountrySummary.report_file_id == report.id)
-            .order_by(metric_sub.c.value.desc() if order_desc else metric_sub.c.value.asc())
-        )
-
-    rows = db.execute(query.offset((page - 1) * pageSize).limit(pageSize)).scalars().all()
-    countries = [r.country for r in rows]
-
-    metrics_for_page = db.execute(
-        select(CountryMetric.country, CountryMetric.metric_key, CountryMetric.value)
-        .where(CountryMetric.report_file_id == report.id, CountryMetric.country.in_(countries))
-    ).all()
-    metric_map: dict[str, dict[str, float | None]] = {}
-    for country, key, value in metrics_for_page:
-        metric_map.setdefault(country, {})[key] = value
+        order_col = CountrySummary.metrics[sortKey].as_float()
+
+    query = (
+        select(CountrySummary, func.count().over().label("total"))
+        .where(CountrySummary.report_file_id == report.id)
+        .order_by(order_col.desc() if order_desc else order_col.asc(), CountrySummary.id.asc())
+        .offset((page - 1) * pageSize)
+        .limit(pageSize)
+    )
+    result = db.execute(query).all()
+    rows = [r for (r, _) in result]
+    if result:
+        total = result[0].total
+    else:
+        total = db.execute(
+            select(func.count()).select_from(CountrySummary).where(CountrySummary.report_file_id == report.id)
+        ).scalar_one()
 
     items = [
         CountryRankingRow(
@@ -159,7 +172,7 @@ def country_ranking(
             total_score=r.total_score,
             rank_current=r.rank_current,
             rank_change=r.rank_change,
-            metrics=metric_map.get(r.country, {}),
+            metrics=r.metrics or {},
         )
         for r in rows
     ]
@@ -0,0 +1,184 @@
+"""
+Benchmarks ``/countries/ranking`` on synthetic data.
+
+Seeds ``--months`` × 2 report types × ``--countries`` × ``--metrics`` into a
+scratch database, then times the current ranking query (pivoted
+``country_summary.metrics``) against the previous EAV join on
+``country_metrics``. Both must return the same page.
+
+    PYTHONPATH=src python3 -m di_es_dashboard_api.scripts.bench_ranking --months 12
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from di_es_dashboard_api.models import Base, CountryMetric, CountrySummary, ReportFile
+
+
+def metric_keys(metrics: int) -> list[str]:
+    return [f"{i + 1}_metric" for i in range(metrics)]
+
+
+def seed(db: Session, months: int, countries: int, metrics: int, seed_value: int = 7) -> None:
+    rng = random.Random(seed_value)
+    keys = metric_keys(metrics)
+    report_id = 0
+    for report_type in ("B2B", "B2C"):
+        for m in range(months):
+            report_id += 1
+            db.execute(
+                insert(ReportFile.__table__),
+                [
+                    {
+                        "id": report_id,
+                        "report_type": report_type,
+                        "year": 2024 + m // 12,
+                        "month": m % 12 + 1,
+                        "revision": 1,
+                        "file_name": f"bench_{report_type}_{m}.xlsx",
+                        "stored_path": "",
+                        "is_active": True,
+                        "status": "completed",
+                        "warnings_count": 0,
+                    }
+                ],
+            )
+            summaries = []
+            metric_rows = []
+            for c in range(countries):
+                values = {key: (rng.random() * 20 if rng.random() > 0.05 else None) for key in keys}
+                summaries.append(
+                    {
+                        "report_file_id": report_id,
+                        "region": f"R{c % 7}",
+                        "country": f"Country {c:03d}",
+                        "total_score": rng.random() * 100,
+                        "metrics": values,
+                    }
+                )
+                metric_rows.extend(
+                    {
+                        "report_file_id": report_id,
+                        "country": f"Country {c:03d}",
+                        "metric_key": key,
+                        "metric_label": key,
+                        "value": value,
+                    }
+                    for key, value in values.items()
+                )
+            db.execute(insert(CountrySummary.__table__), summaries)
+            db.execute(insert(CountryMetric.__table__), metric_rows)
+    db.commit()
+
+
+def ranking_eav(db: Session, report_id: int, sort_key: str, page: int, page_size: int) -> list[tuple[str, dict]]:
+    """The pre-pivot implementation: subquery join for the sort + second query for the page's metrics."""
+    base_query = select(CountrySummary).where(CountrySummary.report_file_id == report_id)
+    db.execute(select(func.count()).select_from(base_query.subquery())).scalar_one()
+    metric_sub = (
+        select(CountryMetric.country, CountryMetric.value)
+        .where(CountryMetric.report_file_id == report_id, CountryMetric.metric_key == sort_key)
+        .subquery()
+    )
+    query = (
+        select(CountrySummary)
+        .join(metric_sub, metric_sub.c.country == CountrySummary.country, isouter=True)
+        .where(CountrySummary.report_file_id == report_id)
+        .order_by(metric_sub.c.value.desc(), CountrySummary.id.asc())
+    )
+    rows = db.execute(query.offset((page - 1) * page_size).limit(page_size)).scalars().all()
+    metric_map: dict[str, dict] = {}
+    for country, key, value in db.execute(
+        select(CountryMetric.country, CountryMetric.metric_key, CountryMetric.value).where(
+            CountryMetric.report_file_id == report_id, CountryMetric.country.in_([r.country for r in rows])
+        )
+    ):
+        metric_map.setdefault(country, {})[key] = value
+    return [(r.country, metric_map.get(r.country, {})) for r in rows]
+
+
+def ranking_pivoted(db: Session, report_id: int, sort_key: str, page: int, page_size: int) -> list[tuple[str, dict]]:
+    order_col = CountrySummary.metrics[sort_key].as_float()
+    result = db.execute(
+        select(CountrySummary, func.count().over().label("total"))
+        .where(CountrySummary.report_file_id == report_id)
+        .order_by(order_col.desc(), CountrySummary.id.asc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+    ).all()
+    return [(r.country, r.metrics or {}) for (r, _) in result]
+
+
+def _time(fn, db: Session, cases: list[tuple[int, str, int]], page_size: int, repeat: int) -> list[float]:
+    samples = []
+    for _ in range(repeat):
+        for report_id, key, page in cases:
+            started = time.perf_counter()
+            fn(db, report_id, key, page, page_size)
+            samples.append((time.perf_counter() - started) * 1000)
+            db.expunge_all()
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="Scratch database, dropped and recreated (default: temporary SQLite file).")
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--countries", type=int, default=120)
+    parser.add_argument("--metrics", type=int, default=40)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tmp_dir = None
+    url = args.database_url
+    if not url:
+        tmp_dir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{Path(tmp_dir.name) / 'bench.db'}"
+
+    engine = create_engine(url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    try:
+        with Session(engine) as db:
+            started = time.perf_counter()
+            seed(db, args.months, args.countries, args.metrics)
+            reports = args.months * 2
+            print(
+                f"Seeded {reports} reports × {args.countries} countries × {args.metrics} metrics "
+                f"({reports * args.countries * args.metrics:,} metric rows) in {time.perf_counter() - started:.1f}s"
+            )
+
+            rng = random.Random(1)
+            pages = max(1, args.countries // args.page_size)
+            keys = metric_keys(args.metrics)
+            cases = [(rng.randint(1, reports), rng.choice(keys), rng.randint(1, pages)) for _ in range(20)]
+
+            for report_id, key, page in cases:
+                if ranking_eav(db, report_id, key, page, args.page_size) != ranking_pivoted(
+                    db, report_id, key, page, args.page_size
+                ):
+                    raise SystemExit(f"Mismatch for report {report_id}, sort {key}, page {page}")
+
+            for label, fn in (("eav", ranking_eav), ("pivoted", ranking_pivoted)):
+                samples = _time(fn, db, cases, args.page_size, args.repeat)
+                print(
+                    f"{label:>8}: median {statistics.median(samples):7.2f} ms  "
+                    f"p95 {sorted(samples)[int(len(samples) * 0.95) - 1]:7.2f} ms  ({len(samples)} requests)"
+                )
+    finally:
+        engine.dispose()
+        if tmp_dir is not None:
+            tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import logging
+import multiprocessing
+
+from di_es_dashboard_api.config import settings
+
+
+def _worker_main(poll_seconds: float, once: bool) -> None:
+    # Imported in the child so every process builds its own engine/pool.
+    from di_es_dashboard_api.db import SessionLocal
+    from di_es_dashboard_api.services.ingest_queue import run_worker
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    run_worker(
+        SessionLocal,
+        poll_seconds=poll_seconds,
+        stale_after=dt.timedelta(minutes=settings.ingest_job_stale_minutes),
+        max_attempts=settings.ingest_job_max_attempts,
+        once=once,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Ingest queued report uploads.")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.ingest_worker_processes,
+        help="Worker processes; each ingests one upload at a time.",
+    )
+    parser.add_argument("--poll-seconds", type=float, default=settings.ingest_poll_seconds)
+    parser.add_argument("--once", action="store_true", help="Exit when the queue is empty.")
+    args = parser.parse_args()
+
+    processes = max(1, args.processes)
+    if processes == 1:
+        _worker_main(args.poll_seconds, args.once)
+        return
+
+    ctx = multiprocessing.get_context("spawn")
+    workers = [
+        ctx.Process(target=_worker_main, args=(args.poll_seconds, args.once), name=f"ingest-worker-{i}")
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.join()
+
+
+if __name__ == "__main__":
+    main()
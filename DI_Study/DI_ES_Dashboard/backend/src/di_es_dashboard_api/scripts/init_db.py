@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.engine import Connection
+
 from di_es_dashboard_api.db import engine
 from di_es_dashboard_api.models import Base
 
 
+MIGRATIONS_DIR = Path(__file__).resolve().parents[1] / "migrations"
+
+
+def alembic_config(connection: Connection) -> Config:
+    cfg = Config()
+    cfg.set_main_option("script_location", str(MIGRATIONS_DIR))
+    cfg.attributes["connection"] = connection
+    return cfg
+
+
 def main() -> None:
+    # New tables come from create_all; migrations bring existing ones up to date.
     Base.metadata.create_all(bind=engine)
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), "head")
     print("DB schema created/verified.")
 
 
 if __name__ == "__main__":
     main()
-
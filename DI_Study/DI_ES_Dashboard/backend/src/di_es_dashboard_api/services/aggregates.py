@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import datetime as dt
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from di_es_dashboard_api.models import CountryMetric, CountrySummary, IssueAltText, IssueBottom30, ReportAggregate
+
+
+def compute_report_aggregate(db: Session, report_file_id: int) -> ReportAggregate:
+    """Computes one report's aggregates from its imported rows, without adding them to the session."""
+    avg_total, countries_count = db.execute(
+        select(func.avg(CountrySummary.total_score), func.count()).where(CountrySummary.report_file_id == report_file_id)
+    ).one()
+    alt_count = db.execute(
+        select(func.count()).select_from(IssueAltText).where(IssueAltText.report_file_id == report_file_id)
+    ).scalar_one()
+    bottom_count = db.execute(
+        select(func.count()).select_from(IssueBottom30).where(IssueBottom30.report_file_id == report_file_id)
+    ).scalar_one()
+    metrics_rows = db.execute(
+        select(CountryMetric.metric_key, CountryMetric.metric_label, func.avg(CountryMetric.value))
+        .where(CountryMetric.report_file_id == report_file_id)
+        .group_by(CountryMetric.metric_key, CountryMetric.metric_label)
+        .order_by(CountryMetric.metric_key.asc())
+    ).all()
+
+    return ReportAggregate(
+        report_file_id=report_file_id,
+        avg_total_score=float(avg_total) if avg_total is not None else None,
+        countries_count=int(countries_count),
+        alt_text_errors_count=int(alt_count),
+        bottom30_count=int(bottom_count),
+        metrics=[
+            {"metric_key": k, "metric_label": l, "avg_value": float(v) if v is not None else None}
+            for (k, l, v) in metrics_rows
+        ],
+        computed_at=dt.datetime.utcnow(),
+    )
+
+
+def refresh_report_aggregate(db: Session, report_file_id: int) -> ReportAggregate:
+    """(Re)computes and stores the aggregates row for one report from its imported rows."""
+    aggregate = compute_report_aggregate(db, report_file_id)
+    db.execute(delete(ReportAggregate).where(ReportAggregate.report_file_id == report_file_id))
+    db.add(aggregate)
+    db.flush()
+    return aggregate
+
+
+class LRUCache:
+    """Small thread-safe LRU map for per-process response caching."""
+
+    def __init__(self, maxsize: int = 256) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# Keyed by (report_type, year, month, revision, ingested_at): a reprocessed
+# or newly activated revision gets a new key, so entries never go stale.
+overview_cache = LRUCache()
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import io
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import openpyxl
 
@@ -26,12 +28,16 @@ class ParsedCountryRow:
     metrics: dict[str, tuple[str, float | None]]
 
 
-def _find_header_row(ws: openpyxl.worksheet.worksheet.Worksheet, max_rows: int = 30) -> int:
+def _find_header_row(rows: Iterator[tuple[Any, ...]], max_rows: int = 30) -> list[str]:
+    """Consumes ``rows`` up to and including the REGION/COUNTRY header row."""
     required = {"REGION", "COUNTRY"}
-    for r in range(1, max_rows + 1):
-        row = [normalize_header(c.value) for c in ws[r]]
-        if required.issubset(set(row)):
-            return r
+    for _ in range(max_rows):
+        row = next(rows, None)
+        if row is None:
+            break
+        header_values = [normalize_header(v) for v in row]
+        if required.issubset(set(header_values)):
+            return header_values
     raise ValueError("Header row not found (REGION/COUNTRY)")
 
 
@@ -86,10 +92,9 @@ def _build_base_col_index(header_values: list[str]) -> dict[str, int]:
 
 
 def _build_metric_col_index(
-    ws: openpyxl.worksheet.worksheet.Worksheet, header_row: int
+    metric_values: tuple[Any, ...],
 ) -> tuple[dict[int, tuple[str, str]], dict[str, int]]:
-    metric_row_idx = header_row + 2
-    metric_row = [clean_cell(c.value) for c in ws[metric_row_idx]]
+    metric_row = [clean_cell(v) for v in metric_values]
 
     metric_cols: dict[int, tuple[str, str]] = {}
     rank_cols: dict[str, int] = {}
@@ -120,71 +125,75 @@ def _build_metric_col_index(
     return metric_cols, rank_cols
 
 
-def parse_country_table_from_sheet(file_path: Path, sheet_name: str) -> list[ParsedCountryRow]:
-    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-    try:
-        if sheet_name not in wb.sheetnames:
-            raise ValueError(f"Sheet not found: {sheet_name}")
+def iter_country_rows(rows: Iterable[tuple[Any, ...]]) -> Iterator[ParsedCountryRow]:
+    """
+    Parses a country table (Summary / Bottom 30%) from a stream of row values.
+
+    Layout: REGION/COUNTRY header row within the first 30 rows, metric labels
+    two rows below it, data from the fifth row below it.
+    """
+    rows = iter(rows)
+    header_values = _find_header_row(rows)
+    base_idx = _build_base_col_index(header_values)
+    next(rows, None)
+    metric_cols, rank_cols = _build_metric_col_index(next(rows, ()))
+    next(rows, None)
+    next(rows, None)
+
+    for row in rows:
+        country_raw = row[base_idx["country"]] if base_idx["country"] >= 0 else None
+        country = clean_cell(country_raw)
+        if not country:
+            continue
+        if str(country).strip() == "*":
+            continue
 
-        ws = wb[sheet_name]
-        header_row = _find_header_row(ws)
-        header_values = [normalize_header(c.value) for c in ws[header_row]]
-        base_idx = _build_base_col_index(header_values)
-        metric_cols, rank_cols = _build_metric_col_index(ws, header_row)
+        region = clean_cell(row[base_idx["region"]]) if base_idx["region"] >= 0 else None
+        gp1_status = None
+        if base_idx["gp1_status"] >= 0:
+            gp1_status = clean_cell(row[base_idx["gp1_status"]])
 
-        data_start = header_row + 5
-        parsed: list[ParsedCountryRow] = []
+        sku = to_int(row[base_idx["sku"]]) if base_idx["sku"] >= 0 else None
+        sku_prev = to_int(row[base_idx["sku_prev"]]) if base_idx["sku_prev"] >= 0 else None
+        sku_gap = to_int(row[base_idx["sku_gap"]]) if base_idx["sku_gap"] >= 0 else None
 
-        for row in ws.iter_rows(min_row=data_start, values_only=True):
-            country_raw = row[base_idx["country"]] if base_idx["country"] >= 0 else None
-            country = clean_cell(country_raw)
-            if not country:
-                continue
-            if str(country).strip() == "*":
+        total_score = to_float(row[base_idx["total_score"]]) if base_idx["total_score"] >= 0 else None
+        total_score_prev = to_float(row[base_idx["total_score_prev"]]) if base_idx["total_score_prev"] >= 0 else None
+        total_gap = to_float(row[base_idx["total_gap"]]) if base_idx["total_gap"] >= 0 else None
+
+        rank_prev = to_int(row[rank_cols["rank_prev"]]) if "rank_prev" in rank_cols else None
+        rank_current = to_int(row[rank_cols["rank_current"]]) if "rank_current" in rank_cols else None
+        rank_change = to_int(row[rank_cols["rank_change"]]) if "rank_change" in rank_cols else None
+
+        metrics: dict[str, tuple[str, float | None]] = {}
+        for col_idx, (m_key, m_label) in metric_cols.items():
+            if col_idx >= len(row):
                 continue
+            metrics[m_key] = (m_label, to_float(row[col_idx]))
+
+        yield ParsedCountryRow(
+            region=str(region) if region is not None else None,
+            country=str(country),
+            gp1_status=str(gp1_status) if gp1_status is not None else None,
+            sku=sku,
+            sku_prev=sku_prev,
+            sku_gap=sku_gap,
+            total_score=total_score,
+            total_score_prev=total_score_prev,
+            total_gap=total_gap,
+            rank_prev=rank_prev,
+            rank_current=rank_current,
+            rank_change=rank_change,
+            metrics=metrics,
+        )
+
 
-            region = clean_cell(row[base_idx["region"]]) if base_idx["region"] >= 0 else None
-            gp1_status = None
-            if base_idx["gp1_status"] >= 0:
-                gp1_status = clean_cell(row[base_idx["gp1_status"]])
-
-            sku = to_int(row[base_idx["sku"]]) if base_idx["sku"] >= 0 else None
-            sku_prev = to_int(row[base_idx["sku_prev"]]) if base_idx["sku_prev"] >= 0 else None
-            sku_gap = to_int(row[base_idx["sku_gap"]]) if base_idx["sku_gap"] >= 0 else None
-
-            total_score = to_float(row[base_idx["total_score"]]) if base_idx["total_score"] >= 0 else None
-            total_score_prev = to_float(row[base_idx["total_score_prev"]]) if base_idx["total_score_prev"] >= 0 else None
-            total_gap = to_float(row[base_idx["total_gap"]]) if base_idx["total_gap"] >= 0 else None
-
-            rank_prev = to_int(row[rank_cols["rank_prev"]]) if "rank_prev" in rank_cols else None
-            rank_current = to_int(row[rank_cols["rank_current"]]) if "rank_current" in rank_cols else None
-            rank_change = to_int(row[rank_cols["rank_change"]]) if "rank_change" in rank_cols else None
-
-            metrics: dict[str, tuple[str, float | None]] = {}
-            for col_idx, (m_key, m_label) in metric_cols.items():
-                if col_idx >= len(row):
-                    continue
-                metrics[m_key] = (m_label, to_float(row[col_idx]))
-
-            parsed.append(
-                ParsedCountryRow(
-                    region=str(region) if region is not None else None,
-                    country=str(country),
-                    gp1_status=str(gp1_status) if gp1_status is not None else None,
-                    sku=sku,
-                    sku_prev=sku_prev,
-                    sku_gap=sku_gap,
-                    total_score=total_score,
-                    total_score_prev=total_score_prev,
-                    total_gap=total_gap,
-                    rank_prev=rank_prev,
-                    rank_current=rank_current,
-                    rank_change=rank_change,
-                    metrics=metrics,
-                )
-            )
-
-        return parsed
+def parse_country_table_from_sheet(file_path: Path, sheet_name: str) -> list[ParsedCountryRow]:
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if sheet_name not in wb.sheetnames:
+            raise ValueError(f"Sheet not found: {sheet_name}")
+        return list(iter_country_rows(wb[sheet_name].iter_rows(values_only=True)))
     finally:
         wb.close()
 
@@ -201,50 +210,111 @@ class ParsedAltTextIssue:
     alt_comment: str | None
 
 
-def parse_alt_text_issues(file_path: Path, sheet_name: str = "Feature Card Alt Text Error") -> list[ParsedAltTextIssue]:
+ALT_TEXT_SHEET = "Feature Card Alt Text Error"
+
+
+def iter_alt_text_issues(rows: Iterable[tuple[Any, ...]]) -> Iterator[ParsedAltTextIssue]:
+    """Parses the alt text error sheet from a stream of row values; nothing if its header is missing."""
+    rows = iter(rows)
+    header: list[str] | None = None
+    for _ in range(9):
+        row = next(rows, None)
+        if row is None:
+            break
+        values = [normalize_header(v) for v in row]
+        if "COUNTRY" in values and "URL" in values:
+            header = values
+            break
+    if header is None:
+        return
+
+    col = {name: header.index(name) for name in header if name}
+
+    def idx(name: str) -> int | None:
+        return col.get(name)
+
+    required = {"COUNTRY", "URL"}
+    if not required.issubset(set(col.keys())):
+        return
+
+    for row in rows:
+        country = clean_cell(row[idx("COUNTRY")] if idx("COUNTRY") is not None else None)
+        url = clean_cell(row[idx("URL")] if idx("URL") is not None else None)
+        if not country or not url:
+            continue
+
+        yield ParsedAltTextIssue(
+            country=str(country),
+            url=str(url),
+            card_index=to_int(row[idx("CARDINDEX")] if idx("CARDINDEX") is not None else None),
+            src=str(clean_cell(row[idx("SRC")] if idx("SRC") is not None else None) or "") or None,
+            srcset=str(clean_cell(row[idx("SRCSET")] if idx("SRCSET") is not None else None) or "") or None,
+            alt=str(clean_cell(row[idx("ALT")] if idx("ALT") is not None else None) or "") or None,
+            alt_length=to_int(row[idx("ALTLENGTH")] if idx("ALTLENGTH") is not None else None),
+            alt_comment=str(clean_cell(row[idx("ALTCOMMENT")] if idx("ALTCOMMENT") is not None else None) or "") or None,
+        )
+
+
+def parse_alt_text_issues(file_path: Path, sheet_name: str = ALT_TEXT_SHEET) -> list[ParsedAltTextIssue]:
     wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
     try:
         if sheet_name not in wb.sheetnames:
             return []
-        ws = wb[sheet_name]
-        header_row = None
-        for r in range(1, 10):
-            values = [normalize_header(c.value) for c in ws[r]]
-            if "COUNTRY" in values and "URL" in values:
-                header_row = r
-                break
-        if header_row is None:
-            return []
-
-        header = [normalize_header(c.value) for c in ws[header_row]]
-        col = {name: header.index(name) for name in header if name}
+        return list(iter_alt_text_issues(wb[sheet_name].iter_rows(values_only=True)))
+    finally:
+        wb.close()
 
-        def idx(name: str) -> int | None:
-            return col.get(name)
 
-        required = {"COUNTRY", "URL"}
-        if not required.issubset(set(col.keys())):
-            return []
+class ReportWorkbook:
+    """
+    A report file read once from disk.
+
+    The bytes are hashed while they are read, and the read-only workbook is
+    opened over the same in-memory copy, so ingestion needs a single file
+    read and a single workbook load no matter how many sheets it parses.
+    Each sheet is streamed front to back exactly once.
+
+    Usage::
+
+        with ReportWorkbook(path) as book:
+            book.sha256, book.sheetnames
+            for row in book.country_rows("Summary"):
+                ...
+    """
+
+    def __init__(self, file_path: Path, chunk_size: int = 1024 * 1024) -> None:
+        digest = hashlib.sha256()
+        buffer = io.BytesIO()
+        with file_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+                buffer.write(chunk)
+        buffer.seek(0)
+        self.sha256 = digest.hexdigest()
+        self.size_bytes = buffer.getbuffer().nbytes
+        self._buffer = buffer
+        self._wb = openpyxl.load_workbook(buffer, read_only=True, data_only=True)
+        self.sheetnames: list[str] = list(self._wb.sheetnames)
+
+    def __enter__(self) -> ReportWorkbook:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._wb.close()
+        self._buffer.close()
+
+    def rows(self, sheet_name: str) -> Iterator[tuple[Any, ...]]:
+        if sheet_name not in self.sheetnames:
+            raise ValueError(f"Sheet not found: {sheet_name}")
+        return self._wb[sheet_name].iter_rows(values_only=True)
 
-        issues: list[ParsedAltTextIssue] = []
-        for row in ws.iter_rows(min_row=header_row + 1, values_only=True):
-            country = clean_cell(row[idx("COUNTRY")] if idx("COUNTRY") is not None else None)
-            url = clean_cell(row[idx("URL")] if idx("URL") is not None else None)
-            if not country or not url:
-                continue
+    def country_rows(self, sheet_name: str) -> Iterator[ParsedCountryRow]:
+        return iter_country_rows(self.rows(sheet_name))
 
-            issues.append(
-                ParsedAltTextIssue(
-                    country=str(country),
-                    url=str(url),
-                    card_index=to_int(row[idx("CARDINDEX")] if idx("CARDINDEX") is not None else None),
-                    src=str(clean_cell(row[idx("SRC")] if idx("SRC") is not None else None) or "") or None,
-                    srcset=str(clean_cell(row[idx("SRCSET")] if idx("SRCSET") is not None else None) or "") or None,
-                    alt=str(clean_cell(row[idx("ALT")] if idx("ALT") is not None else None) or "") or None,
-                    alt_length=to_int(row[idx("ALTLENGTH")] if idx("ALTLENGTH") is not None else None),
-                    alt_comment=str(clean_cell(row[idx("ALTCOMMENT")] if idx("ALTCOMMENT") is not None else None) or "") or None,
-                )
-            )
-        return issues
-    finally:
-        wb.close()
+    def alt_text_issues(self, sheet_name: str = ALT_TEXT_SHEET) -> Iterator[ParsedAltTextIssue]:
+        if sheet_name not in self.sheetnames:
+            return iter(())
+        return iter_alt_text_issues(self.rows(sheet_name))
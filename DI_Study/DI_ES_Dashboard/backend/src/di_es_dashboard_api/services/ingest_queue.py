@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import datetime as dt
+import logging
+import os
+import socket
+import time
+from collections.abc import Callable
+
+from sqlalchemy import and_, exists, or_, select, update
+from sqlalchemy.orm import Session, aliased
+
+from di_es_dashboard_api.models import IngestJob, ReportFile
+from di_es_dashboard_api.services.ingestion import _log, ingest_excel_report
+
+
+logger = logging.getLogger("di_es_dashboard_api.ingest_worker")
+
+
+def enqueue_ingest(db: Session, report_file_id: int) -> IngestJob:
+    """Queues ``report_file_id`` for the ingest worker (no-op if it is already queued)."""
+    job = db.execute(
+        select(IngestJob).where(IngestJob.report_file_id == report_file_id, IngestJob.status == "queued")
+    ).scalar_one_or_none()
+    if job is None:
+        job = IngestJob(report_file_id=report_file_id, status="queued")
+        db.add(job)
+        db.flush()
+    return job
+
+
+def _claimable(now: dt.datetime, stale_after: dt.timedelta, max_attempts: int):
+    # Running jobs whose worker died are picked up again once they go stale.
+    # A report is never ingested by two workers at once: a job (e.g. from a
+    # reprocess) waits while another job for the same report is running.
+    other = aliased(IngestJob)
+    report_busy = exists().where(
+        other.report_file_id == IngestJob.report_file_id,
+        other.id != IngestJob.id,
+        other.status == "running",
+        other.started_at >= now - stale_after,
+    )
+    return and_(
+        or_(
+            IngestJob.status == "queued",
+            and_(
+                IngestJob.status == "running",
+                IngestJob.started_at < now - stale_after,
+                IngestJob.attempts < max_attempts,
+            ),
+        ),
+        ~report_busy,
+    )
+
+
+def claim_next_job(
+    db: Session,
+    worker_id: str,
+    stale_after: dt.timedelta,
+    max_attempts: int,
+) -> IngestJob | None:
+    """
+    Atomically moves the oldest claimable job to ``running`` for ``worker_id``.
+
+    Candidates are read with ``FOR UPDATE SKIP LOCKED`` (MySQL 8 / Postgres)
+    and claimed with a conditional UPDATE, so concurrent workers never run
+    the same job even on databases without row locking. The report file is
+    marked ``processing`` in the same transaction.
+    """
+    now = dt.datetime.utcnow()
+    candidates = db.execute(
+        select(IngestJob.id, IngestJob.report_file_id)
+        .where(_claimable(now, stale_after, max_attempts))
+        .order_by(IngestJob.id)
+        .limit(10)
+        .with_for_update(skip_locked=True)
+    ).all()
+
+    for job_id, report_file_id in candidates:
+        claimed = db.execute(
+            update(IngestJob)
+            .where(IngestJob.id == job_id, _claimable(now, stale_after, max_attempts))
+            .values(status="running", worker_id=worker_id, started_at=now, attempts=IngestJob.attempts + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if claimed.rowcount == 1:
+            db.execute(
+                update(ReportFile)
+                .where(ReportFile.id == report_file_id)
+                .values(status="processing", error_message=None)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            return db.get(IngestJob, job_id)
+    db.commit()
+    return None
+
+
+def fail_exhausted_jobs(db: Session, stale_after: dt.timedelta, max_attempts: int) -> int:
+    """
+    Gives up on stale jobs that already used every attempt.
+
+    Their report files are marked ``failed`` in the same transaction, unless
+    a newer job for the file is still queued (e.g. after a reprocess).
+    """
+    now = dt.datetime.utcnow()
+    error = "Worker stopped responding"
+    exhausted = and_(
+        IngestJob.status == "running",
+        IngestJob.started_at < now - stale_after,
+        IngestJob.attempts >= max_attempts,
+    )
+    jobs = db.execute(select(IngestJob.id, IngestJob.report_file_id).where(exhausted)).all()
+    if not jobs:
+        return 0
+
+    failed = db.execute(
+        update(IngestJob)
+        .where(IngestJob.id.in_([job_id for job_id, _ in jobs]), exhausted)
+        .values(status="failed", finished_at=now, error_message=error)
+        .execution_options(synchronize_session=False)
+    )
+    report_file_ids = sorted({report_file_id for _, report_file_id in jobs})
+    requeued = exists().where(IngestJob.report_file_id == ReportFile.id, IngestJob.status == "queued")
+    db.execute(
+        update(ReportFile)
+        .where(ReportFile.id.in_(report_file_ids), ~requeued)
+        .values(status="failed", error_message=error)
+        .execution_options(synchronize_session=False)
+    )
+    for report_file_id in report_file_ids:
+        _log(db, report_file_id, "ERROR", "Ingestion failed", {"error": error, "attempts": max_attempts})
+    db.commit()
+    return failed.rowcount or 0
+
+
+def process_report_file(db: Session, report_file_id: int) -> str | None:
+    """Ingests one report file and commits; returns the error message on failure."""
+    report_file = db.get(ReportFile, report_file_id)
+    if not report_file:
+        return "Report file not found"
+    try:
+        ingest_excel_report(db, report_file)
+        db.commit()
+        return None
+    except Exception as e:
+        db.rollback()
+        report_file = db.get(ReportFile, report_file_id)
+        report_file.status = "failed"
+        report_file.error_message = str(e)
+        db.add(report_file)
+        _log(db, report_file.id, "ERROR", "Ingestion failed", {"error": str(e)})
+        db.commit()
+        return str(e)
+
+
+def run_job(db: Session, job: IngestJob) -> None:
+    error = process_report_file(db, job.report_file_id)
+    db.execute(
+        update(IngestJob)
+        .where(IngestJob.id == job.id)
+        .values(
+            status="failed" if error else "done",
+            error_message=error,
+            finished_at=dt.datetime.utcnow(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def run_worker(
+    session_factory: Callable[[], Session],
+    poll_seconds: float,
+    stale_after: dt.timedelta,
+    max_attempts: int,
+    worker_id: str | None = None,
+    once: bool = False,
+) -> int:
+    """
+    Polls the job table and ingests claimed jobs one at a time.
+
+    Run several of these (``scripts/ingest_worker.py --processes N``) to
+    ingest uploads in parallel. With ``once`` the loop returns as soon as
+    the queue is empty. Returns the number of jobs processed.
+    """
+    worker_id = worker_id or default_worker_id()
+    processed = 0
+    while True:
+        with session_factory() as db:
+            fail_exhausted_jobs(db, stale_after, max_attempts)
+            job = claim_next_job(db, worker_id, stale_after, max_attempts)
+            if job is not None:
+                started = time.perf_counter()
+                logger.info("%s: ingesting report_file_id=%s (job %s)", worker_id, job.report_file_id, job.id)
+                run_job(db, job)
+                processed += 1
+                logger.info("%s: job %s finished in %.1fs", worker_id, job.id, time.perf_counter() - started)
+                continue
+        if once:
+            return processed
+        time.sleep(poll_seconds)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import datetime as dt
+import math
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from sqlalchemy import func, select, update, delete
+from sqlalchemy import Table, func, insert, select, update, delete
 from sqlalchemy.orm import Session
 
 from di_es_dashboard_api.models import (
@@ -12,17 +15,33 @@ from di_es_dashboard_api.models import (
     CountrySummary,
     IssueAltText,
     IssueBottom30,
+    ReportAggregate,
     ReportFile,
     ReportIngestLog,
 )
-from di_es_dashboard_api.services.excel_parser import parse_alt_text_issues, parse_country_table_from_sheet
-from di_es_dashboard_api.utils import parse_report_filename, sha256_file
+from di_es_dashboard_api.services.aggregates import refresh_report_aggregate
+from di_es_dashboard_api.services.excel_parser import ReportWorkbook
+from di_es_dashboard_api.utils import parse_report_filename
 
 
 def _log(db: Session, report_file_id: int, level: str, message: str, context: dict[str, Any] | None = None) -> None:
     db.add(ReportIngestLog(report_file_id=report_file_id, level=level, message=message, context=context))
 
 
+BULK_INSERT_CHUNK_SIZE = 2000
+
+
+def _bulk_insert(db: Session, table: Table, rows: list[dict[str, Any]]) -> None:
+    """
+    Core ``INSERT`` executed as executemany in chunks.
+
+    Skips the ORM unit of work entirely; the driver batches each chunk into
+    multi-row ``INSERT ... VALUES`` statements (insertmanyvalues).
+    """
+    for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+        db.execute(insert(table), rows[start:start + BULK_INSERT_CHUNK_SIZE])
+
+
 def next_revision(db: Session, report_type: str, year: int, month: int) -> int:
     value = db.execute(
         select(func.max(ReportFile.revision)).where(
@@ -50,13 +69,66 @@ def purge_report_data(db: Session, report_file_id: int) -> None:
     db.execute(delete(CountrySummary).where(CountrySummary.report_file_id == report_file_id))
     db.execute(delete(IssueAltText).where(IssueAltText.report_file_id == report_file_id))
     db.execute(delete(IssueBottom30).where(IssueBottom30.report_file_id == report_file_id))
+    db.execute(delete(ReportAggregate).where(ReportAggregate.report_file_id == report_file_id))
+
+
+class _StageTimer:
+    """Wall-clock milliseconds per ingestion stage, written to the ingest log."""
+
+    def __init__(self) -> None:
+        self._started = time.perf_counter()
+        self.timings_ms: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - started) * 1000
+            self.timings_ms[name] = round(self.timings_ms.get(name, 0.0) + elapsed, 1)
+
+    def total(self) -> dict[str, float]:
+        return {**self.timings_ms, "total": round((time.perf_counter() - self._started) * 1000, 1)}
 
 
 def ingest_excel_report(db: Session, report_file: ReportFile) -> None:
+    """
+    Imports one report file.
+
+    The file is read from disk and loaded as a workbook exactly once
+    (``ReportWorkbook``); the summary, alt text and bottom 30% sheets are
+    then streamed row by row from that single load. The report's
+    ``ReportAggregate`` row is rebuilt once all rows are in.
+    """
     file_path = Path(report_file.stored_path)
     report_type, year, month = report_file.report_type, report_file.year, report_file.month
+    timer = _StageTimer()
+
+    with timer.stage("read"):
+        book = ReportWorkbook(file_path)
+    try:
+        _ingest_workbook(db, report_file, book, timer)
+    finally:
+        book.close()
+
+    with timer.stage("aggregate"):
+        refresh_report_aggregate(db, report_file.id)
 
-    report_file.sha256 = sha256_file(file_path)
+    report_file.status = "completed"
+    report_file.ingested_at = dt.datetime.utcnow()
+    db.add(report_file)
+
+    deactivate_completed_active(db, report_type, year, month)
+    report_file.is_active = True
+    db.add(report_file)
+    _log(db, report_file.id, "INFO", "Ingestion completed", {"timings_ms": timer.total()})
+
+
+def _ingest_workbook(db: Session, report_file: ReportFile, book: ReportWorkbook, timer: _StageTimer) -> None:
+    report_type, year, month = report_file.report_type, report_file.year, report_file.month
+
+    report_file.sha256 = book.sha256
     report_file.status = "processing"
     report_file.error_message = None
     report_file.warnings_count = 0
@@ -64,136 +136,160 @@ def ingest_excel_report(db: Session, report_file: ReportFile) -> None:
     db.flush()
 
     purge_report_data(db, report_file.id)
-    _log(db, report_file.id, "INFO", "Starting ingestion", {"report_type": report_type, "year": year, "month": month})
+    _log(
+        db,
+        report_file.id,
+        "INFO",
+        "Starting ingestion",
+        {
+            "report_type": report_type,
+            "year": year,
+            "month": month,
+            "size_bytes": book.size_bytes,
+            "read_ms": timer.timings_ms["read"],
+        },
+    )
 
     if report_type == "B2B":
-        summary_sheet = "Summary (최종)" if "Summary (최종)" in _sheetnames(file_path) else "Summary"
+        summary_sheet = "Summary (최종)" if "Summary (최종)" in book.sheetnames else "Summary"
     elif report_type == "B2C":
         summary_sheet = "Summary by Country"
     else:
         raise ValueError(f"Unsupported report_type: {report_type}")
 
+    country_summaries: list[dict[str, Any]] = []
+    country_metrics: list[dict[str, Any]] = []
+
     try:
-        summary_rows = parse_country_table_from_sheet(file_path, summary_sheet)
+        with timer.stage("summary_parse"):
+            for r in book.country_rows(summary_sheet):
+                country_summaries.append(
+                    {
+                        "report_file_id": report_file.id,
+                        "region": r.region,
+                        "country": r.country,
+                        "gp1_status": r.gp1_status,
+                        "sku": r.sku,
+                        "sku_prev": r.sku_prev,
+                        "sku_gap": r.sku_gap,
+                        "total_score": r.total_score,
+                        "total_score_prev": r.total_score_prev,
+                        "total_gap": r.total_gap,
+                        "rank_prev": r.rank_prev,
+                        "rank_current": r.rank_current,
+                        "rank_change": r.rank_change,
+                        "metrics": {
+                            k: v if v is None or math.isfinite(v) else None for k, (_, v) in r.metrics.items()
+                        },
+                    }
+                )
+
+                for metric_key, (metric_label, value) in r.metrics.items():
+                    country_metrics.append(
+                        {
+                            "report_file_id": report_file.id,
+                            "country": r.country,
+                            "metric_key": metric_key,
+                            "metric_label": metric_label,
+                            "group_label": None,
+                            "value": value,
+                        }
+                    )
     except Exception as e:
         _log(db, report_file.id, "ERROR", "Failed to parse summary sheet", {"sheet": summary_sheet, "error": str(e)})
         raise
 
-    country_summaries: list[CountrySummary] = []
-    country_metrics: list[CountryMetric] = []
-
-    for r in summary_rows:
-        country_summaries.append(
-            CountrySummary(
-                report_file_id=report_file.id,
-                region=r.region,
-                country=r.country,
-                gp1_status=r.gp1_status,
-                sku=r.sku,
-                sku_prev=r.sku_prev,
-                sku_gap=r.sku_gap,
-                total_score=r.total_score,
-                total_score_prev=r.total_score_prev,
-                total_gap=r.total_gap,
-                rank_prev=r.rank_prev,
-                rank_current=r.rank_current,
-                rank_change=r.rank_change,
-            )
-        )
-
-        for metric_key, (metric_label, value) in r.metrics.items():
-            country_metrics.append(
-                CountryMetric(
-                    report_file_id=report_file.id,
-                    country=r.country,
-                    metric_key=metric_key,
-                    metric_label=metric_label,
-                    group_label=None,
-                    value=value,
-                )
-            )
-
-    db.bulk_save_objects(country_summaries)
-    db.bulk_save_objects(country_metrics)
+    with timer.stage("summary_insert"):
+        _bulk_insert(db, CountrySummary.__table__, country_summaries)
+        _bulk_insert(db, CountryMetric.__table__, country_metrics)
     _log(
         db,
         report_file.id,
         "INFO",
         "Summary imported",
-        {"countries": len(country_summaries), "metrics": len(country_metrics), "sheet": summary_sheet},
+        {
+            "countries": len(country_summaries),
+            "metrics": len(country_metrics),
+            "sheet": summary_sheet,
+            "parse_ms": timer.timings_ms["summary_parse"],
+            "insert_ms": timer.timings_ms["summary_insert"],
+        },
     )
 
-    issues_alt = parse_alt_text_issues(file_path)
+    with timer.stage("alt_text_parse"):
+        issues_alt = [
+            {
+                "report_file_id": report_file.id,
+                "country": i.country,
+                "url": i.url,
+                "card_index": i.card_index,
+                "src": i.src,
+                "srcset": i.srcset,
+                "alt": i.alt,
+                "alt_length": i.alt_length,
+                "alt_comment": i.alt_comment,
+            }
+            for i in book.alt_text_issues()
+        ]
     if issues_alt:
-        db.bulk_save_objects(
-            [
-                IssueAltText(
-                    report_file_id=report_file.id,
-                    country=i.country,
-                    url=i.url,
-                    card_index=i.card_index,
-                    src=i.src,
-                    srcset=i.srcset,
-                    alt=i.alt,
-                    alt_length=i.alt_length,
-                    alt_comment=i.alt_comment,
-                )
-                for i in issues_alt
-            ]
+        with timer.stage("alt_text_insert"):
+            _bulk_insert(db, IssueAltText.__table__, issues_alt)
+        _log(
+            db,
+            report_file.id,
+            "INFO",
+            "Alt text issues imported",
+            {
+                "count": len(issues_alt),
+                "parse_ms": timer.timings_ms["alt_text_parse"],
+                "insert_ms": timer.timings_ms["alt_text_insert"],
+            },
         )
-        _log(db, report_file.id, "INFO", "Alt text issues imported", {"count": len(issues_alt)})
 
     for bottom_sheet in ["Bottom 30%"]:
-        if bottom_sheet not in _sheetnames(file_path):
+        if bottom_sheet not in book.sheetnames:
             continue
         try:
-            bottom_rows = parse_country_table_from_sheet(file_path, bottom_sheet)
+            with timer.stage("bottom30_parse"):
+                issues_bottom = [
+                    {
+                        "report_file_id": report_file.id,
+                        "region": r.region,
+                        "country": r.country,
+                        "total_score": r.total_score,
+                        "rank_prev": r.rank_prev,
+                        "rank_current": r.rank_current,
+                        "rank_change": r.rank_change,
+                        "details": {
+                            "sku": r.sku,
+                            "sku_prev": r.sku_prev,
+                            "sku_gap": r.sku_gap,
+                            "total_score_prev": r.total_score_prev,
+                            "total_gap": r.total_gap,
+                            "metrics": {k: v for k, (_, v) in r.metrics.items()},
+                        },
+                    }
+                    for r in book.country_rows(bottom_sheet)
+                ]
         except Exception as e:
             _log(db, report_file.id, "WARN", "Failed to parse bottom30 sheet", {"sheet": bottom_sheet, "error": str(e)})
             continue
 
-        issues_bottom = [
-            IssueBottom30(
-                report_file_id=report_file.id,
-                region=r.region,
-                country=r.country,
-                total_score=r.total_score,
-                rank_prev=r.rank_prev,
-                rank_current=r.rank_current,
-                rank_change=r.rank_change,
-                details={
-                    "sku": r.sku,
-                    "sku_prev": r.sku_prev,
-                    "sku_gap": r.sku_gap,
-                    "total_score_prev": r.total_score_prev,
-                    "total_gap": r.total_gap,
-                    "metrics": {k: v for k, (_, v) in r.metrics.items()},
+        if issues_bottom:
+            with timer.stage("bottom30_insert"):
+                _bulk_insert(db, IssueBottom30.__table__, issues_bottom)
+            _log(
+                db,
+                report_file.id,
+                "INFO",
+                "Bottom30 imported",
+                {
+                    "count": len(issues_bottom),
+                    "sheet": bottom_sheet,
+                    "parse_ms": timer.timings_ms["bottom30_parse"],
+                    "insert_ms": timer.timings_ms["bottom30_insert"],
                 },
             )
-            for r in bottom_rows
-        ]
-        if issues_bottom:
-            db.bulk_save_objects(issues_bottom)
-            _log(db, report_file.id, "INFO", "Bottom30 imported", {"count": len(issues_bottom), "sheet": bottom_sheet})
-
-    report_file.status = "completed"
-    report_file.ingested_at = dt.datetime.utcnow()
-    db.add(report_file)
-
-    deactivate_completed_active(db, report_type, year, month)
-    report_file.is_active = True
-    db.add(report_file)
-    _log(db, report_file.id, "INFO", "Ingestion completed")
-
-
-def _sheetnames(file_path: Path) -> list[str]:
-    import openpyxl
-
-    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-    try:
-        return list(wb.sheetnames)
-    finally:
-        wb.close()
 
 
 def create_report_file_record(db: Session, stored_path: Path, original_name: str) -> ReportFile:
@@ -0,0 +1,4 @@
+import os
+
+# di_es_dashboard_api.db builds its engine at import time; tests use their own engines.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -0,0 +1,101 @@
+"""
+Report file status transitions driven by the ingest job queue.
+"""
+import datetime as dt
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from di_es_dashboard_api.models import Base, IngestJob, ReportFile, ReportIngestLog
+from di_es_dashboard_api.services.ingest_queue import claim_next_job, enqueue_ingest, fail_exhausted_jobs
+
+STALE_AFTER = dt.timedelta(minutes=30)
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _report(db, report_id):
+    db.add(
+        ReportFile(
+            id=report_id,
+            report_type="B2B",
+            year=2025,
+            month=report_id,
+            file_name=f"report_{report_id}.xlsx",
+            stored_path="",
+            status="pending",
+        )
+    )
+    enqueue_ingest(db, report_id)
+    db.commit()
+
+
+def test_claim_marks_report_processing(db):
+    _report(db, 1)
+    job = claim_next_job(db, "worker-a", STALE_AFTER, max_attempts=3)
+    assert job.status == "running" and job.attempts == 1
+    db.expire_all()
+    assert db.get(ReportFile, 1).status == "processing"
+
+
+def test_exhausted_jobs_fail_their_report(db):
+    _report(db, 1)
+    _report(db, 2)
+    for _ in range(2):
+        job = claim_next_job(db, "worker-a", STALE_AFTER, max_attempts=3)
+        job.attempts = 3
+        job.started_at = dt.datetime.utcnow() - 2 * STALE_AFTER
+    db.commit()
+    # Report 2 was reprocessed: a newer job is queued, so it stays pending.
+    db.get(ReportFile, 2).status = "pending"
+    enqueue_ingest(db, 2)
+    db.commit()
+
+    assert fail_exhausted_jobs(db, STALE_AFTER, max_attempts=3) == 2
+    db.expire_all()
+    first, second = db.get(ReportFile, 1), db.get(ReportFile, 2)
+    assert (first.status, first.error_message) == ("failed", "Worker stopped responding")
+    assert (second.status, second.error_message) == ("pending", None)
+    assert db.execute(select(IngestJob.status).order_by(IngestJob.id)).scalars().all() == ["failed", "failed", "queued"]
+    assert db.execute(select(ReportIngestLog.level).where(ReportIngestLog.report_file_id == 1)).scalars().all() == [
+        "ERROR"
+    ]
+    assert fail_exhausted_jobs(db, STALE_AFTER, max_attempts=3) == 0
+
+
+def test_reprocess_waits_for_the_running_job(db):
+    _report(db, 1)
+    _report(db, 2)
+    running = claim_next_job(db, "worker-a", STALE_AFTER, max_attempts=3)
+    assert running.report_file_id == 1
+    # Reprocess while worker A is still ingesting report 1.
+    requeued = enqueue_ingest(db, 1)
+    db.commit()
+
+    other = claim_next_job(db, "worker-b", STALE_AFTER, max_attempts=3)
+    assert other.report_file_id == 2
+    assert claim_next_job(db, "worker-b", STALE_AFTER, max_attempts=3) is None
+
+    running.status = "done"
+    db.commit()
+    assert claim_next_job(db, "worker-b", STALE_AFTER, max_attempts=3).id == requeued.id
+
+
+def test_stale_job_is_retried_before_a_newer_one(db):
+    _report(db, 1)
+    running = claim_next_job(db, "worker-a", STALE_AFTER, max_attempts=3)
+    running.started_at = dt.datetime.utcnow() - 2 * STALE_AFTER
+    requeued = enqueue_ingest(db, 1)
+    db.commit()
+    # Worker A died: its job is retried first, which blocks the newer one again.
+    assert claim_next_job(db, "worker-b", STALE_AFTER, max_attempts=3).id == running.id
+    assert claim_next_job(db, "worker-c", STALE_AFTER, max_attempts=3) is None
+    assert requeued.status == "queued"
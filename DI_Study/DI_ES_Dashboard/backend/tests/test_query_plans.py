@@ -0,0 +1,241 @@
+"""
+Query plan regression tests for the public API.
+
+Each public endpoint is called against a seeded SQLite database; every
+SELECT it issues is re-run under EXPLAIN QUERY PLAN. Tables must only be
+reached through an index (SEARCH, never SCAN) and the key access paths
+must use the composite indexes declared on the models.
+"""
+import random
+import re
+
+import pytest
+from alembic import command
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, event, insert, inspect, text
+from sqlalchemy.orm import Session
+
+from di_es_dashboard_api.models import (
+    Base,
+    CountryMetric,
+    CountrySummary,
+    IssueAltText,
+    IssueBottom30,
+    ReportFile,
+)
+from di_es_dashboard_api.routes import public
+from di_es_dashboard_api.scripts.init_db import alembic_config
+from di_es_dashboard_api.services.aggregates import overview_cache, refresh_report_aggregate
+
+TABLES = {table.name for table in Base.metadata.sorted_tables}
+METRIC_KEYS = [f"{i + 1}_metric" for i in range(10)]
+
+
+def _seed(db):
+    rng = random.Random(3)
+    report_id = 0
+    for report_type in ("B2B", "B2C"):
+        for month in range(1, 13):
+            for revision in (1, 2):
+                report_id += 1
+                db.execute(
+                    insert(ReportFile.__table__),
+                    [
+                        {
+                            "id": report_id,
+                            "report_type": report_type,
+                            "year": 2025,
+                            "month": month,
+                            "revision": revision,
+                            "file_name": f"{report_type}_{month}_{revision}.xlsx",
+                            "stored_path": "",
+                            "is_active": revision == 2,
+                            "status": "completed",
+                            "warnings_count": 0,
+                        }
+                    ],
+                )
+                countries = [f"Country {c:02d}" for c in range(60)]
+                db.execute(
+                    insert(CountrySummary.__table__),
+                    [
+                        {
+                            "report_file_id": report_id,
+                            "region": f"R{i % 5}",
+                            "country": country,
+                            "total_score": rng.random() * 100,
+                            "metrics": {key: rng.random() * 20 for key in METRIC_KEYS},
+                        }
+                        for i, country in enumerate(countries)
+                    ],
+                )
+                db.execute(
+                    insert(CountryMetric.__table__),
+                    [
+                        {
+                            "report_file_id": report_id,
+                            "country": country,
+                            "metric_key": key,
+                            "metric_label": key,
+                            "value": rng.random() * 20,
+                        }
+                        for country in countries
+                        for key in METRIC_KEYS
+                    ],
+                )
+                db.execute(
+                    insert(IssueAltText.__table__),
+                    [{"report_file_id": report_id, "country": countries[i % 60], "url": f"/p/{i}"} for i in range(200)],
+                )
+                db.execute(
+                    insert(IssueBottom30.__table__),
+                    [
+                        {"report_file_id": report_id, "country": country, "total_score": rng.random() * 50}
+                        for country in countries[:18]
+                    ],
+                )
+                refresh_report_aggregate(db, report_id)
+    db.commit()
+    db.execute(text("ANALYZE"))
+    db.commit()
+
+
+@pytest.fixture(scope="module")
+def seeded(tmp_path_factory):
+    engine = create_engine(f"sqlite:///{tmp_path_factory.mktemp('plans') / 'dashboard.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        _seed(db)
+        yield engine, db
+    engine.dispose()
+
+
+def _query_plans(engine, db, call):
+    """Runs ``call(db)`` and returns (sql, plan detail lines) for every SELECT it issued."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    overview_cache.clear()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call(db)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            plans.append((statement, [row[3] for row in rows]))
+    return plans
+
+
+ENDPOINTS = {
+    "periods": (
+        lambda db: public.list_periods("B2B", db),
+        {"ix_report_files_type_active_status_period"},
+    ),
+    "overview": (
+        lambda db: public.overview("B2B", 2025, 5, db),
+        {"ix_report_files_type_active_status_period"},
+    ),
+    "ranking_total_score": (
+        lambda db: public.country_ranking("B2B", 2025, 5, "total_score", "desc", 2, 20, db),
+        {"ix_report_files_type_active_status_period"},
+    ),
+    "ranking_metric": (
+        lambda db: public.country_ranking("B2C", 2025, 7, "3_metric", "asc", 1, 20, db),
+        {"ix_report_files_type_active_status_period"},
+    ),
+    "country_detail": (
+        lambda db: public.country_detail("Country 05", "B2B", 2025, 5, db),
+        {
+            "ix_country_summary_report_country",
+            "ix_country_metrics_report_country_metric",
+            "ix_issues_alt_text_report_country",
+            "ix_issues_bottom30_report_country",
+        },
+    ),
+    "alt_text": (
+        lambda db: public.issues_alt_text("B2B", 2025, 5, None, 1, 50, db),
+        set(),
+    ),
+    "alt_text_country": (
+        lambda db: public.issues_alt_text("B2B", 2025, 5, "Country 03", 1, 50, db),
+        {"ix_issues_alt_text_report_country"},
+    ),
+    "bottom30": (
+        lambda db: public.issues_bottom30("B2B", 2025, 5, None, 1, 50, db),
+        {"ix_issues_bottom30_report_total_score"},
+    ),
+    "bottom30_country": (
+        lambda db: public.issues_bottom30("B2B", 2025, 5, "Country 03", 1, 50, db),
+        {"ix_issues_bottom30_report_country"},
+    ),
+    "report_aggregate": (
+        lambda db: refresh_report_aggregate(db, 7),
+        {"ix_country_metrics_report_metric"},
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(ENDPOINTS))
+def test_tables_are_only_reached_through_indexes(seeded, name):
+    engine, db = seeded
+    call, _ = ENDPOINTS[name]
+    plans = _query_plans(engine, db, call)
+    assert plans
+    for statement, details in plans:
+        for detail in details:
+            match = re.match(r"(SCAN|SEARCH) (\w+)", detail)
+            if match and match.group(2) in TABLES:
+                assert match.group(1) == "SEARCH", f"{detail}\n{statement}"
+
+
+@pytest.mark.parametrize("name", list(ENDPOINTS))
+def test_access_paths_use_composite_indexes(seeded, name):
+    engine, db = seeded
+    call, expected = ENDPOINTS[name]
+    plans = _query_plans(engine, db, call)
+    used = {
+        index
+        for _, details in plans
+        for detail in details
+        for index in re.findall(r"USING (?:COVERING )?INDEX (\w+)", detail)
+    }
+    assert expected <= used, f"missing {expected - used}, used {sorted(used)}"
+
+
+def test_country_queries_filter_on_report_and_country(seeded):
+    engine, db = seeded
+    plans = _query_plans(engine, db, ENDPOINTS["country_detail"][0])
+    searches = [detail for _, details in plans for detail in details if detail.startswith("SEARCH")]
+    for table in ("country_summary", "country_metrics", "issues_alt_text", "issues_bottom30"):
+        assert any(
+            detail.startswith(f"SEARCH {table} ") and "report_file_id=? AND country=?" in detail for detail in searches
+        ), table
+
+
+def test_migrations_create_every_model_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        cfg = alembic_config(conn)
+        indexes = ScriptDirectory.from_config(cfg).get_revision("0002_public_query_indexes").module.INDEXES
+        # A database created before these indexes existed, already at revision 0001.
+        for name, _, _ in indexes:
+            conn.exec_driver_sql(f"DROP INDEX {name}")
+        command.stamp(cfg, "0001_country_summary_metrics")
+
+    with engine.begin() as conn:
+        command.upgrade(alembic_config(conn), "head")
+
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        declared = {index.name for index in table.indexes}
+        present = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert declared <= present, f"{table.name}: {declared - present}"
+    engine.dispose()
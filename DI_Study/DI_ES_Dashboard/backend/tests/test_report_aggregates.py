@@ -0,0 +1,124 @@
+"""
+``report_aggregates`` backfill and the read-only ``/overview`` fallback.
+"""
+from alembic import command
+from sqlalchemy import create_engine, delete, event, insert, select
+from sqlalchemy.orm import Session
+
+from di_es_dashboard_api.models import (
+    Base,
+    CountryMetric,
+    CountrySummary,
+    IssueAltText,
+    IssueBottom30,
+    ReportAggregate,
+    ReportFile,
+)
+from di_es_dashboard_api.routes import public
+from di_es_dashboard_api.scripts.init_db import alembic_config
+from di_es_dashboard_api.services.aggregates import compute_report_aggregate, overview_cache
+
+AGGREGATE_FIELDS = ("avg_total_score", "countries_count", "alt_text_errors_count", "bottom30_count", "metrics")
+
+
+def _seed(db):
+    for report_id, month in ((1, 1), (2, 2), (3, 3)):
+        db.execute(
+            insert(ReportFile.__table__),
+            [
+                {
+                    "id": report_id,
+                    "report_type": "B2B",
+                    "year": 2025,
+                    "month": month,
+                    "revision": 1,
+                    "file_name": f"B2B_{month}.xlsx",
+                    "stored_path": "",
+                    "is_active": True,
+                    "status": "completed",
+                    "warnings_count": 0,
+                }
+            ],
+        )
+        countries = [f"Country {c}" for c in range(report_id + 2)]
+        db.execute(
+            insert(CountrySummary.__table__),
+            [
+                {"report_file_id": report_id, "country": country, "total_score": 10.0 * i + report_id}
+                for i, country in enumerate(countries)
+            ],
+        )
+        db.execute(
+            insert(CountryMetric.__table__),
+            [
+                {
+                    "report_file_id": report_id,
+                    "country": country,
+                    "metric_key": key,
+                    "metric_label": key.upper(),
+                    "value": float(i + len(key)),
+                }
+                for i, country in enumerate(countries)
+                for key in ("b_metric", "a_metric")
+            ],
+        )
+        db.execute(insert(IssueAltText.__table__), [{"report_file_id": report_id, "country": "Country 0", "url": "/p"}])
+        db.execute(
+            insert(IssueBottom30.__table__),
+            [{"report_file_id": report_id, "country": country, "total_score": 1.0} for country in countries[:2]],
+        )
+    db.commit()
+
+
+def _fields(aggregate):
+    return tuple(getattr(aggregate, field) for field in AGGREGATE_FIELDS)
+
+
+def test_migration_backfills_missing_aggregates(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        _seed(db)
+        expected = {report_id: _fields(compute_report_aggregate(db, report_id)) for report_id in (1, 2, 3)}
+
+    with engine.begin() as conn:
+        command.stamp(alembic_config(conn), "0002_public_query_indexes")
+    with engine.begin() as conn:
+        command.upgrade(alembic_config(conn), "head")
+
+    with Session(engine) as db:
+        stored = {row.report_file_id: _fields(row) for row in db.execute(select(ReportAggregate)).scalars()}
+    assert stored == expected
+    engine.dispose()
+
+
+def test_overview_does_not_write_when_aggregates_are_missing(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'dashboard.db'}")
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        _seed(db)
+        with engine.begin() as conn:
+            command.upgrade(alembic_config(conn), "head")
+        overview_cache.clear()
+        stored = public.overview("B2B", 2025, 2, db)
+
+        db.execute(delete(ReportAggregate).where(ReportAggregate.report_file_id.in_([1, 2])))
+        db.commit()
+        writes = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if not statement.lstrip().upper().startswith("SELECT"):
+                writes.append(statement)
+
+        overview_cache.clear()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            computed = public.overview("B2B", 2025, 2, db)
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+
+        assert writes == []
+        assert not db.new and not db.dirty
+        assert computed == stored
+        assert db.execute(select(ReportAggregate.report_file_id)).scalars().all() == [3]
+    engine.dispose()